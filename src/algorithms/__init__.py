@@ -6,15 +6,25 @@ This module contains sophisticated algorithms for:
 - Geodesic path calculation
 - Surface curvature analysis
 - Triangle mesh processing
+- Chart segmentation and multi-chart unfolding
+- Shared mesh topology (edges, one-rings, boundary loops)
+- KD-tree spatial index for nearest-vertex queries and farthest-point sampling
 """
 
 from .lscm import LSCMSolver
 from .mesh_utils import extract_triangle_mesh, analyze_mesh_curvature
 from .geodesic import calculate_geodesic_paths
+from .charts import segment_mesh_into_charts, unfold_surface_charts
+from .mesh_topology import MeshTopology
+from .spatial_index import VertexSpatialIndex
 
 __all__ = [
     'LSCMSolver',
     'extract_triangle_mesh', 
     'analyze_mesh_curvature',
-    'calculate_geodesic_paths'
+    'calculate_geodesic_paths',
+    'segment_mesh_into_charts',
+    'unfold_surface_charts',
+    'MeshTopology',
+    'VertexSpatialIndex'
 ]
\ No newline at end of file
@@ -0,0 +1,406 @@
+"""
+Chart segmentation and parallel multi-chart LSCM unfolding.
+
+Large, highly curved surfaces unfold with less distortion (and faster) when they
+are split into nearly developable charts that are unfolded independently and
+then packed side by side in the UV plane.
+"""
+
+import logging
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+from .lscm import LSCMSolver, compute_distortion_metrics
+
+logger = logging.getLogger(__name__)
+
+
+def compute_face_normals(vertices: np.ndarray, triangles: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute unit face normals and face areas for all triangles at once.
+
+    Args:
+        vertices: Nx3 array of vertex coordinates
+        triangles: Mx3 array of triangle indices
+
+    Returns:
+        Tuple of (Mx3 unit normals, M areas); degenerate faces get a +Z normal
+    """
+    cross = np.cross(vertices[triangles[:, 1]] - vertices[triangles[:, 0]],
+                     vertices[triangles[:, 2]] - vertices[triangles[:, 0]])
+    double_areas = np.linalg.norm(cross, axis=1)
+    normals = np.tile([0.0, 0.0, 1.0], (len(triangles), 1))
+    valid = double_areas > 1e-12
+    normals[valid] = cross[valid] / double_areas[valid, None]
+    return normals, 0.5 * double_areas
+
+
+def build_face_adjacency(triangles: np.ndarray) -> sparse.csr_matrix:
+    """
+    Build the face-to-face adjacency matrix (faces sharing an edge).
+
+    Args:
+        triangles: Mx3 array of triangle indices
+
+    Returns:
+        Symmetric MxM CSR matrix with ones for adjacent faces
+    """
+    n_faces = len(triangles)
+    edges = np.sort(triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    edge_faces = np.repeat(np.arange(n_faces), 3)
+
+    _, edge_ids = np.unique(edges, axis=0, return_inverse=True)
+    edge_ids = edge_ids.ravel()
+    order = np.argsort(edge_ids, kind='stable')
+    shared = edge_ids[order[1:]] == edge_ids[order[:-1]]
+
+    f1 = edge_faces[order[:-1][shared]]
+    f2 = edge_faces[order[1:][shared]]
+    adjacency = sparse.csr_matrix((np.ones(len(f1)), (f1, f2)), shape=(n_faces, n_faces))
+    adjacency = ((adjacency + adjacency.T) > 0).astype(np.int8)
+    return adjacency.tocsr()
+
+
+def segment_mesh_into_charts(vertices: np.ndarray, triangles: np.ndarray,
+                             max_normal_deviation: float = 30.0,
+                             min_chart_faces: int = 16,
+                             curvature_analysis: Optional[Dict[str, Any]] = None) -> np.ndarray:
+    """
+    Split a mesh into nearly developable charts by region growing.
+
+    Charts are grown from the flattest remaining face and accept neighbouring
+    faces whose normal stays within max_normal_deviation degrees of the chart's
+    area-weighted average normal. Charts smaller than min_chart_faces are merged
+    into the neighbouring chart they share the most edges with.
+
+    Args:
+        vertices: Nx3 array of vertex coordinates
+        triangles: Mx3 array of triangle indices
+        max_normal_deviation: Maximum normal deviation from the chart normal, in degrees
+        min_chart_faces: Minimum faces per chart before merging into a neighbour
+        curvature_analysis: Optional result of mesh_utils.analyze_mesh_curvature; its
+            vertex curvatures order the seeds (flattest first)
+
+    Returns:
+        Array of M chart labels (0..n_charts-1)
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    triangles = np.asarray(triangles, dtype=np.int64)
+    n_faces = len(triangles)
+
+    normals, areas = compute_face_normals(vertices, triangles)
+    adjacency = build_face_adjacency(triangles)
+    indptr, neighbors = adjacency.indptr, adjacency.indices
+
+    # Seed order: flattest faces first
+    vertex_curvatures = None
+    if curvature_analysis and len(curvature_analysis.get('vertex_curvatures', [])) == len(vertices):
+        vertex_curvatures = np.asarray(curvature_analysis['vertex_curvatures'], dtype=np.float64)
+    if vertex_curvatures is not None:
+        face_scores = vertex_curvatures[triangles].mean(axis=1)
+    else:
+        # Mean normal deviation from adjacent faces as a local curvature proxy
+        rows = np.repeat(np.arange(n_faces), np.diff(indptr))
+        deviation = 1.0 - np.einsum('ij,ij->i', normals[rows], normals[neighbors])
+        counts = np.maximum(np.diff(indptr), 1)
+        face_scores = np.bincount(rows, weights=deviation, minlength=n_faces) / counts
+    seed_order = np.argsort(face_scores, kind='stable')
+
+    cos_limit = math.cos(math.radians(max_normal_deviation))
+    labels = np.full(n_faces, -1, dtype=np.int64)
+    n_charts = 0
+
+    for seed in seed_order:
+        if labels[seed] >= 0:
+            continue
+        chart = n_charts
+        n_charts += 1
+        labels[seed] = chart
+        normal_sum = normals[seed] * areas[seed]
+        chart_normal = normals[seed]
+        queue = deque([seed])
+
+        while queue:
+            face = queue.popleft()
+            for neighbor in neighbors[indptr[face]:indptr[face + 1]]:
+                if labels[neighbor] >= 0:
+                    continue
+                if np.dot(normals[neighbor], chart_normal) < cos_limit:
+                    continue
+                labels[neighbor] = chart
+                normal_sum = normal_sum + normals[neighbor] * areas[neighbor]
+                norm = np.linalg.norm(normal_sum)
+                if norm > 1e-12:
+                    chart_normal = normal_sum / norm
+                queue.append(neighbor)
+
+    labels = _merge_small_charts(labels, adjacency, min_chart_faces)
+    logger.info(f"Segmented mesh into {labels.max() + 1 if n_faces else 0} charts")
+    return labels
+
+
+def _merge_small_charts(labels: np.ndarray, adjacency: sparse.csr_matrix,
+                        min_chart_faces: int) -> np.ndarray:
+    """
+    Merge charts below min_chart_faces into their most connected neighbour and relabel.
+
+    Every small chart is merged in the same pass: each one links to the neighbour it
+    shares the most edges with, the links are resolved as connected components and
+    the labels are rewritten once, so the loop runs a handful of passes instead of
+    one per small chart.
+    """
+    _, labels = np.unique(labels, return_inverse=True)
+    labels = labels.ravel()
+    coo = adjacency.tocoo()
+
+    while True:
+        sizes = np.bincount(labels)
+        n_charts = len(sizes)
+        small = np.flatnonzero(sizes < min_chart_faces)
+        if len(small) == 0 or n_charts <= 1:
+            break
+
+        # Count shared edges between chart pairs
+        a, b = labels[coo.row], labels[coo.col]
+        cross = a != b
+        chart_links = sparse.coo_matrix(
+            (np.ones(np.count_nonzero(cross)), (a[cross], b[cross])),
+            shape=(n_charts, n_charts)
+        ).tocsr()
+        chart_links.sum_duplicates()
+
+        # Strongest-linked neighbour of every small chart that has one
+        small = small[np.diff(chart_links.indptr)[small] > 0]
+        if len(small) == 0:
+            break
+        small_links = chart_links[small]
+        row_of = np.repeat(np.arange(len(small)), np.diff(small_links.indptr))
+        order = np.lexsort((-small_links.data, row_of))
+        first = np.concatenate([[0], np.flatnonzero(np.diff(row_of[order])) + 1])
+        targets = small_links.indices[order[first]]
+
+        merges = sparse.coo_matrix((np.ones(len(small)), (small, targets)),
+                                   shape=(n_charts, n_charts))
+        _, labels_of_chart = connected_components(merges, directed=False)
+        _, labels = np.unique(labels_of_chart[labels], return_inverse=True)
+        labels = labels.ravel()
+
+    return labels
+
+
+def extract_chart(vertices: np.ndarray, triangles: np.ndarray,
+                  face_indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Extract a chart as a standalone mesh.
+
+    Args:
+        vertices: Nx3 array of vertex coordinates
+        triangles: Mx3 array of triangle indices
+        face_indices: Indices of the chart's faces
+
+    Returns:
+        Tuple of (original vertex indices, chart vertices, chart triangles)
+    """
+    chart_triangles = triangles[face_indices]
+    vertex_indices, local = np.unique(chart_triangles, return_inverse=True)
+    return vertex_indices, vertices[vertex_indices], local.reshape(-1, 3)
+
+
+def _gauge_pins(vertices: np.ndarray) -> List[Tuple[int, float, float]]:
+    """
+    Pin two far-apart vertices to fix translation, rotation and scale of a chart.
+
+    The second pin is placed at the true 3D distance so the chart keeps its size.
+    """
+    centroid = vertices.mean(axis=0)
+    first = int(np.argmax(np.linalg.norm(vertices - centroid, axis=1)))
+    distances = np.linalg.norm(vertices - vertices[first], axis=1)
+    second = int(np.argmax(distances))
+    return [(first, 0.0, 0.0), (second, float(distances[second]), 0.0)]
+
+
+def _unfold_chart(payload: Tuple[int, np.ndarray, np.ndarray, Dict[str, Any]]) -> Dict[str, Any]:
+    """Process-pool worker unfolding one chart."""
+    chart_id, vertices, triangles, solve_options = payload
+    start_time = time.perf_counter()
+    try:
+        solver = LSCMSolver(vertices, triangles)
+        uv, solution_info = solver.solve_lscm(_gauge_pins(vertices), **solve_options)
+        return {
+            'chart_id': chart_id,
+            'success': True,
+            'uv_coordinates': uv,
+            'residual_norm': float(solution_info['residual_norm']),
+            'time': time.perf_counter() - start_time
+        }
+    except Exception as e:
+        return {
+            'chart_id': chart_id,
+            'success': False,
+            'error': str(e),
+            'time': time.perf_counter() - start_time
+        }
+
+
+def pack_charts(chart_uvs: List[np.ndarray], margin: Optional[float] = None) -> List[np.ndarray]:
+    """
+    Pack chart UV islands side by side with a simple shelf packer.
+
+    Args:
+        chart_uvs: List of per-chart Kx2 UV arrays
+        margin: Gap between islands (defaults to 2% of the largest island extent)
+
+    Returns:
+        List of translated UV arrays in the same order
+    """
+    mins = np.array([uv.min(axis=0) for uv in chart_uvs])
+    sizes = np.array([uv.max(axis=0) for uv in chart_uvs]) - mins
+
+    if margin is None:
+        margin = 0.02 * float(sizes.max()) if len(sizes) else 0.0
+
+    shelf_width = max(math.sqrt(float(np.sum((sizes[:, 0] + margin) * (sizes[:, 1] + margin)))),
+                      float(sizes[:, 0].max()))
+
+    offsets = np.zeros_like(mins)
+    x = y = shelf_height = 0.0
+    for chart in np.argsort(-sizes[:, 1], kind='stable'):
+        width, height = sizes[chart]
+        if x > 0 and x + width > shelf_width:
+            x = 0.0
+            y += shelf_height + margin
+            shelf_height = 0.0
+        offsets[chart] = (x, y)
+        x += width + margin
+        shelf_height = max(shelf_height, height)
+
+    return [uv - mins[i] + offsets[i] for i, uv in enumerate(chart_uvs)]
+
+
+def unfold_surface_charts(vertices: np.ndarray, triangles: np.ndarray,
+                          max_normal_deviation: float = 30.0,
+                          min_chart_faces: int = 16,
+                          max_workers: Optional[int] = None,
+                          chart_margin: Optional[float] = None,
+                          curvature_analysis: Optional[Dict[str, Any]] = None,
+                          solve_options: Optional[Dict[str, Any]] = None,
+                          distortion_tolerance: float = 0.001) -> Dict[str, Any]:
+    """
+    Segment a surface into charts, unfold them in parallel and pack the results.
+
+    Vertices on chart seams are duplicated, so the output UV array is indexed by
+    chart vertex; 'vertex_map' gives the original vertex for every UV row.
+
+    Args:
+        vertices: Nx3 array of vertex coordinates
+        triangles: Mx3 array of triangle indices
+        max_normal_deviation: Chart normal deviation limit in degrees
+        min_chart_faces: Minimum faces per chart
+        max_workers: Process pool size (None = os.cpu_count(), 1 = run inline)
+        chart_margin: Gap between packed charts in UV units
+        curvature_analysis: Optional mesh_utils.analyze_mesh_curvature result for seeding
+        solve_options: Extra keyword arguments for LSCMSolver.solve_lscm
+        distortion_tolerance: Maximum acceptable mean edge-length distortion
+
+    Returns:
+        Dictionary containing packed UVs, per-chart information and distortion metrics
+    """
+    total_start = time.perf_counter()
+
+    try:
+        vertices = np.asarray(vertices, dtype=np.float64)
+        triangles = np.asarray(triangles, dtype=np.int64)
+
+        segmentation_start = time.perf_counter()
+        labels = segment_mesh_into_charts(vertices, triangles, max_normal_deviation,
+                                          min_chart_faces, curvature_analysis)
+        n_charts = int(labels.max()) + 1
+        face_groups = np.split(np.argsort(labels, kind='stable'), np.cumsum(np.bincount(labels))[:-1])
+
+        charts = []
+        payloads = []
+        for chart_id, face_indices in enumerate(face_groups):
+            vertex_indices, chart_vertices, chart_triangles = extract_chart(vertices, triangles, face_indices)
+            charts.append({'face_indices': face_indices, 'vertex_indices': vertex_indices,
+                           'triangles': chart_triangles})
+            payloads.append((chart_id, chart_vertices, chart_triangles, solve_options or {}))
+        segmentation_time = time.perf_counter() - segmentation_start
+
+        unfolding_start = time.perf_counter()
+        workers = max_workers or os.cpu_count() or 1
+        if workers > 1 and n_charts > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, n_charts)) as executor:
+                # Largest charts first so the slowest solves start early
+                order = sorted(range(n_charts), key=lambda i: -len(charts[i]['face_indices']))
+                results = {r['chart_id']: r for r in executor.map(_unfold_chart, [payloads[i] for i in order])}
+        else:
+            results = {p[0]: _unfold_chart(p) for p in payloads}
+        unfolding_time = time.perf_counter() - unfolding_start
+
+        failed = [r for r in results.values() if not r['success']]
+        if failed:
+            raise ValueError(f"{len(failed)} of {n_charts} charts failed to unfold: {failed[0]['error']}")
+
+        packing_start = time.perf_counter()
+        packed = pack_charts([results[i]['uv_coordinates'] for i in range(n_charts)], chart_margin)
+
+        offsets = np.cumsum([0] + [len(c['vertex_indices']) for c in charts])
+        uv_coords = np.vstack(packed)
+        vertex_map = np.concatenate([c['vertex_indices'] for c in charts])
+        combined_triangles = np.vstack([c['triangles'] + offsets[i] for i, c in enumerate(charts)])
+        face_order = np.concatenate([c['face_indices'] for c in charts])
+        packing_time = time.perf_counter() - packing_start
+
+        distortion_metrics = compute_distortion_metrics(vertices[vertex_map], combined_triangles, uv_coords)
+        uv_min = uv_coords.min(axis=0)
+        uv_max = uv_coords.max(axis=0)
+
+        chart_summaries = []
+        for chart_id, chart in enumerate(charts):
+            chart_summaries.append({
+                'chart_id': chart_id,
+                'n_faces': int(len(chart['face_indices'])),
+                'n_vertices': int(len(chart['vertex_indices'])),
+                'uv_offset': int(offsets[chart_id]),
+                'residual_norm': results[chart_id]['residual_norm'],
+                'solve_time': results[chart_id]['time']
+            })
+
+        return {
+            'success': True,
+            'method': 'Chart-based LSCM',
+            'n_charts': n_charts,
+            'uv_coordinates': uv_coords.tolist(),
+            'triangle_indices': combined_triangles.tolist(),
+            'vertex_map': vertex_map.tolist(),
+            'face_map': face_order.tolist(),
+            'face_chart_labels': labels.tolist(),
+            'charts': chart_summaries,
+            'pattern_size': (uv_max - uv_min).tolist(),
+            'pattern_bounds': {'min': uv_min.tolist(), 'max': uv_max.tolist()},
+            'distortion_metrics': distortion_metrics,
+            'distortion_acceptable': distortion_metrics['mean_edge_length_distortion'] < distortion_tolerance,
+            'timings': {
+                'segmentation': segmentation_time,
+                'unfolding': unfolding_time,
+                'packing': packing_time,
+                'total': time.perf_counter() - total_start
+            },
+            'max_workers': workers
+        }
+
+    except Exception as e:
+        logger.error(f"Chart-based surface unfolding failed: {e}")
+        return {
+            'success': False,
+            'error': str(e),
+            'method': 'Chart-based LSCM'
+        }
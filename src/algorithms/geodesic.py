@@ -2,16 +2,108 @@
 Geodesic path calculation for optimal fold line placement on 3D surfaces.
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
+
 import numpy as np
-import heapq
 import logging
 from typing import List, Tuple, Dict, Any, Optional
+from scipy import sparse
+from scipy.sparse import csgraph
+from scipy.sparse.linalg import splu
+
+from .mesh_topology import MeshTopology
+from .spatial_index import VertexSpatialIndex
 
 logger = logging.getLogger(__name__)
 
+# Geodesic distance backends for fold-line planning
+GEODESIC_METHODS = ('dijkstra', 'heat')
+
+
+def build_edge_graph(vertices: np.ndarray, triangles: np.ndarray,
+                     topology: Optional[MeshTopology] = None) -> sparse.csr_matrix:
+    """
+    Build the symmetric mesh edge graph weighted by Euclidean edge length.
+    
+    Args:
+        vertices: Nx3 array of vertex coordinates
+        triangles: Mx3 array of triangle indices
+        topology: Optional MeshTopology (defaults to the cached topology of the mesh)
+        
+    Returns:
+        NxN CSR matrix with one entry per directed mesh edge
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    n_vertices = len(vertices)
+    if topology is None:
+        topology = MeshTopology.for_mesh(triangles, n_vertices)
+    
+    # Each undirected edge once, however many triangles share it
+    edges = topology.edges[topology.edges[:, 0] != topology.edges[:, 1]]
+    weights = np.linalg.norm(vertices[edges[:, 0]] - vertices[edges[:, 1]], axis=1)
+    
+    # Explicit zero weights (coincident vertices) are kept as edges by csgraph
+    rows = np.concatenate([edges[:, 0], edges[:, 1]])
+    cols = np.concatenate([edges[:, 1], edges[:, 0]])
+    return sparse.csr_matrix((np.concatenate([weights, weights]), (rows, cols)),
+                             shape=(n_vertices, n_vertices))
+
+
+def calculate_geodesic_distances_multi_source(vertices: np.ndarray, triangles: np.ndarray,
+                                              sources: List[int],
+                                              graph: Optional[sparse.csr_matrix] = None,
+                                              topology: Optional[MeshTopology] = None
+                                              ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Run Dijkstra from several sources in one batched call on the mesh edge graph.
+    
+    Args:
+        vertices: Nx3 array of vertex coordinates
+        triangles: Mx3 array of triangle indices
+        sources: Source vertex indices
+        graph: Optional prebuilt graph from build_edge_graph
+        topology: Optional MeshTopology used when building the graph
+        
+    Returns:
+        Tuple of (KxN distance array, KxN predecessor array with -9999 for no predecessor)
+    """
+    if graph is None:
+        graph = build_edge_graph(vertices, triangles, topology)
+    
+    distances, predecessors = csgraph.dijkstra(graph, directed=False,
+                                               indices=np.asarray(sources, dtype=np.int64),
+                                               return_predecessors=True)
+    return np.atleast_2d(distances), np.atleast_2d(predecessors)
+
+
+def reconstruct_path(predecessors: np.ndarray, source: int, target: int) -> Optional[List[int]]:
+    """
+    Walk a predecessor array back from target to source.
+    
+    Args:
+        predecessors: Predecessor row for the source from csgraph.dijkstra
+        source: Source vertex index
+        target: Target vertex index
+        
+    Returns:
+        Vertex indices from source to target, or None if target is unreachable
+    """
+    path = [int(target)]
+    current = int(target)
+    while current != source:
+        current = int(predecessors[current])
+        if current < 0:
+            return None
+        path.append(current)
+    path.reverse()
+    return path
+
 
 def calculate_geodesic_distance_dijkstra(vertices: np.ndarray, triangles: np.ndarray, 
-                                        source_vertex: int, target_vertex: Optional[int] = None) -> Dict[str, Any]:
+                                        source_vertex: int, target_vertex: Optional[int] = None,
+                                        graph: Optional[sparse.csr_matrix] = None) -> Dict[str, Any]:
     """
     Calculate geodesic distances from a source vertex using Dijkstra's algorithm on the mesh.
     
@@ -20,6 +112,7 @@ def calculate_geodesic_distance_dijkstra(vertices: np.ndarray, triangles: np.nda
         triangles: Mx3 array of triangle indices
         source_vertex: Index of source vertex
         target_vertex: Optional target vertex (if None, calculates distances to all vertices)
+        graph: Optional prebuilt graph from build_edge_graph
         
     Returns:
         Dictionary containing geodesic distances and paths
@@ -27,102 +120,355 @@ def calculate_geodesic_distance_dijkstra(vertices: np.ndarray, triangles: np.nda
     logger.info(f"Calculating geodesic distances from vertex {source_vertex}")
     
     try:
-        n_vertices = len(vertices)
+        distances, predecessors = calculate_geodesic_distances_multi_source(
+            vertices, triangles, [source_vertex], graph
+        )
+        distances, predecessors = distances[0], predecessors[0]
         
-        # Build adjacency graph with edge weights as Euclidean distances
-        adjacency = {i: [] for i in range(n_vertices)}
+        # Reconstruct path if target specified
+        path = None
+        if target_vertex is not None and np.isfinite(distances[target_vertex]):
+            path = reconstruct_path(predecessors, source_vertex, target_vertex)
         
-        for triangle in triangles:
-            v0, v1, v2 = triangle
-            
-            # Add edges for each pair of vertices in the triangle
-            edges = [(v0, v1), (v1, v2), (v2, v0)]
-            
-            for va, vb in edges:
-                # Calculate Euclidean distance as edge weight
-                distance = np.linalg.norm(vertices[va] - vertices[vb])
-                
-                # Add bidirectional edges
-                adjacency[va].append((vb, distance))
-                adjacency[vb].append((va, distance))
-        
-        # Remove duplicate edges and keep minimum distance
-        for vertex in adjacency:
-            edges_dict = {}
-            for neighbor, distance in adjacency[vertex]:
-                if neighbor not in edges_dict or distance < edges_dict[neighbor]:
-                    edges_dict[neighbor] = distance
-            
-            adjacency[vertex] = list(edges_dict.items())
+        n_reached = int(np.count_nonzero(np.isfinite(distances)))
+        result = {
+            'distances': dict(enumerate(distances.tolist())),
+            'source_vertex': source_vertex,
+            'target_vertex': target_vertex,
+            'path': path,
+            'path_length': float(distances[target_vertex]) if target_vertex else None,
+            'n_vertices_processed': n_reached
+        }
         
-        # Dijkstra's algorithm
-        distances = {i: float('inf') for i in range(n_vertices)}
-        distances[source_vertex] = 0.0
-        previous = {i: None for i in range(n_vertices)}
+        logger.info(f"Geodesic calculation completed, processed {n_reached} vertices")
         
-        # Priority queue: (distance, vertex)
-        pq = [(0.0, source_vertex)]
-        visited = set()
+        return result
         
-        while pq:
-            current_dist, current_vertex = heapq.heappop(pq)
-            
-            if current_vertex in visited:
-                continue
+    except Exception as e:
+        logger.error(f"Geodesic distance calculation failed: {e}")
+        return {'error': str(e)}
+
+
+def build_cotangent_laplacian(vertices: np.ndarray, triangles: np.ndarray
+                              ) -> Tuple[sparse.csr_matrix, np.ndarray]:
+    """
+    Assemble the cotangent Laplacian and lumped mass matrix of a triangle mesh.
+    
+    Args:
+        vertices: Nx3 array of vertex coordinates
+        triangles: Mx3 array of triangle indices
+        
+    Returns:
+        Tuple of (NxN positive semi-definite cotangent Laplacian, N lumped vertex areas)
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    triangles = np.asarray(triangles, dtype=np.int64)
+    n_vertices = len(vertices)
+    
+    cotangents, double_areas = _corner_cotangents(vertices, triangles)
+    
+    # Corner k weights the opposite edge (k+1, k+2)
+    i = triangles[:, [1, 2, 0]].ravel()
+    j = triangles[:, [2, 0, 1]].ravel()
+    w = 0.5 * cotangents.ravel()
+    
+    rows = np.concatenate([i, j, i, j])
+    cols = np.concatenate([j, i, i, j])
+    data = np.concatenate([-w, -w, w, w])
+    laplacian = sparse.csr_matrix((data, (rows, cols)), shape=(n_vertices, n_vertices))
+    
+    mass = np.bincount(triangles.ravel(), weights=np.repeat(double_areas / 6.0, 3), minlength=n_vertices)
+    return laplacian, mass
+
+
+def _corner_cotangents(vertices: np.ndarray, triangles: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return Mx3 cotangents of the corner angles and M doubled areas (degenerate faces get zeros)."""
+    p = vertices[triangles]
+    cotangents = np.zeros((len(triangles), 3))
+    cross = np.cross(p[:, 1] - p[:, 0], p[:, 2] - p[:, 0])
+    double_areas = np.linalg.norm(cross, axis=1)
+    valid = double_areas > 1e-12
+    
+    for k in range(3):
+        a = p[:, (k + 1) % 3] - p[:, k]
+        b = p[:, (k + 2) % 3] - p[:, k]
+        cotangents[valid, k] = np.einsum('ij,ij->i', a[valid], b[valid]) / double_areas[valid]
+    
+    return cotangents, double_areas
+
+
+class HeatMethodGeodesics:
+    """
+    Heat-method geodesic distances (Crane et al.) with prefactored operators.
+    
+    The heat operator M + tL and the Poisson operator L are factored once per
+    mesh; each query then costs one heat solve, a per-face gradient, a
+    divergence and one Poisson solve. Several source sets are solved together
+    as a multi-column right-hand side.
+    """
+    
+    # Shared cache of factored operators keyed by mesh hash
+    max_cached_meshes = 4
+    _solver_cache: 'OrderedDict[str, HeatMethodGeodesics]' = OrderedDict()
+    _cache_lock = threading.Lock()
+    _cache_stats = {'hits': 0, 'misses': 0}
+    
+    def __init__(self, vertices: np.ndarray, triangles: np.ndarray, time_scale: float = 1.0):
+        """
+        Assemble and factor the heat and Poisson operators.
+        
+        Args:
+            vertices: Nx3 array of vertex coordinates
+            triangles: Mx3 array of triangle indices
+            time_scale: Multiplier on the squared mean edge length used as heat time step
+        """
+        self.vertices = np.asarray(vertices, dtype=np.float64)
+        self.triangles = np.asarray(triangles, dtype=np.int64)
+        self.n_vertices = len(self.vertices)
+        
+        p = self.vertices[self.triangles]
+        self.cotangents, double_areas = _corner_cotangents(self.vertices, self.triangles)
+        self.valid_faces = double_areas > 1e-12
+        
+        # Per-face quantities for the gradient: unit normal and 1/(2A)
+        cross = np.cross(p[:, 1] - p[:, 0], p[:, 2] - p[:, 0])
+        self.face_normals = np.zeros_like(cross)
+        self.face_normals[self.valid_faces] = cross[self.valid_faces] / double_areas[self.valid_faces, None]
+        self.inv_double_areas = np.zeros(len(self.triangles))
+        self.inv_double_areas[self.valid_faces] = 1.0 / double_areas[self.valid_faces]
+        
+        self.laplacian, self.mass = build_cotangent_laplacian(self.vertices, self.triangles)
+        
+        edges = p[:, [1, 2, 0]] - p
+        mean_edge = float(np.mean(np.linalg.norm(edges, axis=2)))
+        self.time_step = time_scale * mean_edge ** 2
+        
+        mass_matrix = sparse.diags(self.mass)
+        # Both operators are symmetric, so a symmetric fill-reducing ordering applies
+        self._heat_factor = splu((mass_matrix + self.time_step * self.laplacian).tocsc(),
+                                 permc_spec='MMD_AT_PLUS_A')
+        # L is singular (constants); a tiny mass shift keeps it factorable without
+        # changing the zero-mean solution the divergence right-hand side defines
+        shift = 1e-10 * self.laplacian.diagonal().sum() / max(self.mass.sum(), 1e-300)
+        self._poisson_factor = splu((self.laplacian + shift * mass_matrix).tocsc(), permc_spec='MMD_AT_PLUS_A')
+        
+        logger.info(f"Heat method operators factored for {self.n_vertices} vertices, t = {self.time_step:.3g}")
+    
+    def distances(self, source_sets: List[Any]) -> np.ndarray:
+        """
+        Geodesic distances from several source sets at once.
+        
+        Args:
+            source_sets: List where each item is a vertex index or a list of indices
+                treated as one multi-source set
             
-            visited.add(current_vertex)
+        Returns:
+            KxN array of distances, one row per source set
+        """
+        n_sets = len(source_sets)
+        impulses = np.zeros((self.n_vertices, n_sets))
+        for column, sources in enumerate(source_sets):
+            impulses[np.atleast_1d(sources), column] = 1.0
+        
+        # 1. Diffuse heat from the sources for one time step
+        heat = self._heat_factor.solve(impulses)
+        
+        # 2. Normalized negative gradient per face
+        gradient = np.zeros((len(self.triangles), 3, n_sets))
+        for k in range(3):
+            opposite = self.vertices[self.triangles[:, (k + 2) % 3]] - self.vertices[self.triangles[:, (k + 1) % 3]]
+            rotated = np.cross(self.face_normals, opposite) * self.inv_double_areas[:, None]
+            gradient += rotated[:, :, None] * heat[self.triangles[:, k]][:, None, :]
+        norms = np.linalg.norm(gradient, axis=1, keepdims=True)
+        field = np.divide(-gradient, norms, out=np.zeros_like(gradient), where=norms > 1e-300)
+        
+        # 3. Integrated divergence at each vertex
+        divergence = np.zeros((self.n_vertices, n_sets))
+        for k in range(3):
+            corner = self.vertices[self.triangles[:, k]]
+            e1 = self.vertices[self.triangles[:, (k + 1) % 3]] - corner
+            e2 = self.vertices[self.triangles[:, (k + 2) % 3]] - corner
+            contribution = 0.5 * (self.cotangents[:, (k + 2) % 3, None] * np.einsum('fi,fin->fn', e1, field)
+                                  + self.cotangents[:, (k + 1) % 3, None] * np.einsum('fi,fin->fn', e2, field))
+            np.add.at(divergence, self.triangles[:, k], contribution)
+        
+        # 4. Poisson solve (L is positive semi-definite, so the sign flips)
+        phi = self._poisson_factor.solve(-divergence)
+        
+        # Shift so distances are zero at each set's sources
+        result = phi.T
+        for row, sources in enumerate(source_sets):
+            result[row] -= result[row, np.atleast_1d(sources)].min()
+        return np.maximum(result, 0.0)
+    
+    def distance(self, sources: Any) -> np.ndarray:
+        """
+        Geodesic distance from one vertex or multi-source set.
+        
+        Args:
+            sources: Vertex index or list of vertex indices
             
-            # Early termination if we only need distance to target
-            if target_vertex is not None and current_vertex == target_vertex:
-                break
+        Returns:
+            Array of N distances
+        """
+        return self.distances([sources])[0]
+    
+    @staticmethod
+    def mesh_hash(vertices: np.ndarray, triangles: np.ndarray) -> str:
+        """Content hash of the vertex and triangle arrays."""
+        vertices = np.ascontiguousarray(vertices, dtype=np.float64)
+        triangles = np.ascontiguousarray(triangles, dtype=np.int64)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(vertices.tobytes())
+        digest.update(triangles.tobytes())
+        digest.update(f"{vertices.shape}{triangles.shape}".encode())
+        return digest.hexdigest()
+    
+    @classmethod
+    def for_mesh(cls, vertices: np.ndarray, triangles: np.ndarray) -> 'HeatMethodGeodesics':
+        """
+        Return the cached, factored solver for a mesh, building it on first use.
+        
+        Args:
+            vertices: Nx3 array of vertex coordinates
+            triangles: Mx3 array of triangle indices
             
-            # Update distances to neighbors
-            for neighbor, edge_weight in adjacency[current_vertex]:
-                if neighbor not in visited:
-                    new_distance = current_dist + edge_weight
-                    
-                    if new_distance < distances[neighbor]:
-                        distances[neighbor] = new_distance
-                        previous[neighbor] = current_vertex
-                        heapq.heappush(pq, (new_distance, neighbor))
+        Returns:
+            Shared HeatMethodGeodesics instance
+        """
+        key = cls.mesh_hash(vertices, triangles)
+        with cls._cache_lock:
+            solver = cls._solver_cache.get(key)
+            if solver is not None:
+                cls._solver_cache.move_to_end(key)
+                cls._cache_stats['hits'] += 1
+                return solver
+            cls._cache_stats['misses'] += 1
+        
+        solver = cls(vertices, triangles)
+        
+        with cls._cache_lock:
+            cls._solver_cache[key] = solver
+            while len(cls._solver_cache) > cls.max_cached_meshes:
+                cls._solver_cache.popitem(last=False)
+        return solver
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached solvers and reset statistics."""
+        with cls._cache_lock:
+            cls._solver_cache.clear()
+            for key in cls._cache_stats:
+                cls._cache_stats[key] = 0
+    
+    @classmethod
+    def cache_info(cls) -> Dict[str, Any]:
+        """Return heat method solver cache statistics."""
+        with cls._cache_lock:
+            return {
+                **cls._cache_stats,
+                'entries': len(cls._solver_cache),
+                'max_entries': cls.max_cached_meshes
+            }
+
+
+def descent_predecessors(distances: np.ndarray, adjacency: sparse.csr_matrix) -> np.ndarray:
+    """
+    Turn a distance field into a predecessor array by steepest descent on the one-ring.
+    
+    Each vertex points at its neighbour with the smallest distance, or at
+    -9999 when no neighbour is closer (a source or a local minimum), so the
+    result can be walked with reconstruct_path.
+    
+    Args:
+        distances: Array of N distances from a source set
+        adjacency: NxN CSR one-ring adjacency
+        
+    Returns:
+        Array of N predecessor indices
+    """
+    indptr, indices = adjacency.indptr, adjacency.indices
+    n_vertices = len(indptr) - 1
+    counts = np.diff(indptr)
+    rows = np.repeat(np.arange(n_vertices), counts)
+    
+    # Sort neighbours by (row, distance) and take the first of each row
+    order = np.lexsort((distances[indices], rows))
+    has_neighbors = counts > 0
+    best = indices[order[indptr[:-1][has_neighbors]]]
+    
+    predecessors = np.full(n_vertices, -9999, dtype=np.int64)
+    closer = distances[best] < distances[has_neighbors]
+    predecessors[np.flatnonzero(has_neighbors)[closer]] = best[closer]
+    return predecessors
+
+
+def calculate_geodesic_distance_heat(vertices: np.ndarray, triangles: np.ndarray,
+                                     source_vertex: int, target_vertex: Optional[int] = None,
+                                     topology: Optional[MeshTopology] = None) -> Dict[str, Any]:
+    """
+    Calculate geodesic distances from a source vertex with the heat method.
+    
+    Distances are smooth approximations of true surface distance rather than
+    shortest edge paths. The path to target_vertex follows steepest descent of
+    the distance field along mesh edges.
+    
+    Args:
+        vertices: Nx3 array of vertex coordinates
+        triangles: Mx3 array of triangle indices
+        source_vertex: Index of source vertex
+        target_vertex: Optional target vertex (if None, calculates distances to all vertices)
+        topology: Optional MeshTopology (defaults to the cached topology of the mesh)
+        
+    Returns:
+        Dictionary containing geodesic distances and paths
+    """
+    logger.info(f"Calculating heat method geodesic distances from vertex {source_vertex}")
+    
+    try:
+        if topology is None:
+            topology = MeshTopology.for_mesh(triangles, len(vertices))
+        
+        distances = HeatMethodGeodesics.for_mesh(vertices, triangles).distance(source_vertex)
         
-        # Reconstruct path if target specified
         path = None
-        if target_vertex is not None and distances[target_vertex] != float('inf'):
-            path = []
-            current = target_vertex
-            while current is not None:
-                path.append(current)
-                current = previous[current]
-            path.reverse()
+        if target_vertex is not None:
+            predecessors = descent_predecessors(distances, topology.vertex_adjacency)
+            path = reconstruct_path(predecessors, source_vertex, target_vertex)
         
-        result = {
-            'distances': distances,
+        return {
+            'distances': dict(enumerate(distances.tolist())),
             'source_vertex': source_vertex,
             'target_vertex': target_vertex,
             'path': path,
-            'path_length': distances[target_vertex] if target_vertex else None,
-            'n_vertices_processed': len(visited)
+            'path_length': float(distances[target_vertex]) if target_vertex else None,
+            'n_vertices_processed': len(distances)
         }
         
-        logger.info(f"Geodesic calculation completed, processed {len(visited)} vertices")
-        
-        return result
-        
     except Exception as e:
-        logger.error(f"Geodesic distance calculation failed: {e}")
+        logger.error(f"Heat method geodesic calculation failed: {e}")
         return {'error': str(e)}
 
 
 def calculate_geodesic_paths(vertices: np.ndarray, triangles: np.ndarray, 
-                           key_vertices: List[int]) -> Dict[str, Any]:
+                           key_vertices: List[int],
+                           topology: Optional[MeshTopology] = None,
+                           method: str = 'dijkstra') -> Dict[str, Any]:
     """
     Calculate geodesic paths between key vertices for fold line generation.
     
+    With 'dijkstra' the edge graph is built once and a single batched call
+    computes distances and predecessors from every key vertex. With 'heat'
+    all key vertices are solved together on the prefactored heat method
+    operators and paths follow steepest descent of each distance field;
+    pairs where descent stalls fall back to the Dijkstra path.
+    
     Args:
         vertices: Nx3 array of vertex coordinates
         triangles: Mx3 array of triangle indices
         key_vertices: List of important vertex indices (corners, high curvature points)
+        topology: Optional MeshTopology (defaults to the cached topology of the mesh)
+        method: Geodesic backend, one of GEODESIC_METHODS
         
     Returns:
         Dictionary containing geodesic paths between key vertices
@@ -130,22 +476,47 @@ def calculate_geodesic_paths(vertices: np.ndarray, triangles: np.ndarray,
     logger.info(f"Calculating geodesic paths between {len(key_vertices)} key vertices")
     
     try:
+        if method not in GEODESIC_METHODS:
+            raise ValueError(f"Unknown geodesic method '{method}', expected one of {GEODESIC_METHODS}")
+        
+        vertices = np.asarray(vertices, dtype=np.float64)
+        if topology is None:
+            topology = MeshTopology.for_mesh(triangles, len(vertices))
         paths_matrix = {}
         all_paths = []
         
+        dijkstra_predecessors = None
+        if method == 'heat':
+            distances = HeatMethodGeodesics.for_mesh(vertices, triangles).distances(list(key_vertices))
+            predecessors = [descent_predecessors(row, topology.vertex_adjacency) for row in distances]
+        else:
+            distances, predecessors = calculate_geodesic_distances_multi_source(
+                vertices, triangles, key_vertices, topology=topology
+            )
+            dijkstra_predecessors = predecessors
+        
         # Calculate paths between all pairs of key vertices
         for i, source in enumerate(key_vertices):
             for j, target in enumerate(key_vertices):
                 if i < j:  # Avoid duplicate paths
-                    result = calculate_geodesic_distance_dijkstra(vertices, triangles, source, target)
+                    if not np.isfinite(distances[i, target]):
+                        continue
                     
-                    if 'error' not in result and result['path'] is not None:
+                    path = reconstruct_path(predecessors[i], source, target)
+                    if path is None and dijkstra_predecessors is None:
+                        # Descent stalled in a local minimum of the heat field
+                        _, dijkstra_predecessors = calculate_geodesic_distances_multi_source(
+                            vertices, triangles, key_vertices, topology=topology
+                        )
+                    if path is None:
+                        path = reconstruct_path(dijkstra_predecessors[i], source, target)
+                    if path is not None:
                         path_info = {
                             'source': source,
                             'target': target,
-                            'path': result['path'],
-                            'length': result['path_length'],
-                            'vertices': [vertices[v].tolist() for v in result['path']]
+                            'path': path,
+                            'length': float(distances[i, target]),
+                            'vertices': vertices[path].tolist()
                         }
                         
                         paths_matrix[(source, target)] = path_info
@@ -159,7 +530,8 @@ def calculate_geodesic_paths(vertices: np.ndarray, triangles: np.ndarray,
             'paths_matrix': paths_matrix,
             'all_paths': all_paths,
             'fold_lines': fold_lines,
-            'n_paths': len(all_paths)
+            'n_paths': len(all_paths),
+            'method': method
         }
         
     except Exception as e:
@@ -192,30 +564,24 @@ def generate_fold_lines_from_paths(vertices: np.ndarray, triangles: np.ndarray,
             if len(path_vertices) < 2:
                 continue
             
-            # Analyze path curvature to determine fold type
-            path_curvatures = []
-            for i in range(1, len(path_vertices) - 1):
-                v_prev = vertices[path_vertices[i-1]]
-                v_curr = vertices[path_vertices[i]]
-                v_next = vertices[path_vertices[i+1]]
-                
-                # Calculate angle change (curvature indicator)
-                edge1 = v_curr - v_prev
-                edge2 = v_next - v_curr
-                
-                edge1_norm = np.linalg.norm(edge1)
-                edge2_norm = np.linalg.norm(edge2)
-                
-                if edge1_norm > 1e-12 and edge2_norm > 1e-12:
-                    cos_angle = np.clip(np.dot(edge1, edge2) / (edge1_norm * edge2_norm), -1, 1)
-                    angle_change = np.pi - np.arccos(cos_angle)
-                    path_curvatures.append(abs(angle_change))
-                else:
-                    path_curvatures.append(0.0)
+            # Analyze path curvature to determine fold type: turning angle at
+            # every interior path vertex
+            points = vertices[path_vertices]
+            edges = np.diff(points, axis=0)
+            edge_norms = np.linalg.norm(edges, axis=1)
+            edge1, edge2 = edges[:-1], edges[1:]
+            norm_products = edge_norms[:-1] * edge_norms[1:]
+            valid = (edge_norms[:-1] > 1e-12) & (edge_norms[1:] > 1e-12)
+            
+            cos_angle = np.ones(len(edge1))
+            cos_angle[valid] = np.clip(
+                np.einsum('ij,ij->i', edge1[valid], edge2[valid]) / norm_products[valid], -1, 1
+            )
+            path_curvatures = np.where(valid, np.abs(np.pi - np.arccos(cos_angle)), 0.0)
             
             # Determine fold line properties
-            mean_curvature = np.mean(path_curvatures) if path_curvatures else 0.0
-            max_curvature = np.max(path_curvatures) if path_curvatures else 0.0
+            mean_curvature = float(np.mean(path_curvatures)) if len(path_curvatures) else 0.0
+            max_curvature = float(np.max(path_curvatures)) if len(path_curvatures) else 0.0
             
             # Classify fold type based on curvature
             if max_curvature > 0.5:  # High curvature
@@ -238,7 +604,7 @@ def generate_fold_lines_from_paths(vertices: np.ndarray, triangles: np.ndarray,
                 'start_coord': vertices[path_vertices[0]].tolist(),
                 'end_coord': vertices[path_vertices[-1]].tolist(),
                 'path_vertices': path_vertices,
-                'path_coordinates': [vertices[v].tolist() for v in path_vertices],
+                'path_coordinates': points.tolist(),
                 'length': path_length,
                 'fold_type': fold_type,
                 'fold_angle': fold_angle,
@@ -263,7 +629,9 @@ def generate_fold_lines_from_paths(vertices: np.ndarray, triangles: np.ndarray,
 
 
 def find_key_vertices_for_folding(vertices: np.ndarray, triangles: np.ndarray, 
-                                 curvature_analysis: Dict[str, Any]) -> List[int]:
+                                 curvature_analysis: Dict[str, Any],
+                                 topology: Optional[MeshTopology] = None,
+                                 geodesic_method: Optional[str] = None) -> List[int]:
     """
     Identify key vertices that should be connected by fold lines.
     
@@ -271,6 +639,10 @@ def find_key_vertices_for_folding(vertices: np.ndarray, triangles: np.ndarray,
         vertices: Vertex coordinates
         triangles: Triangle connectivity  
         curvature_analysis: Results from mesh curvature analysis
+        topology: Optional MeshTopology (defaults to the cached topology of the mesh)
+        geodesic_method: Optional geodesic backend from GEODESIC_METHODS. When set and
+            there are more than 20 candidates, they are thinned by geodesic farthest-point
+            selection instead of Euclidean farthest-point sampling
         
     Returns:
         List of key vertex indices
@@ -293,29 +665,32 @@ def find_key_vertices_for_folding(vertices: np.ndarray, triangles: np.ndarray,
         high_curvature_vertices = np.where(vertex_curvatures > curvature_threshold)[0]
         
         # Find boundary vertices (if mesh has boundary)
-        boundary_vertices = find_boundary_vertices(triangles, n_vertices)
+        boundary_vertices = np.asarray(find_boundary_vertices(triangles, n_vertices, topology),
+                                       dtype=np.int64)
         
         # Find corner vertices (boundary vertices with high curvature)
-        corner_vertices = []
-        for vertex in boundary_vertices:
-            if vertex < len(vertex_curvatures) and vertex_curvatures[vertex] > curvature_threshold:
-                corner_vertices.append(vertex)
+        corner_vertices = boundary_vertices[vertex_curvatures[boundary_vertices] > curvature_threshold]
+        
+        # Spread boundary samples around the outline by farthest-point sampling
+        spatial_index = VertexSpatialIndex.for_mesh(vertices)
+        boundary_samples = spatial_index.farthest_point_sample(4, boundary_vertices)
         
         # Combine all key vertex types
         key_vertices.extend(high_curvature_vertices[:10])  # Limit high curvature vertices
         key_vertices.extend(corner_vertices)
-        key_vertices.extend(boundary_vertices[::max(1, len(boundary_vertices)//4)])  # Sample boundary
+        key_vertices.extend(boundary_samples)
         
         # Remove duplicates and sort
-        key_vertices = sorted(list(set(key_vertices)))
+        key_vertices = np.unique(np.asarray(key_vertices, dtype=np.int64)).tolist()
         
         # Limit total number of key vertices for performance
-        if len(key_vertices) > 20:
-            # Keep vertices with highest curvature
-            curvature_scores = [vertex_curvatures[v] if v < len(vertex_curvatures) else 0 
-                              for v in key_vertices]
-            sorted_indices = np.argsort(curvature_scores)[::-1]
-            key_vertices = [key_vertices[i] for i in sorted_indices[:20]]
+        if len(key_vertices) > 20 and geodesic_method is not None:
+            key_vertices = _geodesic_farthest_candidates(vertices, triangles, key_vertices,
+                                                         vertex_curvatures, 20, geodesic_method, topology)
+        elif len(key_vertices) > 20:
+            # Keep well-spread vertices, starting from the highest curvature one
+            start = key_vertices[int(np.argmax(vertex_curvatures[key_vertices]))]
+            key_vertices = spatial_index.farthest_point_sample(20, key_vertices, start=start)
         
         logger.info(f"Selected {len(key_vertices)} key vertices for folding analysis")
         
@@ -326,37 +701,54 @@ def find_key_vertices_for_folding(vertices: np.ndarray, triangles: np.ndarray,
         return []
 
 
-def find_boundary_vertices(triangles: np.ndarray, n_vertices: int) -> List[int]:
+def _geodesic_farthest_candidates(vertices: np.ndarray, triangles: np.ndarray, candidates: List[int],
+                                  vertex_curvatures: np.ndarray, count: int, method: str,
+                                  topology: Optional[MeshTopology]) -> List[int]:
+    """
+    Pick count candidates by farthest-point selection in geodesic distance.
+    
+    Starts from the highest-curvature candidate and repeatedly adds the candidate
+    farthest from those already chosen.
+    """
+    if method not in GEODESIC_METHODS:
+        raise ValueError(f"Unknown geodesic method '{method}', expected one of {GEODESIC_METHODS}")
+    
+    candidates = np.asarray(candidates, dtype=np.int64)
+    if method == 'heat':
+        # One query per candidate on the prefactored operators
+        distances = HeatMethodGeodesics.for_mesh(vertices, triangles).distances(list(candidates))
+    else:
+        distances, _ = calculate_geodesic_distances_multi_source(vertices, triangles, candidates,
+                                                                 topology=topology)
+    pairwise = distances[:, candidates]
+    pairwise = np.minimum(pairwise, pairwise.T)
+    
+    chosen = [int(np.argmax(vertex_curvatures[candidates]))]
+    nearest = pairwise[chosen[0]].copy()
+    while len(chosen) < count:
+        nearest[chosen] = -1.0
+        best = int(np.argmax(nearest))
+        chosen.append(best)
+        nearest = np.minimum(nearest, pairwise[best])
+    
+    return candidates[chosen].tolist()
+
+
+def find_boundary_vertices(triangles: np.ndarray, n_vertices: int,
+                           topology: Optional[MeshTopology] = None) -> List[int]:
     """
     Find vertices that lie on the boundary of the mesh.
     
     Args:
         triangles: Triangle connectivity array
         n_vertices: Total number of vertices
+        topology: Optional MeshTopology (defaults to the cached topology of the mesh)
         
     Returns:
         List of boundary vertex indices
     """
-    # Build edge adjacency count
-    edge_count = {}
+    if topology is None:
+        topology = MeshTopology.for_mesh(triangles, n_vertices)
     
-    for triangle in triangles:
-        for i in range(3):
-            v1 = triangle[i]
-            v2 = triangle[(i + 1) % 3]
-            
-            # Create canonical edge (smaller index first)
-            edge = tuple(sorted([v1, v2]))
-            
-            if edge in edge_count:
-                edge_count[edge] += 1
-            else:
-                edge_count[edge] = 1
-    
-    # Find boundary edges (appear only once)
-    boundary_vertices = set()
-    for edge, count in edge_count.items():
-        if count == 1:
-            boundary_vertices.update(edge)
-    
-    return sorted(list(boundary_vertices))
\ No newline at end of file
+    # Boundary edges appear in only one triangle
+    return topology.boundary_vertices.tolist()
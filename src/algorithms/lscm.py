@@ -6,12 +6,28 @@ for 3D surface unfolding with minimal distortion.
 import numpy as np
 import math
 import logging
+import os
 import sys
-from typing import List, Tuple, Dict, Any, Optional, Union
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import List, Tuple, Dict, Any, Generator, Iterator, Optional
 from scipy import sparse
-from scipy.sparse.linalg import spsolve
+from scipy.sparse.linalg import (
+    splu, lsqr, lsmr, cg, eigsh, onenormest, LinearOperator, ArpackNoConvergence,
+    norm as sparse_norm
+)
+from scipy.linalg import lu_factor, lu_solve
+from scipy.spatial import cKDTree
 import cmath
 
+from .mesh_utils import cluster_decimate_mesh
+from .preconditioners import IncompleteCholesky
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,6 +49,26 @@ class LSCMSolver:
         BEND_RADIUS = 'bend_radius'
         SURFACE_ROUGHNESS = 'surface_roughness'
     
+    # Regularization added to the normal equations to improve conditioning
+    REGULARIZATION = 1e-8
+    
+    # Linear solver backends and preconditioners accepted by solve_lscm
+    SOLVER_BACKENDS = ('direct', 'lsqr', 'lsmr', 'cg')
+    PRECONDITIONERS = (None, 'jacobi', 'ic')
+    
+    # Shared cache of assembled systems and factorizations, keyed by mesh hash
+    # and manufacturing constraints so repeated unfolds of the same mesh reuse them
+    max_cached_systems = 8
+    max_cached_pin_sets = 16
+    # Pin sets touching more unknowns than this are refactorized instead of
+    # applied as a low-rank update
+    max_pin_update_rank = 64
+    # Right-hand sides solved at once while forming a pin-set capacitance matrix
+    _pin_solve_chunk = 16
+    _system_cache: 'OrderedDict[Tuple[str, str], Dict[str, Any]]' = OrderedDict()
+    _cache_lock = threading.Lock()
+    _cache_stats = {'hits': 0, 'misses': 0, 'pin_hits': 0, 'pin_misses': 0}
+    
     def __init__(self, vertices: np.ndarray, triangles: np.ndarray):
         """
         Initialize LSCM solver with robust mesh data validation.
@@ -75,9 +111,40 @@ class LSCMSolver:
         if np.any(np.isnan(vertices)) or np.any(np.isinf(vertices)):
             raise ValueError("Vertices contain NaN or infinite values")
         
+        self._mesh_hash = None
+        
         logger.info(f"LSCM solver initialized: {self.n_vertices} vertices, {self.n_triangles} valid triangles")
     
-    def build_conformal_system(self) -> sparse.csr_matrix:
+    @property
+    def mesh_hash(self) -> str:
+        """Content hash of the validated vertex and triangle arrays."""
+        if self._mesh_hash is None:
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(np.ascontiguousarray(self.vertices).tobytes())
+            digest.update(np.ascontiguousarray(self.triangles, dtype=np.int32).tobytes())
+            digest.update(f"{self.vertices.shape}{self.triangles.shape}".encode())
+            self._mesh_hash = digest.hexdigest()
+        return self._mesh_hash
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached systems and factorizations and reset statistics."""
+        with cls._cache_lock:
+            cls._system_cache.clear()
+            for key in cls._cache_stats:
+                cls._cache_stats[key] = 0
+    
+    @classmethod
+    def cache_info(cls) -> Dict[str, Any]:
+        """Return factorization cache statistics."""
+        with cls._cache_lock:
+            return {
+                **cls._cache_stats,
+                'entries': len(cls._system_cache),
+                'max_entries': cls.max_cached_systems
+            }
+    
+    def build_conformal_system(self, vectorized: bool = True) -> sparse.csr_matrix:
         """
         Build the sparse linear system for LSCM conformal constraints.
         
@@ -85,6 +152,87 @@ class LSCMSolver:
         Cauchy-Riemann equations for conformal mapping.
         The system has 2*n_vertices unknowns (u and v coordinates for each vertex).
         
+        Args:
+            vectorized: Assemble all triangles at once with NumPy (default). When
+                False, the per-triangle reference loop is used instead.
+        
+        Returns:
+            Sparse coefficient matrix A of size (2*n_triangles, 2*n_vertices)
+        """
+        if not vectorized:
+            return self._build_conformal_system_reference()
+        
+        logger.info("Building LSCM conformal constraint system (vectorized)...")
+        
+        tri = self.triangles.astype(np.int64)
+        p0 = self.vertices[tri[:, 0]]
+        e1 = self.vertices[tri[:, 1]] - p0  # Edges from p0 to p1
+        e2 = self.vertices[tri[:, 2]] - p0  # Edges from p0 to p2
+        
+        # Face normals and doubled areas for every triangle at once
+        normals = np.cross(e1, e2)
+        double_areas = np.linalg.norm(normals, axis=1)
+        
+        # Mask degenerate triangles instead of skipping them one by one;
+        # their rows stay empty exactly as in the reference loop
+        valid = double_areas >= 1e-12
+        n_degenerate = int(np.count_nonzero(~valid))
+        if n_degenerate:
+            logger.warning(f"{n_degenerate} degenerate triangles detected, skipping")
+        
+        tri_idx = np.flatnonzero(valid)
+        tri = tri[valid]
+        e1 = e1[valid]
+        e2 = e2[valid]
+        normals = normals[valid] / double_areas[valid, None]
+        
+        # Local 2D frames: u-axis along e1, v-axis orthogonal in the triangle plane
+        e1_len = np.linalg.norm(e1, axis=1)
+        u_axis = e1 / e1_len[:, None]
+        v_axis = np.cross(normals, u_axis)
+        
+        # Projected edges (e1_2d = [|e1|, 0], e2_2d = [e2.u, e2.v])
+        e1x = e1_len
+        e1y = np.zeros_like(e1_len)
+        e2x = np.einsum('ij,ij->i', e2, u_axis)
+        e2y = np.einsum('ij,ij->i', e2, v_axis)
+        
+        # Complex weights W_j = (x_l - x_k) + i(y_l - y_k) over the cyclic vertex
+        # order (j, k, l), scaled by 1/sqrt(2*area); sum_j W_j (u_j + i v_j) = 0
+        # is the discrete Cauchy-Riemann equation for the triangle
+        scale = 1.0 / np.sqrt(double_areas[valid])
+        w_real = np.column_stack([e2x - e1x, -e2x, e1x]) * scale[:, None]
+        w_imag = np.column_stack([e2y - e1y, -e2y, e1y]) * scale[:, None]
+        
+        u_cols = 2 * tri
+        v_cols = 2 * tri + 1
+        
+        # Real part: sum(Wr*u - Wi*v) = 0, imaginary part: sum(Wi*u + Wr*v) = 0
+        blocks = [
+            (2 * tri_idx, u_cols, w_real),
+            (2 * tri_idx, v_cols, -w_imag),
+            (2 * tri_idx + 1, u_cols, w_imag),
+            (2 * tri_idx + 1, v_cols, w_real),
+        ]
+        
+        row_indices = np.concatenate([np.repeat(rows, 3) for rows, _, _ in blocks])
+        col_indices = np.concatenate([cols.ravel() for _, cols, _ in blocks])
+        data = np.concatenate([coeffs.ravel() for _, _, coeffs in blocks])
+        nonzero = data != 0.0
+        
+        matrix_shape = (2 * self.n_triangles, 2 * self.n_vertices)
+        A = sparse.csr_matrix((data[nonzero], (row_indices[nonzero], col_indices[nonzero])),
+                              shape=matrix_shape)
+        
+        logger.info(f"Built conformal system: {A.shape[0]} equations, {A.shape[1]} unknowns (2D coords), {A.nnz} non-zeros")
+        return A
+    
+    def _build_conformal_system_reference(self) -> sparse.csr_matrix:
+        """
+        Reference per-triangle implementation of build_conformal_system.
+        
+        Kept for validation and benchmarking of the vectorized assembly.
+        
         Returns:
             Sparse coefficient matrix A of size (2*n_triangles, 2*n_vertices)
         """
@@ -130,36 +278,25 @@ class LSCMSolver:
             # Get vertex indices for this triangle
             v0_idx, v1_idx, v2_idx = triangle
             
-            # Coefficients for conformal constraint matrix
-            # Based on discrete Cauchy-Riemann equations: du/dx = dv/dy, du/dy = -dv/dx
-            
-            # First equation: conformal constraint for u-coordinates
-            row = 2 * tri_idx
-            # Contributions to u-coordinates (even indices: 2*vertex_idx)
-            if abs(e2_2d[1]) > 1e-12:
-                row_indices.extend([row, row, row])
-                col_indices.extend([2*v0_idx, 2*v1_idx, 2*v2_idx])  # u-coordinates
-                data.extend([e2_2d[1], e1_2d[1] - e2_2d[1], -e1_2d[1]])
-            
-            # Contributions to v-coordinates (odd indices: 2*vertex_idx + 1)
-            if abs(e2_2d[0]) > 1e-12:
-                row_indices.extend([row, row, row])
-                col_indices.extend([2*v0_idx+1, 2*v1_idx+1, 2*v2_idx+1])  # v-coordinates
-                data.extend([e2_2d[0], e1_2d[0] - e2_2d[0], -e1_2d[0]])
-            
-            # Second equation: conformal constraint for v-coordinates
-            row = 2 * tri_idx + 1
-            # Contributions to u-coordinates (negative of v-constraint)
-            if abs(e2_2d[0]) > 1e-12:
-                row_indices.extend([row, row, row])
-                col_indices.extend([2*v0_idx, 2*v1_idx, 2*v2_idx])  # u-coordinates
-                data.extend([-e2_2d[0], -e1_2d[0] + e2_2d[0], e1_2d[0]])
-            
-            # Contributions to v-coordinates 
-            if abs(e2_2d[1]) > 1e-12:
-                row_indices.extend([row, row, row])
-                col_indices.extend([2*v0_idx+1, 2*v1_idx+1, 2*v2_idx+1])  # v-coordinates
-                data.extend([e2_2d[1], e1_2d[1] - e2_2d[1], -e1_2d[1]])
+            # Complex weights W_j = (x_l - x_k) + i(y_l - y_k) for the local
+            # coordinates (0, 0), e1_2d, e2_2d, scaled by 1/sqrt(2*area)
+            scale = 1.0 / math.sqrt(2.0 * area_2d)
+            w_real = np.array([e2_2d[0] - e1_2d[0], -e2_2d[0], e1_2d[0]]) * scale
+            w_imag = np.array([e2_2d[1] - e1_2d[1], -e2_2d[1], e1_2d[1]]) * scale
+            u_cols = [2*v0_idx, 2*v1_idx, 2*v2_idx]
+            v_cols = [2*v0_idx+1, 2*v1_idx+1, 2*v2_idx+1]
+            
+            # First equation (real part): sum(Wr*u - Wi*v) = 0
+            # Second equation (imaginary part): sum(Wi*u + Wr*v) = 0
+            for row, cols, coeffs in ((2 * tri_idx, u_cols, w_real),
+                                      (2 * tri_idx, v_cols, -w_imag),
+                                      (2 * tri_idx + 1, u_cols, w_imag),
+                                      (2 * tri_idx + 1, v_cols, w_real)):
+                for col, value in zip(cols, coeffs):
+                    if value != 0.0:
+                        row_indices.append(row)
+                        col_indices.append(col)
+                        data.append(value)
         
         # Build sparse matrix with proper dimensions for 2D coordinates
         matrix_shape = (2 * self.n_triangles, 2 * self.n_vertices)
@@ -204,28 +341,50 @@ class LSCMSolver:
         # Combine original system with constraints
         extended_shape = (A.shape[0] + 2*n_constraints, A.shape[1])
         
-        # Convert A to lil_matrix for efficient modification
-        A_extended = sparse.lil_matrix(extended_shape)
-        A_extended[:A.shape[0], :] = A
-        
-        # Add constraint equations
-        for row, col, val in constraint_data:
-            A_extended[row, col] = val
+        # Stack the constraint rows under A in one pass instead of copying A into LIL format
+        rows, cols, vals = (np.array(column) for column in zip(*constraint_data))
+        constraint_block = sparse.coo_matrix(
+            (vals, (rows - A.shape[0], cols)), shape=(2*n_constraints, A.shape[1])
+        )
+        A_extended = sparse.vstack([A, constraint_block], format='csr')
         
         # Create extended RHS vector
         rhs_extended = np.zeros(extended_shape[0])
         rhs_extended[A.shape[0]:] = rhs_values
         
-        return A_extended.tocsr(), rhs_extended
+        return A_extended, rhs_extended
     
     def solve_lscm(self, boundary_constraints: Optional[List[Tuple[int, float, float]]] = None, 
-                    manufacturing_constraints: Optional[Dict[str, Any]] = None) -> Tuple[np.ndarray, Dict[str, Any]]:
+                    manufacturing_constraints: Optional[Dict[str, Any]] = None,
+                    use_cache: bool = True,
+                    solver: str = 'direct',
+                    tol: float = 1e-8,
+                    max_iterations: Optional[int] = None,
+                    preconditioner: Optional[str] = 'jacobi',
+                    initial_guess: Optional[np.ndarray] = None,
+                    estimate_condition: bool = True) -> Tuple[np.ndarray, Dict[str, Any]]:
         """
         Advanced LSCM system solver with comprehensive robust handling.
         
         Args:
             boundary_constraints: Optional list of (vertex_index, u, v) constraints
             manufacturing_constraints: Optional dictionary of manufacturing-specific constraints
+            use_cache: Reuse the assembled system and sparse factorization from a previous
+                solve of the same mesh. New pin values only need triangular solves, and a
+                new pin set is applied as a low-rank update of the cached factorization.
+                Only used by the direct backend.
+            solver: Linear solver backend. 'direct' factorizes A^T A; 'lsqr' and 'lsmr'
+                work on A without forming the normal equations; 'cg' runs conjugate
+                gradients on the normal equations. The iterative backends keep memory
+                linear in the mesh size for very large meshes.
+            tol: Convergence tolerance for the iterative backends
+            max_iterations: Iteration limit for the iterative backends (None = solver default)
+            preconditioner: Preconditioner for the 'cg' backend: 'jacobi', 'ic'
+                (zero fill-in incomplete Cholesky factor of A^T A) or None
+            initial_guess: Optional Nx2 UV array used as a warm start by the iterative backends
+            estimate_condition: Estimate the condition number of the normal equations.
+                The iterative backends pay a few extra Jacobi-preconditioned CG solves
+                for it. Disable for latency-sensitive calls; condition_number is then -1.
             
         Returns:
             UV coordinates and comprehensive solution information
@@ -237,41 +396,30 @@ class LSCMSolver:
             if self.n_vertices < 3 or self.n_triangles < 1:
                 raise ValueError("Insufficient vertices or triangles for unfolding")
             
-            # Ensure unique and valid triangles
-            unique_triangles = np.unique(self.triangles, axis=0)
-            valid_triangles = unique_triangles[np.all(unique_triangles < self.n_vertices, axis=1)]
+            if solver not in self.SOLVER_BACKENDS:
+                raise ValueError(f"Unknown solver backend '{solver}', expected one of {self.SOLVER_BACKENDS}")
             
-            if len(valid_triangles) == 0:
-                raise ValueError("No valid triangles found in mesh")
+            start_time = time.perf_counter()
             
-            # Build the conformal constraint system with enhanced stability
-            A = self.build_conformal_system()
-            
-            # Sanity check the system matrix
-            if A.shape[0] == 0 or A.shape[1] == 0:
-                raise ValueError("Unable to construct conformal system matrix")
-            
-            # Apply boundary constraints with robust handling
-            A_constrained, rhs = self.apply_boundary_constraints(A, boundary_constraints or [])
-            
-            # Incorporate manufacturing constraints
-            if manufacturing_constraints:
-                A_constrained, rhs = self._apply_manufacturing_constraints(
-                    A_constrained, rhs, manufacturing_constraints
+            if solver != 'direct':
+                solution, residual_norm, AtA, apply_inverse, solver_info = self._solve_iterative(
+                    boundary_constraints or [], manufacturing_constraints, solver,
+                    tol, max_iterations, preconditioner, initial_guess
                 )
+                cache_info = {'enabled': False}
+            elif use_cache:
+                solution, residual_norm, AtA, apply_inverse, cache_info = self._solve_cached(
+                    boundary_constraints or [], manufacturing_constraints
+                )
+                solver_info = {'backend': 'direct', 'factorization': 'splu'}
+            else:
+                solution, residual_norm, AtA, apply_inverse = self._solve_direct(
+                    boundary_constraints or [], manufacturing_constraints
+                )
+                cache_info = {'enabled': False}
+                solver_info = {'backend': 'direct', 'factorization': 'splu'}
             
-            # Solve the least squares system with regularization
-            AtA = A_constrained.T @ A_constrained
-            Atrhs = A_constrained.T @ rhs
-            
-            # Add small regularization to improve conditioning
-            regularization = 1e-8 * sparse.eye(AtA.shape[0])
-            AtA = AtA + regularization
-            
-            logger.info("Solving sparse linear system with enhanced stability...")
-            
-            # Use more robust solving method
-            solution = spsolve(AtA, Atrhs)
+            solver_info['total_time'] = time.perf_counter() - start_time
             
             # Robust UV coordinate generation
             uv_coords = solution.reshape(-1, 2)
@@ -288,18 +436,23 @@ class LSCMSolver:
                     uv_coords = uv_coords[:self.n_vertices]
             
             # Enhanced solution quality metrics
-            residual_norm = np.linalg.norm(A_constrained @ solution - rhs)
-            condition_number = np.linalg.cond(AtA.toarray()) if AtA.shape[0] < 1000 else -1
+            if estimate_condition:
+                condition_number, condition_info = self._estimate_condition_number(AtA, apply_inverse)
+            else:
+                condition_number, condition_info = -1, {'method': 'disabled'}
             
             # Comprehensive solution information
             solution_info = {
                 'residual_norm': residual_norm,
                 'condition_number': condition_number,
+                'condition_estimate': condition_info,
                 'n_vertices': self.n_vertices,
                 'n_triangles': self.n_triangles,
                 'n_constraints': len(boundary_constraints) if boundary_constraints else 0,
                 'complex_representation': False,  # Now direct 2D representation
-                'manufacturing_constraints': bool(manufacturing_constraints)
+                'manufacturing_constraints': bool(manufacturing_constraints),
+                'cache': cache_info,
+                'solver': solver_info
             }
             
             logger.info(f"Advanced LSCM solution completed - residual: {residual_norm:.2e}")
@@ -307,12 +460,486 @@ class LSCMSolver:
             
         except Exception as e:
             logger.error(f"Advanced LSCM solution failed: {e}")
-            raise ValueError(f"LSCM unfolding error: {str(e)}")
+            raise ValueError(f"LSCM unfolding error: {str(e)}") from e
+    
+    def solve_multilevel(self, boundary_constraints: Optional[List[Tuple[int, float, float]]] = None,
+                         manufacturing_constraints: Optional[Dict[str, Any]] = None,
+                         levels: int = 3,
+                         coarsening_ratio: float = 0.25,
+                         min_coarse_vertices: int = 200,
+                         tol: float = 1e-8,
+                         max_iterations: Optional[int] = None,
+                         estimate_condition: bool = False) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Coarse-to-fine LSCM solve for dense meshes.
+        
+        The mesh is repeatedly decimated by vertex clustering and each level is
+        linked to the next finer one by a linear-precision interpolation operator P.
+        The LSCM system is projected onto every level (P^T N P), the coarsest level
+        is solved directly, and its UVs are prolonged to the fine mesh as the
+        initial guess for conjugate gradients on the fine system. The hierarchy is
+        also used as a V-cycle preconditioner, which keeps the iteration count
+        roughly independent of mesh size.
+        
+        Args:
+            boundary_constraints: Optional list of (vertex_index, u, v) constraints
+            manufacturing_constraints: Optional dictionary of manufacturing-specific constraints
+            levels: Total number of levels including the fine mesh (1 = direct solve)
+            coarsening_ratio: Fraction of vertices kept from one level to the next
+            min_coarse_vertices: Stop coarsening below this many vertices
+            tol: Relative residual tolerance for the fine-level CG solve
+            max_iterations: CG iteration limit (None = solver default)
+            estimate_condition: Estimate the condition number of the fine system
+            
+        Returns:
+            UV coordinates and solution information; per-level sizes and timings
+            are reported under 'multilevel'
+        """
+        if levels < 1:
+            raise ValueError(f"levels must be at least 1, got {levels}")
+        if not 0.0 < coarsening_ratio < 1.0:
+            raise ValueError(f"coarsening_ratio must be in (0, 1), got {coarsening_ratio}")
+        
+        logger.info(f"Solving LSCM system with up to {levels} levels...")
+        start_time = time.perf_counter()
+        
+        try:
+            A_constrained, rhs = self._build_constrained_system(boundary_constraints or [],
+                                                                manufacturing_constraints)
+            N = (A_constrained.T @ A_constrained
+                 + self.REGULARIZATION * sparse.eye(A_constrained.shape[1])).tocsr()
+            Atrhs = A_constrained.T @ rhs
+            assembly_time = time.perf_counter() - start_time
+            
+            hierarchy = _MultilevelHierarchy(N, self.vertices, self.triangles, levels,
+                                             coarsening_ratio, min_coarse_vertices)
+            
+            # Coarse solve prolonged to the fine mesh as the initial guess
+            coarse_start = time.perf_counter()
+            x0 = hierarchy.coarse_solution(Atrhs)
+            coarse_time = time.perf_counter() - coarse_start
+            
+            iteration_count = [0]
+            
+            def count_iteration(_):
+                iteration_count[0] += 1
+            
+            solve_start = time.perf_counter()
+            if hierarchy.n_levels > 1:
+                M = LinearOperator(N.shape, matvec=hierarchy.vcycle, dtype=np.float64)
+                solution, status = cg(N, Atrhs, x0=x0, rtol=tol, maxiter=max_iterations,
+                                      M=M, callback=count_iteration)
+            else:
+                solution, status = x0, 0
+            solve_time = time.perf_counter() - solve_start
+            
+            if status != 0:
+                logger.warning(f"Multilevel CG did not converge within {iteration_count[0]} iterations")
+            
+            uv_coords = solution.reshape(-1, 2)
+            residual_norm = float(np.linalg.norm(A_constrained @ solution - rhs))
+            
+            if estimate_condition:
+                if hierarchy.n_levels == 1:
+                    apply_inverse = hierarchy.coarse_solve
+                else:
+                    apply_inverse = _cg_inverse(N, M)
+                condition_number, condition_info = self._estimate_condition_number(N, apply_inverse)
+            else:
+                condition_number, condition_info = -1, {'method': 'disabled'}
+            
+            level_info = hierarchy.level_info
+            level_info[0]['setup_time'] += assembly_time
+            level_info[-1]['solve_time'] += coarse_time
+            level_info[0]['solve_time'] += solve_time
+            level_info[0]['iterations'] = iteration_count[0]
+            total_time = time.perf_counter() - start_time
+            
+            solution_info = {
+                'residual_norm': residual_norm,
+                'condition_number': condition_number,
+                'condition_estimate': condition_info,
+                'n_vertices': self.n_vertices,
+                'n_triangles': self.n_triangles,
+                'n_constraints': len(boundary_constraints) if boundary_constraints else 0,
+                'complex_representation': False,
+                'manufacturing_constraints': bool(manufacturing_constraints),
+                'cache': {'enabled': False},
+                'solver': {
+                    'backend': 'multilevel' if hierarchy.n_levels > 1 else 'direct',
+                    'tolerance': tol,
+                    'warm_start': hierarchy.n_levels > 1,
+                    'setup_time': assembly_time + hierarchy.setup_time,
+                    'solve_time': coarse_time + solve_time,
+                    'iterations': iteration_count[0],
+                    'stop_reason': int(status),
+                    'converged': status == 0,
+                    'total_time': total_time
+                },
+                'multilevel': {
+                    'n_levels': hierarchy.n_levels,
+                    'coarsening_ratio': coarsening_ratio,
+                    'levels': level_info,
+                    'total_time': total_time
+                }
+            }
+            
+            logger.info(f"Multilevel LSCM solution completed in {iteration_count[0]} iterations "
+                        f"- residual: {residual_norm:.2e}")
+            return uv_coords, solution_info
+            
+        except Exception as e:
+            logger.error(f"Multilevel LSCM solution failed: {e}")
+            raise ValueError(f"LSCM unfolding error: {str(e)}") from e
+    
+    def _build_unpinned_system(self, manufacturing_constraints: Optional[Dict[str, Any]]) -> sparse.csr_matrix:
+        """
+        Build the conformal system with manufacturing rows but without pin rows.
+        
+        Args:
+            manufacturing_constraints: Optional dictionary of manufacturing-specific constraints
+            
+        Returns:
+            Sparse coefficient matrix whose right-hand side is all zeros
+        """
+        A = self.build_conformal_system()
+        
+        # Sanity check the system matrix
+        if A.shape[0] == 0 or A.shape[1] == 0:
+            raise ValueError("Unable to construct conformal system matrix")
+        
+        if manufacturing_constraints:
+            A, _ = self._apply_manufacturing_constraints(A, np.zeros(A.shape[0]), manufacturing_constraints)
+        
+        return A.tocsr()
+    
+    def _build_constrained_system(self, boundary_constraints: List[Tuple[int, float, float]],
+                                  manufacturing_constraints: Optional[Dict[str, Any]]):
+        """
+        Build the full least-squares system including pin and manufacturing rows.
+        
+        Returns:
+            Tuple of (sparse coefficient matrix, right-hand side vector)
+        """
+        # Build the conformal constraint system with enhanced stability
+        A = self.build_conformal_system()
+        
+        # Sanity check the system matrix
+        if A.shape[0] == 0 or A.shape[1] == 0:
+            raise ValueError("Unable to construct conformal system matrix")
+        
+        # Apply boundary constraints with robust handling
+        A_constrained, rhs = self.apply_boundary_constraints(A, boundary_constraints)
+        
+        # Incorporate manufacturing constraints
+        if manufacturing_constraints:
+            A_constrained, rhs = self._apply_manufacturing_constraints(
+                A_constrained, rhs, manufacturing_constraints
+            )
+        
+        return A_constrained.tocsr(), rhs
+    
+    def _solve_direct(self, boundary_constraints: List[Tuple[int, float, float]],
+                      manufacturing_constraints: Optional[Dict[str, Any]]):
+        """
+        Assemble and solve the regularized normal equations from scratch.
+        
+        Returns:
+            Tuple of (solution vector, residual norm, AtA, callable applying AtA^-1)
+        """
+        A_constrained, rhs = self._build_constrained_system(boundary_constraints, manufacturing_constraints)
+        
+        # Solve the least squares system with regularization
+        AtA = A_constrained.T @ A_constrained
+        Atrhs = A_constrained.T @ rhs
+        
+        # Add small regularization to improve conditioning
+        regularization = self.REGULARIZATION * sparse.eye(AtA.shape[0])
+        AtA = AtA + regularization
+        
+        logger.info("Solving sparse linear system with enhanced stability...")
+        
+        # Use more robust solving method; the factorization is kept for the
+        # condition estimate
+        factor = splu(AtA.tocsc())
+        solution = factor.solve(Atrhs)
+        
+        residual_norm = np.linalg.norm(A_constrained @ solution - rhs)
+        return solution, residual_norm, AtA, factor.solve
+    
+    def _solve_iterative(self, boundary_constraints: List[Tuple[int, float, float]],
+                         manufacturing_constraints: Optional[Dict[str, Any]], backend: str,
+                         tol: float, max_iterations: Optional[int], preconditioner: Optional[str],
+                         initial_guess: Optional[np.ndarray]):
+        """
+        Solve the regularized least-squares problem with an iterative backend.
+        
+        LSQR/LSMR minimize ||A x - b||^2 + reg*||x||^2 directly on A (damp = sqrt(reg)).
+        CG solves the equivalent normal equations (A^T A + reg*I) x = A^T b; with the
+        Jacobi preconditioner A^T A is only applied matrix-free.
+        
+        Returns:
+            Tuple of (solution vector, residual norm, AtA operator, callable applying an
+            approximate AtA^-1 by preconditioned CG, solver info)
+        """
+        if preconditioner not in self.PRECONDITIONERS:
+            raise ValueError(f"Unknown preconditioner '{preconditioner}', expected one of {self.PRECONDITIONERS}")
+        
+        setup_start = time.perf_counter()
+        A_constrained, rhs = self._build_constrained_system(boundary_constraints, manufacturing_constraints)
+        n_unknowns = A_constrained.shape[1]
+        
+        x0 = None
+        if initial_guess is not None:
+            x0 = np.asarray(initial_guess, dtype=np.float64).reshape(-1)
+            if x0.size != n_unknowns:
+                raise ValueError(f"Initial guess must contain {self.n_vertices} UV pairs, got {x0.size // 2}")
+        
+        # Matrix-free normal-equations operator, also used for the condition estimate
+        AtA = LinearOperator(
+            (n_unknowns, n_unknowns),
+            matvec=lambda x: A_constrained.T @ (A_constrained @ x) + self.REGULARIZATION * x,
+            dtype=np.float64
+        )
+        AtA_diag = np.asarray(A_constrained.multiply(A_constrained).sum(axis=0)).ravel()
+        AtA_diag += self.REGULARIZATION
+        jacobi = LinearOperator((n_unknowns, n_unknowns), matvec=lambda x: x / AtA_diag,
+                                dtype=np.float64)
+        
+        solver_info = {'backend': backend, 'tolerance': tol, 'warm_start': x0 is not None}
+        
+        if backend in ('lsqr', 'lsmr'):
+            damp = math.sqrt(self.REGULARIZATION)
+            solver_info['setup_time'] = time.perf_counter() - setup_start
+            
+            solve_start = time.perf_counter()
+            if backend == 'lsqr':
+                result = lsqr(A_constrained, rhs, damp=damp, atol=tol, btol=tol,
+                              iter_lim=max_iterations, x0=x0)
+            else:
+                result = lsmr(A_constrained, rhs, damp=damp, atol=tol, btol=tol,
+                              maxiter=max_iterations, x0=x0)
+            solution, stop_reason, iterations = result[0], int(result[1]), int(result[2])
+            solver_info['solve_time'] = time.perf_counter() - solve_start
+            solver_info['iterations'] = iterations
+            solver_info['stop_reason'] = stop_reason
+            # Stop reason 7 means the iteration limit was reached for both solvers
+            solver_info['converged'] = stop_reason != 7
+        else:
+            if preconditioner == 'ic':
+                operator = (A_constrained.T @ A_constrained
+                            + self.REGULARIZATION * sparse.eye(n_unknowns)).tocsc()
+                M = IncompleteCholesky(operator).as_linear_operator()
+            else:
+                operator = AtA
+                M = jacobi if preconditioner == 'jacobi' else None
+            
+            Atrhs = A_constrained.T @ rhs
+            solver_info['preconditioner'] = preconditioner
+            solver_info['setup_time'] = time.perf_counter() - setup_start
+            
+            iteration_count = [0]
+            
+            def count_iteration(_):
+                iteration_count[0] += 1
+            
+            solve_start = time.perf_counter()
+            solution, status = cg(operator, Atrhs, x0=x0, rtol=tol, maxiter=max_iterations,
+                                  M=M, callback=count_iteration)
+            solver_info['solve_time'] = time.perf_counter() - solve_start
+            solver_info['iterations'] = iteration_count[0]
+            solver_info['stop_reason'] = int(status)
+            solver_info['converged'] = status == 0
+        
+        if not solver_info['converged']:
+            logger.warning(f"{backend} did not converge within {solver_info['iterations']} iterations")
+        
+        residual_norm = float(np.linalg.norm(A_constrained @ solution - rhs))
+        # Both preconditioners are symmetric positive definite, so the CG
+        # estimate reuses the one the solve used
+        apply_inverse = _cg_inverse(AtA, M if backend == 'cg' and M is not None else jacobi)
+        return solution, residual_norm, AtA, apply_inverse, solver_info
+    
+    def _solve_cached(self, boundary_constraints: List[Tuple[int, float, float]],
+                      manufacturing_constraints: Optional[Dict[str, Any]]):
+        """
+        Solve using the shared system/factorization cache.
+        
+        The factorized matrix is N = A^T A + reg*I for the unpinned system. Pins add
+        the diagonal term U U^T (U selects the pinned u/v unknowns), which is applied
+        with the Woodbury identity. Only the k x k capacitance matrix I + U^T N^-1 U
+        (k = 2*n_pins) is cached per pin set; forming it costs k solves for a new pin
+        set, and each later solve needs one extra solve with the cached factor.
+        
+        Returns:
+            Tuple of (solution vector, residual norm, AtA, callable applying AtA^-1, cache info)
+        """
+        cls = type(self)
+        key = (self.mesh_hash, repr(sorted((manufacturing_constraints or {}).items())))
+        
+        with cls._cache_lock:
+            entry = cls._system_cache.get(key)
+            if entry is not None:
+                cls._system_cache.move_to_end(key)
+                cls._cache_stats['hits'] += 1
+            else:
+                cls._cache_stats['misses'] += 1
+        system_hit = entry is not None
+        
+        if entry is None:
+            A = self._build_unpinned_system(manufacturing_constraints)
+            N = (A.T @ A + self.REGULARIZATION * sparse.eye(A.shape[1])).tocsc()
+            logger.info("Factorizing LSCM normal equations...")
+            entry = {
+                'A': A,
+                'N': N,
+                'factor': splu(N),
+                'pin_updates': OrderedDict(),
+                'lock': threading.Lock()
+            }
+            with cls._cache_lock:
+                cls._system_cache[key] = entry
+                while len(cls._system_cache) > cls.max_cached_systems:
+                    cls._system_cache.popitem(last=False)
+        
+        A = entry['A']
+        N = entry['N']
+        factor = entry['factor']
+        n_unknowns = A.shape[1]
+        
+        if boundary_constraints:
+            pins = np.array([(idx, u, v) for idx, u, v in boundary_constraints], dtype=np.float64)
+            pin_vertices = pins[:, 0].astype(np.int64)
+            if np.any(pin_vertices < 0) or np.any(pin_vertices >= self.n_vertices):
+                raise IndexError("Boundary constraint vertex index out of range")
+            dofs = np.column_stack([2 * pin_vertices, 2 * pin_vertices + 1]).ravel()
+            values = pins[:, 1:].ravel()
+        else:
+            dofs = np.zeros(0, dtype=np.int64)
+            values = np.zeros(0)
+        
+        b = np.zeros(n_unknowns)
+        np.add.at(b, dofs, values)
+        
+        update = None
+        pin_hit = True
+        if len(dofs):
+            pin_key = dofs.tobytes()
+            with entry['lock']:
+                update = entry['pin_updates'].get(pin_key)
+                if update is not None:
+                    entry['pin_updates'].move_to_end(pin_key)
+            
+            if update is None:
+                pin_hit = False
+                if len(dofs) <= cls.max_pin_update_rank:
+                    # Only the rows of N^-1 U at the pinned unknowns are kept, so
+                    # the dense n x k block never has to be held at once
+                    capacitance = np.eye(len(dofs))
+                    for start in range(0, len(dofs), cls._pin_solve_chunk):
+                        columns = np.arange(start, min(start + cls._pin_solve_chunk, len(dofs)))
+                        U = np.zeros((n_unknowns, len(columns)))
+                        U[dofs[columns], np.arange(len(columns))] = 1.0
+                        capacitance[:, columns] += factor.solve(U)[dofs]
+                    update = ('woodbury', lu_factor(capacitance), None)
+                else:
+                    pin_diag = sparse.csc_matrix((np.ones(len(dofs)), (dofs, dofs)), shape=N.shape)
+                    update = ('refactor', splu((N + pin_diag).tocsc()), None)
+                with entry['lock']:
+                    entry['pin_updates'][pin_key] = update
+                    while len(entry['pin_updates']) > cls.max_cached_pin_sets:
+                        entry['pin_updates'].popitem(last=False)
+            
+            with cls._cache_lock:
+                cls._cache_stats['pin_hits' if pin_hit else 'pin_misses'] += 1
+        
+        def apply_inverse(rhs_vectors):
+            if update is None:
+                return factor.solve(rhs_vectors)
+            method, first, second = update
+            if method == 'refactor':
+                return first.solve(rhs_vectors)
+            y = factor.solve(rhs_vectors)
+            correction = np.zeros_like(y)
+            np.add.at(correction, dofs, lu_solve(first, y[dofs]))
+            return y - factor.solve(correction)
+        
+        solution = apply_inverse(b)
+        
+        residual_norm = float(np.sqrt(
+            np.sum((A @ solution) ** 2) + np.sum((solution[dofs] - values) ** 2)
+        ))
+        
+        AtA = N + sparse.csc_matrix((np.ones(len(dofs)), (dofs, dofs)), shape=N.shape)
+        
+        cache_info = {
+            'enabled': True,
+            'hit': system_hit,
+            'pin_update_hit': pin_hit,
+            'mesh_hash': self.mesh_hash,
+            **type(self).cache_info()
+        }
+        
+        return solution, residual_norm, AtA, apply_inverse, cache_info
+    
+    def _estimate_condition_number(self, AtA, apply_inverse,
+                                   max_lanczos_iterations: int = 20) -> Tuple[float, Dict[str, Any]]:
+        """
+        Estimate the condition number of the normal-equations matrix with bounded cost.
+        
+        For an assembled matrix the 1-norm condition number is estimated as
+        ||AtA||_1 * est(||AtA^-1||_1) using Higham's block 1-norm estimator, which only
+        needs a handful of solves. A matrix-free AtA (iterative backends) gets the
+        2-norm condition number instead: the largest eigenvalue from Lanczos on AtA
+        and the smallest as the reciprocal of the largest eigenvalue of AtA^-1, so
+        Lanczos never has to resolve the clustered bottom of the spectrum.
+        
+        Args:
+            AtA: Sparse matrix or LinearOperator for the regularized normal equations
+            apply_inverse: Callable applying (an approximation of) AtA^-1 to a vector
+                or matrix, e.g. a factorization or a preconditioned CG solve
+            max_lanczos_iterations: Restart cap for the Lanczos estimates
+            
+        Returns:
+            Tuple of (condition number estimate or -1 if unavailable, estimate details)
+        """
+        start_time = time.perf_counter()
+        
+        try:
+            inverse = LinearOperator(
+                AtA.shape, matvec=apply_inverse, rmatvec=apply_inverse,
+                matmat=apply_inverse, rmatmat=apply_inverse, dtype=np.float64
+            )
+            if sparse.issparse(AtA):
+                condition_number = float(sparse_norm(AtA, 1) * onenormest(inverse))
+                info = {'method': '1-norm condest', 'converged': True}
+            else:
+                lanczos_options = {'k': 1, 'which': 'LA', 'tol': 1e-2,
+                                   'maxiter': max_lanczos_iterations, 'return_eigenvectors': False}
+                largest = eigsh(AtA, ncv=min(8, AtA.shape[0] - 1), **lanczos_options)[0]
+                # The top of the inverse spectrum is well separated; a small Krylov
+                # space keeps this to a handful of inner solves
+                inverse_largest = eigsh(inverse, ncv=min(4, AtA.shape[0] - 1), **lanczos_options)[0]
+                condition_number = float(largest * inverse_largest) if inverse_largest > 0 else -1
+                info = {'method': 'lanczos', 'converged': True}
+        except ArpackNoConvergence:
+            condition_number = -1
+            info = {'method': 'lanczos', 'converged': False}
+        except Exception as e:
+            logger.warning(f"Condition number estimation failed: {e}")
+            condition_number = -1
+            info = {'method': 'failed', 'converged': False}
+        
+        info['time'] = time.perf_counter() - start_time
+        return condition_number, info
 
     def _apply_manufacturing_constraints(self, A_matrix, rhs, constraints):
         """
         Apply manufacturing-specific constraints to the LSCM system.
         
+        Each constraint generator returns a COO block of penalty rows; all blocks
+        are stacked under the conformal system in a single sparse.vstack.
+        
         Args:
             A_matrix: Sparse coefficient matrix
             rhs: Right-hand side vector
@@ -323,45 +950,43 @@ class LSCMSolver:
         """
         logger.info("Applying manufacturing constraints...")
         
-        original_rows = A_matrix.shape[0]
+        blocks = []
         
         # Material thickness constraint
         if constraints.get(self.ManufacturingConstraint.MATERIAL_THICKNESS):
             thickness = constraints[self.ManufacturingConstraint.MATERIAL_THICKNESS]
-            A_matrix = self._add_thickness_constraint(A_matrix, thickness)
+            blocks.append(self._add_thickness_constraint(thickness))
         
         # Cutting tolerance constraint
         if constraints.get(self.ManufacturingConstraint.CUTTING_TOLERANCE):
             tolerance = constraints[self.ManufacturingConstraint.CUTTING_TOLERANCE]
-            A_matrix = self._add_cutting_tolerance_constraint(A_matrix, tolerance)
+            blocks.append(self._add_cutting_tolerance_constraint(tolerance))
         
-        # Extend RHS vector to match new matrix dimensions
-        new_rows = A_matrix.shape[0]
-        if new_rows > original_rows:
-            # Extend RHS with zeros for additional constraint rows
-            rhs_extended = np.zeros(new_rows)
-            rhs_extended[:original_rows] = rhs
-            rhs = rhs_extended
+        n_added = sum(block.shape[0] for block in blocks)
+        if n_added:
+            A_matrix = sparse.vstack([A_matrix] + blocks, format='csr')
+            # Constraint rows have a zero right-hand side
+            rhs = np.concatenate([rhs, np.zeros(n_added)])
         
-        logger.info(f"Applied {len(constraints)} manufacturing constraints, added {new_rows - original_rows} constraint rows")
+        logger.info(f"Applied {len(constraints)} manufacturing constraints, added {n_added} constraint rows")
         return A_matrix, rhs
 
-    def _add_thickness_constraint(self, A_matrix, thickness):
+    def _add_thickness_constraint(self, thickness) -> sparse.coo_matrix:
         """
-        Add material thickness-related constraints to the LSCM system.
+        Build material thickness-related constraint rows for the LSCM system.
         
         Material thickness affects the minimum bend radius and edge distances.
         Adds penalty terms to prevent UV coordinates from being too close.
+        Close vertex pairs are found with a k-d tree instead of testing all pairs.
         
         Args:
-            A_matrix: Current sparse matrix
             thickness: Material thickness in same units as vertices
+            
+        Returns:
+            COO block with one penalty row per close vertex pair
         """
         logger.info(f"Adding material thickness constraint: {thickness}")
         
-        # Convert to lil_matrix for efficient modification
-        A_lil = A_matrix.tolil()
-        
         # Add penalty terms for vertices that are closer than minimum distance
         min_distance = thickness * 2.0  # Minimum distance = 2x thickness (industry standard)
         
@@ -369,76 +994,51 @@ class LSCMSolver:
         # add a penalty to keep their UV coordinates separated
         penalty_weight = 1e-3  # Small penalty weight to not overwhelm conformal constraints
         
-        additional_rows = []
-        for i in range(self.n_vertices):
-            for j in range(i + 1, self.n_vertices):
-                # Check 3D distance between vertices
-                distance_3d = np.linalg.norm(self.vertices[i] - self.vertices[j])
-                
-                if distance_3d < min_distance and distance_3d > 1e-12:
-                    # Add penalty row to maintain minimum UV separation
-                    new_row = A_lil.shape[0] + len(additional_rows)
-                    additional_rows.append(new_row)
-                    
-                    # Extend matrix to accommodate new row
-                    if new_row >= A_lil.shape[0]:
-                        A_lil.resize((new_row + 1, A_lil.shape[1]))
-                    
-                    # Add penalty: minimize (u_i - u_j)^2 + (v_i - v_j)^2
-                    # Linearized as: penalty_weight * (u_i - u_j) = 0
-                    A_lil[new_row, 2*i] = penalty_weight      # u_i coefficient
-                    A_lil[new_row, 2*j] = -penalty_weight     # u_j coefficient
-        
-        logger.info(f"Added {len(additional_rows)} thickness constraint penalties")
-        return A_lil.tocsr()
-
-    def _add_cutting_tolerance_constraint(self, A_matrix, tolerance):
-        """
-        Add cutting tolerance-related constraints to the LSCM system.
+        pairs = cKDTree(self.vertices).query_pairs(min_distance, output_type='ndarray')
+        if len(pairs):
+            distances = np.linalg.norm(self.vertices[pairs[:, 0]] - self.vertices[pairs[:, 1]], axis=1)
+            pairs = pairs[(distances < min_distance) & (distances > 1e-12)]
+            # Same row order as a nested loop over (i, j) with i < j
+            pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+        
+        # Add penalty: minimize (u_i - u_j)^2 + (v_i - v_j)^2
+        # Linearized as: penalty_weight * (u_i - u_j) = 0
+        block = _pair_difference_block(pairs, penalty_weight, 2 * self.n_vertices)
+        
+        logger.info(f"Added {block.shape[0]} thickness constraint penalties")
+        return block
+
+    def _add_cutting_tolerance_constraint(self, tolerance) -> sparse.coo_matrix:
+        """
+        Build cutting tolerance-related constraint rows for the LSCM system.
         
         Cutting tolerance affects edge length precision. Adds constraints to
         maintain edge length ratios within acceptable tolerance.
         
         Args:
-            A_matrix: Current sparse matrix  
             tolerance: Cutting tolerance as fractional error (e.g., 0.001 = 0.1%)
+            
+        Returns:
+            COO block with one row per non-degenerate triangle edge
         """
         logger.info(f"Adding cutting tolerance constraint: {tolerance}")
         
-        # Convert to lil_matrix for efficient modification
-        A_lil = A_matrix.tolil()
-        
         # Add edge length preservation constraints for critical edges
         tolerance_weight = 1e-4  # Weight for tolerance constraints
         
-        additional_rows = []
-        for triangle in self.triangles:
-            # For each edge in the triangle, add constraint to preserve relative length
-            for edge_idx in range(3):
-                v1_idx = triangle[edge_idx]
-                v2_idx = triangle[(edge_idx + 1) % 3]
-                
-                # Calculate 3D edge length
-                edge_3d = self.vertices[v1_idx] - self.vertices[v2_idx]
-                length_3d = np.linalg.norm(edge_3d)
-                
-                if length_3d > 1e-12:  # Skip degenerate edges
-                    # Add constraint row
-                    new_row = A_lil.shape[0] + len(additional_rows)
-                    additional_rows.append(new_row)
-                    
-                    # Extend matrix to accommodate new row
-                    if new_row >= A_lil.shape[0]:
-                        A_lil.resize((new_row + 1, A_lil.shape[1]))
-                    
-                    # Add edge length constraint: 
-                    # tolerance_weight * sqrt((u1-u2)^2 + (v1-v2)^2) ≈ target_length
-                    # Linearized approximation for small deviations
-                    A_lil[new_row, 2*v1_idx] = tolerance_weight      # u1 coefficient
-                    A_lil[new_row, 2*v2_idx] = -tolerance_weight     # u2 coefficient
-        
-        logger.info(f"Added {len(additional_rows)} cutting tolerance constraints")
-        return A_lil.tocsr()
+        # Every triangle edge in (v0, v1), (v1, v2), (v2, v0) order; shared edges
+        # appear once per adjacent triangle
+        edges = self.triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2).astype(np.int64)
+        lengths = np.linalg.norm(self.vertices[edges[:, 0]] - self.vertices[edges[:, 1]], axis=1)
+        edges = edges[lengths > 1e-12]  # Skip degenerate edges
+        
+        # Add edge length constraint: 
+        # tolerance_weight * sqrt((u1-u2)^2 + (v1-v2)^2) ≈ target_length
+        # Linearized approximation for small deviations
+        block = _pair_difference_block(edges, tolerance_weight, 2 * self.n_vertices)
+        
+        logger.info(f"Added {block.shape[0]} cutting tolerance constraints")
+        return block
     
     def calculate_triangle_area(self, triangle_idx: int) -> float:
         """
@@ -464,101 +1064,318 @@ class LSCMSolver:
         
         return area
     
-    def calculate_distortion_metrics(self, uv_coords: np.ndarray) -> Dict[str, Union[float, Dict[str, float]]]:
+    def calculate_distortion_metrics(self, uv_coords: np.ndarray,
+                                     detail: str = 'summary') -> Dict[str, Any]:
         """
         Advanced distortion metrics calculation with comprehensive analysis.
         
         Args:
             uv_coords: UV coordinates from LSCM solution
+            detail: 'summary' for statistics and histograms only, 'full' to also
+                return per-triangle arrays
             
         Returns:
             Comprehensive dictionary of distortion metrics
         """
-        logger.info("Performing advanced distortion metrics analysis...")
+        return compute_distortion_metrics(self.vertices, self.triangles, uv_coords, detail=detail)
+
+
+def _pair_difference_block(pairs: np.ndarray, weight: float, n_columns: int) -> sparse.coo_matrix:
+    """
+    Build penalty rows weight * (u_i - u_j) for vertex pairs (i, j).
+    
+    Args:
+        pairs: Kx2 array of vertex index pairs, one row each
+        weight: Penalty weight
+        n_columns: Number of unknowns (2 * n_vertices)
+        
+    Returns:
+        COO matrix of shape (K, n_columns)
+    """
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+    rows = np.repeat(np.arange(len(pairs)), 2)
+    cols = (2 * pairs).ravel()
+    data = np.tile([weight, -weight], len(pairs))
+    return sparse.coo_matrix((data, (rows, cols)), shape=(len(pairs), n_columns))
+
+
+def compute_distortion_metrics(vertices: np.ndarray, triangles: np.ndarray, uv_coords: np.ndarray,
+                               detail: str = 'summary', histogram_bins: int = 20) -> Dict[str, Any]:
+    """
+    Vectorized per-triangle distortion analysis of a UV parameterization.
+    
+    Per triangle, computes the UV/3D area ratio, the angle error at the first
+    corner and the relative stretch of the two edges leaving it. Undefined values
+    (degenerate triangles or edges) are NaN and excluded from the statistics.
+    
+    Args:
+        vertices: Nx3 array of 3D vertex coordinates
+        triangles: Mx3 array of triangle vertex indices
+        uv_coords: Nx2 array of UV coordinates
+        detail: 'summary' for statistics and histograms only, 'full' to also
+            return the per-triangle arrays under 'per_triangle'
+        histogram_bins: Number of histogram bins per metric
         
-        # Detailed tracking of distortion metrics
-        distortion_analysis = {
-            'angle_distortions': [],
-            'area_distortions': [],
-            'edge_length_distortions': [],
-            'local_scaling_factors': []
+    Returns:
+        Dictionary of distortion metrics
+    """
+    if detail not in ('summary', 'full'):
+        raise ValueError(f"Unknown distortion detail level '{detail}', expected 'summary' or 'full'")
+    
+    logger.info("Performing advanced distortion metrics analysis...")
+    
+    vertices = np.asarray(vertices, dtype=np.float64)
+    uv_coords = np.asarray(uv_coords, dtype=np.float64)
+    triangles = np.asarray(triangles, dtype=np.int64)
+    triangles = triangles[np.all((triangles >= 0) & (triangles < min(len(vertices), len(uv_coords))), axis=1)]
+    
+    # Edges leaving the first corner of every triangle, in 3D and in UV space
+    e1_3d = vertices[triangles[:, 1]] - vertices[triangles[:, 0]]
+    e2_3d = vertices[triangles[:, 2]] - vertices[triangles[:, 0]]
+    e1_uv = uv_coords[triangles[:, 1]] - uv_coords[triangles[:, 0]]
+    e2_uv = uv_coords[triangles[:, 2]] - uv_coords[triangles[:, 0]]
+    
+    area_3d = 0.5 * np.linalg.norm(np.cross(e1_3d, e2_3d), axis=1)
+    area_uv = 0.5 * np.abs(e1_uv[:, 0] * e2_uv[:, 1] - e1_uv[:, 1] * e2_uv[:, 0])
+    
+    lengths_3d = np.column_stack([np.linalg.norm(e1_3d, axis=1), np.linalg.norm(e2_3d, axis=1)])
+    lengths_uv = np.column_stack([np.linalg.norm(e1_uv, axis=1), np.linalg.norm(e2_uv, axis=1)])
+    
+    valid_area = (area_3d > 1e-12) & (area_uv > 1e-12)
+    valid_edges = (lengths_3d > 1e-12) & (lengths_uv > 1e-12)
+    valid_angle = valid_edges.all(axis=1)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        area_ratio = np.where(valid_area, area_uv / area_3d, np.nan)
+        edge_stretch = np.where(valid_edges, np.abs(lengths_uv - lengths_3d) / lengths_3d, np.nan)
+        
+        cos_3d = np.einsum('ij,ij->i', e1_3d, e2_3d) / (lengths_3d[:, 0] * lengths_3d[:, 1])
+        cos_uv = np.einsum('ij,ij->i', e1_uv, e2_uv) / (lengths_uv[:, 0] * lengths_uv[:, 1])
+        angle_error = np.where(
+            valid_angle,
+            np.degrees(np.abs(np.arccos(np.clip(cos_uv, -1, 1)) - np.arccos(np.clip(cos_3d, -1, 1)))),
+            np.nan
+        )
+    
+    area_values = area_ratio[valid_area]
+    angle_values = angle_error[valid_angle]
+    stretch_values = edge_stretch[valid_edges]
+    
+    # Comprehensive distortion metrics
+    metrics = {
+        'mean_area_distortion': float(np.mean(area_values)) if area_values.size else 0.0,
+        'max_area_distortion': float(np.max(area_values)) if area_values.size else 0.0,
+        'mean_angle_distortion': float(np.mean(angle_values)) if angle_values.size else 0.0,
+        'max_angle_distortion': float(np.max(angle_values)) if angle_values.size else 0.0,
+        'area_distortion_variance': float(np.var(area_values)) if area_values.size else 0.0,
+        'mean_edge_length_distortion': float(np.mean(stretch_values)) if stretch_values.size else 0.0,
+        'max_local_scaling': float(np.sqrt(np.max(area_values))) if area_values.size else 1.0,
+        'statistics': {
+            'area_ratio': _summarize_metric(area_values, histogram_bins),
+            'angle_error_degrees': _summarize_metric(angle_values, histogram_bins),
+            'edge_stretch': _summarize_metric(stretch_values, histogram_bins)
+        },
+        'n_triangles': int(len(triangles))
+    }
+    
+    if detail == 'full':
+        metrics['per_triangle'] = {
+            'area_ratio': area_ratio,
+            'angle_error_degrees': angle_error,
+            'edge_stretch': edge_stretch
         }
+    
+    logger.info(f"Advanced distortion analysis: "
+               f"mean area = {metrics['mean_area_distortion']:.3f}, "
+               f"mean angle = {metrics['mean_angle_distortion']:.2f}°, "
+               f"edge length distortion = {metrics['mean_edge_length_distortion']:.4f}")
+    
+    return metrics
+
+
+def _summarize_metric(values: np.ndarray, bins: int) -> Dict[str, Any]:
+    """
+    Summary statistics and histogram for one distortion metric.
+    
+    Args:
+        values: 1D array of finite metric values
+        bins: Number of histogram bins
         
-        for triangle in self.triangles:
-            # Get 3D triangle vertices
-            p0_3d, p1_3d, p2_3d = self.vertices[triangle]
-            
-            # Get UV triangle vertices
-            p0_uv, p1_uv, p2_uv = uv_coords[triangle]
-            
-            # Compute 3D triangle properties
-            e1_3d = p1_3d - p0_3d
-            e2_3d = p2_3d - p0_3d
-            area_3d = 0.5 * np.linalg.norm(np.cross(e1_3d, e2_3d))
-            
-            # Compute UV triangle properties
-            e1_uv = p1_uv - p0_uv
-            e2_uv = p2_uv - p0_uv
-            # Future-proof 2D cross product calculation
-            area_uv = 0.5 * abs(e1_uv[0] * e2_uv[1] - e1_uv[1] * e2_uv[0])
-            
-            # Detailed distortion calculations
-            if area_3d > 1e-12 and area_uv > 1e-12:
-                # Area distortion
-                area_ratio = area_uv / area_3d
-                distortion_analysis['area_distortions'].append(area_ratio)
-                
-                # Local scaling factor
-                local_scaling = np.sqrt(area_ratio)
-                distortion_analysis['local_scaling_factors'].append(local_scaling)
-            
-            # Angle and edge length distortion
-            for (vec_3d, vec_uv) in [(e1_3d, e1_uv), (e2_3d, e2_uv)]:
-                if np.linalg.norm(vec_3d) > 1e-12 and np.linalg.norm(vec_uv) > 1e-12:
-                    # Angle distortion
-                    angle_3d = np.arccos(np.clip(np.dot(e1_3d, e2_3d) / 
-                                                  (np.linalg.norm(e1_3d) * np.linalg.norm(e2_3d)), -1, 1))
-                    angle_uv = np.arccos(np.clip(np.dot(e1_uv, e2_uv) / 
-                                                 (np.linalg.norm(e1_uv) * np.linalg.norm(e2_uv)), -1, 1))
-                    distortion_analysis['angle_distortions'].append(abs(angle_uv - angle_3d))
-                    
-                    # Edge length distortion
-                    length_3d = np.linalg.norm(vec_3d)
-                    length_uv = np.linalg.norm(vec_uv)
-                    edge_distortion = abs(length_uv - length_3d) / length_3d
-                    distortion_analysis['edge_length_distortions'].append(edge_distortion)
-        
-        # Comprehensive distortion metrics
-        metrics = {
-            'mean_area_distortion': np.mean(distortion_analysis['area_distortions']) 
-                                    if distortion_analysis['area_distortions'] else 0.0,
-            'max_area_distortion': np.max(distortion_analysis['area_distortions']) 
-                                   if distortion_analysis['area_distortions'] else 0.0,
-            'mean_angle_distortion': np.degrees(np.mean(distortion_analysis['angle_distortions'])) 
-                                     if distortion_analysis['angle_distortions'] else 0.0,
-            'max_angle_distortion': np.degrees(np.max(distortion_analysis['angle_distortions'])) 
-                                    if distortion_analysis['angle_distortions'] else 0.0,
-            'area_distortion_variance': np.var(distortion_analysis['area_distortions']) 
-                                        if distortion_analysis['area_distortions'] else 0.0,
-            'mean_edge_length_distortion': np.mean(distortion_analysis['edge_length_distortions']) 
-                                           if distortion_analysis['edge_length_distortions'] else 0.0,
-            'max_local_scaling': np.max(distortion_analysis['local_scaling_factors']) 
-                                 if distortion_analysis['local_scaling_factors'] else 1.0,
-            'detailed_analysis': distortion_analysis
+    Returns:
+        Dictionary with count, mean, std, min, max, percentiles and histogram
+    """
+    if values.size == 0:
+        return {'count': 0}
+    
+    counts, bin_edges = np.histogram(values, bins=bins)
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        'count': int(values.size),
+        'mean': float(np.mean(values)),
+        'std': float(np.std(values)),
+        'min': float(np.min(values)),
+        'max': float(np.max(values)),
+        'p50': float(p50),
+        'p95': float(p95),
+        'p99': float(p99),
+        'histogram': {
+            'counts': counts.tolist(),
+            'bin_edges': bin_edges.tolist()
         }
+    }
+
+
+def build_prolongation_operator(coarse_vertices: np.ndarray, coarse_triangles: np.ndarray,
+                                fine_vertices: np.ndarray, k: int = 6) -> sparse.csr_matrix:
+    """
+    Build a sparse operator interpolating per-vertex values from a coarse mesh.
+    
+    Each fine vertex is interpolated from its k nearest coarse vertices with
+    moving-least-squares weights that reproduce constant and linear fields
+    exactly. Linear precision matters for LSCM: its slowest modes are global
+    similarity transforms, which are linear in the vertex positions.
+    
+    Args:
+        coarse_vertices: Kx3 coarse vertex coordinates
+        coarse_triangles: Coarse triangle indices; unused coarse vertices are ignored
+        fine_vertices: Nx3 fine vertex coordinates
+        k: Number of coarse neighbours per fine vertex
+        
+    Returns:
+        Sparse (N, K) interpolation matrix
+    """
+    n_fine = len(fine_vertices)
+    referenced = np.unique(coarse_triangles)
+    k = min(k, len(referenced))
+    distances, neighbors = cKDTree(coarse_vertices[referenced]).query(fine_vertices, k=k)
+    distances = distances.reshape(n_fine, k)
+    neighbors = referenced[neighbors.reshape(n_fine, k)]
+    
+    # Gaussian weights relative to the k-th neighbour distance
+    radius = np.maximum(distances[:, -1:], 1e-12)
+    omega = np.exp(-2.0 * (distances / radius) ** 2) + 1e-6
+    
+    # Weighted least squares subject to sum(w) = 1 and sum(w * (x_c - x_f)) = 0
+    offsets = (coarse_vertices[neighbors] - fine_vertices[:, None, :]) / radius[:, :, None]
+    basis = np.concatenate([np.ones((n_fine, k, 1)), offsets], axis=2)
+    moments = np.einsum('nki,nk,nkj->nij', basis, omega, basis) + 1e-6 * np.eye(4)
+    unit = np.zeros((n_fine, 4, 1))
+    unit[:, 0] = 1.0
+    multipliers = np.linalg.solve(moments, unit)[:, :, 0]
+    weights = omega * np.einsum('nki,ni->nk', basis, multipliers)
+    
+    rows = np.repeat(np.arange(n_fine), k)
+    return sparse.csr_matrix((weights.ravel(), (rows, neighbors.ravel())),
+                             shape=(n_fine, len(coarse_vertices)))
+
+
+class _MultilevelHierarchy:
+    """Galerkin level hierarchy and V-cycle used by LSCMSolver.solve_multilevel."""
+    
+    # Damped Jacobi sweeps before and after each coarse-grid correction
+    SMOOTHING_STEPS = 2
+    
+    def __init__(self, N: sparse.csr_matrix, vertices: np.ndarray, triangles: np.ndarray,
+                 levels: int, coarsening_ratio: float, min_coarse_vertices: int):
+        setup_start = time.perf_counter()
+        self.operators = [N]
+        self.prolongations = []
+        self.level_info = [self._level_entry(0, vertices, triangles)]
+        
+        while len(self.operators) < levels:
+            target = int(len(vertices) * coarsening_ratio)
+            if target < min_coarse_vertices:
+                break
+            
+            level_start = time.perf_counter()
+            coarse_vertices, coarse_triangles, _ = cluster_decimate_mesh(vertices, triangles, target)
+            if len(coarse_triangles) == 0:
+                break
+            decimation_time = time.perf_counter() - level_start
+            
+            # Interpolate u and v independently: unknowns are interleaved [u0, v0, u1, v1, ...]
+            P = sparse.kron(build_prolongation_operator(coarse_vertices, coarse_triangles, vertices),
+                            sparse.eye(2), format='csr')
+            self.prolongations.append(P)
+            self.operators.append((P.T @ self.operators[-1] @ P).tocsr())
+            
+            entry = self._level_entry(len(self.operators) - 1, coarse_vertices, coarse_triangles)
+            entry['decimation_time'] = decimation_time
+            entry['setup_time'] = time.perf_counter() - level_start
+            self.level_info.append(entry)
+            vertices, triangles = coarse_vertices, coarse_triangles
+        
+        # Jacobi damping 4/(3*lambda_max(D^-1 N)) per level; Galerkin operators get
+        # denser with depth so a fixed damping factor can diverge
+        self.inverse_diagonals = [1.0 / op.diagonal() for op in self.operators[:-1]]
+        self.damping = [self._jacobi_damping(op, inv_diag)
+                        for op, inv_diag in zip(self.operators, self.inverse_diagonals)]
+        
+        factor_start = time.perf_counter()
+        self.coarse_solve = splu(self.operators[-1].tocsc()).solve
+        self.level_info[-1]['setup_time'] += time.perf_counter() - factor_start
+        self.setup_time = time.perf_counter() - setup_start
+    
+    @staticmethod
+    def _level_entry(level: int, vertices: np.ndarray, triangles: np.ndarray) -> Dict[str, Any]:
+        return {'level': level, 'n_vertices': len(vertices), 'n_triangles': len(triangles),
+                'decimation_time': 0.0, 'setup_time': 0.0, 'solve_time': 0.0, 'iterations': 0}
+    
+    @property
+    def n_levels(self) -> int:
+        """Number of levels actually built (1 when the mesh is too small to coarsen)."""
+        return len(self.operators)
+    
+    @staticmethod
+    def _jacobi_damping(operator: sparse.csr_matrix, inverse_diagonal: np.ndarray,
+                        power_iterations: int = 15) -> float:
+        vector = np.random.default_rng(0).random(operator.shape[0])
+        lambda_max = 1.0
+        for _ in range(power_iterations):
+            vector = inverse_diagonal * (operator @ vector)
+            lambda_max = np.linalg.norm(vector)
+            vector /= lambda_max
+        return 4.0 / (3.0 * lambda_max)
+    
+    def coarse_solution(self, rhs: np.ndarray) -> np.ndarray:
+        """Solve on the coarsest level and prolong the result to the fine level."""
+        for P in self.prolongations:
+            rhs = P.T @ rhs
+        solution = self.coarse_solve(rhs)
+        for P in reversed(self.prolongations):
+            solution = P @ solution
+        return solution
+    
+    def vcycle(self, residual: np.ndarray, level: int = 0) -> np.ndarray:
+        """Apply one symmetric V-cycle as an approximate inverse of the fine operator."""
+        if level == self.n_levels - 1:
+            return self.coarse_solve(residual)
+        
+        operator = self.operators[level]
+        smoother = self.damping[level] * self.inverse_diagonals[level]
         
-        logger.info(f"Advanced distortion analysis: "
-                   f"mean area = {metrics['mean_area_distortion']:.3f}, "
-                   f"mean angle = {metrics['mean_angle_distortion']:.2f}°, "
-                   f"edge length distortion = {metrics['mean_edge_length_distortion']:.4f}")
+        correction = smoother * residual
+        for _ in range(self.SMOOTHING_STEPS - 1):
+            correction += smoother * (residual - operator @ correction)
         
-        return metrics
+        coarse_residual = self.prolongations[level].T @ (residual - operator @ correction)
+        correction += self.prolongations[level] @ self.vcycle(coarse_residual, level + 1)
+        
+        for _ in range(self.SMOOTHING_STEPS):
+            correction += smoother * (residual - operator @ correction)
+        return correction
 
 
 def unfold_surface_lscm(vertices: np.ndarray, triangles: np.ndarray, 
                        boundary_constraints: Optional[List[Tuple[int, float, float]]] = None,
                        manufacturing_constraints: Optional[Dict[str, Any]] = None,
-                       distortion_tolerance: float = 0.001) -> Dict[str, Any]:
+                       distortion_tolerance: float = 0.001,
+                       use_cache: bool = True,
+                       solver_backend: str = 'direct',
+                       solver_options: Optional[Dict[str, Any]] = None,
+                       distortion_detail: str = 'summary',
+                       levels: int = 1,
+                       coarsening_ratio: float = 0.25) -> Dict[str, Any]:
     """
     Advanced surface unfolding with comprehensive manufacturing and distortion analysis.
     
@@ -568,6 +1385,17 @@ def unfold_surface_lscm(vertices: np.ndarray, triangles: np.ndarray,
         boundary_constraints: Optional boundary vertex constraints
         manufacturing_constraints: Optional dictionary of manufacturing-specific constraints
         distortion_tolerance: Maximum acceptable distortion level
+        use_cache: Reuse cached system factorizations for previously seen meshes
+        solver_backend: Linear solver backend ('direct', 'lsqr', 'lsmr' or 'cg')
+        solver_options: Optional keyword arguments for LSCMSolver.solve_lscm
+            (tol, max_iterations, preconditioner, initial_guess, estimate_condition),
+            or for LSCMSolver.solve_multilevel when levels > 1
+        distortion_detail: 'summary' for distortion statistics only, 'full' to also
+            include per-triangle distortion values
+        levels: Number of levels for the coarse-to-fine multilevel solve. 1 (default)
+            solves the fine system with solver_backend; values above 1 use
+            LSCMSolver.solve_multilevel, recommended for dense scanned meshes
+        coarsening_ratio: Fraction of vertices kept per level in multilevel mode
         
     Returns:
         Comprehensive dictionary containing unfolding results and detailed analysis
@@ -577,13 +1405,30 @@ def unfold_surface_lscm(vertices: np.ndarray, triangles: np.ndarray,
         solver = LSCMSolver(vertices, triangles)
         
         # Solve LSCM with optional manufacturing constraints
-        uv_coords, solution_info = solver.solve_lscm(
-            boundary_constraints=boundary_constraints,
-            manufacturing_constraints=manufacturing_constraints
-        )
+        if levels > 1:
+            uv_coords, solution_info = solver.solve_multilevel(
+                boundary_constraints=boundary_constraints,
+                manufacturing_constraints=manufacturing_constraints,
+                levels=levels,
+                coarsening_ratio=coarsening_ratio,
+                **(solver_options or {})
+            )
+        else:
+            uv_coords, solution_info = solver.solve_lscm(
+                boundary_constraints=boundary_constraints,
+                manufacturing_constraints=manufacturing_constraints,
+                use_cache=use_cache,
+                solver=solver_backend,
+                **(solver_options or {})
+            )
         
         # Calculate comprehensive distortion metrics
-        distortion_metrics = solver.calculate_distortion_metrics(uv_coords)
+        distortion_metrics = solver.calculate_distortion_metrics(uv_coords, detail=distortion_detail)
+        if 'per_triangle' in distortion_metrics:
+            distortion_metrics['per_triangle'] = {
+                name: np.where(np.isnan(values), None, values).tolist()
+                for name, values in distortion_metrics['per_triangle'].items()
+            }
         
         # Calculate bounding box of UV coordinates
         uv_min = np.min(uv_coords, axis=0)
@@ -626,6 +1471,222 @@ def unfold_surface_lscm(vertices: np.ndarray, triangles: np.ndarray,
             'detailed_error': str(sys.exc_info())
         }
 
+
+def unfold_surfaces_batch(parts: List[Dict[str, Any]],
+                          max_workers: Optional[int] = None,
+                          **unfold_options) -> Iterator[Dict[str, Any]]:
+    """
+    Unfold many meshes in a process pool, yielding results as parts finish.
+    
+    All vertex and triangle arrays are copied once into two shared-memory blocks;
+    workers receive only the block names and their part's offsets, so mesh data
+    is never pickled. Each part is unfolded with unfold_surface_lscm. Failures,
+    including invalid input and crashed workers, are reported as that part's
+    result and never abort the batch: when a worker dies, the unfinished parts
+    are resubmitted to a fresh pool, and after a repeated crash they run one at
+    a time until the crashing part is found and reported.
+    
+    Args:
+        parts: List of part dictionaries with 'vertices' and 'triangles' and optional
+            'part_id', 'boundary_constraints' and 'manufacturing_constraints'
+        max_workers: Process pool size (None = os.cpu_count(), 1 = run inline)
+        **unfold_options: Keyword arguments passed to unfold_surface_lscm for every
+            part (e.g. distortion_tolerance, levels, solver_backend)
+        
+    Yields:
+        unfold_surface_lscm result dictionaries in completion order, each extended
+        with 'part_index', 'part_id' and 'elapsed_time'
+    """
+    tasks = []
+    vertex_blocks = []
+    triangle_blocks = []
+    vertex_offset = triangle_offset = 0
+    
+    for index, part in enumerate(parts):
+        task = {
+            'part_index': index,
+            'part_id': part.get('part_id', index),
+            'boundary_constraints': part.get('boundary_constraints'),
+            'manufacturing_constraints': part.get('manufacturing_constraints'),
+            'options': unfold_options
+        }
+        try:
+            vertices = np.asarray(part['vertices'], dtype=np.float64).reshape(-1, 3)
+            triangles = np.asarray(part['triangles'], dtype=np.int32).reshape(-1, 3)
+        except Exception as e:
+            yield _batch_failure(task, f"Invalid mesh arrays: {e}", 0.0)
+            continue
+        
+        task['vertex_slice'] = (vertex_offset, len(vertices))
+        task['triangle_slice'] = (triangle_offset, len(triangles))
+        vertex_blocks.append(vertices)
+        triangle_blocks.append(triangles)
+        vertex_offset += len(vertices)
+        triangle_offset += len(triangles)
+        tasks.append(task)
+    
+    if not tasks:
+        return
+    
+    vertex_data = np.concatenate(vertex_blocks)
+    triangle_data = np.concatenate(triangle_blocks)
+    workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+    
+    if workers == 1:
+        for task in tasks:
+            yield _unfold_batch_part(task, *_slice_batch_part(task, vertex_data, triangle_data))
+        return
+    
+    vertex_memory = _copy_to_shared_memory(vertex_data)
+    triangle_memory = _copy_to_shared_memory(triangle_data)
+    layout = (vertex_memory.name, vertex_data.shape, triangle_memory.name, triangle_data.shape)
+    
+    try:
+        # Largest parts first so the slowest solves start early
+        queue = sorted(tasks, key=lambda t: -t['triangle_slice'][1])
+        pool_crashes = 0
+        while queue:
+            # After two crashes in a row, run parts alone so only the culprit fails
+            isolate = pool_crashes >= 2
+            group = queue[:1] if isolate else queue
+            unfinished = yield from _run_batch_pool(group, layout, 1 if isolate else min(workers, len(group)))
+            if not unfinished:
+                queue = queue[len(group):]
+            elif isolate:
+                task = unfinished[0]
+                logger.error(f"Batch worker crashed on part {task['part_id']}")
+                yield _batch_failure(task, "Worker failed: process terminated abruptly", 0.0)
+                queue = queue[1:]
+                pool_crashes = 0
+            else:
+                logger.warning(f"Batch process pool crashed, resubmitting {len(unfinished)} parts")
+                queue = unfinished
+                pool_crashes += 1
+    finally:
+        for memory in (vertex_memory, triangle_memory):
+            memory.close()
+            memory.unlink()
+
+
+def _run_batch_pool(tasks: List[Dict[str, Any]], layout: Tuple,
+                    workers: int) -> Generator[Dict[str, Any], None, List[Dict[str, Any]]]:
+    """
+    Unfold tasks in a fresh process pool, yielding results as they complete.
+    
+    Returns:
+        Tasks left unfinished because a worker crashed and broke the pool
+    """
+    executor = ProcessPoolExecutor(max_workers=workers)
+    unfinished = []
+    try:
+        futures = {executor.submit(_unfold_shared_batch_part, task, layout): task for task in tasks}
+        for future in as_completed(futures):
+            task = futures[future]
+            try:
+                result = future.result()
+            except BrokenProcessPool:
+                unfinished.append(task)
+                continue
+            except Exception as e:
+                logger.error(f"Batch worker failed on part {task['part_id']}: {e}")
+                result = _batch_failure(task, f"Worker failed: {e}", 0.0)
+            yield result
+    finally:
+        # Workers must be gone before the shared blocks are released
+        executor.shutdown(wait=True, cancel_futures=True)
+    
+    # Keep the largest-first submission order for the retry
+    order = {id(task): i for i, task in enumerate(tasks)}
+    return sorted(unfinished, key=lambda t: order[id(t)])
+
+
+def _cg_inverse(operator, preconditioner=None, rtol: float = 1e-6,
+                max_iterations: Optional[int] = None):
+    """
+    Build a callable applying operator^-1 approximately with preconditioned CG.
+    
+    Used where no factorization exists, e.g. for condition estimates on the
+    iterative and multilevel paths. Accepts a vector or a matrix of columns.
+    """
+    def apply_inverse(b):
+        b = np.asarray(b, dtype=np.float64)
+        if b.ndim == 1:
+            return cg(operator, b, rtol=rtol, maxiter=max_iterations, M=preconditioner)[0]
+        return np.column_stack([
+            cg(operator, column, rtol=rtol, maxiter=max_iterations, M=preconditioner)[0]
+            for column in b.T
+        ])
+    
+    return apply_inverse
+
+
+def _copy_to_shared_memory(array: np.ndarray) -> shared_memory.SharedMemory:
+    """Copy an array into a new shared-memory block owned by this process."""
+    memory = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)[...] = array
+    return memory
+
+
+def _slice_batch_part(task: Dict[str, Any], vertex_data: np.ndarray,
+                      triangle_data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Copy one part's vertices and triangles out of the packed batch arrays."""
+    vertex_start, n_vertices = task['vertex_slice']
+    triangle_start, n_triangles = task['triangle_slice']
+    return (vertex_data[vertex_start:vertex_start + n_vertices].copy(),
+            triangle_data[triangle_start:triangle_start + n_triangles].copy())
+
+
+def _unfold_shared_batch_part(task: Dict[str, Any], layout: Tuple) -> Dict[str, Any]:
+    """Process-pool worker: read a part from shared memory and unfold it."""
+    vertex_name, vertex_shape, triangle_name, triangle_shape = layout
+    # Pool workers share the parent's resource tracker, so attaching does not
+    # transfer ownership; only the parent unlinks the blocks
+    vertex_memory = shared_memory.SharedMemory(name=vertex_name)
+    triangle_memory = shared_memory.SharedMemory(name=triangle_name)
+    try:
+        vertices, triangles = _slice_batch_part(
+            task,
+            np.ndarray(vertex_shape, dtype=np.float64, buffer=vertex_memory.buf),
+            np.ndarray(triangle_shape, dtype=np.int32, buffer=triangle_memory.buf)
+        )
+    finally:
+        vertex_memory.close()
+        triangle_memory.close()
+    return _unfold_batch_part(task, vertices, triangles)
+
+
+def _unfold_batch_part(task: Dict[str, Any], vertices: np.ndarray,
+                       triangles: np.ndarray) -> Dict[str, Any]:
+    """Unfold one batch part and tag the result with its identity and timing."""
+    start_time = time.perf_counter()
+    try:
+        result = unfold_surface_lscm(
+            vertices, triangles,
+            boundary_constraints=task['boundary_constraints'],
+            manufacturing_constraints=task['manufacturing_constraints'],
+            **task['options']
+        )
+    except Exception as e:
+        return _batch_failure(task, str(e), time.perf_counter() - start_time)
+    
+    result['part_index'] = task['part_index']
+    result['part_id'] = task['part_id']
+    result['elapsed_time'] = time.perf_counter() - start_time
+    return result
+
+
+def _batch_failure(task: Dict[str, Any], error: str, elapsed_time: float) -> Dict[str, Any]:
+    """Result dictionary for a batch part that could not be unfolded."""
+    return {
+        'success': False,
+        'error': error,
+        'method': 'Advanced LSCM',
+        'part_index': task['part_index'],
+        'part_id': task['part_id'],
+        'elapsed_time': elapsed_time
+    }
+
+
 def _generate_unfolding_warnings(distortion_metrics: Dict[str, float], 
                                    manufacturability: Dict[str, Any]) -> List[str]:
     """
@@ -0,0 +1,253 @@
+"""
+Shared mesh connectivity for unfolding, geodesic and mesh-processing code.
+
+MeshTopology derives edges, edge-face incidence, vertex one-rings and boundary
+loops from a triangle array with vectorized NumPy operations. Instances are
+cached by a hash of the connectivity, so every stage of a pipeline working on
+the same mesh shares one topology even when vertex positions change.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+import numpy as np
+from scipy import sparse
+
+logger = logging.getLogger(__name__)
+
+
+class MeshTopology:
+    """
+    Connectivity of a triangle mesh.
+
+    Attributes:
+        n_vertices: Number of vertices
+        triangles: Mx3 int64 triangle array
+        edges: Ex2 unique undirected edges, smaller index first, sorted
+        face_edges: Mx3 edge index of each triangle side (v0v1, v1v2, v2v0)
+        edge_face_counts: Number of triangles sharing each edge
+        edge_faces: ExM CSR edge-to-face incidence matrix (built on first use)
+        vertex_faces: NxM CSR vertex-to-face incidence matrix (built on first use)
+        vertex_adjacency: NxN CSR one-ring adjacency matrix (built on first use)
+        boundary_edges: Bx2 boundary edges oriented as in their triangle
+        boundary_vertices: Sorted indices of vertices on a boundary edge
+        non_manifold_edges: Indices into edges shared by more than two faces
+    """
+
+    # Shared cache of topologies keyed by connectivity hash
+    max_cached_topologies = 8
+    _topology_cache: 'OrderedDict[str, MeshTopology]' = OrderedDict()
+    _cache_lock = threading.Lock()
+    _cache_stats = {'hits': 0, 'misses': 0}
+
+    def __init__(self, triangles: np.ndarray, n_vertices: int):
+        """
+        Build the topology of a triangle mesh.
+
+        Args:
+            triangles: Mx3 array of triangle indices
+            n_vertices: Number of vertices in the mesh
+        """
+        triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+
+        self.n_vertices = int(n_vertices)
+        self.triangles = triangles
+
+        # Triangle sides as directed half-edges, three per face
+        half_edges = triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2)
+        low = np.minimum(half_edges[:, 0], half_edges[:, 1])
+        high = np.maximum(half_edges[:, 0], half_edges[:, 1])
+        keys = low * self.n_vertices + high
+        edge_keys, edge_ids, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        edge_ids = edge_ids.ravel()
+
+        self.edges = np.column_stack([edge_keys // self.n_vertices, edge_keys % self.n_vertices])
+        self.face_edges = edge_ids.reshape(-1, 3)
+        self.edge_face_counts = counts
+
+        boundary_half_edges = counts[edge_ids] == 1
+        self.boundary_edges = half_edges[boundary_half_edges]
+        self.boundary_vertices = np.unique(self.boundary_edges)
+        self.non_manifold_edges = np.flatnonzero(counts > 2)
+
+        # Incidence matrices and loops are only built when a caller needs them
+        self._edge_faces = None
+        self._vertex_faces = None
+        self._vertex_adjacency = None
+        self._boundary_loops = None
+
+    @property
+    def edge_faces(self) -> sparse.csr_matrix:
+        """ExM CSR edge-to-face incidence matrix."""
+        if self._edge_faces is None:
+            n_triangles = len(self.triangles)
+            self._edge_faces = sparse.csr_matrix(
+                (np.ones(3 * n_triangles, dtype=np.int8),
+                 (self.face_edges.ravel(), np.repeat(np.arange(n_triangles), 3))),
+                shape=(self.n_edges, n_triangles)
+            )
+        return self._edge_faces
+
+    @property
+    def vertex_faces(self) -> sparse.csr_matrix:
+        """NxM CSR vertex-to-face incidence matrix."""
+        if self._vertex_faces is None:
+            n_triangles = len(self.triangles)
+            self._vertex_faces = sparse.csr_matrix(
+                (np.ones(3 * n_triangles, dtype=np.int8),
+                 (self.triangles.ravel(), np.repeat(np.arange(n_triangles), 3))),
+                shape=(self.n_vertices, n_triangles)
+            )
+        return self._vertex_faces
+
+    @property
+    def vertex_adjacency(self) -> sparse.csr_matrix:
+        """NxN CSR one-ring adjacency matrix."""
+        if self._vertex_adjacency is None:
+            proper = self.edges[:, 0] != self.edges[:, 1]
+            rows = np.concatenate([self.edges[proper, 0], self.edges[proper, 1]])
+            cols = np.concatenate([self.edges[proper, 1], self.edges[proper, 0]])
+            self._vertex_adjacency = sparse.csr_matrix(
+                (np.ones(len(rows), dtype=np.int8), (rows, cols)),
+                shape=(self.n_vertices, self.n_vertices)
+            )
+        return self._vertex_adjacency
+
+    @property
+    def n_edges(self) -> int:
+        """Number of unique undirected edges."""
+        return len(self.edges)
+
+    @property
+    def is_manifold(self) -> bool:
+        """True when no edge is shared by more than two triangles."""
+        return len(self.non_manifold_edges) == 0
+
+    def neighbors(self, vertex: int) -> np.ndarray:
+        """
+        Return the sorted one-ring neighbours of a vertex.
+
+        Args:
+            vertex: Vertex index
+
+        Returns:
+            Array of neighbouring vertex indices
+        """
+        indptr = self.vertex_adjacency.indptr
+        return self.vertex_adjacency.indices[indptr[vertex]:indptr[vertex + 1]]
+
+    def one_rings(self) -> List[np.ndarray]:
+        """Return the one-ring neighbours of every vertex as a list of arrays."""
+        return np.split(self.vertex_adjacency.indices, self.vertex_adjacency.indptr[1:-1])
+
+    @property
+    def boundary_loops(self) -> List[np.ndarray]:
+        """
+        Ordered boundary loops, each an array of vertex indices.
+
+        Loops follow the boundary half-edge orientation. At non-manifold
+        boundary vertices the remaining outgoing edges start further loops.
+        """
+        if self._boundary_loops is None:
+            self._boundary_loops = self._trace_boundary_loops()
+        return self._boundary_loops
+
+    def _trace_boundary_loops(self) -> List[np.ndarray]:
+        """Chain oriented boundary edges into loops."""
+        order = np.argsort(self.boundary_edges[:, 0], kind='stable')
+        starts = self.boundary_edges[order, 0]
+        ends = self.boundary_edges[order, 1]
+        first_edge = dict(zip(*np.unique(starts, return_index=True)))
+        used = np.zeros(len(order), dtype=bool)
+
+        loops = []
+        for seed in range(len(order)):
+            if used[seed]:
+                continue
+            loop = []
+            edge = seed
+            while edge is not None and not used[edge]:
+                used[edge] = True
+                loop.append(int(starts[edge]))
+                next_vertex = ends[edge]
+                edge = None
+                candidate = first_edge.get(next_vertex)
+                # Take the first unused edge leaving next_vertex
+                while candidate is not None and candidate < len(order) and starts[candidate] == next_vertex:
+                    if not used[candidate]:
+                        edge = candidate
+                        break
+                    candidate += 1
+            loops.append(np.array(loop, dtype=np.int64))
+
+        return loops
+
+    @staticmethod
+    def connectivity_hash(triangles: np.ndarray, n_vertices: int) -> str:
+        """
+        Content hash of a triangle array and vertex count.
+
+        Args:
+            triangles: Mx3 array of triangle indices
+            n_vertices: Number of vertices in the mesh
+
+        Returns:
+            Hex digest identifying the connectivity
+        """
+        triangles = np.ascontiguousarray(triangles, dtype=np.int64)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(triangles.tobytes())
+        digest.update(f"{triangles.shape}{int(n_vertices)}".encode())
+        return digest.hexdigest()
+
+    @classmethod
+    def for_mesh(cls, triangles: np.ndarray, n_vertices: int) -> 'MeshTopology':
+        """
+        Return the cached topology for a mesh, building it on first use.
+
+        Args:
+            triangles: Mx3 array of triangle indices
+            n_vertices: Number of vertices in the mesh
+
+        Returns:
+            Shared MeshTopology instance
+        """
+        key = cls.connectivity_hash(triangles, n_vertices)
+        with cls._cache_lock:
+            topology = cls._topology_cache.get(key)
+            if topology is not None:
+                cls._topology_cache.move_to_end(key)
+                cls._cache_stats['hits'] += 1
+                return topology
+            cls._cache_stats['misses'] += 1
+
+        topology = cls(triangles, n_vertices)
+        logger.debug(f"Built mesh topology: {topology.n_edges} edges, "
+                     f"{len(topology.boundary_edges)} boundary edges")
+
+        with cls._cache_lock:
+            cls._topology_cache[key] = topology
+            while len(cls._topology_cache) > cls.max_cached_topologies:
+                cls._topology_cache.popitem(last=False)
+        return topology
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached topologies and reset statistics."""
+        with cls._cache_lock:
+            cls._topology_cache.clear()
+            for key in cls._cache_stats:
+                cls._cache_stats[key] = 0
+
+    @classmethod
+    def cache_info(cls) -> Dict[str, Any]:
+        """Return topology cache statistics."""
+        with cls._cache_lock:
+            return {
+                **cls._cache_stats,
+                'entries': len(cls._topology_cache),
+                'max_entries': cls.max_cached_topologies
+            }
@@ -5,9 +5,18 @@ Mesh utilities for AutoCAD integration and triangle mesh processing.
 import numpy as np
 import logging
 from typing import List, Tuple, Dict, Any, Optional
+from scipy import sparse
+from scipy.spatial import cKDTree
+
+from .mesh_topology import MeshTopology
 
 logger = logging.getLogger(__name__)
 
+# Edges or faces evaluated per block in QEM decimation; blocks this size keep
+# the many temporaries of the cost and flip tests in cache, which is over
+# twice as fast as whole-array operations on million-edge meshes
+QEM_BLOCK_SIZE = 1 << 14
+
 
 def extract_triangle_mesh(acad_entity) -> Tuple[np.ndarray, np.ndarray]:
     """
@@ -22,64 +31,16 @@ def extract_triangle_mesh(acad_entity) -> Tuple[np.ndarray, np.ndarray]:
     try:
         logger.info(f"Extracting triangle mesh from AutoCAD entity {acad_entity.ObjectID}")
         
-        # Get coordinates from AutoCAD entity
-        coordinates = acad_entity.Coordinates
-        
-        # Convert coordinates tuple to numpy array
-        coords_array = np.array(coordinates).reshape(-1, 3)
-        n_vertices = len(coords_array)
-        
-        logger.info(f"Extracted {n_vertices} vertices from AutoCAD mesh")
-        
-        # Determine mesh dimensions by analyzing coordinate patterns
-        vertices = []
-        for i in range(0, len(coordinates), 3):
-            vertices.append([coordinates[i], coordinates[i+1], coordinates[i+2]])
-        
-        vertices = np.array(vertices)
-        
-        # Find unique X and Y coordinates to determine grid size
-        x_coords = sorted(set(v[0] for v in vertices))
-        y_coords = sorted(set(v[1] for v in vertices))
-        
-        m_size = len(x_coords)  # Number of unique X positions
-        n_size = len(y_coords)  # Number of unique Y positions
-        
-        logger.info(f"Detected {m_size}x{n_size} grid mesh")
-        
-        # Generate triangle connectivity from mesh grid
-        triangles = []
-        
-        # Create mapping from (x,y) coordinates to vertex indices
-        coord_to_index = {}
-        for i, vertex in enumerate(vertices):
-            key = (vertex[0], vertex[1])
-            coord_to_index[key] = i
-        
-        # Generate triangles from grid structure
-        for i in range(m_size - 1):
-            for j in range(n_size - 1):
-                # Get the four corners of the grid cell
-                x0, x1 = x_coords[i], x_coords[i + 1]
-                y0, y1 = y_coords[j], y_coords[j + 1]
-                
-                # Find vertex indices for the four corners
-                try:
-                    v00 = coord_to_index[(x0, y0)]  # Bottom-left
-                    v10 = coord_to_index[(x1, y0)]  # Bottom-right
-                    v01 = coord_to_index[(x0, y1)]  # Top-left
-                    v11 = coord_to_index[(x1, y1)]  # Top-right
-                    
-                    # Create two triangles per quad (split diagonal)
-                    triangles.append([v00, v10, v01])  # Triangle 1
-                    triangles.append([v10, v11, v01])  # Triangle 2
-                    
-                except KeyError as e:
-                    logger.warning(f"Could not find vertex for coordinates {e}")
-                    continue
-        
-        triangles = np.array(triangles)
+        # One conversion of the flat COM coordinate tuple
+        vertices = polygon_mesh_vertices(acad_entity.Coordinates)
+        logger.info(f"Extracted {len(vertices)} vertices from AutoCAD mesh")
+        
+        grid = polygon_mesh_grid(acad_entity, vertices)
+        if grid is None:
+            raise ValueError(f"Could not determine grid dimensions for {len(vertices)} vertices")
+        logger.info(f"Detected {grid.shape[0]}x{grid.shape[1]} grid mesh")
         
+        triangles = grid_triangles(grid)
         logger.info(f"Generated {len(triangles)} triangles from mesh grid")
         
         return vertices, triangles
@@ -89,13 +50,103 @@ def extract_triangle_mesh(acad_entity) -> Tuple[np.ndarray, np.ndarray]:
         raise
 
 
-def analyze_mesh_curvature(vertices: np.ndarray, triangles: np.ndarray) -> Dict[str, Any]:
+def polygon_mesh_vertices(coordinates) -> np.ndarray:
+    """
+    Convert a flat Coordinates sequence (x0, y0, z0, x1, ...) to an Nx3 array.
+    
+    Args:
+        coordinates: Flat coordinate tuple, list or array from a mesh entity
+        
+    Returns:
+        Nx3 float64 array of vertex coordinates
+    """
+    return np.asarray(coordinates, dtype=np.float64).reshape(-1, 3)
+
+
+def _com_count(acad_entity, name: str) -> Optional[int]:
+    """Read an integer COM property, returning None when it is missing or not an int."""
+    value = getattr(acad_entity, name, None)
+    if isinstance(value, (int, np.integer)) and not isinstance(value, bool):
+        return int(value)
+    return None
+
+
+def polygon_mesh_grid(acad_entity, vertices: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Arrange the vertices of a PolygonMesh as an M x N grid of vertex indices.
+    
+    PolygonMesh vertices are stored row by row, so when the entity reports
+    MVertexCount and NVertexCount the grid is plain index arithmetic and works
+    for any orientation or warping. Closed directions (MClose/NClose) repeat
+    their first row or column. Without the counts, an axis-aligned grid is
+    recovered from the unique X and Y values and a square vertex count is
+    assumed to be stored row by row.
+    
+    Args:
+        acad_entity: AutoCAD PolygonMesh entity
+        vertices: Nx3 array from polygon_mesh_vertices
+        
+    Returns:
+        MxN int64 array of vertex indices, or None if no grid fits
+    """
+    n_vertices = len(vertices)
+    m_size = _com_count(acad_entity, 'MVertexCount')
+    n_size = _com_count(acad_entity, 'NVertexCount')
+    
+    if m_size and n_size and m_size * n_size == n_vertices:
+        grid = np.arange(n_vertices, dtype=np.int64).reshape(m_size, n_size)
+        if getattr(acad_entity, 'MClose', False) is True:
+            grid = np.vstack([grid, grid[:1]])
+        if getattr(acad_entity, 'NClose', False) is True:
+            grid = np.hstack([grid, grid[:, :1]])
+    else:
+        x_coords = np.unique(vertices[:, 0])
+        y_coords = np.unique(vertices[:, 1])
+        if len(x_coords) * len(y_coords) == n_vertices:
+            # Sort by X then Y; rows of the grid share an X position
+            grid = np.lexsort((vertices[:, 1], vertices[:, 0])).reshape(len(x_coords), len(y_coords))
+        else:
+            side = int(round(np.sqrt(n_vertices)))
+            if side * side != n_vertices:
+                return None
+            logger.info(f"Using fallback grid size: {side}x{side} for {n_vertices} vertices")
+            grid = np.arange(n_vertices, dtype=np.int64).reshape(side, side)
+    
+    if grid.shape[0] < 2 or grid.shape[1] < 2:
+        return None
+    return grid
+
+
+def grid_triangles(grid: np.ndarray) -> np.ndarray:
+    """
+    Split every cell of a vertex index grid into two triangles.
+    
+    Args:
+        grid: MxN array of vertex indices
+        
+    Returns:
+        (2*(M-1)*(N-1))x3 triangle array, both triangles of a cell adjacent
+    """
+    v00 = grid[:-1, :-1].ravel()
+    v10 = grid[1:, :-1].ravel()
+    v01 = grid[:-1, 1:].ravel()
+    v11 = grid[1:, 1:].ravel()
+    
+    triangles = np.empty((2 * len(v00), 3), dtype=np.int64)
+    triangles[0::2] = np.column_stack([v00, v10, v01])
+    triangles[1::2] = np.column_stack([v10, v11, v01])
+    return triangles
+
+
+def analyze_mesh_curvature(vertices: np.ndarray, triangles: np.ndarray,
+                           topology: Optional[MeshTopology] = None) -> Dict[str, Any]:
     """
     Analyze curvature properties of a triangle mesh.
     
     Args:
         vertices: Nx3 array of vertex coordinates
         triangles: Mx3 array of triangle indices
+        topology: Optional MeshTopology (defaults to the cached topology of the mesh)
         
     Returns:
         Dictionary containing curvature analysis results
@@ -103,80 +154,62 @@ def analyze_mesh_curvature(vertices: np.ndarray, triangles: np.ndarray) -> Dict[
     logger.info("Analyzing mesh curvature...")
     
     try:
+        vertices = np.asarray(vertices, dtype=np.float64)
+        triangles = np.asarray(triangles, dtype=np.int64)
         n_vertices = len(vertices)
-        vertex_curvatures = np.zeros(n_vertices)
-        vertex_normals = np.zeros((n_vertices, 3))
-        vertex_areas = np.zeros(n_vertices)
+        if topology is None:
+            topology = MeshTopology.for_mesh(triangles, n_vertices)
         
-        # Calculate face normals and areas
-        face_normals = []
-        face_areas = []
+        # Face normals and areas for all triangles at once
+        p0, p1, p2 = vertices[triangles[:, 0]], vertices[triangles[:, 1]], vertices[triangles[:, 2]]
+        cross = np.cross(p1 - p0, p2 - p0)
+        face_areas = np.linalg.norm(cross, axis=1) / 2.0
         
-        for triangle in triangles:
-            v0, v1, v2 = vertices[triangle]
-            
-            # Compute face normal and area
-            edge1 = v1 - v0
-            edge2 = v2 - v0
-            face_normal = np.cross(edge1, edge2)
-            face_area = np.linalg.norm(face_normal) / 2.0
-            
-            if face_area > 1e-12:
-                face_normal = face_normal / (2.0 * face_area)  # Normalize
-            else:
-                face_normal = np.array([0, 0, 1])  # Default normal for degenerate triangles
-            
-            face_normals.append(face_normal)
-            face_areas.append(face_area)
-            
-            # Accumulate vertex normals (area-weighted)
-            for vertex_idx in triangle:
-                vertex_normals[vertex_idx] += face_normal * face_area
-                vertex_areas[vertex_idx] += face_area / 3.0  # Distribute area equally
+        valid_faces = face_areas > 1e-12
+        face_normals = np.tile([0.0, 0.0, 1.0], (len(triangles), 1))  # Default for degenerate triangles
+        face_normals[valid_faces] = cross[valid_faces] / (2.0 * face_areas[valid_faces, None])
+        
+        # Area-weighted vertex normals and one third of each face area per vertex,
+        # accumulated through the vertex-face incidence matrix
+        accumulated = topology.vertex_faces @ np.column_stack([face_normals * face_areas[:, None],
+                                                               face_areas / 3.0])
+        vertex_normals = accumulated[:, :3]
+        vertex_areas = accumulated[:, 3]
         
         # Normalize vertex normals
-        for i in range(n_vertices):
-            if vertex_areas[i] > 1e-12:
-                vertex_normals[i] = vertex_normals[i] / np.linalg.norm(vertex_normals[i])
-        
-        # Calculate mean curvature using cotangent weights (simplified)
-        for i, vertex in enumerate(vertices):
-            curvature_sum = 0.0
-            weight_sum = 0.0
+        normal_lengths = np.linalg.norm(vertex_normals, axis=1)
+        normalize = (vertex_areas > 1e-12) & (normal_lengths > 1e-12)
+        vertex_normals[normalize] /= normal_lengths[normalize, None]
+        
+        # Area-weighted mean of the corner angles around each vertex
+        corners = triangles.ravel()
+        corner_angles = np.zeros(corners.shape)
+        corner_valid = np.zeros(corners.shape, dtype=bool)
+        points = (p0, p1, p2)
+        for k in range(3):
+            edge1 = points[(k + 1) % 3] - points[k]
+            edge2 = points[(k + 2) % 3] - points[k]
+            edge1_norm = np.linalg.norm(edge1, axis=1)
+            edge2_norm = np.linalg.norm(edge2, axis=1)
             
-            # Find triangles adjacent to this vertex
-            adjacent_triangles = []
-            for tri_idx, triangle in enumerate(triangles):
-                if i in triangle:
-                    adjacent_triangles.append((tri_idx, triangle))
+            # Corners whose vertex repeats in the triangle have no angle
+            distinct = (triangles[:, k] != triangles[:, (k + 1) % 3]) & (triangles[:, k] != triangles[:, (k + 2) % 3])
+            valid = distinct & (edge1_norm > 1e-12) & (edge2_norm > 1e-12)
             
-            # Calculate curvature contribution from each adjacent triangle
-            for tri_idx, triangle in adjacent_triangles:
-                # Find the other two vertices in the triangle
-                other_vertices = [v for v in triangle if v != i]
-                if len(other_vertices) != 2:
-                    continue
-                
-                v1, v2 = vertices[other_vertices]
-                
-                # Simple curvature approximation using angle between edges
-                edge1 = v1 - vertex
-                edge2 = v2 - vertex
-                
-                edge1_norm = np.linalg.norm(edge1)
-                edge2_norm = np.linalg.norm(edge2)
-                
-                if edge1_norm > 1e-12 and edge2_norm > 1e-12:
-                    cos_angle = np.clip(np.dot(edge1, edge2) / (edge1_norm * edge2_norm), -1, 1)
-                    angle = np.arccos(cos_angle)
-                    
-                    # Weight by triangle area
-                    weight = face_areas[tri_idx]
-                    curvature_sum += angle * weight
-                    weight_sum += weight
-            
-            if weight_sum > 1e-12:
-                vertex_curvatures[i] = curvature_sum / weight_sum
+            cos_angle = np.ones(len(triangles))
+            cos_angle[valid] = np.clip(
+                np.einsum('ij,ij->i', edge1[valid], edge2[valid]) / (edge1_norm[valid] * edge2_norm[valid]), -1, 1
+            )
+            corner_angles[k::3] = np.arccos(cos_angle)
+            corner_valid[k::3] = valid
+        
+        corner_weights = np.where(corner_valid, np.repeat(face_areas, 3), 0.0)
+        curvature_sum = np.bincount(corners, weights=corner_angles * corner_weights, minlength=n_vertices)
+        weight_sum = np.bincount(corners, weights=corner_weights, minlength=n_vertices)
+        
+        vertex_curvatures = np.zeros(n_vertices)
+        weighted = weight_sum > 1e-12
+        vertex_curvatures[weighted] = curvature_sum[weighted] / weight_sum[weighted]
         
         # Calculate curvature statistics
         mean_curvature = np.mean(vertex_curvatures)
@@ -215,13 +248,15 @@ def analyze_mesh_curvature(vertices: np.ndarray, triangles: np.ndarray) -> Dict[
         return {'error': str(e)}
 
 
-def validate_mesh_manifold(vertices: np.ndarray, triangles: np.ndarray) -> Dict[str, Any]:
+def validate_mesh_manifold(vertices: np.ndarray, triangles: np.ndarray,
+                           topology: Optional[MeshTopology] = None) -> Dict[str, Any]:
     """
     Validate that the mesh is a manifold suitable for LSCM.
     
     Args:
         vertices: Nx3 array of vertex coordinates
         triangles: Mx3 array of triangle indices
+        topology: Optional MeshTopology (defaults to the cached topology of the mesh)
         
     Returns:
         Dictionary containing validation results
@@ -233,49 +268,30 @@ def validate_mesh_manifold(vertices: np.ndarray, triangles: np.ndarray) -> Dict[
         n_triangles = len(triangles)
         
         # Check for degenerate triangles
-        degenerate_triangles = []
-        for i, triangle in enumerate(triangles):
-            v0, v1, v2 = vertices[triangle]
-            
-            # Calculate triangle area
-            edge1 = v1 - v0
-            edge2 = v2 - v0
-            area = np.linalg.norm(np.cross(edge1, edge2)) / 2.0
-            
-            if area < 1e-12:
-                degenerate_triangles.append(i)
-        
-        # Check for duplicate vertices
-        unique_vertices = np.unique(vertices, axis=0)
-        n_unique_vertices = len(unique_vertices)
-        
-        # Build edge adjacency information
-        edge_count = {}
-        boundary_edges = []
-        
-        for triangle in triangles:
-            for i in range(3):
-                v1 = triangle[i]
-                v2 = triangle[(i + 1) % 3]
-                
-                # Create canonical edge (smaller index first)
-                edge = tuple(sorted([v1, v2]))
-                
-                if edge in edge_count:
-                    edge_count[edge] += 1
-                else:
-                    edge_count[edge] = 1
-        
-        # Find boundary edges (appear only once)
-        for edge, count in edge_count.items():
-            if count == 1:
-                boundary_edges.append(edge)
-        
-        # Check for non-manifold edges (appear more than twice)
-        non_manifold_edges = [edge for edge, count in edge_count.items() if count > 2]
+        vertices = np.asarray(vertices, dtype=np.float64)
+        triangles = np.asarray(triangles, dtype=np.int64)
+        cross = np.cross(vertices[triangles[:, 1]] - vertices[triangles[:, 0]],
+                         vertices[triangles[:, 2]] - vertices[triangles[:, 0]])
+        areas = np.linalg.norm(cross, axis=1) / 2.0
+        degenerate_triangles = np.flatnonzero(areas < 1e-12).tolist()
+        
+        # Check for duplicate vertices: lexicographic sort, then compare neighbours
+        if n_vertices > 1:
+            ordered = vertices[np.lexsort(vertices.T[::-1])]
+            n_unique_vertices = 1 + int(np.count_nonzero(np.any(ordered[1:] != ordered[:-1], axis=1)))
+        else:
+            n_unique_vertices = n_vertices
+        
+        # Edge adjacency information from the shared topology
+        if topology is None:
+            topology = MeshTopology.for_mesh(triangles, n_vertices)
+        
+        # Boundary edges appear only once, non-manifold edges more than twice
+        boundary_edges = [tuple(edge) for edge in topology.edges[topology.edge_face_counts == 1].tolist()]
+        non_manifold_edges = [tuple(edge) for edge in topology.edges[topology.non_manifold_edges].tolist()]
         
         # Calculate Euler characteristic (V - E + F)
-        n_edges = len(edge_count)
+        n_edges = topology.n_edges
         euler_characteristic = n_vertices - n_edges + n_triangles
         
         # For a closed manifold: chi = 2 - 2*genus
@@ -288,6 +304,7 @@ def validate_mesh_manifold(vertices: np.ndarray, triangles: np.ndarray) -> Dict[
             'n_triangles': n_triangles,
             'n_edges': n_edges,
             'n_boundary_edges': len(boundary_edges),
+            'n_boundary_loops': len(topology.boundary_loops),
             'n_degenerate_triangles': len(degenerate_triangles),
             'n_non_manifold_edges': len(non_manifold_edges),
             'euler_characteristic': euler_characteristic,
@@ -318,57 +335,559 @@ def validate_mesh_manifold(vertices: np.ndarray, triangles: np.ndarray) -> Dict[
 
 
 def optimize_mesh_for_lscm(vertices: np.ndarray, triangles: np.ndarray, 
-                          max_vertices: int = 10000) -> Tuple[np.ndarray, np.ndarray]:
+                          max_vertices: int = 10000,
+                          return_mapping: bool = False) -> Tuple[np.ndarray, ...]:
     """
     Optimize mesh for LSCM processing by reducing complexity if needed.
     
+    Large meshes are simplified with quadric error metric edge collapse
+    (qem_decimate_mesh), which keeps the surface closed over, manifold and
+    its boundary unchanged.
+    
     Args:
         vertices: Original vertex array
         triangles: Original triangle array  
         max_vertices: Maximum allowed vertices
+        return_mapping: Also return the original-to-optimized vertex map, for use
+            with interpolate_to_original_vertices
         
     Returns:
-        Optimized vertices and triangles arrays
+        Optimized vertices and triangles arrays, plus the vertex map if requested
     """
     if len(vertices) <= max_vertices:
         logger.info("Mesh size acceptable, no optimization needed")
+        if return_mapping:
+            return vertices, triangles, np.arange(len(vertices))
         return vertices, triangles
     
     logger.info(f"Mesh too large ({len(vertices)} vertices), applying simplification...")
     
-    # Simple decimation strategy - remove every nth vertex
-    # In a production system, this would use sophisticated mesh decimation algorithms
+    optimized_vertices, optimized_triangles, vertex_map = qem_decimate_mesh(vertices, triangles, max_vertices)
+    
+    logger.info(f"Mesh optimized: {len(optimized_vertices)} vertices, {len(optimized_triangles)} triangles")
+    
+    if return_mapping:
+        return optimized_vertices, optimized_triangles, vertex_map
+    return optimized_vertices, optimized_triangles
+
+
+def qem_decimate_mesh(vertices: np.ndarray, triangles: np.ndarray, target_vertices: int,
+                      max_normal_change: float = 60.0,
+                      pool_fraction: float = 0.25,
+                      max_rounds: int = 500) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simplify a mesh by quadric error metric (Garland-Heckbert) edge collapse.
+    
+    Collapses are taken in vectorized rounds instead of one heap pop at a time.
+    Each round orders all edges by quadric error, like a collapse priority
+    queue, and takes the cheapest pool_fraction of them. A set of pool edges
+    that share no vertex or triangle then collapses at once. Collapses that
+    break the link condition or flip a triangle are skipped. Vertices on
+    boundaries and non-manifold edges are never removed, so open borders are
+    preserved exactly.
+    
+    The edge list and collapse costs are kept between rounds: only the edges
+    at a vertex that moved or was removed are rebuilt and re-costed, so a round
+    costs little more than the collapses it makes.
+    
+    Args:
+        vertices: Nx3 array of vertex coordinates
+        triangles: Mx3 array of triangle indices
+        target_vertices: Number of vertices to stop at
+        max_normal_change: Largest allowed rotation of a triangle normal per collapse, in degrees
+        pool_fraction: Fraction of the cheapest edges considered in each round
+        max_rounds: Upper bound on collapse rounds
+        
+    Returns:
+        Tuple of (vertices, triangles, original-to-simplified vertex map). The map
+        gives, for every original vertex, the simplified vertex it was merged into,
+        or -1 for vertices not referenced by any triangle.
+    """
+    vertices = np.array(vertices, dtype=np.float64)
+    triangles = np.asarray(triangles, dtype=np.int64)
+    n_vertices = len(vertices)
+    target_vertices = max(int(target_vertices), 3)
+    cos_limit = np.cos(np.radians(max_normal_change))
+    
+    quadrics = _face_quadrics_per_vertex(vertices, triangles)
+    vertex_map = np.arange(n_vertices)
+    rng = np.random.default_rng(0)
+    n_active = np.count_nonzero(np.bincount(triangles.ravel(), minlength=n_vertices))
+    
+    # Vertices on boundary (one face) and non-manifold (three or more faces)
+    # edges are locked. Collapses that pass the link condition keep those
+    # edges as they are, so the locked set is found once.
+    edges, counts = _edges_at_vertices(triangles, np.ones(n_vertices, dtype=bool))
+    locked = np.zeros(n_vertices, dtype=bool)
+    locked[edges[counts != 2].ravel()] = True
+    
+    positions, costs, survivors = _collapse_targets(vertices, quadrics, edges[:, 0], edges[:, 1], locked)
+    blocked = np.zeros(len(edges), dtype=bool)
+    
+    for _ in range(max_rounds):
+        if n_active <= target_vertices:
+            break
+        
+        a, b = edges[:, 0], edges[:, 1]
+        candidate_ids = np.flatnonzero((counts == 2) & ~(locked[a] & locked[b]) & ~blocked)
+        if len(candidate_ids) == 0:
+            break
+        
+        # Pop the cheapest pool_fraction of the queue; within the pool, random
+        # priorities give many non-interfering collapses per round
+        n_pool = max(1, int(pool_fraction * len(candidate_ids)))
+        if n_pool < len(candidate_ids):
+            candidate_ids = candidate_ids[np.argpartition(costs[candidate_ids], n_pool - 1)[:n_pool]]
+        selected = _independent_collapses(triangles, n_vertices, a[candidate_ids], b[candidate_ids],
+                                          rng.permutation(n_pool))
+        
+        chosen = candidate_ids[selected]
+        if len(chosen) == 0:
+            break
+        valid = _valid_collapses(vertices, triangles, a[chosen], b[chosen], positions[chosen],
+                                 counts[chosen], cos_limit)
+        blocked[chosen[~valid]] = True
+        chosen = chosen[valid]
+        # Stop exactly at the target with the cheapest collapses first
+        if len(chosen) > n_active - target_vertices:
+            chosen = chosen[np.argsort(costs[chosen], kind='stable')[:n_active - target_vertices]]
+        if len(chosen) == 0:
+            continue
+        
+        survivor = survivors[chosen]
+        removed = np.where(survivor == a[chosen], b[chosen], a[chosen])
+        vertices[survivor] = positions[chosen]
+        quadrics[survivor] += quadrics[removed]
+        
+        remap = np.arange(n_vertices)
+        remap[removed] = survivor
+        triangles = remap[triangles]
+        triangles = triangles[(triangles[:, 0] != triangles[:, 1]) &
+                              (triangles[:, 1] != triangles[:, 2]) &
+                              (triangles[:, 2] != triangles[:, 0])]
+        vertex_map = remap[vertex_map]
+        n_active -= len(chosen)
+        
+        # Replace the edges at the merged vertices with the ones around the survivors
+        changed = np.zeros(n_vertices, dtype=bool)
+        changed[survivor] = True
+        changed[removed] = True
+        kept = ~(changed[a] | changed[b])
+        new_edges, new_counts = _edges_at_vertices(triangles, changed)
+        new_positions, new_costs, new_survivors = _collapse_targets(
+            vertices, quadrics, new_edges[:, 0], new_edges[:, 1], locked
+        )
+        edges = np.concatenate([edges[kept], new_edges])
+        counts = np.concatenate([counts[kept], new_counts])
+        positions = np.concatenate([positions[kept], new_positions])
+        costs = np.concatenate([costs[kept], new_costs])
+        survivors = np.concatenate([survivors[kept], new_survivors])
+        blocked = np.concatenate([blocked[kept], np.zeros(len(new_edges), dtype=bool)])
+    
+    # Compact to the surviving vertices
+    used = np.zeros(n_vertices, dtype=bool)
+    used[triangles.ravel()] = True
+    compact = np.where(used, np.cumsum(used) - 1, -1)
+    
+    logger.info(f"QEM decimation: {n_vertices} -> {np.count_nonzero(used)} vertices, {len(triangles)} triangles")
+    return vertices[used], compact[triangles], compact[vertex_map]
+
+
+def _edges_at_vertices(triangles: np.ndarray, marked: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Edges with at least one marked endpoint, and their face counts.
+    
+    Every face of such an edge contains the marked endpoint, so the faces
+    around the marked vertices give the counts exactly.
+    
+    Returns:
+        Tuple of (Kx2 edges with the lower index first, face count per edge)
+    """
+    n_vertices = len(marked)
+    around = triangles[_faces_touching(triangles, marked)]
+    half_edges = around[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2)
+    low = np.minimum(half_edges[:, 0], half_edges[:, 1])
+    high = np.maximum(half_edges[:, 0], half_edges[:, 1])
+    touching = marked[low] | marked[high]
+    keys, counts = np.unique(low[touching] * n_vertices + high[touching], return_counts=True)
+    return np.column_stack([keys // n_vertices, keys % n_vertices]), counts
+
+
+def _independent_collapses(triangles: np.ndarray, n_vertices: int, a: np.ndarray, b: np.ndarray,
+                           rank: np.ndarray, max_passes: int = 16) -> np.ndarray:
+    """
+    Select edges whose collapses share no triangle, preferring low rank.
+    
+    Each pass takes the edges with the best rank at both endpoints, drops those
+    sharing a triangle with a better one, and then retires every edge touching
+    a triangle around a selected collapse. Passes repeat until the set is maximal.
+    
+    Returns:
+        Boolean mask over the edges
+    """
+    n_edges = len(a)
+    selected = np.zeros(n_edges, dtype=bool)
+    
+    # Work on the edges from worst to best rank so that plain fancy assignment
+    # leaves the best rank per vertex (rank is a permutation, no sort needed)
+    order = np.empty(n_edges, dtype=np.int64)
+    order[rank] = np.arange(n_edges)
+    order = order[::-1]
+    ca, cb, cr = a[order], b[order], rank[order]
+    
+    for pass_index in range(max_passes):
+        if len(order) == 0:
+            break
+        
+        # Only triangles at a remaining edge can conflict or retire edges; the
+        # first pass sees nearly all of them, later passes far fewer
+        if pass_index > 0:
+            live = np.zeros(n_vertices, dtype=bool)
+            live[ca] = True
+            live[cb] = True
+            triangles = triangles[_faces_touching(triangles, live)]
+        
+        # Best priority at both endpoints
+        vertex_best = np.full(n_vertices, n_edges, dtype=np.int64)
+        vertex_best[ca] = cr
+        vertex_best[cb] = np.minimum(vertex_best[cb], cr)
+        new = (vertex_best[ca] == cr) & (vertex_best[cb] == cr)
+        
+        # Of two new collapses touching the same triangle keep the better one
+        owner_rank = np.full(n_vertices, n_edges, dtype=np.int64)
+        owner_rank[ca[new]] = cr[new]
+        owner_rank[cb[new]] = cr[new]
+        face_ranks = owner_rank[triangles]
+        face_best = np.minimum(np.minimum(face_ranks[:, 0], face_ranks[:, 1]), face_ranks[:, 2])
+        conflicts = (face_ranks > face_best[:, None]) & (face_ranks < n_edges)
+        beaten = np.zeros(n_edges + 1, dtype=bool)
+        beaten[face_ranks[conflicts]] = True
+        new &= ~beaten[cr]
+        if not new.any():
+            break
+        selected[order[new]] = True
+        
+        # Retire edges that touch any triangle around a new collapse
+        endpoint = np.zeros(n_vertices, dtype=bool)
+        endpoint[ca[new]] = True
+        endpoint[cb[new]] = True
+        touched = np.zeros(n_vertices, dtype=bool)
+        touched[triangles[_faces_touching(triangles, endpoint)].ravel()] = True
+        available = ~(touched[ca] | touched[cb])
+        order, ca, cb, cr = order[available], ca[available], cb[available], cr[available]
+    
+    return selected
+
+
+def _faces_touching(triangles: np.ndarray, marked: np.ndarray) -> np.ndarray:
+    """Mask of the triangles with at least one marked vertex."""
+    return marked[triangles[:, 0]] | marked[triangles[:, 1]] | marked[triangles[:, 2]]
+
+
+def _sorted_unique(values: np.ndarray) -> np.ndarray:
+    """Sorted distinct values of a 1-D array."""
+    # Plain np.unique on large integer arrays takes a hash-based path in recent
+    # numpy releases that is many times slower than sorting
+    values = np.sort(values)
+    return values[np.concatenate([[True], values[1:] != values[:-1]])]
+
+
+def _face_quadrics_per_vertex(vertices: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+    """
+    Sum area-weighted plane quadrics of the faces around each vertex.
+    
+    Returns:
+        Nx10 array of the unique entries of each symmetric 4x4 quadric, in the
+        order aa, ab, ac, ad, bb, bc, bd, cc, cd, dd for the plane ax + by + cz + d
+    """
+    face_quadrics = np.concatenate([
+        _face_quadrics(vertices, triangles[start:start + QEM_BLOCK_SIZE])
+        for start in range(0, max(len(triangles), 1), QEM_BLOCK_SIZE)
+    ])
+    
+    # One sparse product with the vertex-face incidence sums all ten entries
+    incidence = sparse.csr_matrix(
+        (np.ones(triangles.size), (triangles.ravel(), np.repeat(np.arange(len(triangles)), 3))),
+        shape=(len(vertices), len(triangles))
+    )
+    return incidence @ face_quadrics
+
+
+def _face_quadrics(vertices: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+    """Area-weighted plane quadric of each face, as Mx10 unique entries."""
+    cross = np.cross(vertices[triangles[:, 1]] - vertices[triangles[:, 0]],
+                     vertices[triangles[:, 2]] - vertices[triangles[:, 0]])
+    double_areas = np.linalg.norm(cross, axis=1)
+    normals = np.zeros_like(cross)
+    valid = double_areas > 1e-12
+    normals[valid] = cross[valid] / double_areas[valid, None]
+    
+    planes = np.column_stack([normals, -np.einsum('ij,ij->i', normals, vertices[triangles[:, 0]])])
+    rows, cols = np.triu_indices(4)
+    return 0.5 * double_areas[:, None] * planes[:, rows] * planes[:, cols]
+
+
+def _quadric_error(q: np.ndarray, x: np.ndarray, y: np.ndarray, z: np.ndarray) -> np.ndarray:
+    """Evaluate [p, 1] Q [p, 1]^T for 10xN quadric entries and point coordinates."""
+    return (q[0] * x * x + q[4] * y * y + q[7] * z * z + q[9]
+            + 2.0 * (q[1] * x * y + q[2] * x * z + q[5] * y * z + q[3] * x + q[6] * y + q[8] * z))
+
+
+def _collapse_targets(vertices: np.ndarray, quadrics: np.ndarray, a: np.ndarray, b: np.ndarray,
+                      locked: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pick the collapse position of each edge and its quadric error.
+    
+    Free edges choose the cheapest of the two endpoints and the midpoint; edges
+    with a locked endpoint collapse onto it.
+    
+    Returns:
+        Tuple of (positions, costs, surviving vertex per edge)
+    """
+    if len(a) > QEM_BLOCK_SIZE:
+        blocks = [
+            _collapse_targets(vertices, quadrics, a[start:start + QEM_BLOCK_SIZE],
+                              b[start:start + QEM_BLOCK_SIZE], locked)
+            for start in range(0, len(a), QEM_BLOCK_SIZE)
+        ]
+        return tuple(np.concatenate(parts) for parts in zip(*blocks))
+    
+    # Component rows keep every array operation below on contiguous memory
+    q = np.ascontiguousarray((quadrics[a] + quadrics[b]).T)
+    first, second = vertices[a].T, vertices[b].T
+    midpoint = 0.5 * (first + second)
+    first_error, second_error, midpoint_error = (_quadric_error(q, *point)
+                                                 for point in (first, second, midpoint))
+    
+    second_error[locked[a]] = np.inf
+    midpoint_error[locked[a] | locked[b]] = np.inf
+    first_error[locked[b]] = np.inf
+    
+    # Cheapest candidate, ties going to the earlier one
+    take_second = second_error < first_error
+    costs = np.where(take_second, second_error, first_error)
+    take_midpoint = midpoint_error < costs
+    take_second &= ~take_midpoint
+    costs = np.maximum(np.where(take_midpoint, midpoint_error, costs), 0.0)
+    
+    positions = np.where(take_midpoint, midpoint, np.where(take_second, second, first)).T
+    survivors = np.where(take_second, b, a)
+    return positions, costs, survivors
+
+
+def _valid_collapses(vertices: np.ndarray, triangles: np.ndarray, a: np.ndarray, b: np.ndarray,
+                     positions: np.ndarray, edge_face_counts: np.ndarray,
+                     cos_limit: float) -> np.ndarray:
+    """
+    Check the link condition and normal flips for a batch of edge collapses.
+    
+    The collapses must be independent (see _independent_collapses): no
+    triangle touches the endpoints of two of them, so every face around an
+    endpoint belongs to exactly one edge.
+    
+    Returns:
+        Boolean array, True where collapsing (a, b) to positions is allowed
+    """
+    if len(a) == 0:
+        return np.zeros(0, dtype=bool)
+    
+    n_vertices = len(vertices)
+    owner = np.full(n_vertices, -1, dtype=np.int64)
+    owner[a] = np.arange(len(a))
+    owner[b] = np.arange(len(a))
+    face_vertices = triangles[_faces_touching(triangles, owner >= 0)]
+    face_owners = owner[face_vertices]
+    edge_of_face = np.maximum(np.maximum(face_owners[:, 0], face_owners[:, 1]), face_owners[:, 2])
+    is_a = face_vertices == a[edge_of_face, None]
+    is_b = face_vertices == b[edge_of_face, None]
+    touches_a = is_a[:, 0] | is_a[:, 1] | is_a[:, 2]
+    touches_b = is_b[:, 0] | is_b[:, 1] | is_b[:, 2]
+    
+    # Link condition: the only common neighbours are the edge's opposite vertices
+    other = ~(is_a | is_b)
+    ring_keys = np.repeat(edge_of_face, 3).reshape(-1, 3) * n_vertices + face_vertices
+    ring_a = _sorted_unique(ring_keys[other & touches_a[:, None]])
+    ring_b = _sorted_unique(ring_keys[other & touches_b[:, None]])
+    common = np.bincount(np.intersect1d(ring_a, ring_b, assume_unique=True) // n_vertices,
+                         minlength=len(a))
+    valid = common == edge_face_counts
     
-    decimation_factor = len(vertices) / max_vertices
-    keep_indices = np.arange(0, len(vertices), int(decimation_factor))
+    # Faces around either endpoint that survive the collapse must not flip;
+    # faces at an endpoint that stays in place keep their shape
+    a_moves = np.any(positions != vertices[a], axis=1)
+    b_moves = np.any(positions != vertices[b], axis=1)
+    moving = (is_a & a_moves[edge_of_face, None]) | (is_b & b_moves[edge_of_face, None])
+    check = ~(touches_a & touches_b) & (moving[:, 0] | moving[:, 1] | moving[:, 2])
+    edge_of_face, face_vertices, moving = edge_of_face[check], face_vertices[check], moving[check]
     
-    # Create mapping from old to new vertex indices
-    old_to_new = {old_idx: new_idx for new_idx, old_idx in enumerate(keep_indices)}
+    flipped = np.concatenate([np.zeros(0, dtype=bool)] + [
+        _flipped_faces(vertices[face_vertices[start:start + QEM_BLOCK_SIZE]],
+                       positions[edge_of_face[start:start + QEM_BLOCK_SIZE]],
+                       moving[start:start + QEM_BLOCK_SIZE], cos_limit)
+        for start in range(0, len(edge_of_face), QEM_BLOCK_SIZE)
+    ])
     
-    # Keep only selected vertices
-    optimized_vertices = vertices[keep_indices]
+    valid &= np.bincount(edge_of_face[flipped], minlength=len(a)) == 0
+    return valid
+
+
+def _flipped_faces(corners: np.ndarray, positions: np.ndarray, moving: np.ndarray,
+                   cos_limit: float) -> np.ndarray:
+    """
+    Test faces for degeneration or a large normal rotation when corners move.
     
-    # Update triangles to use new vertex indices
-    optimized_triangles = []
-    for triangle in triangles:
-        new_triangle = []
-        valid = True
+    Args:
+        corners: Fx3x3 corner coordinates before the collapse
+        positions: Fx3 collapse position per face
+        moving: Fx3 mask of the corners moved to the collapse position
+        cos_limit: Cosine of the largest allowed normal rotation
+    
+    Returns:
+        Boolean mask, True for faces the collapse would flip or flatten
+    """
+    moved = np.where(moving[:, :, None], positions[:, None, :], corners)
+    old_normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    new_normals = np.cross(moved[:, 1] - moved[:, 0], moved[:, 2] - moved[:, 0])
+    old_lengths = np.linalg.norm(old_normals, axis=1)
+    new_lengths = np.linalg.norm(new_normals, axis=1)
+    dots = np.einsum('ij,ij->i', old_normals, new_normals)
+    return (new_lengths <= 1e-12 * np.maximum(old_lengths, 1e-300)) | (dots < cos_limit * old_lengths * new_lengths)
+
+
+def interpolate_to_original_vertices(original_vertices: np.ndarray, vertices: np.ndarray,
+                                     triangles: np.ndarray, vertex_map: np.ndarray,
+                                     values: np.ndarray, nearest_faces: int = 8) -> np.ndarray:
+    """
+    Interpolate per-vertex values (e.g. UVs) from a simplified mesh back onto the original vertices.
+    
+    Every original vertex is projected onto the triangles around the simplified
+    vertex it was merged into and onto the triangles with the nearest centroids.
+    The values are blended with the barycentric coordinates of the closest
+    projection.
+    
+    Args:
+        original_vertices: Nx3 array of original vertex coordinates
+        vertices: Kx3 array of simplified vertex coordinates
+        triangles: Simplified triangle array
+        vertex_map: Original-to-simplified vertex map from qem_decimate_mesh
+        values: K or KxD array of values on the simplified vertices
+        nearest_faces: Number of nearest-centroid triangles added to the candidates
         
-        for vertex_idx in triangle:
-            if vertex_idx in old_to_new:
-                new_triangle.append(old_to_new[vertex_idx])
-            else:
-                valid = False
-                break
+    Returns:
+        N or NxD array of interpolated values (NaN for unreferenced original vertices)
+    """
+    original_vertices = np.asarray(original_vertices, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    flat = values.ndim == 1
+    if flat:
+        values = values[:, None]
+    
+    topology = MeshTopology.for_mesh(triangles, len(vertices))
+    mapped = np.flatnonzero(vertex_map >= 0)
+    
+    # Candidate faces: all faces around the merged vertex and its one-ring, plus
+    # the faces with the nearest centroids for vertices that drifted further
+    point_of, ring = _expand_csr_rows(topology.vertex_adjacency, vertex_map[mapped], mapped)
+    point_of = np.concatenate([mapped, point_of])
+    ring = np.concatenate([vertex_map[mapped], ring])
+    point_of, faces = _expand_csr_rows(topology.vertex_faces, ring, point_of)
+    
+    k = min(nearest_faces, len(triangles))
+    _, nearest = cKDTree(vertices[triangles].mean(axis=1)).query(original_vertices[mapped], k=k)
+    point_of = np.concatenate([point_of, np.repeat(mapped, k)])
+    faces = np.concatenate([faces, np.asarray(nearest).reshape(-1)])
+    
+    # Barycentric coordinates of each point's projection onto each candidate face
+    p0, p1, p2 = (vertices[triangles[faces, k]] for k in range(3))
+    e1, e2, d = p1 - p0, p2 - p0, original_vertices[point_of] - p0
+    d11, d12, d22 = (np.einsum('ij,ij->i', e1, e1), np.einsum('ij,ij->i', e1, e2),
+                     np.einsum('ij,ij->i', e2, e2))
+    d1, d2 = np.einsum('ij,ij->i', d, e1), np.einsum('ij,ij->i', d, e2)
+    denominator = np.where(np.abs(d11 * d22 - d12 ** 2) > 1e-300, d11 * d22 - d12 ** 2, 1.0)
+    w1 = (d22 * d1 - d12 * d2) / denominator
+    w2 = (d11 * d2 - d12 * d1) / denominator
+    weights = np.clip(np.column_stack([1.0 - w1 - w2, w1, w2]), 0.0, None)
+    weights /= np.maximum(weights.sum(axis=1, keepdims=True), 1e-300)
+    
+    projected = weights[:, :1] * p0 + weights[:, 1:2] * p1 + weights[:, 2:] * p2
+    distances = np.linalg.norm(projected - original_vertices[point_of], axis=1)
+    
+    # Closest candidate face per original vertex
+    order = np.lexsort((distances, point_of))
+    first = order[np.searchsorted(point_of[order], mapped)]
+    
+    result = np.full((len(original_vertices), values.shape[1]), np.nan)
+    result[mapped] = np.einsum('nk,nkd->nd', weights[first], values[triangles[faces[first]]])
+    return result[:, 0] if flat else result
+
+
+def _expand_csr_rows(matrix, rows: np.ndarray, labels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (label, column) pairs for every stored entry of the given CSR rows."""
+    starts = matrix.indptr[rows]
+    lengths = matrix.indptr[rows + 1] - starts
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return np.repeat(labels, lengths), matrix.indices[np.repeat(starts, lengths) + offsets]
+
+
+def cluster_decimate_mesh(vertices: np.ndarray, triangles: np.ndarray,
+                          target_vertices: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Coarsen a mesh by vertex clustering on a uniform grid.
+    
+    Vertices falling in the same grid cell are merged into their centroid and
+    triangles that collapse are dropped. The cell size is chosen from the surface
+    area so that roughly target_vertices clusters are occupied. This is fast and
+    fully vectorized but does not preserve topology, so it is intended for
+    building coarse levels (e.g. initial guesses), not for final output.
+    
+    Args:
+        vertices: Nx3 array of vertex coordinates
+        triangles: Mx3 array of triangle indices
+        target_vertices: Approximate number of vertices in the coarse mesh
         
-        if valid and len(set(new_triangle)) == 3:  # Avoid degenerate triangles
-            optimized_triangles.append(new_triangle)
+    Returns:
+        Tuple of (coarse vertices, coarse triangles, fine-to-coarse vertex map)
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    triangles = np.asarray(triangles, dtype=np.int64)
+    target_vertices = max(int(target_vertices), 3)
     
-    optimized_triangles = np.array(optimized_triangles)
+    cross = np.cross(vertices[triangles[:, 1]] - vertices[triangles[:, 0]],
+                     vertices[triangles[:, 2]] - vertices[triangles[:, 0]])
+    surface_area = 0.5 * np.linalg.norm(cross, axis=1).sum()
+    origin = vertices.min(axis=0)
     
-    logger.info(f"Mesh optimized: {len(optimized_vertices)} vertices, {len(optimized_triangles)} triangles")
+    # Occupied cells on a surface scale with area / cell_size^2; refine the
+    # estimate a few times from the observed cluster count
+    cell_size = np.sqrt(max(surface_area, 1e-24) / target_vertices)
+    for _ in range(4):
+        cells = np.floor((vertices - origin) / cell_size).astype(np.int64)
+        _, clusters = np.unique(cells, axis=0, return_inverse=True)
+        clusters = clusters.ravel()
+        n_clusters = int(clusters.max()) + 1
+        if abs(n_clusters - target_vertices) <= 0.1 * target_vertices:
+            break
+        cell_size *= np.sqrt(n_clusters / target_vertices)
     
-    return optimized_vertices, optimized_triangles
+    # Cluster centroids
+    counts = np.bincount(clusters, minlength=n_clusters)
+    coarse_vertices = np.column_stack([
+        np.bincount(clusters, weights=vertices[:, axis], minlength=n_clusters) / counts
+        for axis in range(3)
+    ])
+    
+    # Drop collapsed and duplicate triangles, keeping original orientation
+    coarse_triangles = clusters[triangles]
+    collapsed = ((coarse_triangles[:, 0] == coarse_triangles[:, 1]) |
+                 (coarse_triangles[:, 1] == coarse_triangles[:, 2]) |
+                 (coarse_triangles[:, 2] == coarse_triangles[:, 0]))
+    coarse_triangles = coarse_triangles[~collapsed]
+    _, first = np.unique(np.sort(coarse_triangles, axis=1), axis=0, return_index=True)
+    coarse_triangles = coarse_triangles[np.sort(first)]
+    
+    logger.info(f"Clustered mesh from {len(vertices)} to {n_clusters} vertices, "
+                f"{len(coarse_triangles)} triangles")
+    return coarse_vertices, coarse_triangles, clusters
 
 
 def generate_simple_mesh(rows: int = 5, cols: int = 5) -> Tuple[np.ndarray, np.ndarray]:
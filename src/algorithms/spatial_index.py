@@ -0,0 +1,243 @@
+"""
+KD-tree spatial index over mesh vertices.
+
+VertexSpatialIndex wraps scipy.spatial.cKDTree for nearest-vertex lookups
+(snapping picked points to the mesh) and farthest-point sampling. Indices are
+cached by a hash of the vertex positions, so repeated queries against the same
+mesh build the tree only once.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+logger = logging.getLogger(__name__)
+
+
+class VertexSpatialIndex:
+    """
+    Nearest-neighbour index over the vertices of a mesh.
+
+    Attributes:
+        vertices: Nx3 float64 vertex array the tree was built on
+        tree: cKDTree over the vertices
+    """
+
+    # Shared cache of indices keyed by vertex hash
+    max_cached_indices = 8
+    _index_cache: 'OrderedDict[str, VertexSpatialIndex]' = OrderedDict()
+    _cache_lock = threading.Lock()
+    _cache_stats = {'hits': 0, 'misses': 0}
+
+    # Candidates per block of the farthest-point sampling maxima
+    sample_block_size = 256
+
+    def __init__(self, vertices: np.ndarray):
+        """
+        Build the KD-tree over a vertex array.
+
+        Args:
+            vertices: NxD array of vertex coordinates
+        """
+        self.vertices = np.ascontiguousarray(vertices, dtype=np.float64)
+        if self.vertices.ndim != 2 or len(self.vertices) == 0:
+            raise ValueError("Spatial index needs a non-empty NxD vertex array")
+        self.tree = cKDTree(self.vertices)
+
+    @property
+    def n_vertices(self) -> int:
+        """Number of indexed vertices."""
+        return len(self.vertices)
+
+    def nearest_vertices(self, points: np.ndarray,
+                         max_distance: float = np.inf) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the nearest mesh vertex to each query point.
+
+        Args:
+            points: KxD array (or single D point) of query coordinates
+            max_distance: Points farther than this from every vertex get index -1
+
+        Returns:
+            Tuple of (distances, vertex indices), each of length K
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        distances, indices = self.tree.query(points, distance_upper_bound=max_distance)
+        indices = np.where(np.isfinite(distances), indices, -1)
+        return distances, indices.astype(np.int64)
+
+    def nearest_vertex(self, point: Sequence[float]) -> int:
+        """
+        Return the index of the mesh vertex closest to a point.
+
+        Args:
+            point: Query coordinates
+
+        Returns:
+            Vertex index
+        """
+        return int(self.nearest_vertices(point)[1][0])
+
+    def farthest_point_sample(self, count: int, candidates: Optional[Sequence[int]] = None,
+                              start: Optional[int] = None) -> List[int]:
+        """
+        Pick well-spread vertices by farthest-point sampling.
+
+        Each step adds the candidate farthest from the vertices chosen so far.
+        Only candidates inside the current sampling radius can move closer to a
+        new sample, so each step updates a ball query around it instead of
+        every candidate. The farthest candidate is found from per-block maxima
+        of the distances, and only blocks the ball update touched are rescanned.
+
+        Args:
+            count: Number of vertices to pick
+            candidates: Optional vertex indices to sample from (defaults to all vertices)
+            start: Optional first vertex (defaults to the first candidate)
+
+        Returns:
+            List of chosen vertex indices, in selection order
+
+        Raises:
+            ValueError: If start is not one of the candidates
+        """
+        if candidates is None:
+            candidates = np.arange(self.n_vertices)
+            tree = self.tree
+        else:
+            candidates = np.asarray(candidates, dtype=np.int64)
+            tree = cKDTree(self.vertices[candidates])
+        if len(candidates) == 0 or count <= 0:
+            return []
+
+        first = 0
+        if start is not None:
+            matches = np.flatnonzero(candidates == start)
+            if len(matches) == 0:
+                raise ValueError(f"Start vertex {start} is not among the candidates")
+            first = int(matches[0])
+
+        positions = tree.data
+        chosen = [first]
+        n_blocks = -(-len(positions) // self.sample_block_size)
+        nearest = np.full(n_blocks * self.sample_block_size, -1.0)
+        nearest[:len(positions)] = np.linalg.norm(positions - positions[first], axis=1)
+        nearest[first] = -1.0
+        # Block maxima give the farthest candidate without scanning all of them;
+        # the first maximal block holds the first maximal candidate, as argmax would
+        blocks = nearest.reshape(n_blocks, self.sample_block_size)
+        block_max = blocks.max(axis=1)
+        touched = np.zeros(n_blocks, dtype=bool)
+
+        while len(chosen) < min(count, len(candidates)):
+            block = int(np.argmax(block_max))
+            best = block * self.sample_block_size + int(np.argmax(blocks[block]))
+            radius = nearest[best]
+            if radius <= 0.0:
+                break
+            chosen.append(best)
+            nearest[best] = -1.0
+            # Candidates farther than the sampling radius cannot become nearer
+            ball = np.asarray(tree.query_ball_point(positions[best], radius), dtype=np.int64)
+            distance = np.linalg.norm(positions[ball] - positions[best], axis=1)
+            closer = distance < nearest[ball]
+            ball = ball[closer]
+            nearest[ball] = distance[closer]
+
+            touched[ball // self.sample_block_size] = True
+            touched[block] = True
+            stale = np.flatnonzero(touched)
+            touched[stale] = False
+            block_max[stale] = blocks[stale].max(axis=1)
+
+        return candidates[chosen].tolist()
+
+    @staticmethod
+    def vertex_hash(vertices: np.ndarray) -> str:
+        """
+        Content hash of a vertex array.
+
+        Args:
+            vertices: NxD array of vertex coordinates
+
+        Returns:
+            Hex digest identifying the vertex positions
+        """
+        vertices = np.ascontiguousarray(vertices, dtype=np.float64)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(vertices.tobytes())
+        digest.update(f"{vertices.shape}".encode())
+        return digest.hexdigest()
+
+    @classmethod
+    def for_mesh(cls, vertices: np.ndarray) -> 'VertexSpatialIndex':
+        """
+        Return the cached spatial index for a vertex array, building it on first use.
+
+        Args:
+            vertices: NxD array of vertex coordinates
+
+        Returns:
+            Shared VertexSpatialIndex instance
+        """
+        key = cls.vertex_hash(vertices)
+        with cls._cache_lock:
+            index = cls._index_cache.get(key)
+            if index is not None:
+                cls._index_cache.move_to_end(key)
+                cls._cache_stats['hits'] += 1
+                return index
+            cls._cache_stats['misses'] += 1
+
+        index = cls(vertices)
+        logger.debug(f"Built vertex spatial index over {index.n_vertices} vertices")
+
+        with cls._cache_lock:
+            cls._index_cache[key] = index
+            while len(cls._index_cache) > cls.max_cached_indices:
+                cls._index_cache.popitem(last=False)
+        return index
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached indices and reset statistics."""
+        with cls._cache_lock:
+            cls._index_cache.clear()
+            for key in cls._cache_stats:
+                cls._cache_stats[key] = 0
+
+    @classmethod
+    def cache_info(cls) -> Dict[str, Any]:
+        """Return spatial index cache statistics."""
+        with cls._cache_lock:
+            return {
+                **cls._cache_stats,
+                'entries': len(cls._index_cache),
+                'max_entries': cls.max_cached_indices
+            }
+
+
+def snap_point_constraints(vertices: np.ndarray, point_constraints: Sequence[Sequence[float]],
+                           max_distance: float = np.inf) -> List[Tuple[int, float, float]]:
+    """
+    Turn picked-point UV constraints into vertex-index constraints.
+
+    Args:
+        vertices: Nx3 array of vertex coordinates
+        point_constraints: Rows of (x, y, z, u, v)
+        max_distance: Maximum allowed distance from a point to its vertex
+
+    Returns:
+        List of (vertex_index, u, v) tuples for unfold_surface_lscm
+    """
+    rows = np.asarray(point_constraints, dtype=np.float64).reshape(-1, 5)
+    distances, indices = VertexSpatialIndex.for_mesh(vertices).nearest_vertices(rows[:, :3], max_distance)
+    if np.any(indices < 0):
+        far = int(np.flatnonzero(indices < 0)[0])
+        raise ValueError(f"Constraint point {rows[far, :3].tolist()} is farther than "
+                         f"{max_distance} from every mesh vertex")
+    return [(int(index), float(u), float(v)) for index, (u, v) in zip(indices, rows[:, 3:])]
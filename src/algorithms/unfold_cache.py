@@ -0,0 +1,481 @@
+"""
+Content-addressed cache for LSCM surface unfolding results.
+
+Results are keyed by a hash of the mesh arrays, constraints, solver options and
+CACHE_KEY_VERSION, kept in a bounded in-memory LRU tier and persisted as .npz files plus a JSON
+index so repeated unfolds of the same parts survive server restarts.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Environment variable overriding the on-disk cache location
+CACHE_DIR_ENV = 'AUTOCAD_MCP_CACHE_DIR'
+
+# Version of the unfolding algorithm and stored result layout, hashed into every
+# key. Bump it whenever solver output or the .npz schema changes so persisted
+# results from older code are never served (they age out through eviction).
+CACHE_KEY_VERSION = 1
+
+# Result options that do not change the unfolding result and are left out of the key
+_NON_KEY_OPTIONS = ('use_cache',)
+
+# Per-request fields added to batch results that are not stored in the cache
+_BATCH_FIELDS = ('part_index', 'part_id', 'elapsed_time')
+
+
+def default_cache_dir() -> Path:
+    """Return the on-disk cache directory for unfolding results."""
+    base = os.environ.get(CACHE_DIR_ENV)
+    if base:
+        return Path(base) / 'unfold'
+    return Path.home() / '.autocad_mcp' / 'cache' / 'unfold'
+
+
+def _update_digest(digest, value: Any) -> None:
+    """Feed a nested value into a hash digest in a canonical form."""
+    if isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value)
+        digest.update(f"ndarray{array.dtype.str}{array.shape}".encode())
+        digest.update(array.tobytes())
+    elif isinstance(value, dict):
+        digest.update(b'{')
+        for key in sorted(value, key=str):
+            digest.update(str(key).encode())
+            _update_digest(digest, value[key])
+        digest.update(b'}')
+    elif isinstance(value, (list, tuple)):
+        digest.update(b'[')
+        for item in value:
+            _update_digest(digest, item)
+        digest.update(b']')
+    else:
+        digest.update(repr(value).encode())
+
+
+def _json_default(value: Any) -> Any:
+    """JSON fallback for NumPy scalars and arrays in result metadata."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class UnfoldResultCache:
+    """
+    Two-tier (memory + disk) cache for unfold_surface_lscm results.
+
+    The memory tier is an LRU bounded by entry count and bytes. The disk tier
+    stores one .npz file per result and evicts least recently used files once
+    the directory exceeds max_disk_bytes.
+    """
+
+    INDEX_FILENAME = 'index.json'
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None,
+                 max_memory_entries: int = 64,
+                 max_memory_bytes: int = 256 * 1024 * 1024,
+                 max_disk_bytes: int = 2 * 1024 * 1024 * 1024,
+                 enable_disk: bool = True):
+        """
+        Initialize the result cache.
+
+        Args:
+            cache_dir: Directory for the disk tier (defaults to default_cache_dir())
+            max_memory_entries: Maximum number of results kept in memory
+            max_memory_bytes: Maximum approximate size of the memory tier
+            max_disk_bytes: Maximum total size of cached .npz files on disk
+            enable_disk: Set False for a memory-only cache
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self.max_memory_entries = max_memory_entries
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.enable_disk = enable_disk
+
+        self._memory: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._memory_bytes = 0
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self._stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'memory_evictions': 0,
+            'disk_evictions': 0,
+            'errors': 0
+        }
+
+        if self.enable_disk:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                self._load_index()
+            except OSError as e:
+                logger.warning(f"Unfold cache disk tier disabled, cannot use {self.cache_dir}: {e}")
+                self.enable_disk = False
+
+    @staticmethod
+    def make_key(vertices: np.ndarray, triangles: np.ndarray,
+                 boundary_constraints: Optional[Any] = None,
+                 manufacturing_constraints: Optional[Dict[str, Any]] = None,
+                 distortion_tolerance: float = 0.001,
+                 **options: Any) -> str:
+        """
+        Compute the content hash identifying an unfolding request.
+
+        The hash also covers CACHE_KEY_VERSION, so results computed by an
+        older solver never match.
+
+        Args:
+            vertices: Nx3 array of vertex coordinates
+            triangles: Mx3 array of triangle indices
+            boundary_constraints: Optional (vertex_index, u, v) constraints
+            manufacturing_constraints: Optional manufacturing constraint dictionary
+            distortion_tolerance: Distortion tolerance passed to the unfolder
+            **options: Additional unfold_surface_lscm keyword arguments
+
+        Returns:
+            Hex digest key
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        _update_digest(digest, CACHE_KEY_VERSION)
+        _update_digest(digest, np.asarray(vertices, dtype=np.float64))
+        _update_digest(digest, np.asarray(triangles, dtype=np.int64))
+        _update_digest(digest, [tuple(float(x) for x in bc) for bc in (boundary_constraints or [])])
+        _update_digest(digest, manufacturing_constraints or {})
+        _update_digest(digest, float(distortion_tolerance))
+        _update_digest(digest, {k: v for k, v in options.items() if k not in _NON_KEY_OPTIONS})
+        return digest.hexdigest()
+
+    def unfold(self, vertices: np.ndarray, triangles: np.ndarray,
+               boundary_constraints: Optional[Any] = None,
+               manufacturing_constraints: Optional[Dict[str, Any]] = None,
+               distortion_tolerance: float = 0.001,
+               **options: Any) -> Dict[str, Any]:
+        """
+        Cached front end for algorithms.lscm.unfold_surface_lscm.
+
+        Args:
+            vertices: Nx3 array of vertex coordinates
+            triangles: Mx3 array of triangle indices
+            boundary_constraints: Optional (vertex_index, u, v) constraints
+            manufacturing_constraints: Optional manufacturing constraint dictionary
+            distortion_tolerance: Maximum acceptable distortion level
+            **options: Additional unfold_surface_lscm keyword arguments
+
+        Returns:
+            Unfolding result dictionary with a 'result_cache' entry describing the lookup
+        """
+        from .lscm import unfold_surface_lscm
+
+        key = self.make_key(vertices, triangles, boundary_constraints,
+                            manufacturing_constraints, distortion_tolerance, **options)
+
+        cached, tier = self.get(key)
+        if cached is not None:
+            cached['result_cache'] = {'hit': True, 'tier': tier, 'key': key}
+            return cached
+
+        result = unfold_surface_lscm(
+            np.asarray(vertices, dtype=np.float64),
+            np.asarray(triangles, dtype=np.int32),
+            boundary_constraints=boundary_constraints,
+            manufacturing_constraints=manufacturing_constraints,
+            distortion_tolerance=distortion_tolerance,
+            **options
+        )
+
+        if result.get('success'):
+            self.put(key, result)
+
+        result['result_cache'] = {'hit': False, 'tier': None, 'key': key}
+        return result
+
+    def unfold_batch(self, parts: List[Dict[str, Any]],
+                     distortion_tolerance: float = 0.001,
+                     max_workers: Optional[int] = None,
+                     **options: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Cached front end for algorithms.lscm.unfold_surfaces_batch.
+
+        Cached parts are yielded immediately; the remaining parts are unfolded in
+        the process pool and yielded (and stored) as they finish.
+
+        Args:
+            parts: Part dictionaries as accepted by unfold_surfaces_batch
+            distortion_tolerance: Maximum acceptable distortion level
+            max_workers: Process pool size (None = os.cpu_count())
+            **options: Additional unfold_surface_lscm keyword arguments
+
+        Yields:
+            Result dictionaries with 'part_index', 'part_id' and 'result_cache' entries
+        """
+        from .lscm import unfold_surfaces_batch
+
+        pending = []
+        keys = []
+        for index, part in enumerate(parts):
+            try:
+                key = self.make_key(part['vertices'], part['triangles'],
+                                    part.get('boundary_constraints'),
+                                    part.get('manufacturing_constraints'),
+                                    distortion_tolerance, **options)
+            except Exception:
+                # Malformed input is reported by the batch unfolder itself
+                key = None
+
+            cached, tier = self.get(key) if key is not None else (None, None)
+            if cached is not None:
+                cached['part_index'] = index
+                cached['part_id'] = part.get('part_id', index)
+                cached['elapsed_time'] = 0.0
+                cached['result_cache'] = {'hit': True, 'tier': tier, 'key': key}
+                yield cached
+                continue
+
+            pending.append({**part, 'part_id': part.get('part_id', index)})
+            keys.append((index, key))
+
+        for result in unfold_surfaces_batch(pending, max_workers=max_workers,
+                                            distortion_tolerance=distortion_tolerance, **options):
+            index, key = keys[result['part_index']]
+            if key is not None and result.get('success'):
+                self.put(key, {k: v for k, v in result.items() if k not in _BATCH_FIELDS})
+            result['part_index'] = index
+            result['result_cache'] = {'hit': False, 'tier': None, 'key': key}
+            yield result
+
+    def get(self, key: str):
+        """
+        Look up a cached result.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Tuple of (result dictionary or None, tier name or None)
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self._stats['memory_hits'] += 1
+                if key in self._index:
+                    self._index[key]['last_access'] = time.time()
+                return self._to_result(entry), 'memory'
+
+            if self.enable_disk and key in self._index:
+                entry = self._read_entry(key)
+                if entry is not None:
+                    self._stats['disk_hits'] += 1
+                    self._index[key]['last_access'] = time.time()
+                    self._write_index()
+                    self._remember(key, entry)
+                    return self._to_result(entry), 'disk'
+
+            self._stats['misses'] += 1
+            return None, None
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """
+        Store a successful unfolding result in both tiers.
+
+        Args:
+            key: Key from make_key
+            result: Result dictionary from unfold_surface_lscm
+        """
+        entry = self._to_entry(result)
+
+        with self._lock:
+            self._stats['stores'] += 1
+            self._remember(key, entry)
+
+            if self.enable_disk:
+                try:
+                    self._write_entry(key, entry)
+                except OSError as e:
+                    self._stats['errors'] += 1
+                    logger.warning(f"Failed to persist unfold result {key}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and tier sizes."""
+        with self._lock:
+            lookups = self._stats['memory_hits'] + self._stats['disk_hits'] + self._stats['misses']
+            hits = self._stats['memory_hits'] + self._stats['disk_hits']
+            return {
+                **self._stats,
+                'hit_rate': hits / lookups if lookups else 0.0,
+                'memory_entries': len(self._memory),
+                'memory_bytes': self._memory_bytes,
+                'disk_enabled': self.enable_disk,
+                'disk_entries': len(self._index),
+                'disk_bytes': sum(item['size'] for item in self._index.values()),
+                'cache_dir': str(self.cache_dir) if self.enable_disk else None
+            }
+
+    def clear(self, disk: bool = True) -> None:
+        """
+        Remove cached results.
+
+        Args:
+            disk: Also delete the persisted .npz files and index
+        """
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if disk and self.enable_disk:
+                for key in list(self._index):
+                    self._remove_file(key)
+                self._index.clear()
+                self._write_index()
+
+    def _to_entry(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Split a result into compact arrays and JSON-able metadata."""
+        metadata = {k: v for k, v in result.items()
+                    if k not in ('uv_coordinates', 'triangle_indices', 'result_cache')}
+        metadata_json = json.dumps(metadata, default=_json_default)
+        uv = np.asarray(result['uv_coordinates'], dtype=np.float64)
+        tris = np.asarray(result['triangle_indices'], dtype=np.int64)
+        return {
+            'uv_coordinates': uv,
+            'triangle_indices': tris,
+            'metadata': metadata_json,
+            'nbytes': uv.nbytes + tris.nbytes + len(metadata_json)
+        }
+
+    @staticmethod
+    def _to_result(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Rebuild a fresh result dictionary from a cache entry."""
+        result = json.loads(entry['metadata'])
+        result['uv_coordinates'] = entry['uv_coordinates'].tolist()
+        result['triangle_indices'] = entry['triangle_indices'].tolist()
+        return result
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        """Insert into the memory tier and evict down to its bounds."""
+        if key in self._memory:
+            self._memory_bytes -= self._memory.pop(key)['nbytes']
+        self._memory[key] = entry
+        self._memory_bytes += entry['nbytes']
+
+        while self._memory and (len(self._memory) > self.max_memory_entries
+                                or self._memory_bytes > self.max_memory_bytes):
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted['nbytes']
+            self._stats['memory_evictions'] += 1
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.npz"
+
+    def _write_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        """Persist an entry as .npz and update the index."""
+        path = self._path(key)
+        tmp_path = path.with_suffix('.tmp.npz')
+        np.savez(tmp_path,
+                 uv_coordinates=entry['uv_coordinates'],
+                 triangle_indices=entry['triangle_indices'],
+                 metadata=np.array(entry['metadata']))
+        os.replace(tmp_path, path)
+
+        self._index[key] = {'size': path.stat().st_size, 'last_access': time.time()}
+        self._evict_disk()
+        self._write_index()
+
+    def _read_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load an entry from disk, dropping it from the index if unreadable."""
+        try:
+            with np.load(self._path(key), allow_pickle=False) as data:
+                metadata = str(data['metadata'])
+                uv = data['uv_coordinates']
+                tris = data['triangle_indices']
+            return {
+                'uv_coordinates': uv,
+                'triangle_indices': tris,
+                'metadata': metadata,
+                'nbytes': uv.nbytes + tris.nbytes + len(metadata)
+            }
+        except (OSError, KeyError, ValueError) as e:
+            self._stats['errors'] += 1
+            logger.warning(f"Discarding unreadable cached unfold result {key}: {e}")
+            self._index.pop(key, None)
+            self._remove_file(key)
+            self._write_index()
+            return None
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used files until the disk tier fits its budget."""
+        total = sum(item['size'] for item in self._index.values())
+        if total <= self.max_disk_bytes:
+            return
+
+        for key in sorted(self._index, key=lambda k: self._index[k]['last_access']):
+            if total <= self.max_disk_bytes:
+                break
+            total -= self._index.pop(key)['size']
+            self._remove_file(key)
+            self._stats['disk_evictions'] += 1
+
+    def _remove_file(self, key: str) -> None:
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to delete cached unfold result {key}: {e}")
+
+    def _load_index(self) -> None:
+        """Load the disk index, rebuilding it from the .npz files if missing or corrupt."""
+        index_path = self.cache_dir / self.INDEX_FILENAME
+        try:
+            with open(index_path, 'r') as f:
+                index = json.load(f)
+            self._index = {key: item for key, item in index.items() if self._path(key).exists()}
+        except (OSError, ValueError):
+            self._index = {}
+            for path in self.cache_dir.glob('*.npz'):
+                if path.name.endswith('.tmp.npz'):
+                    continue
+                stat = path.stat()
+                self._index[path.stem] = {'size': stat.st_size, 'last_access': stat.st_mtime}
+            if self._index:
+                logger.info(f"Rebuilt unfold cache index with {len(self._index)} entries")
+
+    def _write_index(self) -> None:
+        """Atomically write the disk index."""
+        if not self.enable_disk:
+            return
+        index_path = self.cache_dir / self.INDEX_FILENAME
+        tmp_path = index_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self._index, f)
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            self._stats['errors'] += 1
+            logger.warning(f"Failed to write unfold cache index: {e}")
+
+
+_default_cache: Optional[UnfoldResultCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_unfold_cache() -> UnfoldResultCache:
+    """Return the process-wide unfolding result cache, creating it on first use."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = UnfoldResultCache()
+        return _default_cache
@@ -13,6 +13,631 @@ from src.mcp_interface.algorithm_interface import (
     AlgorithmCategory
 )
 
+# Upper bound on point-edge pairs evaluated at once by the batched tests
+DEFAULT_CHUNK_ELEMENTS = 1 << 22
+
+# Point-in-polygon strategies accepted by _point_in_polygon
+POINT_IN_POLYGON_METHODS = ('auto', 'broadcast', 'grid')
+
+# Above this many point-edge pairs 'auto' switches to the edge grid
+GRID_THRESHOLD_PAIRS = 1 << 24
+
+# Boolean operations computed by polygon_boolean
+BOOLEAN_OPERATIONS = ('intersection', 'union', 'difference')
+
+# Points closer than this fraction of the coordinate magnitude to a segment's
+# line count as lying on it
+SNAP_TOLERANCE = 1e-9
+
+
+def _polygon_edges(polygon: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Non-horizontal edges of a closed polygon for crossing tests.
+    
+    Horizontal edges never cross a horizontal ray, so they are dropped.
+    
+    Args:
+        polygon: Mx2 polygon vertices (further columns are ignored)
+    
+    Returns:
+        Tuple of (start points, end points) of the kept edges
+    """
+    start = np.asarray(polygon, dtype=np.float64)[:, :2]
+    end = np.roll(start, -1, axis=0)
+    keep = start[:, 1] != end[:, 1]
+    return start[keep], end[keep]
+
+
+def _crossed(px: np.ndarray, py: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """
+    Whether a ray from (px, py) towards +x crosses edges start-end.
+    
+    The crossing abscissa is evaluated in the same order as the scalar ray
+    casting test, so points exactly on an edge classify identically.
+    """
+    spans = (start[..., 1] < py) != (end[..., 1] < py)
+    crossing_x = ((py - start[..., 1]) * (end[..., 0] - start[..., 0])
+                  / (end[..., 1] - start[..., 1]) + start[..., 0])
+    return spans & (px <= crossing_x)
+
+
+def points_in_polygon(
+    points: np.ndarray, 
+    polygon: np.ndarray, 
+    chunk_elements: int = DEFAULT_CHUNK_ELEMENTS
+) -> np.ndarray:
+    """
+    Even-odd ray casting of many points against all polygon edges at once.
+    
+    Every point is broadcast against every edge, in chunks of points sized so
+    that at most chunk_elements point-edge pairs are held in memory. Edges
+    count as crossed when min(y) < py <= max(y) and px is left of or on the
+    edge, matching the scalar ray casting test.
+    
+    Args:
+        points: Nx2 points to test (further columns are ignored)
+        polygon: Mx2 polygon vertices
+        chunk_elements: Maximum point-edge pairs per chunk
+    
+    Returns:
+        Boolean array, True for points inside the polygon
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(len(points), -1)[:, :2]
+    start, end = _polygon_edges(polygon)
+    inside = np.zeros(len(points), dtype=bool)
+    if len(start) == 0:
+        return inside
+    
+    rows = max(1, chunk_elements // len(start))
+    for first in range(0, len(points), rows):
+        px = points[first:first + rows, 0:1]
+        py = points[first:first + rows, 1:2]
+        crossed = _crossed(px, py, start, end)
+        inside[first:first + rows] = np.count_nonzero(crossed, axis=1) % 2 == 1
+    return inside
+
+
+def _ramp(counts: np.ndarray) -> np.ndarray:
+    """0, 1, ..., count - 1 for every count, concatenated."""
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.arange(offsets.size) - offsets
+
+
+def _grid_cells(
+    xy: np.ndarray, 
+    lower: np.ndarray, 
+    cell_size: np.ndarray, 
+    shape: Tuple[int, int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Row and column indices of the grid cells containing points, clamped to the grid."""
+    index = np.floor((xy - lower) / cell_size).astype(np.int64)
+    return (np.clip(index[..., 1], 0, shape[0] - 1),
+            np.clip(index[..., 0], 0, shape[1] - 1))
+
+
+def _segment_cells(
+    start: np.ndarray, 
+    end: np.ndarray, 
+    lower: np.ndarray, 
+    cell_size: np.ndarray, 
+    shape: Tuple[int, int]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Grid cells that may contain part of each segment.
+    
+    Segments are split into pieces no longer than a cell; the cells covered
+    by each piece's slightly padded bounding box conservatively contain the
+    segment, with linear work in the segment length.
+    
+    Args:
+        start: Sx2 segment start points
+        end: Sx2 segment end points
+        lower: Minimum corner of the grid
+        cell_size: Cell width and height
+        shape: Number of cell rows and columns
+    
+    Returns:
+        Tuple of (segment indices, cell rows, cell columns), possibly with repeats
+    """
+    direction = end - start
+    pieces = np.maximum(np.ceil(np.max(np.abs(direction) / cell_size, axis=1)), 1).astype(np.int64)
+    segment = np.repeat(np.arange(len(start)), pieces)
+    t0 = _ramp(pieces) / pieces[segment]
+    t1 = t0 + 1.0 / pieces[segment]
+    a = start[segment] + t0[:, None] * direction[segment]
+    b = start[segment] + t1[:, None] * direction[segment]
+    pad = 1e-9 * cell_size
+    row0, col0 = _grid_cells(np.minimum(a, b) - pad, lower, cell_size, shape)
+    row1, col1 = _grid_cells(np.maximum(a, b) + pad, lower, cell_size, shape)
+    
+    # A piece spans at most two cells per axis
+    rows = [np.minimum(row0 + dr, row1) for dr in (0, 1) for _ in (0, 1)]
+    cols = [np.minimum(col0 + dc, col1) for _ in (0, 1) for dc in (0, 1)]
+    return np.tile(segment, 4), np.concatenate(rows), np.concatenate(cols)
+
+
+class PolygonEdgeGrid:
+    """
+    Grid acceleration structure for point-in-polygon queries.
+    
+    Polygon edges are bucketed into horizontal bands, so the exact crossing
+    test for a point only visits edges whose y-range overlaps its band. A
+    coarser 2D grid of cells over the bounding box is classified once: cells
+    no edge passes through are entirely inside or outside, and points in
+    them are answered by lookup without any edge test.
+    
+    Attributes:
+        lower: Minimum corner of the polygon bounding box
+        upper: Maximum corner of the polygon bounding box
+        cell_state: ny x nx int8 cell classes (1 inside, 0 outside, -1 boundary)
+        band_edges: Edge indices of every band, CSR ordered by band_ptr
+        band_ptr: Offsets of each band's edges in band_edges
+    """
+    
+    def __init__(
+        self, 
+        polygon: np.ndarray, 
+        cells_per_axis: Optional[int] = None, 
+        n_bands: Optional[int] = None
+    ):
+        """
+        Build the edge bands and classify the grid cells.
+        
+        Args:
+            polygon: Mx2 polygon vertices
+            cells_per_axis: Grid resolution (defaults to about 2*sqrt(M), at most 1024)
+            n_bands: Number of horizontal edge bands (defaults to M, at most 65536)
+        """
+        vertices = np.asarray(polygon, dtype=np.float64)[:, :2]
+        if len(vertices) < 3:
+            raise ValueError("Polygon needs at least 3 vertices")
+        self.start, self.end = _polygon_edges(vertices)
+        self.lower = vertices.min(axis=0)
+        self.upper = vertices.max(axis=0)
+        extent = np.maximum(self.upper - self.lower, 1e-300)
+        
+        n_vertices = len(vertices)
+        if cells_per_axis is None:
+            cells_per_axis = int(np.clip(2 * np.sqrt(n_vertices), 4, 1024))
+        if n_bands is None:
+            n_bands = int(np.clip(n_vertices, 1, 1 << 16))
+        
+        # Edges of each band: every band between the edge's lowest and highest y
+        self.band_height = extent[1] / n_bands
+        self.n_bands = n_bands
+        low_band = self._bands(np.minimum(self.start[:, 1], self.end[:, 1]))
+        high_band = self._bands(np.maximum(self.start[:, 1], self.end[:, 1]))
+        counts = high_band - low_band + 1
+        edge_ids = np.repeat(np.arange(len(self.start)), counts)
+        bands = np.repeat(low_band, counts) + _ramp(counts)
+        order = np.argsort(bands, kind='stable')
+        self.band_edges = edge_ids[order]
+        self.band_ptr = np.concatenate([[0], np.cumsum(np.bincount(bands, minlength=n_bands))])
+        
+        self.cell_size = extent / cells_per_axis
+        self.shape = (cells_per_axis, cells_per_axis)
+        self.cell_state = self._classify_cells(vertices)
+    
+    def _bands(self, y: np.ndarray) -> np.ndarray:
+        """Band index of y coordinates, clamped to the grid."""
+        return np.clip(((y - self.lower[1]) / self.band_height).astype(np.int64), 0, self.n_bands - 1)
+    
+    def _cells(self, xy: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Row and column cell indices of points, clamped to the grid."""
+        return _grid_cells(xy, self.lower, self.cell_size, self.shape)
+    
+    def _classify_cells(self, vertices: np.ndarray) -> np.ndarray:
+        """Mark cells crossed by an edge and resolve the rest from their centres."""
+        _, rows, cols = _segment_cells(vertices, np.roll(vertices, -1, axis=0),
+                                       self.lower, self.cell_size, self.shape)
+        state = np.full(self.shape, -2, dtype=np.int8)
+        state[rows, cols] = -1
+        
+        free_rows, free_cols = np.nonzero(state == -2)
+        centres = self.lower + (np.column_stack([free_cols, free_rows]) + 0.5) * self.cell_size
+        state[free_rows, free_cols] = self._exact(centres)
+        return state
+    
+    def _exact(self, points: np.ndarray, chunk_elements: int = DEFAULT_CHUNK_ELEMENTS) -> np.ndarray:
+        """Crossing test of points against the edges of their band."""
+        inside = np.zeros(len(points), dtype=bool)
+        bands = self._bands(points[:, 1])
+        counts = self.band_ptr[bands + 1] - self.band_ptr[bands]
+        
+        # Chunk boundaries keep the number of point-edge pairs bounded
+        pair_ends = np.cumsum(counts)
+        first = 0
+        while first < len(points):
+            done = pair_ends[first - 1] if first else 0
+            last = max(int(np.searchsorted(pair_ends, done + chunk_elements, side='right')), first + 1)
+            
+            chunk_counts = counts[first:last]
+            owner = np.repeat(np.arange(last - first), chunk_counts)
+            edge = self.band_edges[np.repeat(self.band_ptr[bands[first:last]], chunk_counts)
+                                   + _ramp(chunk_counts)]
+            px = points[first:last, 0][owner]
+            py = points[first:last, 1][owner]
+            crossed = _crossed(px, py, self.start[edge], self.end[edge])
+            inside[first:last] = np.bincount(owner[crossed], minlength=last - first) % 2 == 1
+            first = last
+        return inside
+    
+    def contains(self, points: np.ndarray, chunk_elements: int = DEFAULT_CHUNK_ELEMENTS) -> np.ndarray:
+        """
+        Test points against the polygon.
+        
+        Args:
+            points: Nx2 points to test (further columns are ignored)
+            chunk_elements: Maximum point-edge pairs evaluated at once
+        
+        Returns:
+            Boolean array, True for points inside the polygon
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(len(points), -1)[:, :2]
+        inside = np.zeros(len(points), dtype=bool)
+        
+        in_box = np.all((points >= self.lower) & (points <= self.upper), axis=1)
+        candidates = np.flatnonzero(in_box)
+        state = self.cell_state[self._cells(points[candidates])]
+        inside[candidates[state == 1]] = True
+        
+        boundary = candidates[state == -1]
+        inside[boundary] = self._exact(points[boundary], chunk_elements)
+        return inside
+
+
+def _orientation(o: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Twice the signed area of triangles (o, a, b); positive when counter-clockwise."""
+    return (a[..., 0] - o[..., 0]) * (b[..., 1] - o[..., 1]) - (a[..., 1] - o[..., 1]) * (b[..., 0] - o[..., 0])
+
+
+def _pair_orientations(
+    a0: np.ndarray, 
+    a1: np.ndarray, 
+    b0: np.ndarray, 
+    b1: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Orientation of each segment's endpoints against the other segment's line.
+    
+    Values for endpoints within SNAP_TOLERANCE (relative to the coordinate
+    magnitude) of the line are set to exactly zero. Otherwise rounding can
+    class a vertex lying on an edge as a crossing for one neighbouring edge
+    and a touch for the other, leaving near-duplicate split points.
+    
+    Returns:
+        Tuple (o1, o2, o3, o4) for b0 and b1 against segment a, then a0 and a1
+        against segment b
+    """
+    if len(a0) == 0:
+        return tuple(np.zeros(0) for _ in range(4))
+    tolerance = SNAP_TOLERANCE * max(np.abs(np.vstack([a0, a1, b0, b1])).max(), 1e-300)
+    len_a = np.linalg.norm(a1 - a0, axis=1) * tolerance
+    len_b = np.linalg.norm(b1 - b0, axis=1) * tolerance
+    orientations = []
+    for value, limit in ((_orientation(a0, a1, b0), len_a), (_orientation(a0, a1, b1), len_a),
+                         (_orientation(b0, b1, a0), len_b), (_orientation(b0, b1, a1), len_b)):
+        value[np.abs(value) <= limit] = 0.0
+        orientations.append(value)
+    return tuple(orientations)
+
+
+def candidate_segment_pairs(
+    start_a: np.ndarray, 
+    end_a: np.ndarray, 
+    start_b: np.ndarray, 
+    end_b: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pairs of segments from two sets whose bounding boxes overlap.
+    
+    Segments are hashed into a uniform grid with cells about twice the mean
+    segment length; only segments sharing a cell are paired, so the work
+    grows with the number of segments and true near-pairs instead of n*m.
+    
+    Args:
+        start_a: Nx2 start points of the first set
+        end_a: Nx2 end points of the first set
+        start_b: Mx2 start points of the second set
+        end_b: Mx2 end points of the second set
+    
+    Returns:
+        Tuple of (first set indices, second set indices), sorted and unique
+    """
+    n_a, n_b = len(start_a), len(start_b)
+    if n_a == 0 or n_b == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    
+    corners = np.vstack([start_a, end_a, start_b, end_b])
+    lower = corners.min(axis=0)
+    extent = np.maximum(corners.max(axis=0) - lower, 1e-300)
+    lengths = np.concatenate([np.linalg.norm(end_a - start_a, axis=1), np.linalg.norm(end_b - start_b, axis=1)])
+    mean_length = max(lengths.mean(), 1e-300)
+    n_cells = int(np.clip(np.ceil(extent.max() / (2.0 * mean_length)), 1, 4096))
+    shape = (n_cells, n_cells)
+    cell_size = extent / n_cells
+    
+    def cell_entries(start, end):
+        segment, rows, cols = _segment_cells(start, end, lower, cell_size, shape)
+        keys = np.unique((rows * n_cells + cols) * len(start) + segment)
+        return keys // len(start), keys % len(start)
+    
+    cell_a, segment_a = cell_entries(start_a, end_a)
+    cell_b, segment_b = cell_entries(start_b, end_b)
+    
+    # Join the two sorted entry lists on cell
+    first = np.searchsorted(cell_a, cell_b, side='left')
+    counts = np.searchsorted(cell_a, cell_b, side='right') - first
+    i = segment_a[np.repeat(first, counts) + _ramp(counts)]
+    j = np.repeat(segment_b, counts)
+    
+    overlap = np.all((np.minimum(start_a[i], end_a[i]) <= np.maximum(start_b[j], end_b[j]))
+                     & (np.minimum(start_b[j], end_b[j]) <= np.maximum(start_a[i], end_a[i])), axis=1)
+    pairs = np.unique(i[overlap] * n_b + j[overlap])
+    return pairs // n_b, pairs % n_b
+
+
+def segment_intersections(
+    start_a: np.ndarray, 
+    end_a: np.ndarray, 
+    start_b: np.ndarray, 
+    end_b: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Proper crossings between two sets of segments.
+    
+    Candidate pairs come from candidate_segment_pairs and are tested with
+    vectorized orientation predicates. Touching and collinear pairs, up to
+    SNAP_TOLERANCE, are not crossings.
+    
+    Args:
+        start_a: Nx2 start points of the first set
+        end_a: Nx2 end points of the first set
+        start_b: Mx2 start points of the second set
+        end_b: Mx2 end points of the second set
+    
+    Returns:
+        Dictionary of crossing 'points', segment indices 'index_a' and
+        'index_b', and segment parameters 't' (along a) and 'u' (along b),
+        ordered by (index_a, index_b)
+    """
+    i, j = candidate_segment_pairs(start_a, end_a, start_b, end_b)
+    a0, a1, b0, b1 = start_a[i], end_a[i], start_b[j], end_b[j]
+    o1, o2, o3, o4 = _pair_orientations(a0, a1, b0, b1)
+    
+    proper = (np.sign(o1) * np.sign(o2) < 0) & (np.sign(o3) * np.sign(o4) < 0)
+    t = o3[proper] / (o3[proper] - o4[proper])
+    u = o1[proper] / (o1[proper] - o2[proper])
+    return {
+        'points': a0[proper] + t[:, None] * (a1[proper] - a0[proper]),
+        'index_a': i[proper],
+        'index_b': j[proper],
+        't': t,
+        'u': u,
+        'candidate_pairs': len(i)
+    }
+
+
+def _touching_vertices(
+    start: np.ndarray, 
+    end: np.ndarray, 
+    vertices: np.ndarray, 
+    edge_index: np.ndarray, 
+    vertex_index: np.ndarray, 
+    orientation: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vertices lying exactly on the interior of candidate edges, as edge splits."""
+    on_line = orientation == 0
+    edge_index, vertex_index = edge_index[on_line], vertex_index[on_line]
+    direction = end[edge_index] - start[edge_index]
+    t = (np.einsum('ij,ij->i', vertices[vertex_index] - start[edge_index], direction)
+         / np.einsum('ij,ij->i', direction, direction))
+    interior = (t > 0.0) & (t < 1.0)
+    return edge_index[interior], t[interior], vertices[vertex_index[interior]]
+
+
+def _split_ring(ring: np.ndarray, edges: List[np.ndarray], params: List[np.ndarray],
+                points: List[np.ndarray]) -> np.ndarray:
+    """Insert split points into ring edges in order, dropping repeated vertices."""
+    edges = np.concatenate([np.arange(len(ring))] + edges)
+    params = np.concatenate([np.zeros(len(ring))] + params)
+    points = np.vstack([ring] + points)
+    split = points[np.lexsort((params, edges))]
+    keep = np.any(split != np.roll(split, -1, axis=0), axis=1)
+    return split[keep]
+
+
+def _closed_ring(polygon: np.ndarray) -> np.ndarray:
+    """Polygon vertices without repeats, counter-clockwise."""
+    ring = np.asarray(polygon, dtype=np.float64)[:, :2]
+    ring = ring[np.any(ring != np.roll(ring, -1, axis=0), axis=1)]
+    if len(ring) < 3:
+        raise ValueError("Polygon needs at least 3 distinct vertices")
+    return ring[::-1] if polygon_area(ring) < 0 else ring
+
+
+def _is_simple_ring(polygon: np.ndarray) -> bool:
+    """
+    Whether a polygon is a simple ring.
+    
+    Rejects fewer than 3 distinct vertices, a vertex visited twice (pinched
+    rings), consecutive edges folding back over each other, and any contact
+    between non-adjacent edges: crossings, a vertex on another edge, or
+    collinear overlaps, all up to SNAP_TOLERANCE.
+    """
+    ring = np.asarray(polygon, dtype=np.float64)[:, :2]
+    ring = ring[np.any(ring != np.roll(ring, -1, axis=0), axis=1)]
+    n = len(ring)
+    if n < 3 or len(np.unique(ring, axis=0)) < n:
+        return False
+    ends = np.roll(ring, -1, axis=0)
+    
+    # Consecutive edges fold back when the turn is collinear and reverses
+    previous, following = np.roll(ring, 1, axis=0) - ring, ends - ring
+    turn, _, _, _ = _pair_orientations(ring, ends, np.roll(ring, 1, axis=0), ring)
+    if np.any((turn == 0) & (np.einsum('ij,ij->i', previous, following) > 0)):
+        return False
+    
+    i, j = candidate_segment_pairs(ring, ends, ring, ends)
+    adjacent = (np.abs(j - i) == 1) | (np.abs(j - i) == n - 1)
+    i, j = i[(i < j) & ~adjacent], j[(i < j) & ~adjacent]
+    a0, a1, b0, b1 = ring[i], ends[i], ring[j], ends[j]
+    o1, o2, o3, o4 = _pair_orientations(a0, a1, b0, b1)
+    crossing = (np.sign(o1) * np.sign(o2) < 0) & (np.sign(o3) * np.sign(o4) < 0)
+    
+    def on_segment(start, end, point, orientation):
+        # Collinear points inside the segment's bounding box lie on it
+        return ((orientation == 0)
+                & np.all(np.minimum(start, end) <= point, axis=1)
+                & np.all(point <= np.maximum(start, end), axis=1))
+    
+    touching = (on_segment(a0, a1, b0, o1) | on_segment(a0, a1, b1, o2)
+                | on_segment(b0, b1, a0, o3) | on_segment(b0, b1, a1, o4))
+    return not np.any(crossing | touching)
+
+
+def _chain_fragments(starts: np.ndarray, ends: np.ndarray) -> List[np.ndarray]:
+    """Chain directed fragments (node id pairs) into closed loops of node ids."""
+    order = np.argsort(starts, kind='stable')
+    starts, ends = starts[order], ends[order]
+    first_fragment = dict(zip(*np.unique(starts, return_index=True)))
+    used = np.zeros(len(starts), dtype=bool)
+    
+    loops = []
+    for seed in range(len(starts)):
+        if used[seed]:
+            continue
+        loop = []
+        fragment = seed
+        while fragment is not None and not used[fragment]:
+            used[fragment] = True
+            loop.append(int(starts[fragment]))
+            next_node = ends[fragment]
+            fragment = None
+            candidate = first_fragment.get(next_node)
+            # Take the first unused fragment leaving next_node
+            while candidate is not None and candidate < len(starts) and starts[candidate] == next_node:
+                if not used[candidate]:
+                    fragment = candidate
+                    break
+                candidate += 1
+        if len(loop) >= 3:
+            loops.append(np.array(loop, dtype=np.int64))
+    return loops
+
+
+def polygon_area(ring: np.ndarray) -> float:
+    """
+    Signed shoelace area of a closed ring.
+    
+    Args:
+        ring: Kx2 ring vertices
+    
+    Returns:
+        Area, positive for counter-clockwise rings
+    """
+    ring = np.asarray(ring, dtype=np.float64)
+    return 0.5 * float(np.sum(ring[:, 0] * np.roll(ring[:, 1], -1) - np.roll(ring[:, 0], -1) * ring[:, 1]))
+
+
+def _contains(polygon: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Point-in-polygon with the same strategy choice as method='auto'."""
+    if len(points) * len(polygon) > GRID_THRESHOLD_PAIRS:
+        return PolygonEdgeGrid(polygon).contains(points)
+    return points_in_polygon(points, polygon)
+
+
+def polygon_boolean(
+    subject: np.ndarray, 
+    clip: np.ndarray, 
+    operations: Tuple[str, ...] = BOOLEAN_OPERATIONS
+) -> Dict[str, List[np.ndarray]]:
+    """
+    Boolean operations between two simple polygons.
+    
+    Both outlines are split at every crossing, at vertices touching the other
+    outline and at the ends of collinear overlaps, using the grid-pruned
+    segment tests. Each resulting fragment is then inside, outside, or shared
+    with the other outline (in the same or opposite direction), and every
+    operation keeps a subset of fragments that chains into closed rings:
+    
+    - intersection: subject inside clip, clip inside subject, shared same
+    - union: subject outside clip, clip outside subject, shared same
+    - difference (subject - clip): subject outside clip, reversed clip inside
+      subject, shared opposite
+    
+    Args:
+        subject: Kx2 vertices of the first polygon
+        clip: Lx2 vertices of the second polygon
+        operations: Operations to compute, from BOOLEAN_OPERATIONS
+    
+    Returns:
+        Dictionary mapping each operation to its rings; outer boundaries are
+        counter-clockwise and holes clockwise
+    """
+    unknown = set(operations) - set(BOOLEAN_OPERATIONS)
+    if unknown:
+        raise ValueError(f"Unknown polygon operations: {sorted(unknown)}")
+    
+    ring_a, ring_b = _closed_ring(subject), _closed_ring(clip)
+    end_a, end_b = np.roll(ring_a, -1, axis=0), np.roll(ring_b, -1, axis=0)
+    
+    i, j = candidate_segment_pairs(ring_a, end_a, ring_b, end_b)
+    o1, o2, o3, o4 = _pair_orientations(ring_a[i], end_a[i], ring_b[j], end_b[j])
+    
+    # Proper crossings split both edges at the same computed point
+    proper = (np.sign(o1) * np.sign(o2) < 0) & (np.sign(o3) * np.sign(o4) < 0)
+    t = o3[proper] / (o3[proper] - o4[proper])
+    u = o1[proper] / (o1[proper] - o2[proper])
+    crossings = ring_a[i[proper]] + t[:, None] * (end_a[i[proper]] - ring_a[i[proper]])
+    
+    # Vertices of one outline on an edge of the other (T-junctions and
+    # collinear overlap ends) split that edge at the vertex itself
+    touches_a = [_touching_vertices(ring_a, end_a, ring_b, i, (j + k) % len(ring_b), o)
+                 for k, o in ((0, o1), (1, o2))]
+    touches_b = [_touching_vertices(ring_b, end_b, ring_a, j, (i + k) % len(ring_a), o)
+                 for k, o in ((0, o3), (1, o4))]
+    
+    split_a = _split_ring(ring_a, [i[proper]] + [e for e, _, _ in touches_a],
+                          [t] + [p for _, p, _ in touches_a], [crossings] + [v for _, _, v in touches_a])
+    split_b = _split_ring(ring_b, [j[proper]] + [e for e, _, _ in touches_b],
+                          [u] + [p for _, p, _ in touches_b], [crossings] + [v for _, _, v in touches_b])
+    
+    # Shared node ids: split points are exact copies in both outlines
+    nodes, node_ids = np.unique(np.vstack([split_a, split_b]), axis=0, return_inverse=True)
+    node_ids = node_ids.ravel()
+    ids_a, ids_b = node_ids[:len(split_a)], node_ids[len(split_a):]
+    start_a, stop_a = ids_a, np.roll(ids_a, -1)
+    start_b, stop_b = ids_b, np.roll(ids_b, -1)
+    
+    n_nodes = len(nodes)
+    keys_b = start_b * n_nodes + stop_b
+    reversed_b = stop_b * n_nodes + start_b
+    same_a = np.isin(start_a * n_nodes + stop_a, keys_b)
+    opposite_a = np.isin(start_a * n_nodes + stop_a, reversed_b)
+    shared_b = np.isin(keys_b, start_a * n_nodes + stop_a) | np.isin(reversed_b, start_a * n_nodes + stop_a)
+    
+    inside_a = _contains(ring_b, 0.5 * (split_a + np.roll(split_a, -1, axis=0))) & ~same_a & ~opposite_a
+    outside_a = ~inside_a & ~same_a & ~opposite_a
+    inside_b = _contains(ring_a, 0.5 * (split_b + np.roll(split_b, -1, axis=0))) & ~shared_b
+    outside_b = ~inside_b & ~shared_b
+    
+    selections = {
+        'intersection': (inside_a | same_a, inside_b, False),
+        'union': (outside_a | same_a, outside_b, False),
+        'difference': (outside_a | opposite_a, inside_b, True),
+    }
+    
+    results = {}
+    for operation in operations:
+        keep_a, keep_b, reverse_b = selections[operation]
+        b_starts, b_ends = (stop_b, start_b) if reverse_b else (start_b, stop_b)
+        loops = _chain_fragments(np.concatenate([start_a[keep_a], b_starts[keep_b]]),
+                                 np.concatenate([stop_a[keep_a], b_ends[keep_b]]))
+        results[operation] = [nodes[loop] for loop in loops]
+    return results
+
+
 class ComputationalGeometryGenerator(AbstractAlgorithmGenerator):
     """
     Specialized generator for computational geometry algorithms.
@@ -101,7 +726,8 @@ class ComputationalGeometryGenerator(AbstractAlgorithmGenerator):
         elif operation_type == 'point_in_polygon':
             if additional_geometry is None:
                 raise ValueError("Additional geometry required for point-in-polygon test")
-            return self._point_in_polygon(points, additional_geometry)
+            return self._point_in_polygon(points, additional_geometry,
+                                          method=input_data.get('point_in_polygon_method', 'auto'))
         
         elif operation_type == 'polygon_intersection':
             if additional_geometry is None:
@@ -158,7 +784,9 @@ class ComputationalGeometryGenerator(AbstractAlgorithmGenerator):
     def _point_in_polygon(
         self, 
         points: np.ndarray, 
-        polygon: np.ndarray
+        polygon: np.ndarray,
+        method: str = 'auto',
+        chunk_elements: int = DEFAULT_CHUNK_ELEMENTS
     ) -> Dict[str, Any]:
         """
         Determine if points are inside a given polygon.
@@ -166,37 +794,29 @@ class ComputationalGeometryGenerator(AbstractAlgorithmGenerator):
         Args:
             points: Points to test
             polygon: Polygon vertices
+            method: 'broadcast' tests every point against every edge, 'grid'
+                builds a PolygonEdgeGrid, 'auto' picks the grid for large inputs
+            chunk_elements: Maximum point-edge pairs evaluated at once
         
         Returns:
             Point-in-polygon test results
         """
-        def point_inside_polygon(point, poly):
-            """
-            Ray casting algorithm for point-in-polygon test.
-            """
-            n = len(poly)
-            inside = False
-            p1x, p1y = poly[0]
-            for i in range(n + 1):
-                p2x, p2y = poly[i % n]
-                if points[point][1] > min(p1y, p2y):
-                    if points[point][1] <= max(p1y, p2y):
-                        if points[point][0] <= max(p1x, p2x):
-                            if p1y != p2y:
-                                xinters = (points[point][1] - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                            if p1x == p2x or points[point][0] <= xinters:
-                                inside = not inside
-                p1x, p1y = p2x, p2y
-            return inside
-        
-        # Test each point against the polygon
-        results = [point_inside_polygon(i, polygon) for i in range(len(points))]
+        if method not in POINT_IN_POLYGON_METHODS:
+            raise ValueError(f"Unknown point-in-polygon method: {method}")
+        if method == 'auto':
+            method = 'grid' if len(points) * len(polygon) > GRID_THRESHOLD_PAIRS else 'broadcast'
+        
+        if method == 'grid':
+            results = PolygonEdgeGrid(polygon).contains(points, chunk_elements)
+        else:
+            results = points_in_polygon(points, polygon, chunk_elements)
         
         return {
             'result': results,
             'metadata': {
                 'points_tested': len(points),
-                'points_inside': sum(results)
+                'points_inside': int(np.count_nonzero(results)),
+                'method': method
             }
         }
     
@@ -213,53 +833,30 @@ class ComputationalGeometryGenerator(AbstractAlgorithmGenerator):
             polygon2: Second polygon vertices
         
         Returns:
-            Polygon intersection results
+            Polygon intersection results: the edge crossing points, plus the
+            intersection, union and difference (polygon1 - polygon2) rings.
+            The rings assume simple polygons; when either input has fewer
+            than 3 distinct vertices or crosses itself, 'polygons' is None
+            and only the crossing points are reported
         """
-        def cross_product(o, a, b):
-            """Compute cross product to determine orientation."""
-            return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
-        
-        def segment_intersection(p1, p2, p3, p4):
-            """
-            Determine if line segments (p1,p2) and (p3,p4) intersect.
-            """
-            o1 = cross_product(p1, p2, p3)
-            o2 = cross_product(p1, p2, p4)
-            o3 = cross_product(p3, p4, p1)
-            o4 = cross_product(p3, p4, p2)
-            
-            if o1 * o2 < 0 and o3 * o4 < 0:
-                # Compute intersection point
-                x1, y1 = p1
-                x2, y2 = p2
-                x3, y3 = p3
-                x4, y4 = p4
-                
-                px = ( (x1*y2 - y1*x2) * (x3 - x4) - (x1 - x2) * (x3*y4 - y3*x4) ) / \
-                     ( (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4) )
-                py = ( (x1*y2 - y1*x2) * (y3 - y4) - (y1 - y2) * (x3*y4 - y3*x4) ) / \
-                     ( (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4) )
-                
-                return (px, py)
-            return None
-        
-        # Find intersection points
-        intersections = []
-        for i in range(len(polygon1)):
-            for j in range(len(polygon2)):
-                p1, p2 = polygon1[i], polygon1[(i+1) % len(polygon1)]
-                p3, p4 = polygon2[j], polygon2[(j+1) % len(polygon2)]
-                
-                inter_point = segment_intersection(p1, p2, p3, p4)
-                if inter_point:
-                    intersections.append(inter_point)
+        ring1 = np.asarray(polygon1, dtype=np.float64)[:, :2]
+        ring2 = np.asarray(polygon2, dtype=np.float64)[:, :2]
+        crossings = segment_intersections(ring1, np.roll(ring1, -1, axis=0),
+                                          ring2, np.roll(ring2, -1, axis=0))
+        simple = _is_simple_ring(ring1) and _is_simple_ring(ring2)
+        polygons = polygon_boolean(ring1, ring2) if simple else None
         
         return {
-            'result': np.array(intersections),
+            'result': crossings['points'],
+            'polygons': polygons,
             'metadata': {
-                'intersection_points': len(intersections),
+                'intersection_points': len(crossings['points']),
                 'polygon1_vertices': len(polygon1),
-                'polygon2_vertices': len(polygon2)
+                'polygon2_vertices': len(polygon2),
+                'candidate_edge_pairs': crossings['candidate_pairs'],
+                'simple_polygons': simple,
+                **{f'{operation}_area': sum(polygon_area(ring) for ring in rings)
+                   for operation, rings in (polygons or {}).items()}
             }
         }
     
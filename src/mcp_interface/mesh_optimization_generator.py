@@ -6,11 +6,14 @@ Provides algorithm generation and execution capabilities for mesh processing and
 
 import numpy as np
 from typing import Dict, Any, Optional
+from scipy import sparse
 from src.mcp_interface.algorithm_interface import (
     AbstractAlgorithmGenerator, 
     AlgorithmSpecification, 
     AlgorithmCategory
 )
+from src.algorithms.mesh_topology import MeshTopology
+from src.algorithms.mesh_utils import qem_decimate_mesh
 
 class MeshOptimizationGenerator(AbstractAlgorithmGenerator):
     """
@@ -86,25 +89,42 @@ class MeshOptimizationGenerator(AbstractAlgorithmGenerator):
         vertices = input_data['vertices']
         triangles = input_data['triangles']
         opt_type = input_data.get('optimization_type', 'smooth')
-        constraints = input_data.get('constraints', {})
+        constraints = input_data.get('constraints') or {}
         
         # Basic optimization implementations
         if opt_type == 'smooth':
-            # Laplacian smoothing (simple implementation)
-            smoothed_vertices = self._laplacian_smooth(vertices, triangles, iterations=5)
+            iterations = int(constraints.get('smoothing_iterations', 5))
+            method = constraints.get('smoothing_method', 'laplacian')
+            if method == 'taubin':
+                lambda_factor = constraints.get('lambda_factor', 0.5)
+                mu_factor = constraints.get('mu_factor', -0.53)
+            elif method == 'laplacian':
+                lambda_factor = constraints.get('lambda_factor', 1.0)
+                mu_factor = None
+            else:
+                raise ValueError(f"Unsupported smoothing method: {method}")
+            pin_boundary = bool(constraints.get('pin_boundary', False))
+            
+            smoothed_vertices = self._laplacian_smooth(
+                vertices, triangles, iterations=iterations, lambda_factor=lambda_factor,
+                mu_factor=mu_factor, pin_boundary=pin_boundary
+            )
             
             return {
                 'optimized_vertices': smoothed_vertices,
                 'optimized_triangles': triangles,
                 'quality_metrics': {
-                    'smoothing_iterations': 5,
-                    'smoothing_method': 'laplacian'
+                    'smoothing_iterations': iterations,
+                    'smoothing_method': method,
+                    'boundary_pinned': pin_boundary
                 }
             }
         
         elif opt_type == 'simplify':
             # Basic mesh simplification (vertex reduction)
-            simplified_vertices, simplified_triangles = self._mesh_simplify(vertices, triangles)
+            simplified_vertices, simplified_triangles = self._mesh_simplify(
+                vertices, triangles, target_reduction=constraints.get('target_reduction', 0.5)
+            )
             
             return {
                 'optimized_vertices': simplified_vertices,
@@ -118,72 +138,89 @@ class MeshOptimizationGenerator(AbstractAlgorithmGenerator):
         else:
             raise ValueError(f"Unsupported optimization type: {opt_type}")
     
-    def _laplacian_smooth(self, vertices, triangles, iterations=5):
+    def _laplacian_smooth(self, vertices, triangles, iterations=5, lambda_factor=1.0,
+                          mu_factor=None, pin_boundary=False):
         """
-        Simple Laplacian smoothing implementation.
+        Laplacian or Taubin smoothing with sparse matrix products.
+        
+        Each step moves every vertex towards the mean of its one-ring,
+        x <- x + factor * (W x - x), where W is the row-normalized adjacency.
+        The step is assembled once as a CSR matrix, so an iteration is a single
+        sparse-dense product. With mu_factor set (negative, |mu| > lambda),
+        every lambda step is followed by a mu step to counter shrinkage (Taubin).
         
         Args:
             vertices: Original vertex coordinates
             triangles: Triangle connectivity
             iterations: Number of smoothing iterations
+            lambda_factor: Smoothing step size (1.0 replaces vertices with the one-ring mean)
+            mu_factor: Optional inflation step size for Taubin smoothing
+            pin_boundary: Keep boundary vertices fixed
         
         Returns:
             Smoothed vertex coordinates
         """
-        # Create vertex-to-vertex adjacency
-        adjacency = self._compute_vertex_adjacency(vertices, triangles)
+        topology = MeshTopology.for_mesh(triangles, len(vertices))
+        pinned = topology.boundary_vertices if pin_boundary else None
+        
+        steps = [self._smoothing_step(topology, lambda_factor, pinned)]
+        if mu_factor is not None:
+            steps.append(self._smoothing_step(topology, mu_factor, pinned))
         
-        smoothed = vertices.copy()
+        smoothed = np.asarray(vertices, dtype=np.float64)
         for _ in range(iterations):
-            for i in range(len(smoothed)):
-                # Compute average of neighboring vertices
-                neighbors = adjacency[i]
-                if neighbors:
-                    smoothed[i] = np.mean(smoothed[neighbors], axis=0)
+            for step in steps:
+                smoothed = step @ smoothed
         
         return smoothed
     
-    def _mesh_simplify(self, vertices, triangles, target_reduction=0.5):
+    def _smoothing_step(self, topology, factor, pinned=None):
         """
-        Basic mesh simplification by vertex reduction.
+        Build the CSR matrix of one smoothing step, (1 - factor) I + factor W.
         
         Args:
-            vertices: Original vertex coordinates
-            triangles: Triangle connectivity
-            target_reduction: Fraction of vertices to remove
+            topology: MeshTopology of the mesh
+            factor: Step size
+            pinned: Optional indices of vertices whose rows stay identity
         
         Returns:
-            Simplified vertices and triangles
+            NxN CSR step matrix
         """
-        # Compute vertex importance (e.g., based on valence)
-        vertex_valence = np.zeros(len(vertices))
-        for triangle in triangles:
-            for vertex in triangle:
-                vertex_valence[vertex] += 1
+        adjacency = topology.vertex_adjacency.astype(np.float64)
+        degree = np.asarray(adjacency.sum(axis=1)).ravel()
         
-        # Sort vertices by valence (lower valence = less important)
-        remove_count = int(len(vertices) * target_reduction)
-        remove_indices = np.argsort(vertex_valence)[:remove_count]
+        # Isolated and pinned vertices do not move
+        scale = np.divide(factor, degree, out=np.zeros_like(degree), where=degree > 0)
+        keep = np.where(degree > 0, 1.0 - factor, 1.0)
+        if pinned is not None and len(pinned):
+            scale[pinned] = 0.0
+            keep[pinned] = 1.0
         
-        # Create a mapping of old to new vertex indices
-        vertex_map = np.arange(len(vertices))
-        vertex_map[remove_indices] = -1
+        return (sparse.diags(scale) @ adjacency + sparse.diags(keep)).tocsr()
+    
+    def _mesh_simplify(self, vertices, triangles, target_reduction=0.5):
+        """
+        Mesh simplification by topology-preserving edge collapse.
         
-        # Compact vertex mapping
-        unique_vertices = np.unique(vertex_map[vertex_map != -1])
-        new_vertex_map = np.zeros(len(vertices), dtype=int)
-        for i, idx in enumerate(unique_vertices):
-            new_vertex_map[idx] = i
+        Uses the quadric error collapse rounds of qem_decimate_mesh, which keep
+        the boundary and reject collapses that would pinch the surface or flip
+        triangles, so the result has no holes. Cost grows linearly with the
+        mesh, at about 6 s per million triangles for a 50% reduction on one
+        core; tests/performance/bench_decimation.py measures it.
         
-        # Filter triangles
-        new_triangles = []
-        for triangle in triangles:
-            # Skip triangles with removed vertices
-            if all(vertex_map[v] != -1 for v in triangle):
-                new_triangle = [new_vertex_map[v] for v in triangle]
-                new_triangles.append(new_triangle)
+        Args:
+            vertices: Original vertex coordinates
+            triangles: Triangle connectivity
+            target_reduction: Fraction of vertices to remove
         
-        return vertices[unique_vertices], np.array(new_triangles)
+        Returns:
+            Simplified vertices and triangles
+        """
+        target_vertices = len(vertices) - int(len(vertices) * target_reduction)
+        simplified_vertices, simplified_triangles, _ = qem_decimate_mesh(
+            vertices, triangles, target_vertices, pool_fraction=0.5
+        )
+        return simplified_vertices, simplified_triangles
     
     def _compute_vertex_adjacency(self, vertices, triangles):
         """
@@ -196,16 +233,8 @@ class MeshOptimizationGenerator(AbstractAlgorithmGenerator):
         Returns:
             List of adjacent vertex indices for each vertex
         """
-        adjacency = [[] for _ in range(len(vertices))]
-        for triangle in triangles:
-            for i in range(3):
-                for j in range(3):
-                    if i != j:
-                        adjacency[triangle[i]].append(triangle[j])
-        
-        # Remove duplicates and convert to numpy arrays
-        adjacency = [np.unique(adj) for adj in adjacency]
-        return adjacency
+        # One-ring CSR from the shared, connectivity-keyed topology cache
+        return MeshTopology.for_mesh(triangles, len(vertices)).one_rings()
     
     def validate_algorithm(
         self, 
@@ -5,16 +5,391 @@ Provides advanced multi-physics simulation and analysis capabilities.
 Supports structural, thermal, and fluid dynamics analysis preparation.
 """
 
+import logging
 import numpy as np
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence
 import scipy.sparse as sparse
-from scipy.sparse.linalg import spsolve
+from scipy.sparse.linalg import spsolve, splu, cg, lsqr, LinearOperator
+from scipy.spatial import ConvexHull, Delaunay, QhullError, cKDTree
 
 from src.mcp_interface.algorithm_interface import (
     AbstractAlgorithmGenerator, 
     AlgorithmSpecification, 
     AlgorithmCategory
 )
+from src.algorithms.preconditioners import IncompleteCholesky
+
+logger = logging.getLogger(__name__)
+
+# Linear solvers accepted by ReducedStiffnessSolver
+SOLVER_METHODS = ('direct', 'cg')
+
+# Hull tetrahedra below this mean-ratio quality (1 = regular) are discarded as slivers
+DEFAULT_MIN_ELEMENT_QUALITY = 0.02
+
+# Elements below this quality are flat (cospherical points) and carry no volume;
+# they are dropped wherever they are
+DEGENERATE_ELEMENT_QUALITY = 1e-9
+
+# Refinement points closer than this fraction of the target size to an earlier
+# point, or to the hull surface for interior points, are skipped
+REFINEMENT_CLEARANCE = 0.5
+
+
+def tetrahedron_shape_gradients(nodes: np.ndarray, elements: np.ndarray):
+    """
+    Signed volumes and linear shape function gradients of tetrahedra.
+    
+    Args:
+        nodes: Nx3 node coordinates
+        elements: Mx4 element connectivity
+        
+    Returns:
+        Tuple of (M signed volumes, Mx4x3 gradients); degenerate elements get
+        zero gradients
+    """
+    corners = nodes[elements]
+    edges = corners[:, 1:] - corners[:, :1]  # rows x1 - x0, x2 - x0, x3 - x0
+    determinants = np.linalg.det(edges)
+    
+    # Rows of the edge matrix dotted with grad N_k give delta_jk, so the
+    # gradients of N_1..N_3 are the columns of its inverse
+    gradients = np.zeros((len(elements), 4, 3))
+    valid = np.abs(determinants) > 1e-300
+    inverse = np.linalg.inv(edges[valid])
+    gradients[valid, 1:] = np.transpose(inverse, (0, 2, 1))
+    gradients[:, 0] = -gradients[:, 1:].sum(axis=1)
+    return determinants / 6.0, gradients
+
+
+def tetrahedron_strain_displacement(gradients: np.ndarray) -> np.ndarray:
+    """
+    Constant-strain B matrices from shape function gradients.
+    
+    Strains are ordered xx, yy, zz, xy, xz, yz (engineering shear), matching
+    the material matrix, and displacements node by node (u, v, w).
+    
+    Args:
+        gradients: Mx4x3 shape function gradients
+        
+    Returns:
+        Contiguous Mx6x12 array of B matrices
+    """
+    dx, dy, dz = gradients[:, :, 0], gradients[:, :, 1], gradients[:, :, 2]
+    B = np.zeros((len(gradients), 6, 4, 3))
+    B[:, 0, :, 0] = dx
+    B[:, 1, :, 1] = dy
+    B[:, 2, :, 2] = dz
+    B[:, 3, :, 0] = dy
+    B[:, 3, :, 1] = dx
+    B[:, 4, :, 0] = dz
+    B[:, 4, :, 2] = dx
+    B[:, 5, :, 1] = dz
+    B[:, 5, :, 2] = dy
+    return B.reshape(len(gradients), 6, 12)
+
+
+def tetrahedron_quality(nodes: np.ndarray, elements: np.ndarray, volumes: np.ndarray) -> np.ndarray:
+    """
+    Mean-ratio quality 6*sqrt(2)*V / l_rms^3, 1 for a regular tetrahedron.
+    
+    Args:
+        nodes: Nx3 node coordinates
+        elements: Mx4 element connectivity
+        volumes: M element volumes
+        
+    Returns:
+        M quality values in [0, 1]
+    """
+    corners = nodes[elements]
+    pairs = np.array([[0, 1], [0, 2], [0, 3], [1, 2], [1, 3], [2, 3]])
+    edges = corners[:, pairs[:, 1]] - corners[:, pairs[:, 0]]
+    rms_length = np.sqrt(np.einsum('ijk,ijk->i', edges, edges) / 6.0)
+    return np.divide(6.0 * np.sqrt(2.0) * np.abs(volumes), rms_length ** 3,
+                     out=np.zeros(len(elements)), where=rms_length > 0)
+
+
+def _bcc_lattice(planes: np.ndarray, lower: np.ndarray, upper: np.ndarray, spacing: float,
+                 clearance: float) -> np.ndarray:
+    """
+    Body-centred cubic lattice of whole cells inside a convex region.
+    
+    Unlike a plain cubic grid, whose Delaunay tetrahedralization is degenerate
+    (eight cospherical corners per cell), the BCC lattice has a unique
+    tetrahedralization into congruent, well-shaped elements. Only cells whose
+    eight corners all lie at least clearance inside every plane are kept,
+    each with its centre, so no cell is left without one.
+    
+    Args:
+        planes: Kx4 hull plane equations (unit normal, offset), negative inside
+        lower: Box lower corner
+        upper: Box upper corner
+        spacing: Cell edge length
+        clearance: Minimum distance of kept points from the planes
+        
+    Returns:
+        Px3 lattice points
+    """
+    axes = [np.arange(lo, hi + spacing, spacing) for lo, hi in zip(lower, upper)]
+    corners = np.stack(np.meshgrid(*axes, indexing='ij'), axis=-1)
+    inside = (corners @ planes[:, :3].T + planes[:, 3]).max(axis=-1) < -clearance
+    
+    cells = inside[:-1, :-1, :-1].copy()
+    for offset in np.ndindex(2, 2, 2):
+        cells &= inside[offset[0]:inside.shape[0] - 1 + offset[0],
+                        offset[1]:inside.shape[1] - 1 + offset[1],
+                        offset[2]:inside.shape[2] - 1 + offset[2]]
+    used = np.zeros_like(inside)
+    for offset in np.ndindex(2, 2, 2):
+        used[offset[0]:used.shape[0] - 1 + offset[0],
+             offset[1]:used.shape[1] - 1 + offset[1],
+             offset[2]:used.shape[2] - 1 + offset[2]] |= cells
+    
+    centres = corners[:-1, :-1, :-1][cells] + 0.5 * spacing
+    return np.vstack([corners[used], centres])
+
+
+def _hull_surface_points(points: np.ndarray, facets: np.ndarray, spacing: float) -> np.ndarray:
+    """Barycentric grid points on each hull triangle, about spacing apart."""
+    corners = points[facets]
+    edges = corners - np.roll(corners, -1, axis=1)
+    divisions = np.ceil(np.linalg.norm(edges, axis=2).max(axis=1) / spacing).astype(np.int64)
+    samples = []
+    for n in np.unique(divisions[divisions > 1]):
+        i, j = np.meshgrid(np.arange(n + 1), np.arange(n + 1), indexing='ij')
+        i, j = i.ravel(), j.ravel()
+        steps = np.column_stack([i, j])[i + j <= n] / n
+        # Offsets from the first corner keep coordinates shared by the whole
+        # facet (an axis-aligned face) exact
+        origin = corners[divisions == n, 0]
+        spans = corners[divisions == n, 1:] - origin[:, None]
+        samples.append((origin[:, None] + np.einsum('pk,fkd->fpd', steps, spans)).reshape(-1, 3))
+    return np.vstack(samples) if samples else np.zeros((0, 3))
+
+
+def _thin_points(points: np.ndarray, n_fixed: int, radius: float) -> np.ndarray:
+    """
+    Greedily drop points within radius of an earlier kept point.
+    
+    The first n_fixed points are always kept. Returns the indices of the kept
+    points after them.
+    """
+    keep = np.ones(len(points), dtype=bool)
+    for i, j in sorted(cKDTree(points).query_pairs(radius)):
+        if keep[i] and keep[j] and j >= n_fixed:
+            keep[j] = False
+    return np.flatnonzero(keep[n_fixed:]) + n_fixed
+
+
+class TetrahedralMesh:
+    """
+    Linear tetrahedral mesh with its element arrays precomputed.
+    
+    All arrays are contiguous and indexed by element, so assembly and stress
+    recovery consume them directly.
+    
+    Attributes:
+        nodes: Nx3 float64 node coordinates
+        elements: Mx4 int64 connectivity, positively oriented
+        volumes: Element volumes
+        quality: Mean-ratio element quality (1 = regular)
+        shape_gradients: Mx4x3 linear shape function gradients
+        strain_displacement: Mx6x12 constant-strain B matrices
+    """
+    
+    def __init__(self, nodes: np.ndarray, elements: np.ndarray):
+        """
+        Build the element arrays of a tetrahedral mesh.
+        
+        Args:
+            nodes: Nx3 node coordinates
+            elements: Mx4 element connectivity (orientation is fixed up)
+        """
+        self.nodes = np.ascontiguousarray(nodes, dtype=np.float64)
+        elements = np.array(elements, dtype=np.int64).reshape(-1, 4)
+        
+        signed_volumes, _ = tetrahedron_shape_gradients(self.nodes, elements)
+        negative = signed_volumes < 0
+        elements[negative] = elements[negative][:, [0, 1, 3, 2]]
+        self.elements = np.ascontiguousarray(elements)
+        
+        self.volumes, self.shape_gradients = tetrahedron_shape_gradients(self.nodes, self.elements)
+        self.quality = tetrahedron_quality(self.nodes, self.elements, self.volumes)
+        self.strain_displacement = tetrahedron_strain_displacement(self.shape_gradients)
+    
+    @property
+    def n_elements(self) -> int:
+        """Number of tetrahedra."""
+        return len(self.elements)
+    
+    @classmethod
+    def from_points(cls, points: np.ndarray, target_element_size: Optional[float] = None,
+                    min_quality: float = DEFAULT_MIN_ELEMENT_QUALITY) -> 'TetrahedralMesh':
+        """
+        Delaunay tetrahedralization of a point cloud's convex hull.
+        
+        With a target element size, the hull facets are sampled at that
+        spacing and the interior is filled with a body-centred cubic lattice,
+        so elements are well shaped throughout. Only tetrahedra with a face on
+        the hull are candidates for the quality filter: removing interior
+        elements would leave holes in the solid. Flat tetrahedra, which
+        Delaunay produces for cospherical points, have no volume and are
+        dropped everywhere.
+        
+        Args:
+            points: Nx3 geometry points; every row becomes a node with the same
+                index, and repeated points are left out of the elements
+            target_element_size: Optional edge length; surface and interior
+                points at this spacing are added before triangulating
+            min_quality: Hull tetrahedra below this mean-ratio quality are dropped
+            
+        Returns:
+            TetrahedralMesh over the hull
+            
+        Raises:
+            QhullError: If the points are coplanar or otherwise degenerate
+        """
+        nodes = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        # Triangulate the distinct points only; repeats stay as unused nodes so
+        # caller node indices (fixed nodes, force vectors) stay valid
+        _, first = np.unique(nodes, axis=0, return_index=True)
+        distinct = np.sort(first)
+        hull = Delaunay(nodes[distinct])
+        
+        if target_element_size:
+            h = float(target_element_size)
+            surface = ConvexHull(nodes[distinct])
+            clearance = REFINEMENT_CLEARANCE * h
+            # Interior lattice points stay clear of the hull planes; the surface
+            # samples fill that band
+            lattice = _bcc_lattice(surface.equations, nodes.min(axis=0), nodes.max(axis=0), h, clearance)
+            candidates = np.vstack([nodes[distinct],
+                                    _hull_surface_points(surface.points, surface.simplices, h),
+                                    lattice])
+            added = candidates[_thin_points(candidates, len(distinct), clearance)]
+            if len(added):
+                distinct = np.concatenate([distinct, np.arange(len(nodes), len(nodes) + len(added))])
+                nodes = np.vstack([nodes, added])
+                hull = Delaunay(nodes[distinct])
+        
+        mesh = cls(nodes, distinct[hull.simplices])
+        on_hull = np.any(hull.neighbors < 0, axis=1)
+        keep = ((mesh.quality >= min_quality) | ~on_hull) & (mesh.quality > DEGENERATE_ELEMENT_QUALITY)
+        if not np.all(keep):
+            logger.debug(f"Dropped {np.count_nonzero(~keep)} flat or hull sliver tetrahedra "
+                         f"below quality {min_quality}")
+            mesh = cls(nodes, mesh.elements[keep])
+        return mesh
+
+
+class ReducedStiffnessSolver:
+    """
+    Displacement solver for a stiffness matrix with fixed nodes.
+    
+    Boundary conditions are applied once with vectorized DOF masks and the
+    reduced matrix is factored once, so every load case after that is a
+    column of one multi-column right-hand side. DOF without any stiffness
+    (nodes no element uses) are held at zero like fixed DOF. For large models
+    the 'cg' method replaces the factorization by preconditioned conjugate
+    gradients.
+    """
+    
+    def __init__(self, K, fixed_nodes: Sequence[int] = (), dofs_per_node: int = 3,
+                 method: str = 'direct', preconditioner: str = 'jacobi',
+                 tol: float = 1e-10, max_iterations: Optional[int] = None):
+        """
+        Apply boundary conditions and prepare the reduced system.
+        
+        Args:
+            K: Global stiffness matrix
+            fixed_nodes: Nodes whose DOF are all constrained to zero
+            dofs_per_node: Number of DOF per node
+            method: 'direct' (sparse LU, factored once) or 'cg'
+            preconditioner: 'jacobi' or 'ic' (incomplete Cholesky) for the 'cg' method
+            tol: Relative residual tolerance for the 'cg' method
+            max_iterations: Optional iteration limit for the 'cg' method
+        """
+        if method not in SOLVER_METHODS:
+            raise ValueError(f"Unknown solver method '{method}', expected one of {SOLVER_METHODS}")
+        
+        self.n_dof = K.shape[0]
+        self.method = method
+        self.tol = tol
+        self.max_iterations = max_iterations
+        
+        n_nodes = self.n_dof // dofs_per_node
+        fixed_nodes = np.asarray(fixed_nodes, dtype=np.int64).ravel()
+        fixed = np.zeros(n_nodes, dtype=bool)
+        fixed[fixed_nodes[(fixed_nodes >= 0) & (fixed_nodes < n_nodes)]] = True
+        
+        K = sparse.csr_matrix(K)
+        has_stiffness = np.asarray(abs(K).sum(axis=1)).ravel() > 0
+        self.free_dof = np.flatnonzero(~np.repeat(fixed, dofs_per_node) & has_stiffness)
+        self.K_free = K[self.free_dof][:, self.free_dof].tocsc()
+        
+        self._factor = None
+        self._preconditioner = None
+        if len(self.free_dof) == 0:
+            return
+        
+        if method == 'direct':
+            try:
+                # K is symmetric positive definite: symmetric ordering, diagonal pivots
+                self._factor = splu(self.K_free, permc_spec='MMD_AT_PLUS_A',
+                                    options={'SymmetricMode': True})
+            except RuntimeError as e:
+                # Singular (under-constrained) systems fall back to least squares
+                logger.warning(f"Stiffness factorization failed, using least squares: {e}")
+        elif preconditioner == 'ic':
+            self._preconditioner = IncompleteCholesky(self.K_free).as_linear_operator()
+        else:
+            diagonal = self.K_free.diagonal()
+            inverse = np.divide(1.0, diagonal, out=np.ones_like(diagonal), where=diagonal != 0)
+            self._preconditioner = LinearOperator(self.K_free.shape, matvec=lambda x: inverse * x,
+                                                  dtype=np.float64)
+    
+    @property
+    def n_free_dof(self) -> int:
+        """Number of unconstrained DOF."""
+        return len(self.free_dof)
+    
+    def solve(self, forces: np.ndarray) -> np.ndarray:
+        """
+        Solve for displacements under one or more load cases.
+        
+        Args:
+            forces: Force vector of length n_dof, or (n_dof, n_cases) array with
+                one load case per column
+            
+        Returns:
+            Displacements with the same shape as forces (zero on fixed DOF)
+        """
+        forces = np.asarray(forces, dtype=np.float64)
+        single = forces.ndim == 1
+        forces = forces.reshape(self.n_dof, -1)
+        
+        displacement = np.zeros_like(forces)
+        if self.n_free_dof:
+            F_free = forces[self.free_dof]
+            if self._factor is not None:
+                u_free = self._factor.solve(F_free)
+            elif self.method == 'cg':
+                u_free = np.column_stack([self._solve_cg(F_free[:, i]) for i in range(F_free.shape[1])])
+            else:
+                u_free = np.column_stack([lsqr(self.K_free, F_free[:, i])[0]
+                                          for i in range(F_free.shape[1])])
+            displacement[self.free_dof] = u_free
+        
+        return displacement[:, 0] if single else displacement
+    
+    def _solve_cg(self, rhs: np.ndarray) -> np.ndarray:
+        """Preconditioned conjugate gradient solve of one reduced load case."""
+        solution, status = cg(self.K_free, rhs, rtol=self.tol, maxiter=self.max_iterations,
+                              M=self._preconditioner)
+        if status != 0:
+            logger.warning(f"Displacement CG did not converge (status {status})")
+        return solution
+
 
 class MultiPhysicsGenerator(AbstractAlgorithmGenerator):
     """
@@ -98,21 +473,24 @@ class MultiPhysicsGenerator(AbstractAlgorithmGenerator):
             return self._structural_analysis(
                 geometry=input_data['geometry'],
                 material_properties=input_data['material_properties'],
-                boundary_conditions=input_data.get('boundary_conditions', {})
+                boundary_conditions=input_data.get('boundary_conditions', {}),
+                mesh_options=input_data.get('mesh_options')
             )
         
         elif simulation_type == 'thermal':
             return self._thermal_analysis(
                 geometry=input_data['geometry'],
                 material_properties=input_data['material_properties'],
-                boundary_conditions=input_data.get('boundary_conditions', {})
+                boundary_conditions=input_data.get('boundary_conditions', {}),
+                mesh_options=input_data.get('mesh_options')
             )
         
         elif simulation_type == 'fluid_dynamics':
             return self._fluid_dynamics_simulation(
                 geometry=input_data['geometry'],
                 material_properties=input_data['material_properties'],
-                boundary_conditions=input_data.get('boundary_conditions', {})
+                boundary_conditions=input_data.get('boundary_conditions', {}),
+                mesh_options=input_data.get('mesh_options')
             )
         
         else:
@@ -122,7 +500,8 @@ class MultiPhysicsGenerator(AbstractAlgorithmGenerator):
         self, 
         geometry: np.ndarray, 
         material_properties: Dict[str, float],
-        boundary_conditions: Dict[str, Any]
+        boundary_conditions: Dict[str, Any],
+        mesh_options: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Perform finite element structural analysis.
@@ -131,6 +510,8 @@ class MultiPhysicsGenerator(AbstractAlgorithmGenerator):
             geometry: Mesh geometry
             material_properties: Material characteristics
             boundary_conditions: Simulation constraints
+            mesh_options: Optional _generate_mesh keyword arguments
+                (target_element_size, min_quality)
         
         Returns:
             Structural analysis results
@@ -140,38 +521,130 @@ class MultiPhysicsGenerator(AbstractAlgorithmGenerator):
         nu = material_properties.get('poisson_ratio', 0.3)
         
         # Generate finite element mesh
-        nodes, elements = self._generate_mesh(geometry)
+        nodes, elements, mesh = self._build_mesh(geometry, **(mesh_options or {}))
         
         # Compute stiffness matrix
-        K = self._assemble_stiffness_matrix(nodes, elements, E, nu)
+        K = self._assemble_stiffness_matrix(nodes, elements, E, nu, mesh=mesh)
         
         # Apply boundary conditions
-        force_vector = self._compute_force_vector(nodes, boundary_conditions)
         fixed_nodes = boundary_conditions.get('fixed_nodes', [])
+        solver = boundary_conditions.get('solver', 'direct')
+        if 'load_cases' in boundary_conditions:
+            return self._solve_load_cases(nodes, elements, K, E, nu, fixed_nodes,
+                                          boundary_conditions['load_cases'], solver, mesh=mesh)
+        force_vector = self._compute_force_vector(nodes, boundary_conditions)
         
         # Solve displacement field
-        displacement = self._solve_displacement(K, force_vector, fixed_nodes)
+        displacement = self._solve_displacement(K, force_vector, fixed_nodes, method=solver)
         
-        # Compute stress and strain
-        stress_distribution = self._compute_stress(displacement, nodes, elements, E, nu)
-        strain_tensor = self._compute_strain(displacement, nodes, elements)
+        # Compute stress and strain for all elements in one pass
+        fields = self._compute_element_fields(displacement, nodes, elements, E, nu, mesh=mesh)
+        stress_distribution = fields['stress'].ravel()
         
         return {
             'stress_distribution': stress_distribution,
             'displacement_field': displacement,
-            'strain_tensor': strain_tensor,
+            'strain_tensor': fields['strain'].ravel(),
+            'von_mises_stress': fields['von_mises'],
+            'principal_stresses': fields['principal_stresses'],
             'simulation_metrics': {
                 'max_stress': np.max(np.abs(stress_distribution)),
+                'max_von_mises_stress': np.max(fields['von_mises']) if fields['von_mises'].size else 0.0,
                 'max_displacement': np.max(np.abs(displacement)),
                 'total_deformation': np.sum(np.abs(displacement))
             }
         }
     
+    def solve_load_cases(
+        self,
+        geometry: np.ndarray,
+        material_properties: Dict[str, float],
+        load_cases: List[Dict[str, Any]],
+        fixed_nodes: Sequence[int] = (),
+        solver: str = 'direct',
+        mesh_options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Structural analysis of one part under many load cases.
+        
+        The mesh and stiffness matrix are built once, boundary conditions are
+        applied once and the reduced stiffness matrix is factored once; all
+        load cases are then solved together as a multi-column right-hand side.
+        
+        Args:
+            geometry: Mesh geometry
+            material_properties: Material characteristics
+            load_cases: Load dictionaries as accepted by _compute_force_vector, or
+                dictionaries with an explicit 'force_vector'
+            fixed_nodes: Nodes constrained in every load case
+            solver: Linear solver from SOLVER_METHODS
+            mesh_options: Optional _generate_mesh keyword arguments
+        
+        Returns:
+            Per-load-case displacement, stress and strain arrays with metrics
+        """
+        E = material_properties.get('young_modulus', 200e9)
+        nu = material_properties.get('poisson_ratio', 0.3)
+        
+        nodes, elements, mesh = self._build_mesh(geometry, **(mesh_options or {}))
+        K = self._assemble_stiffness_matrix(nodes, elements, E, nu, mesh=mesh)
+        return self._solve_load_cases(nodes, elements, K, E, nu, fixed_nodes, load_cases, solver,
+                                      mesh=mesh)
+    
+    def _solve_load_cases(self, nodes, elements, K, E, nu, fixed_nodes, load_cases, solver,
+                          mesh=None):
+        """
+        Solve an assembled structural model for a list of load cases.
+        
+        Args:
+            mesh: Optional TetrahedralMesh of nodes/elements whose B matrices
+                are reused for stress recovery
+        
+        Returns:
+            Result dictionary of solve_load_cases
+        """
+        forces = np.column_stack([
+            np.asarray(case['force_vector'], dtype=np.float64) if 'force_vector' in case
+            else self._compute_force_vector(nodes, case)
+            for case in load_cases
+        ]) if load_cases else np.zeros((K.shape[0], 0))
+        
+        solver_instance = ReducedStiffnessSolver(K, fixed_nodes, method=solver)
+        displacements = solver_instance.solve(forces).T
+        
+        # Stress recovery for every load case in one batched pass
+        fields = self._compute_element_fields(displacements, nodes, elements, E, nu, mesh=mesh)
+        n_components = fields['stress'].shape[1] * 6
+        stresses = fields['stress'].reshape(len(displacements), n_components)
+        
+        return {
+            'displacement_fields': displacements,
+            'stress_distributions': stresses,
+            'strain_tensors': fields['strain'].reshape(len(displacements), n_components),
+            'von_mises_stresses': fields['von_mises'],
+            'principal_stresses': fields['principal_stresses'],
+            'simulation_metrics': [
+                {
+                    'max_stress': np.max(np.abs(stress)) if stress.size else 0.0,
+                    'max_von_mises_stress': np.max(von_mises) if von_mises.size else 0.0,
+                    'max_displacement': np.max(np.abs(u)) if u.size else 0.0,
+                    'total_deformation': np.sum(np.abs(u))
+                }
+                for u, stress, von_mises in zip(displacements, stresses, fields['von_mises'])
+            ],
+            'solver': {
+                'method': solver,
+                'n_load_cases': len(load_cases),
+                'n_free_dof': solver_instance.n_free_dof
+            }
+        }
+    
     def _thermal_analysis(
         self, 
         geometry: np.ndarray, 
         material_properties: Dict[str, float],
-        boundary_conditions: Dict[str, Any]
+        boundary_conditions: Dict[str, Any],
+        mesh_options: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Perform thermal analysis and heat transfer simulation.
@@ -180,6 +653,7 @@ class MultiPhysicsGenerator(AbstractAlgorithmGenerator):
             geometry: Model geometry
             material_properties: Thermal material properties
             boundary_conditions: Temperature and heat flux conditions
+            mesh_options: Optional _generate_mesh keyword arguments
         
         Returns:
             Thermal analysis results
@@ -189,7 +663,7 @@ class MultiPhysicsGenerator(AbstractAlgorithmGenerator):
         cp = material_properties.get('specific_heat', 460)  # J/(kg·K)
         
         # Generate thermal mesh
-        nodes, elements = self._generate_mesh(geometry)
+        nodes, elements = self._generate_mesh(geometry, **(mesh_options or {}))
         
         # Compute thermal conductivity matrix
         K_thermal = self._assemble_thermal_matrix(nodes, elements, k)
@@ -213,7 +687,8 @@ class MultiPhysicsGenerator(AbstractAlgorithmGenerator):
         self, 
         geometry: np.ndarray, 
         material_properties: Dict[str, float],
-        boundary_conditions: Dict[str, Any]
+        boundary_conditions: Dict[str, Any],
+        mesh_options: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Perform computational fluid dynamics (CFD) simulation.
@@ -222,6 +697,7 @@ class MultiPhysicsGenerator(AbstractAlgorithmGenerator):
             geometry: Fluid domain geometry
             material_properties: Fluid characteristics
             boundary_conditions: Flow and pressure conditions
+            mesh_options: Optional _generate_mesh keyword arguments
         
         Returns:
             Fluid dynamics simulation results
@@ -231,7 +707,7 @@ class MultiPhysicsGenerator(AbstractAlgorithmGenerator):
         mu = material_properties.get('viscosity', 0.001)  # Pa·s
         
         # Generate fluid mesh
-        nodes, elements = self._generate_mesh(geometry)
+        nodes, elements = self._generate_mesh(geometry, **(mesh_options or {}))
         
         # Compute fluid dynamics matrices
         A_momentum = self._assemble_momentum_matrix(nodes, elements, rho, mu)
@@ -286,35 +762,79 @@ class MultiPhysicsGenerator(AbstractAlgorithmGenerator):
         return True
     
     # Placeholder methods for matrix assembly and solving
-    def _generate_mesh(self, geometry):
+    def _generate_mesh(self, geometry, target_element_size=None,
+                       min_quality=DEFAULT_MIN_ELEMENT_QUALITY):
         """
         Generate a finite element mesh from geometry.
         
         Args:
             geometry: Array of vertices defining the geometry
+            target_element_size: Optional target edge length for interior refinement
+            min_quality: Minimum mean-ratio quality of kept tetrahedra
             
         Returns:
             Tuple of (nodes, elements) for finite element analysis
         """
-        nodes = np.array(geometry)
-        n_nodes = len(nodes)
+        nodes, elements, _ = self._build_mesh(geometry, target_element_size, min_quality)
+        return nodes, elements
+    
+    def _build_mesh(self, geometry, target_element_size=None,
+                    min_quality=DEFAULT_MIN_ELEMENT_QUALITY):
+        """
+        Generate a finite element mesh and keep its precomputed element arrays.
         
-        # Generate simple tetrahedral elements for 3D mesh
-        # For simplicity, create elements based on node connectivity
-        elements = []
+        Args:
+            geometry: Array of vertices defining the geometry
+            target_element_size: Optional target edge length for interior refinement
+            min_quality: Minimum mean-ratio quality of kept tetrahedra
+            
+        Returns:
+            Tuple of (nodes, elements, TetrahedralMesh or None); the mesh is None
+            for flat geometry and the fallback connectivity
+        """
+        mesh = self.generate_tetrahedral_mesh(geometry, target_element_size, min_quality)
+        if mesh is not None:
+            return mesh.nodes, mesh.elements, mesh
         
-        if n_nodes >= 4:
-            # Create tetrahedral elements
-            for i in range(0, n_nodes-3, 4):
-                if i+3 < n_nodes:
-                    elements.append([i, i+1, i+2, i+3])
-        else:
-            # Fallback to simple connectivity
-            elements = [list(range(min(4, n_nodes)))]
+        nodes = np.asarray(geometry, dtype=np.float64)
+        n_nodes = len(nodes)
+        if n_nodes >= 3:
+            # Flat geometry: triangulate in its best-fit plane
+            centered = nodes - nodes.mean(axis=0)
+            _, _, axes = np.linalg.svd(centered, full_matrices=False)
+            try:
+                return nodes, Delaunay(centered @ axes[:2].T).simplices.astype(np.int64), None
+            except QhullError:
+                pass
+        # Fallback to simple connectivity
+        return nodes, np.array([list(range(min(4, n_nodes)))]), None
+    
+    def generate_tetrahedral_mesh(self, geometry, target_element_size=None,
+                                  min_quality=DEFAULT_MIN_ELEMENT_QUALITY) -> Optional[TetrahedralMesh]:
+        """
+        Build a Delaunay tetrahedral mesh of the geometry with quality filtering.
         
-        return nodes, np.array(elements)
+        Args:
+            geometry: Array of vertices defining the geometry
+            target_element_size: Optional target edge length for interior refinement
+            min_quality: Minimum mean-ratio quality of kept tetrahedra
+            
+        Returns:
+            TetrahedralMesh, or None when the geometry has no volume
+        """
+        points = np.asarray(geometry, dtype=np.float64)
+        if points.ndim != 2 or points.shape[1] != 3 or len(points) < 4:
+            return None
+        try:
+            mesh = TetrahedralMesh.from_points(points, target_element_size, min_quality)
+        except QhullError as e:
+            logger.warning(f"Geometry has no volume to tetrahedralize: {e}")
+            return None
+        if not mesh.n_elements:
+            return None
+        return mesh
     
-    def _assemble_stiffness_matrix(self, nodes, elements, E, nu):
+    def _assemble_stiffness_matrix(self, nodes, elements, E, nu, mesh=None):
         """
         Assemble the global stiffness matrix for structural analysis.
         
@@ -323,81 +843,71 @@ class MultiPhysicsGenerator(AbstractAlgorithmGenerator):
             elements: Element connectivity matrix
             E: Young's modulus
             nu: Poisson's ratio
+            mesh: Optional TetrahedralMesh of nodes/elements whose volumes and
+                B matrices are used instead of recomputing them
             
         Returns:
             Global stiffness matrix
         """
-        n_nodes = len(nodes)
-        n_dof = n_nodes * 3  # 3 DOF per node (x, y, z)
+        nodes = np.asarray(nodes, dtype=np.float64)
+        elements = np.atleast_2d(np.asarray(elements, dtype=np.int64))
+        n_dof = len(nodes) * 3  # 3 DOF per node (x, y, z)
         
-        # Initialize global stiffness matrix
-        K_global = sparse.lil_matrix((n_dof, n_dof))
+        if elements.shape[1] < 4:  # Only tetrahedral elements carry stiffness
+            return sparse.csr_matrix((n_dof, n_dof))
         
         # Material matrix for 3D elasticity
         D = self._compute_material_matrix(E, nu)
         
-        # Assemble element stiffness matrices
-        for element in elements:
-            if len(element) >= 4:  # Tetrahedral element
-                K_elem = self._compute_element_stiffness(nodes[element], D)
-                
-                # Map element DOF to global DOF
-                for i, node_i in enumerate(element):
-                    for j, node_j in enumerate(element):
-                        for dof_i in range(3):
-                            for dof_j in range(3):
-                                global_i = node_i * 3 + dof_i
-                                global_j = node_j * 3 + dof_j
-                                elem_i = i * 3 + dof_i
-                                elem_j = j * 3 + dof_j
-                                K_global[global_i, global_j] += K_elem[elem_i, elem_j]
-        
-        return K_global.tocsr()
-    
-    def _solve_displacement(self, K, force_vector, fixed_nodes):
+        # All element stiffness matrices at once: K_e = V_e * B_e^T D B_e
+        if mesh is not None:
+            volumes = mesh.volumes
+        else:
+            volumes = self._compute_element_volumes(nodes, elements)
+        B = self._compute_strain_displacement_matrices(nodes, elements, mesh=mesh)
+        K_elements = np.einsum('eki,kl,elj->eij', B, D, B, optimize=True)
+        K_elements *= np.where(volumes > 1e-12, volumes, 0.0)[:, None, None]
+        
+        return self._scatter_element_matrices(elements, K_elements, 3, n_dof)
+    
+    def _scatter_element_matrices(self, elements, element_matrices, dofs_per_node, n_dof):
+        """
+        Sum a stack of element matrices into a global sparse matrix.
+        
+        Args:
+            elements: Element connectivity (n_elements x nodes_per_element)
+            element_matrices: Array of shape (n_elements, k, k) with
+                k = nodes_per_element * dofs_per_node, in node-major DOF order
+            dofs_per_node: Number of DOF per node
+            n_dof: Size of the global matrix
+            
+        Returns:
+            Global CSR matrix with duplicate entries summed
+        """
+        index_dtype = np.int32 if n_dof < np.iinfo(np.int32).max else np.int64
+        element_dofs = (elements[:, :, None] * dofs_per_node
+                        + np.arange(dofs_per_node)).reshape(len(elements), -1).astype(index_dtype)
+        k = element_dofs.shape[1]
+        
+        rows = np.repeat(element_dofs, k, axis=1).ravel()
+        cols = np.tile(element_dofs, (1, k)).ravel()
+        return sparse.coo_matrix((element_matrices.ravel(), (rows, cols)),
+                                 shape=(n_dof, n_dof)).tocsr()
+    
+    def _solve_displacement(self, K, force_vector, fixed_nodes, method='direct'):
         """
         Solve for nodal displacements using finite element method.
         
         Args:
             K: Global stiffness matrix
-            force_vector: Applied force vector
+            force_vector: Applied force vector, or (n_dof, n_cases) array of load cases
             fixed_nodes: List of fixed/constrained nodes
+            method: Linear solver from SOLVER_METHODS
             
         Returns:
-            Displacement vector
+            Displacement vector (or one column per load case)
         """
-        n_dof = K.shape[0]
-        
-        # Apply boundary conditions by constraining DOF
-        free_dof = []
-        constrained_dof = []
-        
-        for i in range(n_dof // 3):
-            if i in fixed_nodes:
-                # Fix all DOF for constrained nodes
-                constrained_dof.extend([i*3, i*3+1, i*3+2])
-            else:
-                free_dof.extend([i*3, i*3+1, i*3+2])
-        
-        if len(free_dof) == 0:
-            return np.zeros(n_dof)
-        
-        # Extract free DOF system
-        K_free = K[np.ix_(free_dof, free_dof)]
-        F_free = force_vector[free_dof]
-        
-        # Solve for free DOF displacements
-        try:
-            u_free = spsolve(K_free, F_free)
-        except:
-            # Fallback to least squares if singular
-            u_free = sparse.linalg.lsqr(K_free, F_free)[0]
-        
-        # Assemble full displacement vector
-        displacement = np.zeros(n_dof)
-        displacement[free_dof] = u_free
-        
-        return displacement
+        return ReducedStiffnessSolver(K, fixed_nodes, method=method).solve(force_vector)
     
     def _compute_stress(self, displacement, nodes, elements, E, nu):
         """
@@ -413,31 +923,7 @@ class MultiPhysicsGenerator(AbstractAlgorithmGenerator):
         Returns:
             Stress distribution array
         """
-        n_elements = len(elements)
-        stress_distribution = np.zeros((n_elements, 6))  # 6 stress components
-        
-        # Material matrix
-        D = self._compute_material_matrix(E, nu)
-        
-        for i, element in enumerate(elements):
-            if len(element) >= 3:
-                # Extract element displacements
-                elem_disp = []
-                for node_id in element:
-                    elem_disp.extend(displacement[node_id*3:(node_id+1)*3])
-                elem_disp = np.array(elem_disp)
-                
-                # Compute strain-displacement matrix
-                B = self._compute_strain_displacement_matrix(nodes[element])
-                
-                # Compute element strain
-                strain = np.dot(B, elem_disp)
-                
-                # Compute element stress
-                stress = np.dot(D, strain)
-                stress_distribution[i] = stress
-        
-        return stress_distribution.flatten()
+        return self._compute_element_fields(displacement, nodes, elements, E, nu)['stress'].ravel()
     
     def _compute_strain(self, displacement, nodes, elements):
         """
@@ -451,25 +937,69 @@ class MultiPhysicsGenerator(AbstractAlgorithmGenerator):
         Returns:
             Strain distribution array
         """
-        n_elements = len(elements)
-        strain_distribution = np.zeros((n_elements, 6))  # 6 strain components
-        
-        for i, element in enumerate(elements):
-            if len(element) >= 3:
-                # Extract element displacements
-                elem_disp = []
-                for node_id in element:
-                    elem_disp.extend(displacement[node_id*3:(node_id+1)*3])
-                elem_disp = np.array(elem_disp)
-                
-                # Compute strain-displacement matrix
-                B = self._compute_strain_displacement_matrix(nodes[element])
-                
-                # Compute element strain
-                strain = np.dot(B, elem_disp)
-                strain_distribution[i] = strain
-        
-        return strain_distribution.flatten()
+        return self._compute_element_strains(displacement, nodes, elements).ravel()
+    
+    def _compute_element_strains(self, displacement, nodes, elements, mesh=None):
+        """
+        Constant element strains for one or more displacement fields.
+        
+        Args:
+            displacement: Nodal displacement vector, or (n_cases, n_dof) array
+            nodes: Node coordinates
+            elements: Element connectivity
+            mesh: Optional TetrahedralMesh of nodes/elements with precomputed B matrices
+            
+        Returns:
+            Array of shape (n_elements, 6), or (n_cases, n_elements, 6)
+        """
+        displacement = np.asarray(displacement, dtype=np.float64)
+        elements = np.atleast_2d(np.asarray(elements, dtype=np.int64))
+        n_elements, nodes_per_element = elements.shape
+        
+        if nodes_per_element < 3:
+            return np.zeros(displacement.shape[:-1] + (n_elements, 6))
+        
+        B = self._compute_strain_displacement_matrices(nodes, elements, mesh=mesh)
+        element_dofs = (elements[:, :, None] * 3 + np.arange(3)).reshape(n_elements, -1)
+        return np.einsum('eij,...ej->...ei', B, displacement[..., element_dofs], optimize=True)
+    
+    def _compute_element_fields(self, displacement, nodes, elements, E, nu, mesh=None):
+        """
+        Recover strain, stress and derived stress measures of every element.
+        
+        Args:
+            displacement: Nodal displacement vector, or (n_cases, n_dof) array
+            nodes: Node coordinates
+            elements: Element connectivity
+            E: Young's modulus
+            nu: Poisson's ratio
+            mesh: Optional TetrahedralMesh of nodes/elements with precomputed B matrices
+            
+        Returns:
+            Dictionary of per-element 'strain' and 'stress' (Voigt order xx, yy,
+            zz, xy, xz, yz), 'von_mises' and descending 'principal_stresses',
+            with a leading load-case axis for 2D displacement input
+        """
+        strain = self._compute_element_strains(displacement, nodes, elements, mesh=mesh)
+        stress = strain @ self._compute_material_matrix(E, nu).T
+        
+        sxx, syy, szz, sxy, sxz, syz = np.moveaxis(stress, -1, 0)
+        von_mises = np.sqrt(0.5 * ((sxx - syy) ** 2 + (syy - szz) ** 2 + (szz - sxx) ** 2)
+                            + 3.0 * (sxy ** 2 + sxz ** 2 + syz ** 2))
+        
+        tensors = np.stack([
+            np.stack([sxx, sxy, sxz], axis=-1),
+            np.stack([sxy, syy, syz], axis=-1),
+            np.stack([sxz, syz, szz], axis=-1),
+        ], axis=-2)
+        principal = np.linalg.eigvalsh(tensors)[..., ::-1]
+        
+        return {
+            'strain': strain,
+            'stress': stress,
+            'von_mises': von_mises,
+            'principal_stresses': principal
+        }
     
     def _assemble_thermal_matrix(self, nodes, elements, thermal_conductivity):
         """
@@ -483,21 +1013,24 @@ class MultiPhysicsGenerator(AbstractAlgorithmGenerator):
         Returns:
             Global thermal conductivity matrix
         """
+        nodes = np.asarray(nodes, dtype=np.float64)
+        elements = np.atleast_2d(np.asarray(elements, dtype=np.int64))
         n_nodes = len(nodes)
-        K_thermal = sparse.lil_matrix((n_nodes, n_nodes))
+        nodes_per_element = elements.shape[1]
+        
+        if nodes_per_element < 3:
+            return sparse.csr_matrix((n_nodes, n_nodes))
         
-        # Assemble element thermal matrices
-        for element in elements:
-            if len(element) >= 3:
-                # Compute element thermal matrix
-                K_elem = self._compute_element_thermal_matrix(nodes[element], thermal_conductivity)
-                
-                # Assemble into global matrix
-                for i, node_i in enumerate(element):
-                    for j, node_j in enumerate(element):
-                        K_thermal[node_i, node_j] += K_elem[i, j]
+        # Same conductance pattern for every element, scaled by its size:
+        # (n - 1) on the diagonal, -1 elsewhere
+        if nodes_per_element == 3:
+            element_size = self._compute_element_areas(nodes, elements, planar=False)
+        else:
+            element_size = self._compute_element_volumes(nodes, elements)
+        pattern = nodes_per_element * np.eye(nodes_per_element) - 1.0
+        K_elements = (thermal_conductivity * element_size)[:, None, None] * pattern
         
-        return K_thermal.tocsr()
+        return self._scatter_element_matrices(elements, K_elements, 1, n_nodes)
     
     def _solve_temperature(self, K_thermal, temperature_vector):
         """
@@ -532,28 +1065,29 @@ class MultiPhysicsGenerator(AbstractAlgorithmGenerator):
         Returns:
             Momentum matrix for Navier-Stokes equations
         """
-        n_nodes = len(nodes)
-        n_dof = n_nodes * 2  # 2D velocity components (u, v)
-        A_momentum = sparse.lil_matrix((n_dof, n_dof))
-        
-        # Assemble element momentum matrices
-        for element in elements:
-            if len(element) >= 3:
-                # Compute element momentum matrix (simplified)
-                K_elem = self._compute_element_momentum_matrix(nodes[element], density, viscosity)
-                
-                # Assemble into global matrix
-                for i, node_i in enumerate(element):
-                    for j, node_j in enumerate(element):
-                        for dof_i in range(2):  # u, v components
-                            for dof_j in range(2):
-                                global_i = node_i * 2 + dof_i
-                                global_j = node_j * 2 + dof_j
-                                elem_i = i * 2 + dof_i
-                                elem_j = j * 2 + dof_j
-                                A_momentum[global_i, global_j] += K_elem[elem_i, elem_j]
-        
-        return A_momentum.tocsr()
+        nodes = np.asarray(nodes, dtype=np.float64)
+        elements = np.atleast_2d(np.asarray(elements, dtype=np.int64))
+        n_dof = len(nodes) * 2  # 2D velocity components (u, v)
+        nodes_per_element = elements.shape[1]
+        
+        if nodes_per_element < 3:
+            return sparse.csr_matrix((n_dof, n_dof))
+        
+        if nodes_per_element == 3:
+            area = self._compute_element_areas(nodes, elements, planar=True)
+        else:
+            area = np.ones(len(elements))  # Default for non-triangular elements
+        
+        # Simplified viscous (Laplacian) and convective node couplings, applied
+        # to u-u and v-v only
+        off_diagonal = 1.0 - np.eye(nodes_per_element)
+        viscous = 2.0 * np.eye(nodes_per_element) - off_diagonal / nodes_per_element
+        node_matrices = (viscosity * area)[:, None, None] * viscous
+        node_matrices += (density * area * 0.1 / nodes_per_element)[:, None, None]
+        K_elements = np.einsum('eij,ab->eiajb', node_matrices, np.eye(2)).reshape(
+            len(elements), 2 * nodes_per_element, 2 * nodes_per_element)
+        
+        return self._scatter_element_matrices(elements, K_elements, 2, n_dof)
     
     def _assemble_continuity_matrix(self, nodes, elements):
         """
@@ -566,21 +1100,24 @@ class MultiPhysicsGenerator(AbstractAlgorithmGenerator):
         Returns:
             Continuity matrix for mass conservation
         """
+        nodes = np.asarray(nodes, dtype=np.float64)
+        elements = np.atleast_2d(np.asarray(elements, dtype=np.int64))
         n_nodes = len(nodes)
-        A_continuity = sparse.lil_matrix((n_nodes, n_nodes))
+        nodes_per_element = elements.shape[1]
+        
+        if nodes_per_element < 3:
+            return sparse.csr_matrix((n_nodes, n_nodes))
+        
+        if nodes_per_element == 3:
+            area = self._compute_element_areas(nodes, elements, planar=True)
+        else:
+            area = np.ones(len(elements))
         
-        # Assemble element continuity matrices
-        for element in elements:
-            if len(element) >= 3:
-                # Compute element continuity matrix
-                C_elem = self._compute_element_continuity_matrix(nodes[element])
-                
-                # Assemble into global matrix
-                for i, node_i in enumerate(element):
-                    for j, node_j in enumerate(element):
-                        A_continuity[node_i, node_j] += C_elem[i, j]
+        # Simplified divergence operator: area / n * ((n - 1) on the diagonal, -1 elsewhere)
+        pattern = nodes_per_element * np.eye(nodes_per_element) - 1.0
+        C_elements = (area / nodes_per_element)[:, None, None] * pattern
         
-        return A_continuity.tocsr()
+        return self._scatter_element_matrices(elements, C_elements, 1, n_nodes)
     
     def _solve_fluid_velocity(self, A_momentum, velocity_vector):
         """
@@ -868,6 +1405,67 @@ class MultiPhysicsGenerator(AbstractAlgorithmGenerator):
         volume = abs(np.dot(v1, np.cross(v2, v3))) / 6.0
         return max(volume, 1e-12)  # Prevent zero volume
     
+    def _compute_element_volumes(self, nodes, elements):
+        """
+        Compute the volume of every tetrahedral element.
+        
+        Args:
+            nodes: Node coordinates
+            elements: Element connectivity (n_elements x 4)
+            
+        Returns:
+            Array of element volumes, clamped like _compute_element_volume
+        """
+        corners = nodes[elements[:, :4]]
+        v1 = corners[:, 1] - corners[:, 0]
+        v2 = corners[:, 2] - corners[:, 0]
+        v3 = corners[:, 3] - corners[:, 0]
+        
+        volumes = np.abs(np.einsum('ij,ij->i', v1, np.cross(v2, v3))) / 6.0
+        return np.maximum(volumes, 1e-12)  # Prevent zero volume
+    
+    def _compute_element_areas(self, nodes, elements, planar=False):
+        """
+        Compute the area of every triangular element.
+        
+        Args:
+            nodes: Node coordinates
+            elements: Element connectivity (n_elements x 3)
+            planar: Use only the x and y coordinates
+            
+        Returns:
+            Array of element areas
+        """
+        corners = nodes[elements[:, :3]]
+        v1 = corners[:, 1] - corners[:, 0]
+        v2 = corners[:, 2] - corners[:, 0]
+        if planar or nodes.shape[1] == 2:
+            return 0.5 * np.abs(v1[:, 0] * v2[:, 1] - v1[:, 1] * v2[:, 0])
+        return 0.5 * np.linalg.norm(np.cross(v1, v2), axis=1)
+    
+    def _compute_strain_displacement_matrices(self, nodes, elements, mesh=None):
+        """
+        Compute the strain-displacement matrices of all elements.
+        
+        Args:
+            nodes: Node coordinates
+            elements: Element connectivity
+            mesh: Optional TetrahedralMesh of nodes/elements; its B matrices are returned
+            
+        Returns:
+            Array of shape (n_elements, 6, 3 * nodes_per_element)
+        """
+        if mesh is not None:
+            return mesh.strain_displacement
+        if elements.shape[1] == 4:
+            _, gradients = tetrahedron_shape_gradients(np.asarray(nodes, dtype=np.float64), elements)
+            return tetrahedron_strain_displacement(gradients)
+        
+        # The simplified constant strain B matrix depends only on the node count
+        nodes_per_element = elements.shape[1]
+        B = self._compute_strain_displacement_matrix(np.zeros((nodes_per_element, 3)))
+        return np.broadcast_to(B, (len(elements),) + B.shape)
+    
     def _compute_strain_displacement_matrix(self, nodes):
         """
         Compute the strain-displacement matrix (B matrix) for tetrahedral element.
@@ -879,6 +1477,12 @@ class MultiPhysicsGenerator(AbstractAlgorithmGenerator):
             Strain-displacement matrix
         """
         n_nodes = len(nodes)
+        if n_nodes == 4:
+            # Linear tetrahedron: exact shape function derivatives
+            _, gradients = tetrahedron_shape_gradients(np.asarray(nodes, dtype=np.float64),
+                                                       np.arange(4)[None, :])
+            return tetrahedron_strain_displacement(gradients)[0]
+        
         B = np.zeros((6, n_nodes * 3))
         
         # Simplified B matrix for constant strain element
@@ -10,6 +10,7 @@ import asyncio
 import json
 import logging
 import sys
+import time
 from typing import Any, Sequence
 
 import mcp.types as types
@@ -30,7 +31,8 @@ logger = logging.getLogger("autocad-mcp")
 # Import our MCP tools and utilities
 try:
     from src.utils import get_autocad_instance, validate_point3d, extract_entity_properties
-    from src.algorithms.lscm import unfold_surface_lscm
+    from src.algorithms.unfold_cache import get_unfold_cache
+    from src.algorithms.spatial_index import snap_point_constraints
 except ImportError as e:
     logger.error(f"Failed to import AutoCAD modules: {e}")
     # Continue with basic functionality if advanced modules aren't available
@@ -209,8 +211,26 @@ async def handle_list_tools() -> list[types.Tool]:
                         "description": "Array of triangle vertex indices [[i1,j1,k1], [i2,j2,k2], ...]",
                         "minItems": 1
                     },
-                    "description": "Optional boundary vertex constraints [[vertex_index, u_coord, v_coord], ...]",
-                            "required": False,
+                    "boundary_constraints": {
+                        "type": "array",
+                        "items": {
+                            "type": "array",
+                            "items": {"type": "number"},
+                            "minItems": 3,
+                            "maxItems": 3
+                        },
+                        "description": "Optional boundary vertex constraints [[vertex_index, u_coord, v_coord], ...]"
+                    },
+                    "boundary_points": {
+                        "type": "array",
+                        "items": {
+                            "type": "array",
+                            "items": {"type": "number"},
+                            "minItems": 5,
+                            "maxItems": 5
+                        },
+                        "description": "Optional picked-point constraints [[x, y, z, u_coord, v_coord], ...], each snapped to the nearest mesh vertex"
+                    },
                     "tolerance": {
                         "type": "number",
                         "minimum": 0,
@@ -220,6 +240,72 @@ async def handle_list_tools() -> list[types.Tool]:
                 },
                 "required": ["vertices", "triangles"]
             }
+        ),
+        types.Tool(
+            name="unfold_surfaces_batch",
+            description="Unfold many 3D surface meshes in one call using LSCM in a parallel process pool; per-part results stream back as progress notifications",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "parts": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "part_id": {
+                                    "type": ["string", "integer"],
+                                    "description": "Optional identifier echoed back with the part's result"
+                                },
+                                "vertices": {
+                                    "type": "array",
+                                    "items": {
+                                        "type": "array",
+                                        "items": {"type": "number"},
+                                        "minItems": 3,
+                                        "maxItems": 3
+                                    },
+                                    "description": "Array of 3D vertex coordinates"
+                                },
+                                "triangles": {
+                                    "type": "array",
+                                    "items": {
+                                        "type": "array",
+                                        "items": {"type": "integer", "minimum": 0},
+                                        "minItems": 3,
+                                        "maxItems": 3
+                                    },
+                                    "description": "Array of triangle vertex indices"
+                                },
+                                "boundary_constraints": {
+                                    "type": "array",
+                                    "items": {
+                                        "type": "array",
+                                        "items": {"type": "number"},
+                                        "minItems": 3,
+                                        "maxItems": 3
+                                    },
+                                    "description": "Optional boundary vertex constraints [[vertex_index, u_coord, v_coord], ...]"
+                                }
+                            },
+                            "required": ["vertices", "triangles"]
+                        },
+                        "description": "Parts to unfold",
+                        "minItems": 1
+                    },
+                    "tolerance": {
+                        "type": "number",
+                        "minimum": 0,
+                        "default": 0.001,
+                        "description": "Distortion tolerance for manufacturing validation"
+                    },
+                    "max_workers": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "description": "Number of worker processes (defaults to the CPU count)"
+                    }
+                },
+                "required": ["parts"]
+            }
         )
     ]
 
@@ -255,7 +341,14 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
                 arguments["vertices"],
                 arguments["triangles"],
                 arguments.get("boundary_constraints"),
-                arguments.get("tolerance", 0.001)
+                arguments.get("tolerance", 0.001),
+                arguments.get("boundary_points")
+            )
+        elif name == "unfold_surfaces_batch":
+            result = await _unfold_surfaces_batch(
+                arguments["parts"],
+                arguments.get("tolerance", 0.001),
+                arguments.get("max_workers")
             )
         else:
             result = json.dumps({
@@ -461,7 +554,8 @@ async def _unfold_surface_lscm(
     vertices: list[list[float]], 
     triangles: list[list[int]], 
     boundary_constraints: list[list[float]] = None,
-    tolerance: float = 0.001
+    tolerance: float = 0.001,
+    boundary_points: list[list[float]] = None
 ) -> str:
     """Advanced 3D surface unfolding using LSCM algorithm."""
     try:
@@ -477,12 +571,17 @@ async def _unfold_surface_lscm(
         if boundary_constraints:
             boundary_constraints_converted = [(int(bc[0]), float(bc[1]), float(bc[2])) for bc in boundary_constraints]
         
-        # Execute LSCM algorithm
-        result = unfold_surface_lscm(
-            vertices_array, 
-            triangles_array, 
-            boundary_constraints_converted,
-            tolerance
+        # Snap picked points to their nearest vertices with the cached KD-tree
+        if boundary_points:
+            snapped = snap_point_constraints(vertices_array, boundary_points)
+            boundary_constraints_converted = (boundary_constraints_converted or []) + snapped
+        
+        # Execute LSCM algorithm through the content-addressed result cache
+        result = get_unfold_cache().unfold(
+            vertices_array,
+            triangles_array,
+            boundary_constraints=boundary_constraints_converted,
+            distortion_tolerance=tolerance
         )
         
         # Add algorithm metadata
@@ -490,7 +589,7 @@ async def _unfold_surface_lscm(
         result["input_mesh"] = {
             "vertices_count": len(vertices),
             "triangles_count": len(triangles),
-            "boundary_constraints": len(boundary_constraints) if boundary_constraints else 0
+            "boundary_constraints": len(boundary_constraints_converted) if boundary_constraints_converted else 0
         }
         result["performance"] = {
             "tolerance": tolerance,
@@ -514,6 +613,104 @@ async def _unfold_surface_lscm(
         })
 
 
+async def _unfold_surfaces_batch(
+    parts: list[dict[str, Any]],
+    tolerance: float = 0.001,
+    max_workers: int | None = None
+) -> str:
+    """Unfold many surfaces in a process pool, streaming per-part progress."""
+    start_time = time.perf_counter()
+    try:
+        logger.info(f"Starting batch LSCM unfolding: {len(parts)} parts")
+
+        parts_converted = []
+        for index, part in enumerate(parts):
+            converted = dict(part)
+            converted.setdefault("part_id", index)
+            if part.get("boundary_constraints"):
+                converted["boundary_constraints"] = [
+                    (int(bc[0]), float(bc[1]), float(bc[2])) for bc in part["boundary_constraints"]
+                ]
+            parts_converted.append(converted)
+
+        progress = _progress_reporter(len(parts))
+        results = []
+        batch = get_unfold_cache().unfold_batch(
+            parts_converted,
+            distortion_tolerance=tolerance,
+            max_workers=max_workers
+        )
+
+        # Pull results on a worker thread so the event loop can send notifications
+        while True:
+            part_result = await asyncio.to_thread(next, batch, None)
+            if part_result is None:
+                break
+            results.append(part_result)
+            await progress(part_result, len(results))
+
+        succeeded = sum(1 for r in results if r.get("success"))
+        logger.info(f"Batch LSCM unfolding completed: {succeeded}/{len(parts)} parts succeeded")
+        return json.dumps({
+            "success": True,
+            "algorithm": "LSCM (Least Squares Conformal Mapping)",
+            "parts_total": len(parts),
+            "parts_succeeded": succeeded,
+            "parts_failed": len(results) - succeeded,
+            "results": results,
+            "performance": {
+                "tolerance": tolerance,
+                "max_workers": max_workers,
+                "total_time": time.perf_counter() - start_time
+            }
+        }, indent=2)
+
+    except Exception as e:
+        logger.error(f"Error in batch LSCM surface unfolding: {e}")
+        return json.dumps({
+            "success": False,
+            "error": str(e),
+            "algorithm": "LSCM (Least Squares Conformal Mapping)",
+            "message": "Failed to run batch surface unfolding",
+            "parts_total": len(parts) if parts else 0
+        })
+
+
+def _progress_reporter(total: int):
+    """
+    Build a coroutine reporting each finished batch part to the MCP client.
+
+    Sends a log notification with the part summary and, when the client supplied
+    a progress token, a progress notification. Outside a request it does nothing.
+    """
+    try:
+        context = server.request_context
+    except LookupError:
+        context = None
+
+    progress_token = getattr(context.meta, "progressToken", None) if context and context.meta else None
+
+    async def report(part_result: dict[str, Any], completed: int) -> None:
+        if context is None:
+            return
+        summary = {
+            "part_id": part_result.get("part_id"),
+            "success": part_result.get("success"),
+            "completed": completed,
+            "total": total,
+            "error": part_result.get("error"),
+            "pattern_size": part_result.get("pattern_size"),
+        }
+        try:
+            await context.session.send_log_message(level="info", data=summary, logger="unfold_surfaces_batch")
+            if progress_token is not None:
+                await context.session.send_progress_notification(progress_token, completed, total)
+        except Exception as e:
+            logger.warning(f"Failed to report batch progress: {e}")
+
+    return report
+
+
 async def _server_status() -> str:
     """Get MCP server and AutoCAD connection status."""
     try:
@@ -525,9 +722,10 @@ async def _server_status() -> str:
             "mcp_server": "running",
             "autocad_connected": True,
             "active_document": doc_name,
-            "tools_available": 8,
-            "tools_advanced": 1,
-            "advanced_algorithms": ["LSCM Surface Unfolding"],
+            "tools_available": 9,
+            "tools_advanced": 2,
+            "advanced_algorithms": ["LSCM Surface Unfolding", "Batch LSCM Surface Unfolding"],
+            "unfold_cache": _unfold_cache_stats(),
             "transport": "stdio",
             "message": "MCP server is operational and connected to AutoCAD via Claude Desktop",
         })
@@ -538,13 +736,22 @@ async def _server_status() -> str:
             "error": str(e),
             "mcp_server": "running", 
             "autocad_connected": False,
-            "tools_available": 8,
-            "tools_advanced": 1,
+            "tools_available": 9,
+            "tools_advanced": 2,
+            "unfold_cache": _unfold_cache_stats(),
             "transport": "stdio",
             "message": "MCP server running but AutoCAD connection failed"
         })
 
 
+def _unfold_cache_stats() -> dict[str, Any]:
+    """Hit/miss statistics of the unfolding result cache."""
+    try:
+        return get_unfold_cache().stats()
+    except Exception as e:
+        return {"error": str(e)}
+
+
 @server.list_resources()
 async def handle_list_resources() -> list[types.Resource]:
     """List available resources."""
@@ -605,6 +812,7 @@ async def handle_get_prompt(name: str, arguments: dict[str, str] | None) -> type
 
 ## Advanced Algorithmic Tools:
 8. **unfold_surface_lscm** - Advanced 3D surface unfolding using LSCM algorithm with minimal distortion for manufacturing
+9. **unfold_surfaces_batch** - Unfold many parts in one call on a parallel process pool, with per-part progress
 
 ## Usage Examples:
 ### Basic Drawing:
@@ -614,6 +822,7 @@ async def handle_get_prompt(name: str, arguments: dict[str, str] | None) -> type
 
 ### Advanced Surface Processing:
 - LSCM Unfolding: `unfold_surface_lscm(vertices=[[0,0,0],[1,0,0],[0.5,1,0]], triangles=[[0,1,2]], tolerance=0.001)`
+- Batch Unfolding: `unfold_surfaces_batch(parts=[{"part_id": "A1", "vertices": [...], "triangles": [...]}, ...], tolerance=0.001)`
 
 ## Advanced Features:
 - **LSCM Algorithm**: Research-grade surface unfolding with manufacturing validation
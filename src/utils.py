@@ -256,71 +256,33 @@ def analyze_surface_mesh(entity) -> Dict[str, Any]:
         try:
             m_size = None
             n_size = None
+            vertices = None
 
             # Extract dimensions from coordinates (primary method for AutoCAD PolygonMesh)
             if hasattr(entity, "Coordinates"):
-                coords = entity.Coordinates
-                total_vertices = len(coords) // 3  # 3 coordinates per vertex
-
-                # Determine grid dimensions by analyzing coordinate patterns
-                # Convert to list of vertices for analysis
-                vertices = []
-                for i in range(0, len(coords), 3):
-                    vertices.append([coords[i], coords[i + 1], coords[i + 2]])
-
-                # Find unique X and Y coordinates to determine grid size
-                x_coords = sorted(set(v[0] for v in vertices))
-                y_coords = sorted(set(v[1] for v in vertices))
-
-                m_size = len(x_coords)  # Number of unique X positions
-                n_size = len(y_coords)  # Number of unique Y positions
-
-                # Validate that we have a rectangular grid
-                if m_size * n_size == total_vertices:
-                    logger.info(f"Detected {m_size}x{n_size} grid from coordinates analysis")
-                else:
-                    # Fallback: common grid sizes
-                    if total_vertices == 9:
-                        m_size = n_size = 3
-                    elif total_vertices == 16:
-                        m_size = n_size = 4
-                    elif total_vertices == 25:
-                        m_size = n_size = 5
-                    else:
-                        # Try to guess dimensions for other sizes
-                        import math
-
-                        sqrt_vertices = int(math.sqrt(total_vertices))
-                        if sqrt_vertices * sqrt_vertices == total_vertices:
-                            m_size = n_size = sqrt_vertices
-
-                    logger.info(
-                        f"Using fallback grid size: {m_size}x{n_size} for {total_vertices} vertices"
-                    )
+                from .algorithms.mesh_utils import polygon_mesh_grid, polygon_mesh_vertices
+
+                vertices = polygon_mesh_vertices(entity.Coordinates)
+                grid = polygon_mesh_grid(entity, vertices)
+                if grid is not None:
+                    m_size, n_size = grid.shape
+                    logger.info(f"Detected {m_size}x{n_size} grid from {len(vertices)} vertices")
 
             # If we successfully determined dimensions, populate analysis
             if m_size and n_size and m_size >= 2 and n_size >= 2:
                 analysis["m_size"] = m_size
                 analysis["n_size"] = n_size
-                analysis["vertex_count"] = m_size * n_size
+                analysis["vertex_count"] = len(vertices)
                 analysis["face_count"] = (m_size - 1) * (n_size - 1)
                 analysis["has_vertices"] = True
                 analysis["is_unfoldable"] = True
 
                 # Calculate approximate surface area from coordinates
-                if hasattr(entity, "Coordinates"):
+                if vertices is not None:
                     try:
                         # Simple area estimation from bounding box
-                        vertices = []
-                        for i in range(0, len(coords), 3):
-                            vertices.append([coords[i], coords[i + 1], coords[i + 2]])
-
-                        x_coords = [v[0] for v in vertices]
-                        y_coords = [v[1] for v in vertices]
-
-                        width = max(x_coords) - min(x_coords)
-                        height = max(y_coords) - min(y_coords)
-                        analysis["estimated_area"] = width * height
+                        width, height = vertices[:, :2].max(axis=0) - vertices[:, :2].min(axis=0)
+                        analysis["estimated_area"] = float(width * height)
 
                     except (ValueError, IndexError, TypeError) as e:
                         logger.warning(f"Could not calculate estimated area from coordinates: {e}")
@@ -835,7 +797,7 @@ def create_success_response(
     return response
 
 
-def calculate_distortion_metrics(vertices, triangles, uv_coords) -> Dict[str, Any]:
+def calculate_distortion_metrics(vertices, triangles, uv_coords, detail: str = "summary") -> Dict[str, Any]:
     """
     Calculate mesh distortion metrics for surface unfolding quality assessment.
     
@@ -843,12 +805,11 @@ def calculate_distortion_metrics(vertices, triangles, uv_coords) -> Dict[str, An
         vertices: Nx3 array of 3D vertex coordinates
         triangles: Mx3 array of triangle vertex indices  
         uv_coords: Nx2 array of UV coordinates from LSCM solution
+        detail: "summary" for statistics only, "full" to include per-triangle arrays
         
     Returns:
         Dictionary containing distortion metrics and analysis
     """
-    from .algorithms.lscm import LSCMSolver
-    
-    # Create temporary LSCM solver to access distortion calculation method
-    solver = LSCMSolver(vertices, triangles)
-    return solver.calculate_distortion_metrics(uv_coords)
+    from .algorithms.lscm import compute_distortion_metrics
+
+    return compute_distortion_metrics(vertices, triangles, uv_coords, detail=detail)
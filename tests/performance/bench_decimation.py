@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Quadric error edge-collapse decimation benchmarks.
+
+Decimates wavy grid meshes of increasing size with qem_decimate_mesh and
+reports triangle count against wall time, both for halving the vertex count
+(the MeshOptimizationGenerator simplify path, pool fraction 0.5) and for
+reducing to a fixed vertex budget (the optimize_mesh_for_lscm path, default
+pool fraction). Time per million input triangles shows how the collapse
+rounds scale.
+
+Usage:
+    python tests/performance/bench_decimation.py [options]
+
+    --grids N [N ...]     Grid resolutions, N x N vertices (default: 250, 500, 708, 1000)
+    --target N            Vertex budget for the fixed-target runs (default: 10000)
+    --repeat N            Timing repetitions per measurement (best is reported)
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+# Add repository root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.algorithms.mesh_utils import generate_simple_mesh, qem_decimate_mesh
+
+logger = logging.getLogger(__name__)
+
+# 250 x 250 to 1000 x 1000 vertices: about 124k to 2M triangles
+DEFAULT_GRIDS = [250, 500, 708, 1000]
+DEFAULT_TARGET = 10000
+
+
+def time_call(func: Callable[[], Any], repeat: int) -> float:
+    """Return the best wall time of func over repeat runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def wavy_grid(resolution: int):
+    """Grid mesh over the unit square with a smooth height field."""
+    vertices, triangles = generate_simple_mesh(resolution, resolution)
+    vertices = vertices.astype(np.float64)
+    vertices[:, 2] = 0.05 * np.sin(7.0 * vertices[:, 0]) * np.cos(5.0 * vertices[:, 1])
+    return vertices, triangles
+
+
+def benchmark_decimation(grids: List[int], target: int, repeat: int) -> List[Dict[str, Any]]:
+    """Benchmark halving and fixed-target decimation per grid size."""
+    results = []
+
+    for resolution in grids:
+        vertices, triangles = wavy_grid(resolution)
+        half = len(vertices) // 2
+
+        entry = {
+            'n_vertices': len(vertices),
+            'n_triangles': len(triangles),
+            'halve_seconds': time_call(
+                lambda: qem_decimate_mesh(vertices, triangles, half, pool_fraction=0.5), repeat
+            ),
+            'target_vertices': target,
+            'target_seconds': time_call(lambda: qem_decimate_mesh(vertices, triangles, target), repeat),
+        }
+        per_million = 1e6 / len(triangles)
+
+        results.append(entry)
+        print(
+            f"decimation {entry['n_triangles']:>9} tris  "
+            f"halve {entry['halve_seconds']:8.3f}s ({entry['halve_seconds'] * per_million:6.2f}s/M)  "
+            f"to {target} {entry['target_seconds']:8.3f}s ({entry['target_seconds'] * per_million:6.2f}s/M)"
+        )
+
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--grids', type=int, nargs='+', default=DEFAULT_GRIDS)
+    parser.add_argument('--target', type=int, default=DEFAULT_TARGET)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    report = {
+        'decimation': benchmark_decimation(args.grids, args.target, args.repeat),
+    }
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
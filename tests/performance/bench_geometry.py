@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Computational geometry benchmarks.
+
+Classifies uniformly sampled points against a wavy closed outline with the
+chunked broadcast test and with the polygon edge grid, and clips pairs of
+overlapping outlines (edge crossings plus intersection, union and
+difference).
+
+Usage:
+    python tests/performance/bench_geometry.py [options]
+
+    --points N [N ...]     Point counts to classify (default: 100k, 1M, 5M)
+    --vertices N           Outline vertex count
+    --max-broadcast N      Skip the broadcast test above N points
+    --clip-sizes N [N ...] Outline vertex counts for the clipping benchmark
+    --repeat N             Timing repetitions per measurement (best is reported)
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+# Add repository root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.mcp_interface.computational_geometry_generator import (
+    PolygonEdgeGrid,
+    points_in_polygon,
+    polygon_boolean,
+    segment_intersections,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POINTS = [100_000, 1_000_000, 5_000_000]
+DEFAULT_CLIP_SIZES = [1_000, 5_000, 20_000]
+
+
+def generate_outline(n_vertices: int, lobes: int = 40, seed: int = 0,
+                     centre: Tuple[float, float] = (0.0, 0.0)) -> np.ndarray:
+    """Generate a non-convex closed outline with wavy radius."""
+    rng = np.random.default_rng(seed)
+    angles = np.linspace(0.0, 2 * np.pi, n_vertices, endpoint=False)
+    radii = 1.0 + 0.3 * np.sin(lobes * angles) + 0.02 * rng.random(n_vertices)
+    return np.column_stack([centre[0] + radii * np.cos(angles), centre[1] + radii * np.sin(angles)])
+
+
+def time_call(func: Callable[[], Any], repeat: int) -> float:
+    """Return the best wall time of func over repeat runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_point_in_polygon(point_counts: List[int], n_vertices: int, max_broadcast: int,
+                               repeat: int) -> List[Dict[str, Any]]:
+    """Benchmark broadcast vs grid point-in-polygon classification."""
+    outline = generate_outline(n_vertices)
+    rng = np.random.default_rng(1)
+    results = []
+
+    for count in point_counts:
+        points = rng.uniform(-1.4, 1.4, (count, 2))
+        grid = PolygonEdgeGrid(outline)
+
+        entry = {
+            'n_points': count,
+            'n_vertices': n_vertices,
+            'grid_build_seconds': time_call(lambda: PolygonEdgeGrid(outline), repeat),
+            'grid_query_seconds': time_call(lambda: grid.contains(points), repeat),
+            'boundary_cell_fraction': float(np.mean(grid.cell_state == -1)),
+            'broadcast_seconds': None,
+        }
+
+        if count <= max_broadcast:
+            entry['broadcast_seconds'] = time_call(lambda: points_in_polygon(points, outline), 1)
+
+        results.append(entry)
+        print(
+            f"point-in-polygon {count:>9} points {n_vertices:>6} vertices  "
+            f"grid build {entry['grid_build_seconds']:7.3f}s query {entry['grid_query_seconds']:8.3f}s  "
+            + (
+                f"broadcast {entry['broadcast_seconds']:8.3f}s"
+                if entry['broadcast_seconds'] is not None
+                else "broadcast   skipped"
+            )
+        )
+
+    return results
+
+
+def benchmark_clipping(sizes: List[int], repeat: int) -> List[Dict[str, Any]]:
+    """Benchmark pruned edge crossings and polygon boolean operations."""
+    results = []
+
+    for size in sizes:
+        subject = generate_outline(size, seed=0)
+        clip = generate_outline(size, lobes=23, seed=1, centre=(0.35, 0.1))
+        edges = (subject, np.roll(subject, -1, axis=0), clip, np.roll(clip, -1, axis=0))
+        crossings = segment_intersections(*edges)
+
+        entry = {
+            'n_vertices': size,
+            'crossings': len(crossings['points']),
+            'candidate_pairs': crossings['candidate_pairs'],
+            'all_pairs': size * size,
+            'crossing_seconds': time_call(lambda: segment_intersections(*edges), repeat),
+            'boolean_seconds': time_call(lambda: polygon_boolean(subject, clip), repeat),
+        }
+
+        results.append(entry)
+        print(
+            f"clipping {size:>7} x {size:<7} vertices  {entry['crossings']:>6} crossings "
+            f"from {entry['candidate_pairs']:>8} candidate pairs  "
+            f"crossings {entry['crossing_seconds']:7.3f}s  boolean ops {entry['boolean_seconds']:7.3f}s"
+        )
+
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--points', type=int, nargs='+', default=DEFAULT_POINTS)
+    parser.add_argument('--vertices', type=int, default=5_000)
+    parser.add_argument('--max-broadcast', type=int, default=100_000)
+    parser.add_argument('--clip-sizes', type=int, nargs='+', default=DEFAULT_CLIP_SIZES)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    report = {
+        'point_in_polygon': benchmark_point_in_polygon(args.points, args.vertices, args.max_broadcast,
+                                                       args.repeat),
+        'clipping': benchmark_clipping(args.clip_sizes, args.repeat),
+    }
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
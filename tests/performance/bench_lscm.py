@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+LSCM solver micro-benchmarks.
+
+Compares the vectorized conformal system assembly against the per-triangle
+reference implementation, the multilevel solver against the direct solve, and
+the direct solve with and without manufacturing constraints, on synthetic wavy
+grid meshes.
+
+Usage:
+    python tests/performance/bench_lscm.py [options]
+
+    --sizes N [N ...]     Triangle counts to benchmark (default: 10k, 100k, 1M)
+    --max-reference N     Skip the reference loop above N triangles
+    --repeat N            Timing repetitions per measurement (best is reported)
+    --max-direct N        Skip the direct solve above N triangles
+    --levels N            Levels for the multilevel solve
+    --constraint-size N   Triangle count for the manufacturing constraint benchmark
+"""
+
+import argparse
+import json
+import logging
+import math
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+# Add repository root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.algorithms.lscm import LSCMSolver
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+
+def generate_grid_mesh(n_triangles: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Generate a wavy square grid mesh with roughly n_triangles triangles."""
+    cells = max(1, int(math.sqrt(n_triangles / 2)))
+    n = cells + 1
+
+    x, y = np.meshgrid(np.linspace(0.0, 1.0, n), np.linspace(0.0, 1.0, n))
+    z = 0.1 * np.sin(2 * np.pi * x) * np.sin(2 * np.pi * y)
+    vertices = np.column_stack([x.ravel(), y.ravel(), z.ravel()])
+
+    i, j = np.meshgrid(np.arange(cells), np.arange(cells), indexing='ij')
+    bottom_left = (i * n + j).ravel()
+    bottom_right = bottom_left + 1
+    top_left = bottom_left + n
+    top_right = top_left + 1
+    triangles = np.vstack([
+        np.column_stack([bottom_left, bottom_right, top_left]),
+        np.column_stack([bottom_right, top_right, top_left]),
+    ])
+
+    return vertices, triangles
+
+
+def time_call(func: Callable[[], Any], repeat: int) -> float:
+    """Return the best wall time of func over repeat runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_assembly(sizes: List[int], max_reference: int, repeat: int) -> List[Dict[str, Any]]:
+    """Benchmark vectorized vs reference conformal system assembly."""
+    results = []
+
+    for size in sizes:
+        vertices, triangles = generate_grid_mesh(size)
+        solver = LSCMSolver(vertices, triangles)
+
+        entry = {
+            'n_triangles': solver.n_triangles,
+            'n_vertices': solver.n_vertices,
+            'vectorized_seconds': time_call(lambda: solver.build_conformal_system(), repeat),
+            'reference_seconds': None,
+            'speedup': None,
+        }
+
+        if solver.n_triangles <= max_reference:
+            entry['reference_seconds'] = time_call(
+                lambda: solver.build_conformal_system(vectorized=False), 1
+            )
+            entry['speedup'] = entry['reference_seconds'] / entry['vectorized_seconds']
+
+        results.append(entry)
+        print(
+            f"assembly  {entry['n_triangles']:>9} tris  "
+            f"vectorized {entry['vectorized_seconds']:8.3f}s  "
+            + (
+                f"reference {entry['reference_seconds']:8.3f}s  speedup {entry['speedup']:6.1f}x"
+                if entry['reference_seconds'] is not None
+                else "reference   skipped"
+            )
+        )
+
+    return results
+
+
+def benchmark_multilevel(sizes: List[int], max_direct: int, levels: int) -> List[Dict[str, Any]]:
+    """Benchmark the multilevel solver against the direct solve with two corner pins."""
+    results = []
+
+    for size in sizes:
+        vertices, triangles = generate_grid_mesh(size)
+        n = int(round(math.sqrt(len(vertices))))
+        pins = [(0, 0.0, 0.0), (n - 1, 1.0, 0.0)]
+        solver = LSCMSolver(vertices, triangles)
+
+        start = time.perf_counter()
+        _, info = solver.solve_multilevel(pins, levels=levels)
+        entry = {
+            'n_triangles': solver.n_triangles,
+            'multilevel_seconds': time.perf_counter() - start,
+            'iterations': info['solver']['iterations'],
+            'levels': info['multilevel']['levels'],
+            'direct_seconds': None,
+        }
+
+        if solver.n_triangles <= max_direct:
+            entry['direct_seconds'] = time_call(
+                lambda: solver.solve_lscm(pins, use_cache=False, estimate_condition=False), 1
+            )
+
+        results.append(entry)
+        print(
+            f"multilevel {entry['n_triangles']:>8} tris  "
+            f"{entry['multilevel_seconds']:8.3f}s ({entry['iterations']} CG iterations)  "
+            + (
+                f"direct {entry['direct_seconds']:8.3f}s"
+                if entry['direct_seconds'] is not None
+                else "direct   skipped"
+            )
+        )
+
+    return results
+
+
+def benchmark_constraints(size: int, repeat: int) -> Dict[str, Any]:
+    """Benchmark the direct solve with and without manufacturing constraint rows."""
+    vertices, triangles = generate_grid_mesh(size)
+    n = int(round(math.sqrt(len(vertices))))
+    pins = [(0, 0.0, 0.0), (n - 1, 1.0, 0.0)]
+    # Thickness of one grid spacing pulls in a few rings of neighbours per vertex
+    constraints = {'material_thickness': 1.0 / (n - 1), 'cutting_tolerance': 0.001}
+    solver = LSCMSolver(vertices, triangles)
+    A = solver.build_conformal_system()
+
+    def solve(manufacturing_constraints):
+        return solver.solve_lscm(pins, manufacturing_constraints, use_cache=False, estimate_condition=False)
+
+    A_constrained, _ = solver._apply_manufacturing_constraints(A, np.zeros(A.shape[0]), constraints)
+    entry = {
+        'n_triangles': solver.n_triangles,
+        'constraint_rows': A_constrained.shape[0] - A.shape[0],
+        'constraint_assembly_seconds': time_call(
+            lambda: solver._apply_manufacturing_constraints(A, np.zeros(A.shape[0]), constraints), repeat
+        ),
+        'unconstrained_seconds': time_call(lambda: solve(None), 1),
+        'constrained_seconds': time_call(lambda: solve(constraints), 1),
+    }
+
+    print(
+        f"constraints {entry['n_triangles']:>7} tris  "
+        f"{entry['constraint_rows']} rows assembled in {entry['constraint_assembly_seconds']:8.3f}s  "
+        f"solve {entry['unconstrained_seconds']:8.3f}s -> {entry['constrained_seconds']:8.3f}s"
+    )
+
+    return entry
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--max-reference', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--max-direct', type=int, default=400_000)
+    parser.add_argument('--levels', type=int, default=3)
+    parser.add_argument('--constraint-size', type=int, default=100_000)
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    report = {
+        'assembly': benchmark_assembly(args.sizes, args.max_reference, args.repeat),
+        'multilevel': benchmark_multilevel(args.sizes, args.max_direct, args.levels),
+        'constraints': benchmark_constraints(args.constraint_size, args.repeat),
+    }
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
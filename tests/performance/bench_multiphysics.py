@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Multi-physics structural analysis benchmarks.
+
+Meshes a unit cube with Delaunay tetrahedra at decreasing target element
+sizes and reports element count against the time spent meshing, assembling
+the stiffness matrix and running the complete structural analysis (mesh,
+assembly, solve, stress and strain recovery).
+
+Usage:
+    python tests/performance/bench_multiphysics.py [options]
+
+    --sizes H [H ...]     Target element sizes to benchmark (default: 0.2, 0.1, 0.07, 0.05)
+    --solver NAME         Linear solver ('direct' or 'cg')
+    --repeat N            Timing repetitions per measurement (best is reported)
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+# Add repository root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.mcp_interface.multi_physics_generator import MultiPhysicsGenerator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [0.2, 0.1, 0.07, 0.05]
+
+# Unit cube corners; the bottom face (z = 0) is clamped
+CUBE = np.array([[x, y, z] for x in (0.0, 1.0) for y in (0.0, 1.0) for z in (0.0, 1.0)])
+FIXED_NODES = [0, 2, 4, 6]
+
+
+def time_call(func: Callable[[], Any], repeat: int) -> float:
+    """Return the best wall time of func over repeat runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_structural(sizes: List[float], solver: str, repeat: int) -> List[Dict[str, Any]]:
+    """Benchmark meshing, assembly and the end-to-end structural analysis."""
+    generator = MultiPhysicsGenerator()
+    material = {'young_modulus': 200e9, 'poisson_ratio': 0.3}
+    boundary_conditions = {'fixed_nodes': FIXED_NODES, 'applied_force': 1000.0, 'solver': solver}
+    results = []
+
+    for size in sizes:
+        mesh_options = {'target_element_size': size}
+        mesh = generator.generate_tetrahedral_mesh(CUBE, **mesh_options)
+
+        entry = {
+            'target_element_size': size,
+            'n_elements': mesh.n_elements,
+            'n_nodes': len(mesh.nodes),
+            'min_quality': float(mesh.quality.min()),
+            'mesh_seconds': time_call(lambda: generator.generate_tetrahedral_mesh(CUBE, **mesh_options),
+                                      repeat),
+            'assembly_seconds': time_call(
+                lambda: generator._assemble_stiffness_matrix(mesh.nodes, mesh.elements, 200e9, 0.3), repeat
+            ),
+            'analysis_seconds': time_call(
+                lambda: generator._structural_analysis(CUBE, material, boundary_conditions, mesh_options),
+                repeat
+            ),
+        }
+
+        results.append(entry)
+        print(
+            f"structural h={size:<5} {entry['n_elements']:>8} tets {entry['n_nodes']:>7} nodes  "
+            f"mesh {entry['mesh_seconds']:8.3f}s  assembly {entry['assembly_seconds']:8.3f}s  "
+            f"end-to-end {entry['analysis_seconds']:8.3f}s"
+        )
+
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=float, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--solver', type=str, default='direct', choices=['direct', 'cg'])
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--json', type=str, default=None, help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    report = {
+        'structural': benchmark_structural(args.sizes, args.solver, args.repeat),
+    }
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Unit tests for chart segmentation and multi-chart unfolding.
+"""
+
+import numpy as np
+import pytest
+
+from src.algorithms.charts import (
+    build_face_adjacency, pack_charts, segment_mesh_into_charts, unfold_surface_charts
+)
+from src.algorithms.lscm import LSCMSolver
+from src.algorithms.mesh_utils import generate_simple_mesh
+
+
+@pytest.fixture(autouse=True)
+def clear_lscm_cache():
+    """Isolate tests from the shared LSCM factorization cache."""
+    LSCMSolver.clear_cache()
+    yield
+    LSCMSolver.clear_cache()
+
+
+@pytest.fixture
+def folded_mesh():
+    """Two flat 6x6 grids meeting at a right-angle crease along x = 1."""
+    n = 7
+    vertices, triangles = generate_simple_mesh(n, n)
+    vertices[:, 2] = 0.0
+
+    # Second grid stands on the x = 1 edge of the first and rises along +Z
+    wall = vertices.copy()
+    wall[:, 2] = vertices[:, 0]
+    wall[:, 0] = 1.0
+    mapping = np.arange(len(wall)) + len(vertices)
+    mapping[np.arange(n) * n] = np.arange(n) * n + (n - 1)
+
+    all_vertices = np.vstack([vertices, wall])
+    all_triangles = np.vstack([triangles, mapping[triangles]])
+    return all_vertices, all_triangles
+
+
+class TestSegmentation:
+    """Test cases for segment_mesh_into_charts."""
+
+    def test_flat_mesh_is_one_chart(self):
+        """A developable mesh within the deviation limit stays in one chart."""
+        vertices, triangles = generate_simple_mesh(8, 8)
+        labels = segment_mesh_into_charts(vertices, triangles, max_normal_deviation=45.0)
+
+        assert labels.shape == (len(triangles),)
+        assert labels.max() == 0
+
+    def test_crease_splits_charts(self, folded_mesh):
+        """Faces on either side of a 90 degree crease end up in different charts."""
+        vertices, triangles = folded_mesh
+        labels = segment_mesh_into_charts(vertices, triangles, max_normal_deviation=30.0,
+                                          min_chart_faces=4)
+        half = len(triangles) // 2
+
+        assert labels.max() == 1
+        assert len(set(labels[:half])) == 1
+        assert len(set(labels[half:])) == 1
+        assert labels[0] != labels[-1]
+
+    def test_small_charts_are_merged(self, folded_mesh):
+        """Charts below min_chart_faces join a neighbouring chart."""
+        vertices, triangles = folded_mesh
+        labels = segment_mesh_into_charts(vertices, triangles, max_normal_deviation=30.0,
+                                          min_chart_faces=len(triangles))
+
+        assert labels.max() == 0
+
+    def test_noisy_mesh_has_no_small_charts(self):
+        """Many tiny charts from a noisy surface are all merged up to the minimum size."""
+        vertices, triangles = generate_simple_mesh(30, 30)
+        vertices[:, 2] = np.random.default_rng(0).normal(0.0, 0.02, len(vertices))
+        labels = segment_mesh_into_charts(vertices, triangles, max_normal_deviation=5.0,
+                                          min_chart_faces=16)
+
+        sizes = np.bincount(labels)
+        assert np.all(sizes >= 16)
+        assert len(sizes) == labels.max() + 1
+
+    def test_face_adjacency_is_symmetric(self):
+        """Interior faces of a grid have three neighbours."""
+        _, triangles = generate_simple_mesh(5, 5)
+        adjacency = build_face_adjacency(triangles)
+
+        assert (adjacency != adjacency.T).nnz == 0
+        assert np.diff(adjacency.indptr).max() == 3
+
+
+class TestUnfoldCharts:
+    """Test cases for unfold_surface_charts."""
+
+    def test_folded_mesh_unfolds_without_distortion(self, folded_mesh):
+        """Each flat chart is unfolded isometrically and seams are duplicated."""
+        vertices, triangles = folded_mesh
+        result = unfold_surface_charts(vertices, triangles, min_chart_faces=4, max_workers=1)
+
+        assert result['success'] is True
+        assert result['n_charts'] == 2
+        uv = np.asarray(result['uv_coordinates'])
+        vertex_map = np.asarray(result['vertex_map'])
+        assert uv.shape == (len(vertex_map), 2)
+        assert len(vertex_map) == len(np.unique(triangles)) + 7
+        assert result['distortion_metrics']['mean_edge_length_distortion'] < 1e-3
+
+    def test_process_pool_matches_inline(self, folded_mesh):
+        """Parallel unfolding gives the same layout as running inline."""
+        vertices, triangles = folded_mesh
+        inline = unfold_surface_charts(vertices, triangles, min_chart_faces=4, max_workers=1)
+        pooled = unfold_surface_charts(vertices, triangles, min_chart_faces=4, max_workers=2)
+
+        assert pooled['success'] is True
+        np.testing.assert_allclose(pooled['uv_coordinates'], inline['uv_coordinates'], atol=1e-9)
+        assert pooled['triangle_indices'] == inline['triangle_indices']
+
+    def test_packed_charts_do_not_overlap(self):
+        """Packed island bounding boxes are disjoint."""
+        islands = [np.random.default_rng(i).random((10, 2)) * (i + 1) for i in range(5)]
+        packed = pack_charts(islands, margin=0.1)
+
+        boxes = [(uv.min(axis=0), uv.max(axis=0)) for uv in packed]
+        for i in range(len(boxes)):
+            for j in range(i + 1, len(boxes)):
+                (a_min, a_max), (b_min, b_max) = boxes[i], boxes[j]
+                assert np.any(a_max < b_min) or np.any(b_max < a_min)
+
+    def test_invalid_mesh_reports_failure(self):
+        """Errors are reported in the result instead of raised."""
+        result = unfold_surface_charts(np.zeros((3, 3)), np.array([[0, 1, 5]]), max_workers=1)
+
+        assert result['success'] is False
+        assert 'error' in result
@@ -0,0 +1,224 @@
+"""
+Unit tests for the computational geometry generator's polygon kernels.
+"""
+
+import numpy as np
+import pytest
+
+from src.mcp_interface.computational_geometry_generator import (
+    ComputationalGeometryGenerator,
+    PolygonEdgeGrid,
+    points_in_polygon,
+    polygon_area,
+    polygon_boolean,
+    segment_intersections,
+)
+
+
+def reference_point_in_polygon(point, polygon):
+    """Scalar ray casting test the vectorized kernels must reproduce."""
+    x, y = point[:2]
+    inside = False
+    p1x, p1y = polygon[0]
+    for i in range(len(polygon) + 1):
+        p2x, p2y = polygon[i % len(polygon)]
+        if min(p1y, p2y) < y <= max(p1y, p2y) and x <= max(p1x, p2x):
+            if p1x == p2x or x <= (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x:
+                inside = not inside
+        p1x, p1y = p2x, p2y
+    return inside
+
+
+def square(x0, y0, x1, y1):
+    """Counter-clockwise axis-aligned rectangle."""
+    return np.array([[x0, y0], [x1, y0], [x1, y1], [x0, y1]], dtype=float)
+
+
+def wavy_outline(n_vertices, centre, radius, seed):
+    """Star-shaped non-convex outline."""
+    rng = np.random.default_rng(seed)
+    angles = np.sort(rng.random(n_vertices)) * 2 * np.pi
+    radii = radius * (1 + 0.4 * np.sin(7 * angles) + 0.1 * rng.random(n_vertices))
+    return np.column_stack([centre[0] + radii * np.cos(angles), centre[1] + radii * np.sin(angles)])
+
+
+def total_area(rings):
+    """Signed area of a list of rings."""
+    return sum(polygon_area(ring) for ring in rings)
+
+
+@pytest.fixture
+def generator():
+    """Fresh generator instance."""
+    return ComputationalGeometryGenerator()
+
+
+@pytest.fixture
+def star_polygon():
+    """Non-convex star-shaped polygon with 60 vertices."""
+    angles = np.linspace(0, 2 * np.pi, 60, endpoint=False)
+    radii = np.where(np.arange(60) % 2 == 0, 1.0, 0.45)
+    return np.column_stack([radii * np.cos(angles), radii * np.sin(angles)])
+
+
+@pytest.fixture
+def query_points(star_polygon):
+    """Random points plus vertices, edge midpoints and grid-aligned points."""
+    rng = np.random.default_rng(0)
+    midpoints = 0.5 * (star_polygon + np.roll(star_polygon, -1, axis=0))
+    return np.vstack([rng.uniform(-1.2, 1.2, (2000, 2)), star_polygon, midpoints,
+                      np.round(rng.uniform(-1.2, 1.2, (300, 2)), 1)])
+
+
+class TestPointInPolygon:
+    """Test cases for the batched and grid-accelerated point-in-polygon tests."""
+
+    def test_broadcast_matches_scalar_test(self, star_polygon, query_points):
+        """Chunked broadcasting gives the scalar ray casting answers."""
+        expected = [reference_point_in_polygon(p, star_polygon) for p in query_points]
+
+        np.testing.assert_array_equal(points_in_polygon(query_points, star_polygon, chunk_elements=500),
+                                      expected)
+
+    @pytest.mark.parametrize('cells_per_axis, n_bands', [(None, None), (7, 3), (200, 500)])
+    def test_grid_matches_broadcast(self, star_polygon, query_points, cells_per_axis, n_bands):
+        """The edge grid agrees with brute force at any resolution."""
+        grid = PolygonEdgeGrid(star_polygon, cells_per_axis, n_bands)
+
+        np.testing.assert_array_equal(grid.contains(query_points, chunk_elements=100),
+                                      points_in_polygon(query_points, star_polygon))
+        assert np.any(grid.cell_state == 1) and np.any(grid.cell_state == -1)
+
+    def test_square_boundary_convention(self):
+        """Bottom and left edges are outside, top and right edges inside."""
+        square = np.array([[0.0, 0.0], [2.0, 0.0], [2.0, 2.0], [0.0, 2.0]])
+        points = np.array([[1.0, 1.0], [3.0, 1.0], [1.0, 0.0], [0.0, 1.0], [2.0, 1.0], [1.0, 2.0]])
+        expected = [True, False, False, False, True, True]
+
+        np.testing.assert_array_equal(points_in_polygon(points, square), expected)
+        np.testing.assert_array_equal(PolygonEdgeGrid(square).contains(points), expected)
+
+    @pytest.mark.parametrize('method', ['broadcast', 'grid'])
+    def test_execute_algorithm_routes_method(self, generator, star_polygon, query_points, method):
+        """The operation reports the method used and the inside count."""
+        spec = generator.generate_algorithm("point in polygon")
+
+        result = generator.execute_algorithm(spec, {
+            'points': query_points,
+            'operation_type': 'point_in_polygon',
+            'additional_geometry': star_polygon,
+            'point_in_polygon_method': method
+        })
+
+        assert result['metadata']['method'] == method
+        assert result['metadata']['points_inside'] == int(np.count_nonzero(result['result']))
+
+    def test_unknown_method_rejected(self, generator, star_polygon):
+        """Unsupported methods raise ValueError."""
+        with pytest.raises(ValueError):
+            generator._point_in_polygon(np.zeros((1, 2)), star_polygon, method='quadtree')
+
+
+class TestPolygonIntersection:
+    """Test cases for pruned segment intersection and polygon clipping."""
+
+    def test_crossings_match_all_pairs_test(self):
+        """The grid-pruned test finds exactly the all-pairs proper crossings."""
+        a = wavy_outline(300, (0.0, 0.0), 1.0, seed=1)
+        b = wavy_outline(200, (0.3, 0.2), 0.9, seed=2)
+        a_end, b_end = np.roll(a, -1, axis=0), np.roll(b, -1, axis=0)
+
+        crossings = segment_intersections(a, a_end, b, b_end)
+
+        def orient(o, p, q):
+            return (p[..., 0] - o[..., 0]) * (q[..., 1] - o[..., 1]) - (p[..., 1] - o[..., 1]) * (q[..., 0] - o[..., 0])
+        ai, bj = np.meshgrid(np.arange(len(a)), np.arange(len(b)), indexing='ij')
+        proper = ((orient(a[ai], a_end[ai], b[bj]) * orient(a[ai], a_end[ai], b_end[bj]) < 0)
+                  & (orient(b[bj], b_end[bj], a[ai]) * orient(b[bj], b_end[bj], a_end[ai]) < 0))
+        expected_i, expected_j = np.nonzero(proper)
+
+        np.testing.assert_array_equal(crossings['index_a'], expected_i)
+        np.testing.assert_array_equal(crossings['index_b'], expected_j)
+        assert crossings['candidate_pairs'] < proper.size / 20
+        np.testing.assert_allclose(crossings['points'],
+                                   b[expected_j] + crossings['u'][:, None] * (b_end - b)[expected_j], atol=1e-12)
+
+    @pytest.mark.parametrize('subject, clip, expected', [
+        (square(0, 0, 2, 2), square(1, 1, 3, 3), (1.0, 7.0, 3.0)),
+        (square(0, 0, 2, 2), square(1, 0, 3, 2), (2.0, 6.0, 2.0)),
+        (square(0, 0, 1, 1), square(1, 0, 2, 1), (0.0, 2.0, 1.0)),
+        (square(0, 0, 2, 2), square(0, 0, 2, 2), (4.0, 4.0, 0.0)),
+        (square(0, 0, 2, 2), square(2, 1, 3, 3), (0.0, 6.0, 4.0)),
+        (square(0, 0, 4, 4)[::-1], square(1, 1, 2, 2), (1.0, 16.0, 15.0)),
+        (square(0, 0, 1, 1), square(2, 2, 3, 3), (0.0, 2.0, 1.0)),
+    ], ids=['overlap', 'collinear-overlap', 'shared-edge', 'identical', 't-junction', 'hole', 'disjoint'])
+    def test_boolean_areas(self, subject, clip, expected):
+        """Intersection, union and difference areas, including degenerate contacts."""
+        result = polygon_boolean(subject, clip)
+
+        areas = [total_area(result[op]) for op in ('intersection', 'union', 'difference')]
+        np.testing.assert_allclose(areas, expected, atol=1e-12)
+
+    def test_difference_with_hole(self):
+        """A nested part leaves a remnant with a clockwise hole."""
+        remnant = polygon_boolean(square(0, 0, 4, 4), square(1, 1, 2, 2), ('difference',))['difference']
+
+        assert sorted(polygon_area(ring) for ring in remnant) == [-1.0, 16.0]
+
+    @pytest.mark.parametrize('part', [
+        [[3.0, 5.0], [5.0, 3.0], [6.0, 6.0]],
+        [[1.0, 1.0], [3.0, 1.5], [4.0, 3.0]],
+        [[0.0, 2.0], [1.3, 1.0], [3.0, 3.3]],
+    ], ids=['corner-on-edge', 'nested-vertex-on-edge', 'nested-vertex-on-edge-2'])
+    def test_touching_outlines_at_non_integer_coordinates(self, part):
+        """A vertex lying on the other outline's edge does not break the area identities."""
+        sheet = square(0, 0, 4, 4) * 0.7 + 1.1
+        part = np.array(part) * 0.7 + 1.1
+
+        result = polygon_boolean(sheet, part)
+
+        intersection = total_area(result['intersection'])
+        overlap = polygon_area(part) if intersection > 0 else 0.0
+        assert intersection == pytest.approx(overlap, abs=1e-12)
+        assert total_area(result['union']) == pytest.approx(polygon_area(sheet) + polygon_area(part) - overlap,
+                                                            abs=1e-12)
+        assert total_area(result['difference']) == pytest.approx(polygon_area(sheet) - overlap, abs=1e-12)
+
+    def test_area_identities_on_wavy_outlines(self):
+        """Fragments partition both outlines: areas add up exactly."""
+        a = wavy_outline(400, (0.0, 0.0), 1.0, seed=3)
+        b = wavy_outline(500, (0.4, -0.2), 0.9, seed=4)
+
+        result = polygon_boolean(a, b)
+
+        intersection, union = total_area(result['intersection']), total_area(result['union'])
+        assert intersection + union == pytest.approx(polygon_area(a) + polygon_area(b), abs=1e-12)
+        assert total_area(result['difference']) == pytest.approx(polygon_area(a) - intersection, abs=1e-12)
+        # Monte Carlo estimate of the overlap
+        samples = np.random.default_rng(5).uniform(-2.0, 2.0, (50_000, 2))
+        overlap = np.mean(points_in_polygon(samples, a) & points_in_polygon(samples, b)) * 16.0
+        assert intersection == pytest.approx(overlap, rel=0.04)
+
+    def test_generator_reports_crossings_and_polygons(self, generator):
+        """The operation keeps the crossing points and adds clipped rings."""
+        result = generator._polygon_intersection(square(0, 0, 2, 2), square(1, 1, 3, 3))
+
+        np.testing.assert_allclose(sorted(map(tuple, result['result'])), [(1.0, 2.0), (2.0, 1.0)])
+        assert result['metadata']['intersection_points'] == 2
+        assert result['metadata']['union_area'] == pytest.approx(7.0)
+        assert len(result['polygons']['intersection']) == 1
+
+    @pytest.mark.parametrize('polygon', [
+        np.array([[0.0, 0.0], [4.0, 0.0], [0.0, 0.0]]),
+        np.array([[0.0, 0.0], [2.0, 2.0], [2.0, 0.0], [0.0, 2.0]]),
+        np.array([[0.0, 0.0], [2.0, 0.0], [1.0, 1.0], [2.0, 2.0], [0.0, 2.0], [1.0, 1.0]]),
+        np.array([[0.0, 0.0], [4.0, 0.0], [4.0, 4.0], [2.0, 0.0], [0.0, 4.0]]),
+        np.array([[0.0, 0.0], [2.0, 0.0], [2.0, 2.0], [1.0, 2.0], [1.0, 0.5], [1.0, 2.0], [0.0, 2.0]]),
+    ], ids=['degenerate', 'self-intersecting', 'pinched', 'vertex-on-edge', 'retraced-edge'])
+    def test_generator_skips_boolean_for_non_simple_input(self, generator, polygon):
+        """Only the crossing points are reported when a polygon is not simple."""
+        result = generator._polygon_intersection(polygon, square(1, -1, 3, 1))
+
+        assert result['polygons'] is None
+        assert result['metadata']['simple_polygons'] is False
+        assert result['metadata']['intersection_points'] == len(result['result']) > 0
@@ -260,8 +260,8 @@ class TestServerStatus:
         assert result['mcp_server'] == "running"
         assert result['autocad_connected'] is True
         assert result['active_document'] == "Test Drawing.dwg"
-        assert result['tools_available'] == 8
-        assert result['tools_advanced'] == 1
+        assert result['tools_available'] == 9
+        assert result['tools_advanced'] == 2
         assert 'LSCM Surface Unfolding' in result['advanced_algorithms']
         assert result['transport'] == "stdio"
     
@@ -0,0 +1,161 @@
+"""
+Unit tests for geodesic path calculation and fold line generation.
+"""
+
+import numpy as np
+import pytest
+
+from src.algorithms.geodesic import (
+    HeatMethodGeodesics, build_cotangent_laplacian, build_edge_graph, calculate_geodesic_distance_dijkstra,
+    calculate_geodesic_distance_heat, calculate_geodesic_distances_multi_source, calculate_geodesic_paths,
+    find_key_vertices_for_folding, reconstruct_path
+)
+from src.algorithms.mesh_utils import analyze_mesh_curvature, generate_simple_mesh
+
+
+@pytest.fixture
+def mesh():
+    """Small wavy grid mesh."""
+    return generate_simple_mesh(10, 10)
+
+
+@pytest.fixture
+def flat_mesh():
+    """Flat 30x30 grid where geodesic distance is Euclidean distance."""
+    vertices, triangles = generate_simple_mesh(30, 30)
+    vertices[:, 2] = 0.0
+    return vertices, triangles
+
+
+@pytest.fixture(autouse=True)
+def clear_heat_cache():
+    """Isolate tests from the shared heat method solver cache."""
+    HeatMethodGeodesics.clear_cache()
+    yield
+    HeatMethodGeodesics.clear_cache()
+
+
+class TestEdgeGraph:
+    """Test cases for the CSR edge graph and batched Dijkstra."""
+
+    def test_graph_has_each_edge_once_per_direction(self, mesh):
+        """Shared edges are not double counted."""
+        vertices, triangles = mesh
+        graph = build_edge_graph(vertices, triangles)
+
+        edges = {tuple(sorted((tri[k], tri[(k + 1) % 3]))) for tri in triangles for k in range(3)}
+        assert graph.nnz == 2 * len(edges)
+        i, j = next(iter(edges))
+        assert graph[i, j] == pytest.approx(np.linalg.norm(vertices[i] - vertices[j]))
+        assert abs(graph - graph.T).max() == 0
+
+    def test_batched_rows_match_single_source(self, mesh):
+        """Each row of the batched call equals a single-source run."""
+        vertices, triangles = mesh
+        sources = [0, 37, 99]
+
+        distances, predecessors = calculate_geodesic_distances_multi_source(vertices, triangles, sources)
+
+        for row, source in enumerate(sources):
+            single = calculate_geodesic_distance_dijkstra(vertices, triangles, source)
+            np.testing.assert_allclose(distances[row], [single['distances'][v] for v in range(len(vertices))])
+            path = reconstruct_path(predecessors[row], source, 55)
+            assert path[0] == source and path[-1] == 55
+            steps = np.linalg.norm(np.diff(vertices[path], axis=0), axis=1).sum()
+            assert steps == pytest.approx(distances[row, 55])
+
+    def test_unreachable_target_has_no_path(self):
+        """Disconnected components give no path."""
+        vertices = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [5, 0, 0], [6, 0, 0], [5, 1, 0]], dtype=float)
+        triangles = np.array([[0, 1, 2], [3, 4, 5]])
+
+        result = calculate_geodesic_distance_dijkstra(vertices, triangles, 0, 4)
+
+        assert result['path'] is None
+        assert result['distances'][4] == float('inf')
+
+
+class TestGeodesicPaths:
+    """Test cases for calculate_geodesic_paths."""
+
+    def test_all_key_pairs_produce_fold_lines(self, mesh):
+        """Every pair of connected key vertices yields a path and a fold line."""
+        vertices, triangles = mesh
+        keys = [0, 9, 45, 90, 99]
+
+        result = calculate_geodesic_paths(vertices, triangles, keys)
+
+        assert result['n_paths'] == 10
+        assert len(result['fold_lines']) == 10
+        path_info = result['paths_matrix'][(0, 99)]
+        assert path_info['path'][0] == 0 and path_info['path'][-1] == 99
+        assert path_info['vertices'] == vertices[path_info['path']].tolist()
+
+
+class TestHeatMethod:
+    """Test cases for the heat method geodesic backend."""
+
+    def test_laplacian_rows_sum_to_zero(self, mesh):
+        """The cotangent Laplacian annihilates constants and the mass sums to the area."""
+        vertices, triangles = mesh
+        laplacian, mass = build_cotangent_laplacian(vertices, triangles)
+
+        np.testing.assert_allclose(laplacian @ np.ones(len(vertices)), 0.0, atol=1e-10)
+        assert abs(laplacian - laplacian.T).max() < 1e-12
+        cross = np.cross(vertices[triangles[:, 1]] - vertices[triangles[:, 0]],
+                         vertices[triangles[:, 2]] - vertices[triangles[:, 0]])
+        assert mass.sum() == pytest.approx(0.5 * np.linalg.norm(cross, axis=1).sum())
+
+    def test_flat_distances_beat_dijkstra(self, flat_mesh):
+        """On a flat grid the heat method is closer to Euclidean distance than edge paths."""
+        vertices, triangles = flat_mesh
+        source = 15 * 30 + 15
+        exact = np.linalg.norm(vertices - vertices[source], axis=1)
+
+        heat = HeatMethodGeodesics(vertices, triangles).distance(source)
+        dijkstra, _ = calculate_geodesic_distances_multi_source(vertices, triangles, [source])
+
+        heat_error = np.abs(heat - exact).mean() / exact.mean()
+        dijkstra_error = np.abs(dijkstra[0] - exact).mean() / exact.mean()
+        assert heat[source] == 0.0
+        assert heat_error < 0.05
+        assert heat_error < dijkstra_error
+
+    def test_source_sets_are_solved_together(self, flat_mesh):
+        """Batched rows match single queries; a multi-source set gives the nearest distance."""
+        vertices, triangles = flat_mesh
+        solver = HeatMethodGeodesics(vertices, triangles)
+
+        batched = solver.distances([0, 899, [0, 899]])
+
+        np.testing.assert_allclose(batched[0], solver.distance(0), atol=1e-12)
+        np.testing.assert_allclose(batched[1], solver.distance(899), atol=1e-12)
+        assert batched[2, 0] == pytest.approx(0.0, abs=1e-9) and batched[2, 899] == pytest.approx(0.0, abs=1e-9)
+        assert batched[2, 450] < min(batched[0, 450], batched[1, 450]) + 0.05
+
+    def test_operators_are_factored_once_per_mesh(self, mesh):
+        """Repeated heat queries on the same mesh reuse the cached factorization."""
+        vertices, triangles = mesh
+
+        first = calculate_geodesic_distance_heat(vertices, triangles, 0, 99)
+        calculate_geodesic_distance_heat(vertices, triangles, 45)
+
+        assert first['path'][0] == 0 and first['path'][-1] == 99
+        assert HeatMethodGeodesics.cache_info()['misses'] == 1
+        assert HeatMethodGeodesics.cache_info()['hits'] == 1
+
+    def test_fold_lines_and_key_vertices_select_heat(self):
+        """Fold-line generation and key vertex selection accept the heat backend."""
+        vertices, triangles = generate_simple_mesh(20, 20)
+        curvature = analyze_mesh_curvature(vertices, triangles)
+
+        keys = find_key_vertices_for_folding(vertices, triangles, curvature, geodesic_method='heat')
+        result = calculate_geodesic_paths(vertices, triangles, keys[:6], method='heat')
+
+        assert len(keys) == 20 and len(set(keys)) == 20
+        assert result['method'] == 'heat'
+        assert result['n_paths'] == 15
+        for path_info in result['all_paths']:
+            assert path_info['path'][0] == path_info['source']
+            assert path_info['path'][-1] == path_info['target']
+        assert 'error' in calculate_geodesic_paths(vertices, triangles, keys[:2], method='exact')
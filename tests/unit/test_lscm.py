@@ -0,0 +1,490 @@
+"""
+Unit tests for the LSCM surface unfolding solver.
+
+Covers conformal system assembly, the factorization cache, the iterative
+solver backends, the multilevel solver, manufacturing constraint rows, condition
+estimation, distortion metrics and the unfold_surface_lscm and batch entry points on small synthetic meshes.
+"""
+
+import multiprocessing
+import os
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from src.algorithms.lscm import (
+    LSCMSolver, compute_distortion_metrics, unfold_surface_lscm, unfold_surfaces_batch
+)
+from src.algorithms.mesh_utils import cluster_decimate_mesh, generate_simple_mesh
+
+
+@pytest.fixture
+def wavy_mesh():
+    """Small wavy grid mesh used across LSCM tests."""
+    return generate_simple_mesh(12, 12)
+
+
+@pytest.fixture(autouse=True)
+def clear_lscm_cache():
+    """Isolate tests from the shared LSCM factorization cache."""
+    LSCMSolver.clear_cache()
+    yield
+    LSCMSolver.clear_cache()
+
+
+class TestConformalAssembly:
+    """Test cases for LSCMSolver.build_conformal_system."""
+
+    def test_vectorized_matches_reference(self, wavy_mesh):
+        """Vectorized assembly produces the same matrix as the reference loop."""
+        vertices, triangles = wavy_mesh
+        solver = LSCMSolver(vertices, triangles)
+
+        A_fast = solver.build_conformal_system()
+        A_ref = solver.build_conformal_system(vectorized=False)
+
+        assert A_fast.shape == A_ref.shape
+        assert abs(A_fast - A_ref).max() < 1e-12
+
+    def test_degenerate_triangles_are_masked(self, wavy_mesh):
+        """Degenerate triangles contribute empty rows in both implementations."""
+        vertices, triangles = wavy_mesh
+        triangles = np.vstack([triangles, [[0, 0, 1]]])
+        solver = LSCMSolver(vertices, triangles)
+
+        A_fast = solver.build_conformal_system()
+        A_ref = solver.build_conformal_system(vectorized=False)
+
+        degenerate_idx = int(np.flatnonzero((solver.triangles == [0, 0, 1]).all(axis=1))[0])
+        assert A_fast[2 * degenerate_idx].nnz == 0
+        assert A_fast[2 * degenerate_idx + 1].nnz == 0
+        assert abs(A_fast - A_ref).max() < 1e-12
+
+    def test_flat_mesh_is_reproduced(self):
+        """Two pins on a flat mesh recover its own XY coordinates."""
+        vertices, triangles = generate_simple_mesh(8, 8)
+        vertices[:, 2] = 0.0
+        solver = LSCMSolver(vertices, triangles)
+
+        uv, _ = solver.solve_lscm([(0, 0.0, 0.0), (7, 1.0, 0.0)])
+
+        np.testing.assert_allclose(uv, vertices[:, :2], atol=1e-4)
+
+    def test_conformal_maps_are_in_null_space(self):
+        """Rows vanish for a similarity of the flat layout, whatever the vertex order."""
+        vertices, triangles = generate_simple_mesh(6, 6)
+        vertices[:, 2] = 0.0
+        # Rotate each triangle's vertex order so p0 varies between faces
+        triangles = np.array([np.roll(t, i % 3) for i, t in enumerate(triangles)])
+        angle, scale = 0.3, 2.5
+        z = scale * np.exp(1j * angle) * (vertices[:, 0] + 1j * vertices[:, 1])
+        uv = np.column_stack([z.real, z.imag]).ravel()
+
+        for vectorized in (True, False):
+            A = LSCMSolver(vertices, triangles).build_conformal_system(vectorized=vectorized)
+            assert np.abs(A @ uv).max() < 1e-10
+
+
+class TestFactorizationCache:
+    """Test cases for factorization reuse across repeated solves."""
+
+    PINS = [(0, 0.0, 0.0), (11, 1.0, 0.0), (143, 1.0, 1.0)]
+
+    def test_cached_solution_matches_direct_solve(self, wavy_mesh):
+        """Cached solves agree with solving the normal equations from scratch."""
+        vertices, triangles = wavy_mesh
+        solver = LSCMSolver(vertices, triangles)
+
+        uv_direct, _ = solver.solve_lscm(self.PINS, use_cache=False)
+        uv_cached, info = solver.solve_lscm(self.PINS)
+
+        assert info['cache']['hit'] is False
+        np.testing.assert_allclose(uv_cached, uv_direct, atol=1e-7)
+
+    def test_repeat_solve_hits_cache(self, wavy_mesh):
+        """A second solver on the same mesh reuses the factorization."""
+        vertices, triangles = wavy_mesh
+        LSCMSolver(vertices, triangles).solve_lscm(self.PINS)
+
+        new_pins = [(idx, 2 * u, 2 * v) for idx, u, v in self.PINS]
+        uv, info = LSCMSolver(vertices.copy(), triangles.copy()).solve_lscm(new_pins)
+
+        assert info['cache']['hit'] is True
+        assert info['cache']['pin_update_hit'] is True
+        uv_direct, _ = LSCMSolver(vertices, triangles).solve_lscm(new_pins, use_cache=False)
+        np.testing.assert_allclose(uv, uv_direct, atol=1e-7)
+
+    def test_new_pin_set_uses_low_rank_update(self, wavy_mesh):
+        """Changing which vertices are pinned keeps the system factorization."""
+        vertices, triangles = wavy_mesh
+        solver = LSCMSolver(vertices, triangles)
+        solver.solve_lscm(self.PINS)
+
+        other_pins = [(5, 0.0, 0.0), (120, 1.0, 1.0)]
+        uv, info = solver.solve_lscm(other_pins)
+
+        assert info['cache']['hit'] is True
+        assert info['cache']['pin_update_hit'] is False
+        uv_direct, _ = solver.solve_lscm(other_pins, use_cache=False)
+        np.testing.assert_allclose(uv, uv_direct, atol=1e-7)
+
+    def test_pin_update_stores_only_capacitance(self, wavy_mesh):
+        """A cached pin set keeps a k x k factor, not a dense n x k block."""
+        vertices, triangles = wavy_mesh
+        LSCMSolver(vertices, triangles).solve_lscm(self.PINS)
+
+        entry = next(iter(LSCMSolver._system_cache.values()))
+        (method, (lu, _), _), = entry['pin_updates'].values()
+        assert method == 'woodbury'
+        assert lu.shape == (2 * len(self.PINS), 2 * len(self.PINS))
+
+    def test_changed_geometry_misses_cache(self, wavy_mesh):
+        """Moving a vertex produces a different mesh hash."""
+        vertices, triangles = wavy_mesh
+        LSCMSolver(vertices, triangles).solve_lscm(self.PINS)
+
+        moved = vertices.copy()
+        moved[10, 2] += 0.05
+        _, info = LSCMSolver(moved, triangles).solve_lscm(self.PINS)
+
+        assert info['cache']['hit'] is False
+        assert LSCMSolver.cache_info()['entries'] == 2
+
+
+class TestIterativeSolvers:
+    """Test cases for the iterative solver backends."""
+
+    PINS = [(0, 0.0, 0.0), (11, 1.0, 0.0), (143, 1.0, 1.0)]
+
+    @pytest.mark.parametrize("backend,preconditioner", [
+        ("lsqr", None),
+        ("lsmr", None),
+        ("cg", "jacobi"),
+        ("cg", "ic"),
+    ])
+    def test_backend_matches_direct_solve(self, wavy_mesh, backend, preconditioner):
+        """Each iterative backend converges to the direct solution."""
+        vertices, triangles = wavy_mesh
+        solver = LSCMSolver(vertices, triangles)
+        uv_direct, _ = solver.solve_lscm(self.PINS, use_cache=False)
+
+        uv, info = solver.solve_lscm(self.PINS, solver=backend, preconditioner=preconditioner,
+                                     tol=1e-12, max_iterations=10000)
+
+        assert info['solver']['backend'] == backend
+        assert info['solver']['converged'] is True
+        assert info['solver']['iterations'] > 0
+        np.testing.assert_allclose(uv, uv_direct, atol=1e-5)
+
+    def test_warm_start_reduces_iterations(self, wavy_mesh):
+        """Starting from a nearby solution needs fewer CG iterations."""
+        vertices, triangles = wavy_mesh
+        solver = LSCMSolver(vertices, triangles)
+        uv_direct, _ = solver.solve_lscm(self.PINS, use_cache=False)
+
+        _, cold = solver.solve_lscm(self.PINS, solver='cg', tol=1e-10)
+        _, warm = solver.solve_lscm(self.PINS, solver='cg', tol=1e-10,
+                                    initial_guess=uv_direct + 1e-6)
+
+        assert warm['solver']['warm_start'] is True
+        assert warm['solver']['iterations'] < cold['solver']['iterations']
+
+    def test_unknown_backend_raises(self, wavy_mesh):
+        """Unsupported backends are rejected."""
+        vertices, triangles = wavy_mesh
+        with pytest.raises(ValueError, match="Unknown solver backend"):
+            LSCMSolver(vertices, triangles).solve_lscm(self.PINS, solver='gmres')
+
+
+class TestMultilevelSolve:
+    """Test cases for the coarse-to-fine multilevel solver."""
+
+    PINS = [(0, 0.0, 0.0), (39, 1.0, 0.0)]
+
+    @pytest.fixture
+    def dense_mesh(self):
+        """Wavy grid large enough to build three levels."""
+        return generate_simple_mesh(40, 40)
+
+    def test_matches_direct_solve(self, dense_mesh):
+        """The multilevel solution agrees with the direct solve."""
+        vertices, triangles = dense_mesh
+        solver = LSCMSolver(vertices, triangles)
+        uv_direct, _ = solver.solve_lscm(self.PINS, use_cache=False)
+
+        uv, info = solver.solve_multilevel(self.PINS, levels=3, min_coarse_vertices=50)
+
+        assert info['solver']['backend'] == 'multilevel'
+        assert info['solver']['converged'] is True
+        np.testing.assert_allclose(uv, uv_direct, atol=1e-6)
+
+    def test_reports_per_level_timings(self, dense_mesh):
+        """Each level reports its size and timings, finest first."""
+        vertices, triangles = dense_mesh
+        _, info = LSCMSolver(vertices, triangles).solve_multilevel(
+            self.PINS, levels=3, coarsening_ratio=0.3, min_coarse_vertices=50
+        )
+
+        levels = info['multilevel']['levels']
+        assert info['multilevel']['n_levels'] == len(levels) == 3
+        assert [level['level'] for level in levels] == [0, 1, 2]
+        assert levels[0]['n_vertices'] > levels[1]['n_vertices'] > levels[2]['n_vertices']
+        assert levels[0]['iterations'] == info['solver']['iterations'] > 0
+        for level in levels:
+            assert {'decimation_time', 'setup_time', 'solve_time'} <= set(level)
+
+    def test_coarsening_stops_at_min_vertices(self, dense_mesh):
+        """Small meshes fall back to a single direct level."""
+        vertices, triangles = dense_mesh
+        _, info = LSCMSolver(vertices, triangles).solve_multilevel(self.PINS, levels=4,
+                                                                  min_coarse_vertices=10000)
+
+        assert info['multilevel']['n_levels'] == 1
+        assert info['solver']['backend'] == 'direct'
+
+    def test_invalid_ratio_raises(self, dense_mesh):
+        """Coarsening ratios outside (0, 1) are rejected."""
+        vertices, triangles = dense_mesh
+        with pytest.raises(ValueError, match="coarsening_ratio"):
+            LSCMSolver(vertices, triangles).solve_multilevel(self.PINS, coarsening_ratio=1.5)
+
+    def test_unfold_surface_multilevel_mode(self, dense_mesh):
+        """unfold_surface_lscm exposes levels and coarsening_ratio."""
+        vertices, triangles = dense_mesh
+        result = unfold_surface_lscm(vertices, triangles, boundary_constraints=self.PINS,
+                                     levels=3, coarsening_ratio=0.3,
+                                     solver_options={'min_coarse_vertices': 50})
+
+        assert result['success'] is True
+        assert result['solution_info']['multilevel']['n_levels'] == 3
+
+    def test_cluster_decimation_hits_target(self, dense_mesh):
+        """Vertex clustering lands near the requested size and maps every vertex."""
+        vertices, triangles = dense_mesh
+        coarse_vertices, coarse_triangles, vertex_map = cluster_decimate_mesh(vertices, triangles, 400)
+
+        assert abs(len(coarse_vertices) - 400) <= 80
+        assert vertex_map.shape == (len(vertices),)
+        assert coarse_triangles.max() < len(coarse_vertices)
+        assert np.all(coarse_triangles[:, 0] != coarse_triangles[:, 1])
+
+
+class TestConditionEstimate:
+    """Test cases for the sparse condition number estimator."""
+
+    PINS = [(0, 0.0, 0.0), (11, 1.0, 0.0)]
+
+    def _exact_one_norm_condition(self, solver):
+        A, _ = solver._build_constrained_system(self.PINS, None)
+        AtA = (A.T @ A).toarray() + solver.REGULARIZATION * np.eye(A.shape[1])
+        return np.linalg.cond(AtA, 1)
+
+    @pytest.mark.parametrize("use_cache", [True, False])
+    def test_condest_close_to_exact(self, wavy_mesh, use_cache):
+        """The 1-norm estimate is within the usual factor of the exact value."""
+        vertices, triangles = wavy_mesh
+        solver = LSCMSolver(vertices, triangles)
+
+        _, info = solver.solve_lscm(self.PINS, use_cache=use_cache)
+        exact = self._exact_one_norm_condition(solver)
+
+        assert info['condition_estimate']['method'] == '1-norm condest'
+        assert exact / 3 <= info['condition_number'] <= exact * 1.0001
+
+    @pytest.mark.parametrize("backend", ["lsqr", "cg"])
+    def test_iterative_estimate_close_to_exact(self, wavy_mesh, backend):
+        """Matrix-free backends get a finite 2-norm estimate through inverse Lanczos."""
+        vertices, triangles = wavy_mesh
+        solver = LSCMSolver(vertices, triangles)
+
+        _, info = solver.solve_lscm(self.PINS, solver=backend, tol=1e-10, max_iterations=10000)
+        A, _ = solver._build_constrained_system(self.PINS, None)
+        exact = np.linalg.cond((A.T @ A).toarray() + solver.REGULARIZATION * np.eye(A.shape[1]))
+
+        assert info['condition_estimate']['method'] == 'lanczos'
+        assert info['condition_estimate']['converged'] is True
+        assert np.isfinite(info['condition_number'])
+        assert exact / 1.1 <= info['condition_number'] <= exact * 1.1
+
+    def test_estimate_can_be_disabled(self, wavy_mesh):
+        """Latency-sensitive callers can skip the estimate."""
+        vertices, triangles = wavy_mesh
+        _, info = LSCMSolver(vertices, triangles).solve_lscm(self.PINS, estimate_condition=False)
+
+        assert info['condition_number'] == -1
+        assert info['condition_estimate']['method'] == 'disabled'
+
+
+class TestManufacturingConstraints:
+    """Test cases for the vectorized manufacturing constraint rows."""
+
+    def test_thickness_rows_match_pairwise_loop(self, wavy_mesh):
+        """Thickness rows equal the all-pairs reference in the same order."""
+        vertices, triangles = wavy_mesh
+        solver = LSCMSolver(vertices, triangles)
+        thickness = 0.06
+
+        expected = []
+        for i in range(len(vertices)):
+            for j in range(i + 1, len(vertices)):
+                distance = np.linalg.norm(vertices[i] - vertices[j])
+                if 1e-12 < distance < 2 * thickness:
+                    expected.append((i, j))
+
+        block = solver._add_thickness_constraint(thickness).tocsr()
+
+        assert block.shape == (len(expected), 2 * len(vertices))
+        for row, (i, j) in enumerate(expected):
+            assert block[row, 2 * i] == pytest.approx(1e-3)
+            assert block[row, 2 * j] == pytest.approx(-1e-3)
+
+    def test_cutting_rows_cover_every_triangle_edge(self, wavy_mesh):
+        """One cutting tolerance row per triangle edge, in triangle order."""
+        vertices, triangles = wavy_mesh
+        solver = LSCMSolver(vertices, triangles)
+
+        block = solver._add_cutting_tolerance_constraint(0.001).tocsr()
+
+        assert block.shape == (3 * len(triangles), 2 * len(vertices))
+        v0, v1 = triangles[0, 1], triangles[0, 2]
+        assert block[1, 2 * v0] == pytest.approx(1e-4)
+        assert block[1, 2 * v1] == pytest.approx(-1e-4)
+
+    def test_rows_are_stacked_under_the_system(self, wavy_mesh):
+        """Constraint blocks extend the matrix and a zero right-hand side."""
+        vertices, triangles = wavy_mesh
+        solver = LSCMSolver(vertices, triangles)
+        A = solver.build_conformal_system()
+        constraints = {'material_thickness': 0.06, 'cutting_tolerance': 0.001}
+
+        A_full, rhs = solver._apply_manufacturing_constraints(A, np.ones(A.shape[0]), constraints)
+
+        n_added = (solver._add_thickness_constraint(0.06).shape[0]
+                   + solver._add_cutting_tolerance_constraint(0.001).shape[0])
+        assert A_full.shape == (A.shape[0] + n_added, A.shape[1])
+        assert abs(A_full[:A.shape[0]] - A).max() == 0
+        assert np.all(rhs[:A.shape[0]] == 1.0) and np.all(rhs[A.shape[0]:] == 0.0)
+
+
+class TestDistortionMetrics:
+    """Test cases for the vectorized distortion metrics."""
+
+    def test_identity_parameterization_has_no_distortion(self):
+        """A flat mesh mapped by its own XY coordinates is distortion free."""
+        vertices, triangles = generate_simple_mesh(6, 6)
+        vertices[:, 2] = 0.0
+
+        metrics = compute_distortion_metrics(vertices, triangles, vertices[:, :2])
+
+        assert metrics['mean_area_distortion'] == pytest.approx(1.0)
+        assert metrics['max_angle_distortion'] == pytest.approx(0.0, abs=1e-6)
+        assert metrics['mean_edge_length_distortion'] == pytest.approx(0.0, abs=1e-12)
+
+    def test_summary_and_full_detail(self, wavy_mesh):
+        """Summary output is compact; full output adds per-triangle arrays."""
+        vertices, triangles = wavy_mesh
+        uv = vertices[:, :2] * [2.0, 1.0]
+
+        summary = compute_distortion_metrics(vertices, triangles, uv)
+        full = compute_distortion_metrics(vertices, triangles, uv, detail='full')
+
+        assert 'per_triangle' not in summary
+        assert summary['statistics']['area_ratio']['count'] == len(triangles)
+        assert sum(summary['statistics']['area_ratio']['histogram']['counts']) == len(triangles)
+        assert full['per_triangle']['area_ratio'].shape == (len(triangles),)
+        assert full['per_triangle']['edge_stretch'].shape == (len(triangles), 2)
+        assert full['mean_area_distortion'] == summary['mean_area_distortion']
+
+    def test_utils_wrapper_skips_solver_construction(self, wavy_mesh):
+        """utils.calculate_distortion_metrics uses the fast path directly."""
+        from src.utils import calculate_distortion_metrics
+
+        vertices, triangles = wavy_mesh
+        with patch('src.algorithms.lscm.LSCMSolver') as mock_solver:
+            metrics = calculate_distortion_metrics(vertices, triangles, vertices[:, :2])
+
+        mock_solver.assert_not_called()
+        assert 'mean_area_distortion' in metrics
+
+
+class TestUnfoldSurface:
+    """Test cases for the unfold_surface_lscm entry point."""
+
+    def test_unfold_returns_uv_per_vertex(self, wavy_mesh):
+        """Successful unfolding returns one UV pair per input vertex."""
+        vertices, triangles = wavy_mesh
+        result = unfold_surface_lscm(vertices, triangles,
+                                     boundary_constraints=[(0, 0.0, 0.0), (11, 1.0, 0.0)])
+
+        assert result['success'] is True
+        assert np.asarray(result['uv_coordinates']).shape == (len(vertices), 2)
+
+
+class TestBatchUnfolding:
+    """Test cases for unfold_surfaces_batch."""
+
+    @pytest.fixture
+    def parts(self):
+        """Grid parts of increasing size plus one invalid part."""
+        parts = []
+        for i, size in enumerate((6, 8, 10)):
+            vertices, triangles = generate_simple_mesh(size, size)
+            parts.append({'part_id': f'part-{i}', 'vertices': vertices, 'triangles': triangles,
+                          'boundary_constraints': [(0, 0.0, 0.0), (size - 1, 1.0, 0.0)]})
+        parts.append({'part_id': 'broken', 'vertices': np.zeros((3, 3)), 'triangles': [[0, 1, 9]]})
+        return parts
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_failures_do_not_abort_batch(self, parts, max_workers):
+        """Every part gets a result and only the broken part fails."""
+        results = {r['part_id']: r for r in unfold_surfaces_batch(parts, max_workers=max_workers)}
+
+        assert set(results) == {'part-0', 'part-1', 'part-2', 'broken'}
+        assert results['broken']['success'] is False
+        for i in range(3):
+            assert results[f'part-{i}']['success'] is True
+            assert results[f'part-{i}']['part_index'] == i
+            assert len(results[f'part-{i}']['uv_coordinates']) == len(parts[i]['vertices'])
+
+    @pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                        reason="the crashing stub must be inherited by forked workers")
+    def test_crashed_worker_fails_only_its_part(self, parts):
+        """A worker dying mid-batch breaks the pool; other parts are resubmitted."""
+        def crash_on_part_1(vertices, triangles, **kwargs):
+            if len(vertices) == len(parts[1]['vertices']):
+                os._exit(1)
+            return unfold_surface_lscm(vertices, triangles, **kwargs)
+
+        with patch('src.algorithms.lscm.unfold_surface_lscm', side_effect=crash_on_part_1):
+            results = {r['part_id']: r for r in unfold_surfaces_batch(parts, max_workers=2)}
+
+        assert set(results) == {'part-0', 'part-1', 'part-2', 'broken'}
+        assert results['part-1']['success'] is False
+        assert 'Worker failed' in results['part-1']['error']
+        assert results['part-0']['success'] is True
+        assert results['part-2']['success'] is True
+
+    def test_pool_matches_single_unfold(self, parts):
+        """Shared-memory workers produce the same UVs as a direct call."""
+        results = {r['part_id']: r for r in unfold_surfaces_batch(parts[:3], max_workers=2)}
+        expected = unfold_surface_lscm(parts[2]['vertices'], parts[2]['triangles'],
+                                       boundary_constraints=parts[2]['boundary_constraints'])
+
+        np.testing.assert_allclose(results['part-2']['uv_coordinates'], expected['uv_coordinates'])
+
+    def test_results_stream_lazily(self, parts):
+        """The batch is a generator that can be abandoned early."""
+        batch = unfold_surfaces_batch(parts, max_workers=2)
+        first = next(batch)
+        batch.close()
+
+        assert 'part_id' in first
+
+    def test_malformed_arrays_are_reported(self):
+        """Parts whose arrays cannot be reshaped fail individually."""
+        results = list(unfold_surfaces_batch([{'vertices': [[1.0, 2.0]], 'triangles': [[0]]}]))
+
+        assert len(results) == 1
+        assert results[0]['success'] is False
+        assert results[0]['part_id'] == 0
@@ -0,0 +1,107 @@
+"""
+Unit tests for the mesh optimization generator.
+"""
+
+import numpy as np
+import pytest
+
+from src.algorithms.mesh_topology import MeshTopology
+from src.algorithms.mesh_utils import generate_simple_mesh, validate_mesh_manifold
+from src.mcp_interface.mesh_optimization_generator import MeshOptimizationGenerator
+
+
+def reference_smooth(vertices, triangles, iterations, factor):
+    """One vertex at a time Jacobi smoothing towards the one-ring mean."""
+    rings = MeshTopology(triangles, len(vertices)).one_rings()
+    smoothed = vertices.copy()
+    for _ in range(iterations):
+        previous = smoothed.copy()
+        for i, ring in enumerate(rings):
+            if len(ring):
+                smoothed[i] = previous[i] + factor * (previous[ring].mean(axis=0) - previous[i])
+    return smoothed
+
+
+@pytest.fixture
+def noisy_mesh():
+    """Flat grid with random height noise."""
+    vertices, triangles = generate_simple_mesh(12, 12)
+    vertices[:, 2] = np.random.default_rng(0).normal(scale=0.05, size=len(vertices))
+    return vertices, triangles
+
+
+class TestLaplacianSmoothing:
+    """Test cases for sparse Laplacian and Taubin smoothing."""
+
+    def test_matches_per_vertex_reference(self, noisy_mesh):
+        """The CSR step reproduces the per-vertex neighbour average."""
+        vertices, triangles = noisy_mesh
+        smoothed = MeshOptimizationGenerator()._laplacian_smooth(vertices, triangles, iterations=3,
+                                                                 lambda_factor=0.6)
+        np.testing.assert_allclose(smoothed, reference_smooth(vertices, triangles, 3, 0.6))
+
+    def test_pinned_boundary_stays_fixed(self, noisy_mesh):
+        """Boundary vertices keep their positions while the interior is smoothed."""
+        vertices, triangles = noisy_mesh
+        boundary = MeshTopology(triangles, len(vertices)).boundary_vertices
+
+        smoothed = MeshOptimizationGenerator()._laplacian_smooth(vertices, triangles, iterations=10,
+                                                                 pin_boundary=True)
+
+        np.testing.assert_array_equal(smoothed[boundary], vertices[boundary])
+        interior = np.setdiff1d(np.arange(len(vertices)), boundary)
+        assert np.std(smoothed[interior, 2]) < 0.5 * np.std(vertices[interior, 2])
+
+    def test_taubin_shrinks_less_than_laplacian(self, noisy_mesh):
+        """Taubin lambda/mu steps preserve the mesh extent better than plain Laplacian."""
+        vertices, triangles = noisy_mesh
+        generator = MeshOptimizationGenerator()
+        area = lambda v: np.ptp(v[:, 0]) * np.ptp(v[:, 1])
+
+        laplacian = generator._laplacian_smooth(vertices, triangles, iterations=10, lambda_factor=0.5)
+        taubin = generator._laplacian_smooth(vertices, triangles, iterations=10, lambda_factor=0.5,
+                                             mu_factor=-0.53)
+
+        assert area(taubin) > area(laplacian)
+        assert np.std(taubin[:, 2]) < np.std(vertices[:, 2])
+
+    def test_execute_reads_smoothing_constraints(self, noisy_mesh):
+        """Smoothing options pass through execute_algorithm constraints."""
+        vertices, triangles = noisy_mesh
+        generator = MeshOptimizationGenerator()
+        spec = generator.generate_algorithm("smooth the mesh")
+
+        result = generator.execute_algorithm(spec, {
+            'vertices': vertices, 'triangles': triangles, 'optimization_type': 'smooth',
+            'constraints': {'smoothing_method': 'taubin', 'smoothing_iterations': 4, 'pin_boundary': True}
+        })
+
+        assert result['quality_metrics'] == {'smoothing_iterations': 4, 'smoothing_method': 'taubin',
+                                             'boundary_pinned': True}
+        assert result['optimized_vertices'].shape == vertices.shape
+
+
+class TestMeshSimplify:
+    """Test cases for edge-collapse simplification."""
+
+    def test_halves_vertices_without_holes(self):
+        """Simplification removes the requested vertices and keeps a closed-up surface."""
+        vertices, triangles = generate_simple_mesh(30, 30)
+        generator = MeshOptimizationGenerator()
+        spec = generator.generate_algorithm("simplify the mesh")
+
+        result = generator.execute_algorithm(spec, {
+            'vertices': vertices, 'triangles': triangles, 'optimization_type': 'simplify',
+            'constraints': {'target_reduction': 0.5}
+        })
+
+        simplified_vertices = result['optimized_vertices']
+        simplified_triangles = result['optimized_triangles']
+        assert result['quality_metrics'] == {'original_vertex_count': 900, 'simplified_vertex_count': 450}
+        before = validate_mesh_manifold(vertices, triangles)
+        after = validate_mesh_manifold(simplified_vertices, simplified_triangles)
+        assert after['is_manifold'] and after['n_boundary_loops'] == 1
+        assert after['n_boundary_edges'] == before['n_boundary_edges']
+        # Euler characteristic of a disk: V - E + F == 1
+        n_edges = (3 * len(simplified_triangles) + after['n_boundary_edges']) // 2
+        assert len(simplified_vertices) - n_edges + len(simplified_triangles) == 1
@@ -0,0 +1,89 @@
+"""
+Unit tests for the shared MeshTopology connectivity cache.
+"""
+
+import numpy as np
+import pytest
+
+from src.algorithms.geodesic import calculate_geodesic_paths, find_key_vertices_for_folding
+from src.algorithms.mesh_topology import MeshTopology
+from src.algorithms.mesh_utils import analyze_mesh_curvature, generate_simple_mesh, validate_mesh_manifold
+
+
+@pytest.fixture(autouse=True)
+def clear_topology_cache():
+    """Isolate tests from the shared topology cache."""
+    MeshTopology.clear_cache()
+    yield
+    MeshTopology.clear_cache()
+
+
+class TestMeshTopology:
+    """Test cases for MeshTopology."""
+
+    def test_edges_and_incidence_match_triangle_scan(self):
+        """Unique edges, face counts and one-rings agree with a per-triangle scan."""
+        vertices, triangles = generate_simple_mesh(6, 7)
+        topology = MeshTopology(triangles, len(vertices))
+
+        edge_count = {}
+        rings = [set() for _ in range(len(vertices))]
+        for triangle in triangles:
+            for i in range(3):
+                a, b = triangle[i], triangle[(i + 1) % 3]
+                edge = tuple(sorted((a, b)))
+                edge_count[edge] = edge_count.get(edge, 0) + 1
+                rings[a].add(b)
+                rings[b].add(a)
+
+        assert [tuple(e) for e in topology.edges.tolist()] == sorted(edge_count)
+        assert topology.edge_face_counts.tolist() == [edge_count[e] for e in sorted(edge_count)]
+        assert topology.edge_faces.sum(axis=1).A1.tolist() == topology.edge_face_counts.tolist()
+        assert [set(r.tolist()) for r in topology.one_rings()] == rings
+        assert set(topology.neighbors(8).tolist()) == rings[8]
+        # Each triangle side points at its own edge
+        side = np.sort(triangles[:, [1, 2]], axis=1)
+        np.testing.assert_array_equal(topology.edges[topology.face_edges[:, 1]], side)
+
+    def test_boundary_loop_of_grid_is_ordered(self):
+        """A grid has one boundary loop that walks consecutive boundary edges."""
+        vertices, triangles = generate_simple_mesh(5, 5)
+        topology = MeshTopology(triangles, len(vertices))
+
+        loops = topology.boundary_loops
+        assert len(loops) == 1
+        loop = loops[0]
+        assert sorted(loop.tolist()) == topology.boundary_vertices.tolist()
+        assert len(loop) == 16
+        steps = np.linalg.norm(vertices[loop] - vertices[np.roll(loop, -1)], axis=1)
+        assert np.all(steps < 0.3)
+
+    def test_closed_and_annular_meshes(self):
+        """A tetrahedron has no boundary; a strip with a hole has two loops."""
+        tetrahedron = np.array([[0, 2, 1], [0, 1, 3], [1, 2, 3], [0, 3, 2]])
+        closed = MeshTopology(tetrahedron, 4)
+        assert len(closed.boundary_edges) == 0 and closed.boundary_loops == []
+        assert closed.is_manifold
+
+        # 3x3 grid of quads with the centre quad removed
+        quads = [(r, c) for r in range(3) for c in range(3) if (r, c) != (1, 1)]
+        annulus = []
+        for r, c in quads:
+            v = r * 4 + c
+            annulus += [[v, v + 1, v + 4], [v + 1, v + 5, v + 4]]
+        loops = MeshTopology(np.array(annulus), 16).boundary_loops
+        assert sorted(len(loop) for loop in loops) == [4, 12]
+
+    def test_pipeline_builds_topology_once(self):
+        """Validation, curvature, key vertices and geodesics share one cached topology."""
+        vertices, triangles = generate_simple_mesh(8, 8)
+
+        validation = validate_mesh_manifold(vertices, triangles)
+        curvature = analyze_mesh_curvature(vertices, triangles)
+        keys = find_key_vertices_for_folding(vertices, triangles, curvature)
+        calculate_geodesic_paths(vertices, triangles, keys)
+
+        assert validation['n_boundary_loops'] == 1
+        assert validation['is_manifold'] and validation['n_boundary_edges'] == 28
+        assert MeshTopology.cache_info()['misses'] == 1
+        assert MeshTopology.cache_info()['hits'] >= 3
@@ -0,0 +1,184 @@
+"""
+Unit tests for mesh utility functions.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.algorithms.lscm import LSCMSolver
+from src.algorithms.mesh_utils import (
+    analyze_mesh_curvature, extract_triangle_mesh, generate_simple_mesh, interpolate_to_original_vertices,
+    optimize_mesh_for_lscm, qem_decimate_mesh, validate_mesh_manifold
+)
+from src.utils import analyze_surface_mesh
+
+
+def reference_vertex_curvatures(vertices, triangles):
+    """Area-weighted mean corner angle per vertex, one vertex at a time."""
+    curvatures = np.zeros(len(vertices))
+    for i in range(len(vertices)):
+        angle_sum = weight_sum = 0.0
+        for triangle in triangles:
+            if i not in triangle:
+                continue
+            others = [v for v in triangle if v != i]
+            if len(others) != 2:
+                continue
+            e1, e2 = vertices[others[0]] - vertices[i], vertices[others[1]] - vertices[i]
+            area = np.linalg.norm(np.cross(vertices[triangle[1]] - vertices[triangle[0]],
+                                           vertices[triangle[2]] - vertices[triangle[0]])) / 2.0
+            cos_angle = np.clip(np.dot(e1, e2) / (np.linalg.norm(e1) * np.linalg.norm(e2)), -1, 1)
+            angle_sum += np.arccos(cos_angle) * area
+            weight_sum += area
+        if weight_sum > 1e-12:
+            curvatures[i] = angle_sum / weight_sum
+    return curvatures
+
+
+class TestAnalyzeMeshCurvature:
+    """Test cases for analyze_mesh_curvature."""
+
+    def test_matches_per_vertex_reference(self):
+        """Batched corner angles reproduce the per-vertex loop, including degenerate faces."""
+        vertices, triangles = generate_simple_mesh(9, 7)
+        triangles = np.vstack([triangles, [[0, 0, 5]]])
+
+        result = analyze_mesh_curvature(vertices, triangles)
+
+        np.testing.assert_allclose(result['vertex_curvatures'],
+                                   reference_vertex_curvatures(vertices, triangles), atol=1e-12)
+        normals = np.asarray(result['vertex_normals'])
+        np.testing.assert_allclose(np.linalg.norm(normals, axis=1), 1.0)
+        assert np.all(normals[:, 2] > 0)
+
+    def test_total_area_of_flat_grid(self):
+        """A flat unit grid has unit area and is classified nearly flat."""
+        vertices, triangles = generate_simple_mesh(6, 6)
+        vertices[:, 2] = 0.0
+
+        result = analyze_mesh_curvature(vertices, triangles)
+
+        assert result['total_surface_area'] == pytest.approx(1.0)
+        assert np.asarray(result['vertex_normals']) == pytest.approx(np.tile([0, 0, 1], (36, 1)))
+
+
+class TestValidateMeshManifold:
+    """Test cases for validate_mesh_manifold."""
+
+    def test_clean_grid_is_suitable(self):
+        """A regular grid is a manifold disc with Euler characteristic 1."""
+        vertices, triangles = generate_simple_mesh(5, 5)
+
+        result = validate_mesh_manifold(vertices, triangles)
+
+        assert result['suitable_for_lscm']
+        assert result['euler_characteristic'] == 1
+        assert result['n_edges'] == 56 and result['n_boundary_edges'] == 16
+
+    def test_reports_degenerate_duplicate_and_non_manifold(self):
+        """Degenerate faces, duplicate vertices and fin edges are all detected."""
+        vertices, triangles = generate_simple_mesh(5, 5)
+        vertices = np.vstack([vertices, vertices[3], [0.5, 0.5, 1.0]])
+        # Two fins on boundary edge (0, 1), and a zero-area triangle
+        triangles = np.vstack([triangles, [[0, 1, 26], [1, 0, 24], [2, 3, 25]]])
+
+        result = validate_mesh_manifold(vertices, triangles)
+
+        assert result['n_unique_vertices'] == 26
+        assert result['degenerate_triangles'] == [len(triangles) - 1]
+        assert result['non_manifold_edges'] == [(0, 1)]
+        assert not result['suitable_for_lscm']
+
+
+class TestQemDecimation:
+    """Test cases for quadric error edge-collapse decimation."""
+
+    def test_reaches_target_with_valid_manifold(self):
+        """Decimation hits the vertex target and keeps topology and the boundary."""
+        vertices, triangles = generate_simple_mesh(40, 40)
+        before = validate_mesh_manifold(vertices, triangles)
+
+        coarse_vertices, coarse_triangles, vertex_map = qem_decimate_mesh(vertices, triangles, 300)
+        after = validate_mesh_manifold(coarse_vertices, coarse_triangles)
+
+        assert len(coarse_vertices) == 300
+        assert after['suitable_for_lscm']
+        assert after['euler_characteristic'] == before['euler_characteristic']
+        assert after['n_boundary_loops'] == 1
+        assert after['n_boundary_edges'] == before['n_boundary_edges']
+        # Boundary vertices survive unmoved
+        boundary = np.unique([e for e in before['boundary_edges']])
+        np.testing.assert_array_equal(coarse_vertices[vertex_map[boundary]], vertices[boundary])
+        assert vertex_map.shape == (len(vertices),) and vertex_map.max() == 299
+
+    def test_flat_regions_collapse_before_curved_ones(self):
+        """Quadric error keeps more vertices where the surface bends."""
+        vertices, triangles = generate_simple_mesh(40, 40)
+        vertices[:, 2] = np.where(vertices[:, 0] > 0.5, 0.3 * np.sin(12 * vertices[:, 0]) * vertices[:, 1], 0.0)
+
+        coarse_vertices, _, _ = qem_decimate_mesh(vertices, triangles, 400)
+
+        assert np.count_nonzero(coarse_vertices[:, 0] > 0.5) > 2 * np.count_nonzero(coarse_vertices[:, 0] < 0.5)
+
+    def test_uvs_interpolate_back_to_full_resolution(self):
+        """An unfolded simplified mesh maps UVs back onto every original vertex."""
+        vertices, triangles = generate_simple_mesh(30, 30)
+        vertices[:, 2] = 0.0
+
+        coarse_vertices, coarse_triangles, vertex_map = optimize_mesh_for_lscm(
+            vertices, triangles, max_vertices=200, return_mapping=True
+        )
+        pins = [(int(vertex_map[0]), 0.0, 0.0), (int(vertex_map[29]), 1.0, 0.0)]
+        uv, _ = LSCMSolver(coarse_vertices, coarse_triangles).solve_lscm(pins, use_cache=False)
+        full_uv = interpolate_to_original_vertices(vertices, coarse_vertices, coarse_triangles, vertex_map, uv)
+
+        assert full_uv.shape == (len(vertices), 2)
+        np.testing.assert_allclose(full_uv, vertices[:, :2], atol=1e-3)
+
+
+def polygon_mesh_entity(points, **properties):
+    """Stand-in for a COM PolygonMesh with a flat Coordinates tuple."""
+    return SimpleNamespace(ObjectID=1, ObjectName='AcDbPolygonMesh',
+                           Coordinates=tuple(np.asarray(points).ravel().tolist()), **properties)
+
+
+class TestExtractTriangleMesh:
+    """Test cases for PolygonMesh extraction."""
+
+    def test_vertex_counts_handle_rotated_grids(self):
+        """MVertexCount/NVertexCount give the grid even when it is not axis aligned."""
+        u, v = np.meshgrid(np.arange(4.0), np.arange(3.0), indexing='ij')
+        points = np.stack([u + 0.5 * v, v - 0.5 * u, u * v], axis=-1).reshape(-1, 3)
+        entity = polygon_mesh_entity(points, MVertexCount=4, NVertexCount=3, MClose=False, NClose=False)
+
+        vertices, triangles = extract_triangle_mesh(entity)
+
+        np.testing.assert_array_equal(vertices, points)
+        assert triangles.shape == (12, 3)
+        np.testing.assert_array_equal(triangles[:2], [[0, 3, 1], [3, 4, 1]])
+        assert validate_mesh_manifold(vertices, triangles)['is_manifold']
+        assert analyze_surface_mesh(entity)['face_count'] == 6
+
+    def test_closed_direction_wraps_around(self):
+        """An MClose mesh gets a band of cells joining its last row to the first."""
+        entity = polygon_mesh_entity(np.random.default_rng(0).random((12, 3)),
+                                     MVertexCount=4, NVertexCount=3, MClose=True, NClose=False)
+
+        _, triangles = extract_triangle_mesh(entity)
+
+        assert len(triangles) == 16
+        assert [9, 0, 10] in triangles.tolist()
+
+    def test_axis_aligned_grid_without_counts(self):
+        """Unordered axis-aligned coordinates are sorted into their grid."""
+        x, y = np.meshgrid([0.0, 1.0, 2.0], [0.0, 5.0], indexing='ij')
+        points = np.column_stack([x.ravel(), y.ravel(), np.zeros(6)])
+        order = np.array([4, 1, 5, 0, 3, 2])
+
+        vertices, triangles = extract_triangle_mesh(polygon_mesh_entity(points[order]))
+
+        corners = vertices[triangles]
+        np.testing.assert_array_equal(corners[0], [[0, 0, 0], [1, 0, 0], [0, 5, 0]])
+        assert len(triangles) == 4
@@ -0,0 +1,279 @@
+"""
+Unit tests for the multi-physics generator finite element kernels.
+"""
+
+import numpy as np
+import pytest
+import scipy.sparse as sparse
+from scipy.spatial import ConvexHull
+
+from src.mcp_interface.multi_physics_generator import (
+    MultiPhysicsGenerator,
+    ReducedStiffnessSolver,
+    TetrahedralMesh,
+)
+
+CUBE = np.array([[x, y, z] for x in (0.0, 1.0) for y in (0.0, 1.0) for z in (0.0, 1.0)])
+
+
+def reference_assembly(element_matrix, nodes, elements, dofs_per_node):
+    """Dense element-by-element assembly using a per-element matrix function."""
+    n_dof = len(nodes) * dofs_per_node
+    K = np.zeros((n_dof, n_dof))
+    for element in elements:
+        K_elem = element_matrix(nodes[element])
+        dofs = (element[:, None] * dofs_per_node + np.arange(dofs_per_node)).ravel()
+        K[np.ix_(dofs, dofs)] += K_elem
+    return K
+
+
+@pytest.fixture
+def generator():
+    """Fresh generator instance."""
+    return MultiPhysicsGenerator()
+
+
+@pytest.fixture
+def spring_chain():
+    """SPD stiffness of a chain of 40 nodes with 3 DOF each."""
+    n_nodes = 40
+    laplacian = sparse.diags([-np.ones(n_nodes - 1), 2 * np.ones(n_nodes), -np.ones(n_nodes - 1)],
+                             [-1, 0, 1])
+    return sparse.kron(laplacian, sparse.eye(3)).tocsr() * 1e3
+
+
+@pytest.fixture
+def random_elements():
+    """Random nodes with 4-node and 3-node connectivity."""
+    rng = np.random.default_rng(0)
+    nodes = rng.random((30, 3))
+    tets = np.array([rng.choice(30, 4, replace=False) for _ in range(25)])
+    tris = np.array([rng.choice(30, 3, replace=False) for _ in range(25)])
+    return nodes, tets, tris
+
+
+class TestVectorizedAssembly:
+    """The batched COO assembly reproduces element-by-element assembly."""
+
+    def test_stiffness_matrix(self, generator, random_elements):
+        """Elastic stiffness from batched B^T D B products."""
+        nodes, tets, _ = random_elements
+        D = generator._compute_material_matrix(200e9, 0.3)
+
+        K = generator._assemble_stiffness_matrix(nodes, tets, 200e9, 0.3)
+
+        expected = reference_assembly(lambda n: generator._compute_element_stiffness(n, D), nodes, tets, 3)
+        np.testing.assert_allclose(K.toarray(), expected, rtol=1e-12, atol=1e-12 * np.abs(expected).max())
+
+    @pytest.mark.parametrize('connectivity', ['tets', 'tris'])
+    def test_thermal_and_flow_matrices(self, generator, random_elements, connectivity):
+        """Thermal, momentum and continuity matrices for tetrahedra and triangles."""
+        nodes, tets, tris = random_elements
+        elements = tets if connectivity == 'tets' else tris
+
+        thermal = generator._assemble_thermal_matrix(nodes, elements, 50.0)
+        momentum = generator._assemble_momentum_matrix(nodes, elements, 1000.0, 0.001)
+        continuity = generator._assemble_continuity_matrix(nodes, elements)
+
+        np.testing.assert_allclose(thermal.toarray(), reference_assembly(
+            lambda n: generator._compute_element_thermal_matrix(n, 50.0), nodes, elements, 1), atol=1e-12)
+        np.testing.assert_allclose(momentum.toarray(), reference_assembly(
+            lambda n: generator._compute_element_momentum_matrix(n, 1000.0, 0.001), nodes, elements, 2),
+            atol=1e-12)
+        np.testing.assert_allclose(continuity.toarray(), reference_assembly(
+            generator._compute_element_continuity_matrix, nodes, elements, 1), atol=1e-12)
+
+
+class TestLoadCases:
+    """Test cases for the factor-once, multi-load-case structural solver."""
+
+    def test_multi_column_solve_matches_single_solves(self, spring_chain):
+        """All load cases solved at once equal separate reduced solves."""
+        forces = np.random.default_rng(0).normal(size=(spring_chain.shape[0], 5))
+        solver = ReducedStiffnessSolver(spring_chain, fixed_nodes=[0, 39])
+
+        displacements = solver.solve(forces)
+
+        free = solver.free_dof
+        assert len(free) == 114
+        np.testing.assert_array_equal(displacements[[0, 1, 2, -3, -2, -1]], 0.0)
+        for case in range(5):
+            expected = sparse.linalg.spsolve(spring_chain[free][:, free].tocsc(), forces[free, case])
+            np.testing.assert_allclose(displacements[free, case], expected, rtol=1e-10)
+        np.testing.assert_allclose(solver.solve(forces[:, 2]), displacements[:, 2])
+
+    @pytest.mark.parametrize('preconditioner', ['jacobi', 'ic'])
+    def test_cg_matches_direct(self, spring_chain, preconditioner):
+        """The preconditioned CG path agrees with the factorization."""
+        forces = np.random.default_rng(1).normal(size=(spring_chain.shape[0], 2))
+        direct = ReducedStiffnessSolver(spring_chain, [0]).solve(forces)
+        iterative = ReducedStiffnessSolver(spring_chain, [0], method='cg',
+                                           preconditioner=preconditioner, tol=1e-12).solve(forces)
+        np.testing.assert_allclose(iterative, direct, rtol=1e-6, atol=1e-12)
+
+    def test_solve_load_cases_returns_one_result_per_case(self, generator):
+        """The load-case API reports displacements, stresses and metrics per case."""
+        geometry = np.random.default_rng(2).random((16, 3))
+        material = {'young_modulus': 70e9, 'poisson_ratio': 0.33}
+        cases = [{'applied_force': 1000.0}, {'pressure': 5.0},
+                 {'force_vector': np.ones(48)}]
+
+        result = generator.solve_load_cases(geometry, material, cases, fixed_nodes=[0, 1, 2])
+
+        n_elements = generator.generate_tetrahedral_mesh(geometry).n_elements
+        assert result['displacement_fields'].shape == (3, 48)
+        assert result['stress_distributions'].shape == (3, 6 * n_elements)
+        assert len(result['simulation_metrics']) == 3
+        assert result['solver'] == {'method': 'direct', 'n_load_cases': 3, 'n_free_dof': 39}
+        np.testing.assert_array_equal(result['displacement_fields'][:, :9], 0.0)
+
+
+class TestTetrahedralMesh:
+    """Test cases for Delaunay meshing and linear tetrahedron element arrays."""
+
+    def test_cube_mesh_fills_hull(self, generator):
+        """Tetrahedra are positively oriented and their volumes sum to the cube."""
+        mesh = generator.generate_tetrahedral_mesh(CUBE)
+
+        np.testing.assert_array_equal(mesh.nodes, CUBE)
+        assert mesh.elements.dtype == np.int64 and mesh.elements.flags['C_CONTIGUOUS']
+        assert np.all(mesh.volumes > 0)
+        assert mesh.volumes.sum() == pytest.approx(1.0)
+        assert mesh.strain_displacement.shape == (mesh.n_elements, 6, 12)
+
+    def test_target_size_refines_mesh(self, generator):
+        """A smaller target element size fills the whole hull with more elements."""
+        coarse = generator.generate_tetrahedral_mesh(CUBE)
+        fine = generator.generate_tetrahedral_mesh(CUBE, target_element_size=0.1)
+
+        assert fine.n_elements > 100 * coarse.n_elements
+        np.testing.assert_array_equal(fine.nodes[:8], CUBE)
+        assert fine.volumes.sum() == pytest.approx(ConvexHull(CUBE).volume, rel=1e-12)
+        assert fine.quality.min() > 0.0
+        assert fine.quality.mean() > 0.7
+
+    def test_quality_filter_drops_slivers(self):
+        """Elements below the minimum mean-ratio quality are removed."""
+        points = np.vstack([CUBE, [[0.5, 0.5, 1e-4]]])
+        unfiltered = TetrahedralMesh.from_points(points, min_quality=0.0)
+        filtered = TetrahedralMesh.from_points(points, min_quality=0.05)
+
+        assert unfiltered.quality.min() < 0.05
+        assert filtered.n_elements < unfiltered.n_elements
+        assert filtered.quality.min() >= 0.05
+
+    def test_b_matrices_reproduce_linear_field(self, generator):
+        """B maps a linear displacement field to its exact constant strain."""
+        mesh = generator.generate_tetrahedral_mesh(CUBE, target_element_size=0.4)
+        gradient = np.random.default_rng(3).normal(size=(3, 3))
+        displacement = (mesh.nodes @ gradient.T).ravel()
+
+        element_dofs = (mesh.elements[:, :, None] * 3 + np.arange(3)).reshape(mesh.n_elements, 12)
+        strains = np.einsum('eij,ej->ei', mesh.strain_displacement, displacement[element_dofs])
+
+        shear = gradient + gradient.T
+        expected = [*np.diag(gradient), shear[0, 1], shear[0, 2], shear[1, 2]]
+        np.testing.assert_allclose(strains, np.tile(expected, (mesh.n_elements, 1)), atol=1e-12)
+
+    def test_clamped_cube_solve(self, generator):
+        """A meshed cube clamped at its base gives a finite, nonzero solution."""
+        material = {'young_modulus': 200e9, 'poisson_ratio': 0.3}
+        result = generator._structural_analysis(
+            CUBE, material, {'fixed_nodes': [0, 2, 4, 6], 'applied_force': 1000.0},
+            mesh_options={'target_element_size': 0.5}
+        )
+
+        assert np.all(np.isfinite(result['displacement_field']))
+        assert 0 < result['simulation_metrics']['max_displacement'] < 1e-6
+
+    def test_repeated_vertex_keeps_node_indices(self, generator):
+        """A repeated geometry point stays a node, so loads and fixed nodes line up."""
+        geometry = np.vstack([CUBE, CUBE[3]])
+        material = {'young_modulus': 200e9, 'poisson_ratio': 0.3}
+
+        mesh = generator.generate_tetrahedral_mesh(geometry)
+        assert len(mesh.nodes) == len(geometry)
+        np.testing.assert_array_equal(mesh.nodes[:len(geometry)], geometry)
+        assert len(geometry) - 1 not in mesh.elements
+
+        result = generator.solve_load_cases(geometry, material,
+                                            [{'force_vector': np.ones(3 * len(geometry))}],
+                                            fixed_nodes=[0, 2, 4, 6])
+
+        displacement = result['displacement_fields'][0].reshape(-1, 3)
+        assert np.all(np.isfinite(displacement))
+        np.testing.assert_array_equal(displacement[[0, 2, 4, 6]], 0.0)
+        np.testing.assert_array_equal(displacement[-1], 0.0)
+        assert np.abs(displacement[[1, 3, 5, 7]]).min() > 0.0
+
+    def test_flat_geometry_falls_back_to_triangles(self, generator):
+        """Coplanar input has no volume and is triangulated in its plane."""
+        points = np.random.default_rng(4).random((10, 3))
+        points[:, 2] = 0.0
+
+        nodes, elements = generator._generate_mesh(points)
+
+        assert generator.generate_tetrahedral_mesh(points) is None
+        assert elements.shape[1] == 3 and len(elements) >= 8
+        np.testing.assert_array_equal(nodes, points)
+
+
+class TestStressRecovery:
+    """Test cases for batched strain, stress and derived stress recovery."""
+
+    def test_matches_per_element_recovery(self, generator, random_elements):
+        """One einsum pass equals B and D applied element by element."""
+        nodes, tets, _ = random_elements
+        displacement = np.random.default_rng(5).normal(size=len(nodes) * 3)
+        D = generator._compute_material_matrix(70e9, 0.33)
+
+        fields = generator._compute_element_fields(displacement, nodes, tets, 70e9, 0.33)
+
+        for element, strain, stress in zip(tets, fields['strain'], fields['stress']):
+            dofs = (element[:, None] * 3 + np.arange(3)).ravel()
+            expected = generator._compute_strain_displacement_matrix(nodes[element]) @ displacement[dofs]
+            np.testing.assert_allclose(strain, expected, rtol=1e-10, atol=1e-12)
+            np.testing.assert_allclose(stress, D @ expected, rtol=1e-10, atol=1e-12 * 70e9)
+        np.testing.assert_array_equal(generator._compute_stress(displacement, nodes, tets, 70e9, 0.33),
+                                      fields['stress'].ravel())
+
+    def test_von_mises_and_principal_stresses(self, generator):
+        """Uniaxial stretch gives von Mises equal to the axial stress."""
+        mesh = generator.generate_tetrahedral_mesh(CUBE)
+        nu = 0.25
+        # Uniaxial stress state: eps_xx = 1e-3, lateral contraction -nu * eps_xx
+        displacement = (mesh.nodes * [1e-3, -nu * 1e-3, -nu * 1e-3]).ravel()
+
+        fields = generator._compute_element_fields(displacement, mesh.nodes, mesh.elements, 100e9, nu)
+
+        np.testing.assert_allclose(fields['stress'][:, 0], 100e6, rtol=1e-10)
+        np.testing.assert_allclose(fields['von_mises'], 100e6, rtol=1e-10)
+        np.testing.assert_allclose(fields['principal_stresses'], [[100e6, 0.0, 0.0]] * mesh.n_elements,
+                                   atol=1e-3)
+
+    def test_mesh_b_matrices_are_passed_explicitly(self, generator):
+        """A TetrahedralMesh supplies its B matrices; bare arrays are never cached."""
+        mesh = generator.generate_tetrahedral_mesh(CUBE)
+        assert generator._compute_strain_displacement_matrices(
+            mesh.nodes, mesh.elements, mesh=mesh) is mesh.strain_displacement
+
+        nodes = mesh.nodes.copy()
+        K = generator._assemble_stiffness_matrix(nodes, mesh.elements, 200e9, 0.3)
+        nodes *= 2.0  # Edited in place: the next assembly must see the new geometry
+        K_scaled = generator._assemble_stiffness_matrix(nodes, mesh.elements, 200e9, 0.3)
+
+        # Linear tetrahedra: stiffness scales with length (volume / length^2)
+        np.testing.assert_allclose(K_scaled.toarray(), 2.0 * K.toarray(), rtol=1e-10)
+
+    def test_load_cases_are_batched(self, generator, random_elements):
+        """Stress recovery handles all load cases in one pass."""
+        nodes, tets, _ = random_elements
+        displacements = np.random.default_rng(6).normal(size=(4, len(nodes) * 3))
+
+        batched = generator._compute_element_fields(displacements, nodes, tets, 200e9, 0.3)
+
+        assert batched['principal_stresses'].shape == (4, len(tets), 3)
+        for case, u in enumerate(displacements):
+            single = generator._compute_element_fields(u, nodes, tets, 200e9, 0.3)
+            np.testing.assert_allclose(batched['stress'][case], single['stress'])
+            np.testing.assert_allclose(batched['von_mises'][case], single['von_mises'])
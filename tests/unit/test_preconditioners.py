@@ -0,0 +1,98 @@
+"""
+Unit tests for the incomplete Cholesky preconditioner.
+"""
+
+import numpy as np
+import pytest
+from scipy import sparse
+from scipy.sparse.linalg import cg
+
+from src.algorithms.preconditioners import IncompleteCholesky
+
+
+def laplacian_2d(m):
+    """Five-point Laplacian on an m x m grid."""
+    path = sparse.diags([-1.0, 2.0, -1.0], [-1, 0, 1], shape=(m, m))
+    identity = sparse.eye(m)
+    return (sparse.kron(identity, path) + sparse.kron(path, identity)).tocsc()
+
+
+def reference_ic0(A):
+    """Dense right-looking IC(0) restricted to the pattern of A."""
+    L = np.tril(A.toarray())
+    pattern = L != 0
+    n = L.shape[0]
+    for k in range(n):
+        L[k, k] = np.sqrt(L[k, k])
+        L[k + 1:, k] /= L[k, k]
+        for j in range(k + 1, n):
+            if L[j, k] != 0:
+                L[j:, j] -= np.where(pattern[j:, j], L[j:, k] * L[j, k], 0.0)
+    return L
+
+
+def count_cg_iterations(A, b, M=None):
+    iterations = [0]
+    _, status = cg(A, b, rtol=1e-10, maxiter=2000, M=M,
+                   callback=lambda _: iterations.__setitem__(0, iterations[0] + 1))
+    assert status == 0
+    return iterations[0]
+
+
+def test_dense_pattern_gives_exact_cholesky():
+    """With no entries to drop, IC(0) is the Cholesky factor."""
+    rng = np.random.default_rng(0)
+    B = rng.standard_normal((20, 20))
+    A = B @ B.T + 20 * np.eye(20)
+
+    factor = IncompleteCholesky(sparse.csr_matrix(A))
+
+    assert factor.shift == 0.0
+    np.testing.assert_allclose(factor.L.toarray(), np.linalg.cholesky(A), atol=1e-12)
+    b = rng.standard_normal(20)
+    np.testing.assert_allclose(factor.solve(b), np.linalg.solve(A, b), atol=1e-12)
+
+
+def test_matches_reference_on_laplacian():
+    """Level-scheduled factor equals the column-by-column reference."""
+    A = laplacian_2d(12)
+
+    factor = IncompleteCholesky(A)
+
+    assert factor.levels > 1
+    np.testing.assert_allclose(factor.L.toarray(), reference_ic0(A), atol=1e-12)
+
+
+def test_preconditioner_is_symmetric_and_speeds_up_cg():
+    """M^-1 is symmetric positive definite and cuts CG iterations."""
+    A = laplacian_2d(30)
+    factor = IncompleteCholesky(A)
+    M_inv = factor.solve(np.eye(A.shape[0]))
+
+    np.testing.assert_allclose(M_inv, M_inv.T, atol=1e-12)
+    assert np.linalg.eigvalsh(M_inv).min() > 0
+
+    b = np.random.default_rng(1).standard_normal(A.shape[0])
+    assert count_cg_iterations(A, b, factor.as_linear_operator()) < count_cg_iterations(A, b) / 2
+
+
+def test_breakdown_retries_with_diagonal_shift():
+    """A pivot breakdown is recovered by shifting the diagonal."""
+    # SPD, but the dropped fill drives the last IC(0) pivot negative
+    A = sparse.csc_matrix(np.array([
+        [3.0, -2.0, 0.0, 2.0],
+        [-2.0, 3.0, -2.0, 0.0],
+        [0.0, -2.0, 3.0, -2.0],
+        [2.0, 0.0, -2.0, 3.0],
+    ]))
+    assert np.linalg.eigvalsh(A.toarray()).min() > 0
+
+    factor = IncompleteCholesky(A)
+
+    assert factor.shift > 0
+    assert np.all(factor.L.diagonal() > 0)
+
+
+def test_rejects_non_positive_diagonal():
+    with pytest.raises(ValueError, match="positive diagonal"):
+        IncompleteCholesky(sparse.csc_matrix(np.diag([1.0, 0.0, 2.0])))
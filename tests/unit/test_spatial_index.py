@@ -0,0 +1,94 @@
+"""
+Unit tests for the KD-tree vertex spatial index.
+"""
+
+import numpy as np
+import pytest
+
+from src.algorithms.mesh_utils import generate_simple_mesh
+from src.algorithms.spatial_index import VertexSpatialIndex, snap_point_constraints
+
+
+@pytest.fixture(autouse=True)
+def clear_index_cache():
+    """Start every test with an empty index cache."""
+    VertexSpatialIndex.clear_cache()
+    yield
+    VertexSpatialIndex.clear_cache()
+
+
+def reference_farthest_points(points, count, start=0):
+    """Brute-force farthest-point sampling."""
+    chosen = [start]
+    nearest = np.linalg.norm(points - points[start], axis=1)
+    while len(chosen) < count:
+        best = int(np.argmax(nearest))
+        chosen.append(best)
+        nearest = np.minimum(nearest, np.linalg.norm(points - points[best], axis=1))
+    return chosen
+
+
+class TestVertexSpatialIndex:
+    """Test cases for VertexSpatialIndex."""
+
+    def test_nearest_vertices_match_brute_force(self):
+        """Nearest-vertex queries agree with an exhaustive search."""
+        rng = np.random.default_rng(0)
+        vertices = rng.random((500, 3))
+        points = rng.random((50, 3))
+
+        distances, indices = VertexSpatialIndex(vertices).nearest_vertices(points)
+
+        all_distances = np.linalg.norm(points[:, None] - vertices[None], axis=2)
+        np.testing.assert_array_equal(indices, all_distances.argmin(axis=1))
+        np.testing.assert_allclose(distances, all_distances.min(axis=1))
+
+    def test_points_beyond_max_distance_get_minus_one(self):
+        """Queries with no vertex in range report index -1."""
+        index = VertexSpatialIndex(np.eye(3))
+        _, indices = index.nearest_vertices([[1.0, 0.0, 0.01], [5.0, 5.0, 5.0]], max_distance=0.5)
+        np.testing.assert_array_equal(indices, [0, -1])
+
+    def test_farthest_point_sample_matches_reference(self):
+        """Ball-pruned sampling picks the same vertices as the brute-force loop."""
+        vertices = np.random.default_rng(1).random((2000, 3))
+        candidates = np.arange(0, 2000, 3)
+
+        chosen = VertexSpatialIndex(vertices).farthest_point_sample(25, candidates, start=candidates[7])
+
+        expected = reference_farthest_points(vertices[candidates], 25, start=7)
+        assert chosen == candidates[expected].tolist()
+
+    def test_farthest_point_sample_breaks_ties_like_argmax(self):
+        """On a grid, where many distances tie, blockwise maxima pick the lowest index like argmax."""
+        vertices, _ = generate_simple_mesh(40, 40)
+
+        chosen = VertexSpatialIndex(vertices).farthest_point_sample(60)
+
+        assert chosen == reference_farthest_points(vertices.astype(np.float64), 60)
+
+    def test_farthest_point_sample_rejects_unknown_start(self):
+        """A start vertex outside the candidate set is a ValueError, not an IndexError."""
+        index = VertexSpatialIndex(np.random.default_rng(2).random((50, 3)))
+
+        with pytest.raises(ValueError, match="not among the candidates"):
+            index.farthest_point_sample(5, candidates=[1, 2, 3], start=7)
+
+    def test_for_mesh_caches_by_vertex_positions(self):
+        """The tree is built once per vertex array and rebuilt when positions move."""
+        vertices, _ = generate_simple_mesh(6, 6)
+
+        first = VertexSpatialIndex.for_mesh(vertices)
+        assert VertexSpatialIndex.for_mesh(vertices.copy()) is first
+        assert VertexSpatialIndex.for_mesh(vertices + 1.0) is not first
+        assert VertexSpatialIndex.cache_info()['hits'] == 1
+        assert VertexSpatialIndex.cache_info()['misses'] == 2
+
+    def test_snap_point_constraints(self):
+        """Picked points become (vertex_index, u, v) constraints."""
+        vertices, _ = generate_simple_mesh(6, 6)
+        picked = [list(vertices[7] + 1e-3) + [0.0, 0.0], list(vertices[30]) + [1.0, 2.0]]
+
+        assert snap_point_constraints(vertices, picked) == [(7, 0.0, 0.0), (30, 1.0, 2.0)]
+        with pytest.raises(ValueError):
+            snap_point_constraints(vertices, [[9.0, 9.0, 9.0, 0.0, 0.0]], max_distance=0.1)
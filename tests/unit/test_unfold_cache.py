@@ -0,0 +1,119 @@
+"""
+Unit tests for the content-addressed unfolding result cache.
+"""
+
+import numpy as np
+import pytest
+
+from src.algorithms.mesh_utils import generate_simple_mesh
+from src.algorithms import unfold_cache
+from src.algorithms.unfold_cache import UnfoldResultCache
+
+PINS = [(0, 0.0, 0.0), (7, 1.0, 0.0)]
+
+
+@pytest.fixture
+def mesh():
+    """Small wavy grid mesh."""
+    return generate_simple_mesh(8, 8)
+
+
+class TestUnfoldResultCache:
+    """Test cases for UnfoldResultCache."""
+
+    def test_second_call_hits_memory(self, tmp_path, mesh):
+        """Repeating a request is served from the memory tier."""
+        cache = UnfoldResultCache(tmp_path)
+        vertices, triangles = mesh
+
+        first = cache.unfold(vertices, triangles, PINS)
+        second = cache.unfold(vertices, triangles, PINS)
+
+        assert first['result_cache']['hit'] is False
+        assert second['result_cache'] == {'hit': True, 'tier': 'memory', 'key': first['result_cache']['key']}
+        assert second['uv_coordinates'] == first['uv_coordinates']
+        assert cache.stats()['memory_hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_results_survive_restart(self, tmp_path, mesh):
+        """A new cache instance on the same directory serves results from disk."""
+        vertices, triangles = mesh
+        first = UnfoldResultCache(tmp_path).unfold(vertices, triangles, PINS)
+
+        restarted = UnfoldResultCache(tmp_path)
+        second = restarted.unfold(vertices, triangles, PINS)
+
+        assert second['result_cache']['tier'] == 'disk'
+        np.testing.assert_allclose(second['uv_coordinates'], first['uv_coordinates'])
+        assert second['distortion_metrics'] == first['distortion_metrics']
+
+    def test_version_bump_skips_persisted_results(self, tmp_path, mesh, monkeypatch):
+        """Results stored under an older CACHE_KEY_VERSION are not served."""
+        vertices, triangles = mesh
+        first = UnfoldResultCache(tmp_path).unfold(vertices, triangles, PINS)
+
+        monkeypatch.setattr(unfold_cache, 'CACHE_KEY_VERSION', unfold_cache.CACHE_KEY_VERSION + 1)
+        second = UnfoldResultCache(tmp_path).unfold(vertices, triangles, PINS)
+
+        assert second['result_cache']['hit'] is False
+        assert second['result_cache']['key'] != first['result_cache']['key']
+
+    def test_key_depends_on_inputs(self, mesh):
+        """Changing tolerance or constraints changes the key."""
+        vertices, triangles = mesh
+        base = UnfoldResultCache.make_key(vertices, triangles, PINS, None, 0.001)
+
+        assert UnfoldResultCache.make_key(vertices.copy(), triangles.copy(), PINS, None, 0.001) == base
+        assert UnfoldResultCache.make_key(vertices, triangles, PINS, None, 0.01) != base
+        assert UnfoldResultCache.make_key(vertices, triangles, PINS[:1], None, 0.001) != base
+        assert UnfoldResultCache.make_key(vertices, triangles, PINS, {'material_thickness': 1.0},
+                                          0.001) != base
+
+    def test_size_based_eviction(self, tmp_path, mesh):
+        """Memory and disk tiers evict least recently used entries when over budget."""
+        vertices, triangles = mesh
+        cache = UnfoldResultCache(tmp_path, max_memory_entries=1)
+        first = cache.unfold(vertices, triangles, PINS)
+        # Room for one entry but not two. The budget cannot be exactly the first
+        # file size: the second result's metadata (timings, tolerance) can be a
+        # few bytes longer, and an entry over budget on its own evicts itself.
+        first_size = cache.stats()['disk_bytes']
+        cache.max_disk_bytes = first_size + first_size // 2
+
+        second = cache.unfold(vertices, triangles, PINS, distortion_tolerance=0.01)
+
+        stats = cache.stats()
+        assert stats['memory_entries'] == 1
+        assert stats['memory_evictions'] == 1
+        assert stats['disk_entries'] == 1
+        assert stats['disk_evictions'] == 1
+        assert not (tmp_path / f"{first['result_cache']['key']}.npz").exists()
+        assert (tmp_path / f"{second['result_cache']['key']}.npz").exists()
+
+    def test_failed_results_are_not_cached(self, tmp_path):
+        """Errors are returned but never stored."""
+        cache = UnfoldResultCache(tmp_path)
+        vertices = np.zeros((3, 3))
+        triangles = np.array([[0, 1, 5]])
+
+        result = cache.unfold(vertices, triangles)
+
+        assert result['success'] is False
+        assert cache.stats()['stores'] == 0
+
+    def test_batch_serves_repeated_parts_from_cache(self, tmp_path, mesh):
+        """A second batch only unfolds parts that were not seen before."""
+        cache = UnfoldResultCache(tmp_path)
+        vertices, triangles = mesh
+        part = {'part_id': 'a', 'vertices': vertices, 'triangles': triangles, 'boundary_constraints': PINS}
+
+        first = list(cache.unfold_batch([part], max_workers=1))
+        second = list(cache.unfold_batch([part, {**part, 'part_id': 'b', 'boundary_constraints': PINS[:1]}],
+                                         max_workers=1))
+
+        assert first[0]['result_cache']['hit'] is False
+        by_id = {r['part_id']: r for r in second}
+        assert by_id['a']['result_cache']['tier'] == 'memory'
+        assert by_id['b']['result_cache']['hit'] is False
+        assert by_id['b']['part_index'] == 1
+        assert by_id['a']['uv_coordinates'] == first[0]['uv_coordinates']